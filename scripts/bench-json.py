@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON backends of forge_cli.common.jsoncodec (orjson, msgspec, stdlib json).
+
+Two workloads, run for every installed backend:
+
+- decode: every event payload of a response stream decoded with jsoncodec.loads, as the
+  SDK does for each SSE data line. By default a file-search answer of --answer-chars
+  characters streamed as growing snapshots is synthesized; pass --input to use a
+  recorded stream (a timed .jsonl recording or a raw SSE capture, see
+  forge_cli.testing.mock_server).
+- save: ConversationState.save and .load of a conversation with --messages messages,
+  and the encode step (jsoncodec.dumpb) alone.
+
+Install orjson or msgspec to compare them with the standard library fallback.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from forge_cli.common import jsoncodec
+from forge_cli.models.conversation import ConversationState
+from forge_cli.testing.mock_server import Recording
+
+SENTENCE = "Revenue grew twelve percent while operating costs stayed flat across all regions. "
+
+
+def best_of(repeat: int, call) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def build_conversation(messages: int, chars_per_message: int) -> ConversationState:
+    conversation = ConversationState(model="qwen-max-latest")
+    answer = (SENTENCE * (chars_per_message // len(SENTENCE) + 1))[:chars_per_message]
+    for turn in range(messages // 2):
+        conversation.add_user_message(f"Question {turn}: how did revenue develop in the last quarter?")
+        conversation.add_assistant_message(f"{turn}: {answer}")
+    return conversation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", type=Path, help="Recorded stream (.jsonl or raw SSE) instead of a synthesized one")
+    parser.add_argument("--answer-chars", type=int, default=8000, help="Length of the synthesized answer")
+    parser.add_argument("--messages", type=int, default=1000, help="Messages in the saved conversation")
+    parser.add_argument("--message-chars", type=int, default=1500, help="Length of each assistant message")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    if args.input:
+        recording = Recording.load(args.input)
+    else:
+        answer = (SENTENCE * (args.answer_chars // len(SENTENCE) + 1))[: args.answer_chars]
+        recording = Recording.synthesize(answer=answer)
+    payloads = [event.data for event in recording.events if event.data.startswith("{")]
+    size = sum(len(data.encode()) for data in payloads) / 1_000_000
+    conversation = build_conversation(args.messages, args.message_chars)
+    data = conversation.model_dump(mode="json")
+
+    backends = jsoncodec.available_backends()
+    print(f"backends: {', '.join(backends)}")
+    print(f"stream: {len(payloads)} events, {size:.1f} MB of JSON")
+    print(f"conversation: {conversation.get_message_count()} messages")
+    print()
+    print(f"{'backend':>8} {'decode MB/s':>12} {'events/s':>10} {'encode ms':>10} {'save ms':>9} {'load ms':>9}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "conversation.json"
+        for backend in backends:
+            jsoncodec.set_backend(backend)
+            decode = best_of(args.repeat, lambda: [jsoncodec.loads(payload) for payload in payloads])
+            encode = best_of(args.repeat, lambda: jsoncodec.dumpb(data, indent=2))
+            save = best_of(args.repeat, lambda: conversation.save(path))
+            load = best_of(args.repeat, lambda: ConversationState.load(path))
+            print(
+                f"{backend:>8} {size / decode:12.1f} {len(payloads) / decode:10.0f} "
+                f"{encode * 1000:10.2f} {save * 1000:9.2f} {load * 1000:9.2f}"
+            )
+    jsoncodec.set_backend(None)
+
+
+if __name__ == "__main__":
+    main()
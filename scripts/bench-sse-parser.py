@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: SSE framing throughput of the byte-level SSEParser against the
+previous line-by-line loop of astream_typed_response.
+
+Both variants read the same recorded stream through an aiohttp StreamReader that is
+fed one socket-sized chunk per event loop iteration, so the comparison includes
+aiohttp's own line splitting. JSON
+decoding and Response validation are excluded; only framing is measured.
+
+By default a ~10 MB stream of growing response snapshots (as sent per ADR-004) is
+synthesized. Pass --input to replay a recorded stream instead, e.g. one captured with:
+
+    curl -N -H 'Content-Type: application/json' -d @request.json $KNOWLEDGE_FORGE_URL/v1/responses > stream.sse
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from aiohttp import StreamReader
+from aiohttp.base_protocol import BaseProtocol
+
+from forge_cli.sdk.sse import SSEParser
+
+SNAPSHOT_TEMPLATE = {
+    "id": "resp_bench",
+    "object": "response",
+    "created_at": 1700000000.0,
+    "model": "qwen-max-latest",
+    "parallel_tool_calls": False,
+    "tool_choice": "auto",
+    "tools": [],
+    "status": "in_progress",
+}
+
+
+def synthesize_stream(target_bytes: int, chars_per_event: int = 24) -> bytes:
+    """Build a snapshot stream of roughly target_bytes with a steadily growing answer."""
+    parts = []
+    size = 0
+    text = ""
+    word = "Knowledge Forge streams complete snapshots. "
+    while size < target_bytes:
+        text += (word * (chars_per_event // len(word) + 1))[:chars_per_event]
+        snapshot = {
+            **SNAPSHOT_TEMPLATE,
+            "output": [
+                {
+                    "id": "msg_1",
+                    "type": "message",
+                    "role": "assistant",
+                    "status": "in_progress",
+                    "content": [{"type": "output_text", "text": text, "annotations": []}],
+                }
+            ],
+        }
+        event = f"event: response.output_text.delta\ndata: {json.dumps(snapshot)}\n\n".encode()
+        parts.append(event)
+        size += len(event)
+    parts.append(b"event: done\ndata: \n\n")
+    return b"".join(parts)
+
+
+class _UnpausedProtocol(BaseProtocol):
+    """Protocol stub without flow control; the feeder below plays the socket."""
+
+    @property
+    def connected(self) -> bool:
+        return True
+
+    def pause_reading(self) -> None:
+        pass
+
+    def resume_reading(self, resume_parser: bool = True) -> None:
+        pass
+
+
+def make_reader(limit: int) -> StreamReader:
+    loop = asyncio.get_running_loop()
+    return StreamReader(_UnpausedProtocol(loop), limit, loop=loop)
+
+
+async def feed_reader(reader: StreamReader, payload: bytes, chunk_size: int) -> None:
+    """Deliver the payload one socket-sized chunk per event loop iteration."""
+    for offset in range(0, len(payload), chunk_size):
+        reader.feed_data(payload[offset : offset + chunk_size])
+        await asyncio.sleep(0)
+    reader.feed_eof()
+
+
+async def legacy_loop(reader: StreamReader) -> int:
+    """The framing logic astream_typed_response used before SSEParser."""
+    events = 0
+    current_event_type = ""
+    async for line in reader:
+        line = line.decode("utf-8").strip()
+        if not line:
+            continue
+        if line.startswith("event:"):
+            current_event_type = line[6:].strip()
+            if current_event_type == "done":
+                events += 1
+                break
+            continue
+        if line.startswith("data:"):
+            data_str = line[5:].strip()
+            if data_str.startswith("{") or data_str.startswith("["):
+                SNAPSHOT_EVENT_TYPES = {  # noqa: F841 - rebuilt per data line, as before
+                    "response.created",
+                    "response.in_progress",
+                    "response.completed",
+                    "response.output_text.delta",
+                    "response.output_text.done",
+                    "response.reasoning_summary_text.delta",
+                    "response.reasoning_summary_text.done",
+                    "response.file_search_call.completed",
+                    "response.web_search_call.completed",
+                    "response.function_call.completed",
+                    "response.list_documents_call.completed",
+                    "response.file_reader_call.completed",
+                    "response.page_reader_call.completed",
+                    "response.code_interpreter_call.completed",
+                }
+            events += 1
+    return events
+
+
+async def parser_loop(reader: StreamReader) -> int:
+    """Framing with the shared byte-level SSEParser."""
+    events = 0
+    parser = SSEParser()
+    async for chunk in reader.iter_any():
+        for event in parser.feed(chunk):
+            events += 1
+            if event.event == "done":
+                return events
+    return events + len(parser.flush())
+
+
+async def measure(name: str, loop_fn, payload: bytes, chunk_size: int, limit: int, repeat: int) -> None:
+    best = float("inf")
+    events = 0
+    for _ in range(repeat):
+        reader = make_reader(limit)
+        started = time.perf_counter()
+        try:
+            events, _ = await asyncio.gather(loop_fn(reader), feed_reader(reader, payload, chunk_size))
+        except ValueError as e:
+            print(f"{name:>8}: failed ({e}) - a data line exceeds the StreamReader line limit")
+            return
+        best = min(best, time.perf_counter() - started)
+    mb = len(payload) / 1_000_000
+    print(
+        f"{name:>8}: {events:6d} events  {best * 1000:8.1f} ms  {events / best:10.0f} events/s  {mb / best:8.1f} MB/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", type=Path, help="Recorded SSE stream to replay (default: synthesize)")
+    parser.add_argument("--size-mb", type=float, default=10.0, help="Size of the synthesized stream")
+    parser.add_argument("--chunk-size", type=int, default=16 * 1024, help="Bytes per simulated socket read")
+    parser.add_argument(
+        "--line-limit",
+        type=int,
+        default=2**20,
+        help="StreamReader limit; aiohttp's default (2**16) rejects snapshot lines over 128 KiB",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    payload = args.input.read_bytes() if args.input else synthesize_stream(int(args.size_mb * 1_000_000))
+    print(f"stream: {len(payload) / 1_000_000:.1f} MB, chunk size {args.chunk_size} bytes")
+
+    await measure("legacy", legacy_loop, payload, args.chunk_size, args.line_limit, args.repeat)
+    await measure("sse", parser_loop, payload, args.chunk_size, args.line_limit, args.repeat)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
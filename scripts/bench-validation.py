@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of building Response snapshots of a stream per validation mode of
+astream_typed_response (validate="all", "final" and "none"), with the delta
+accumulator (delta=True) for reference.
+
+Every event payload is decoded with json.loads and turned into a Response exactly as
+astream_typed_response does; network I/O and SSE framing are excluded.
+
+By default a multi-tool stream is synthesized: reasoning, a file search, a web search
+and a list-documents call, followed by an answer growing by --chars-per-event with
+file and URL citations. Pass --input to use a recorded stream instead (a timed .jsonl
+recording or a raw SSE capture, see forge_cli.testing.mock_server).
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from forge_cli.sdk.delta_stream import ResponseDeltaAccumulator
+from forge_cli.sdk.typed_api import VALIDATION_MODES, build_snapshot
+from forge_cli.testing.mock_server import Recording
+
+WORDS = "Revenue grew twelve percent while operating costs stayed flat across all regions. "
+
+
+def synthesize_stream(answer_chars: int, chars_per_event: int) -> list[tuple[str, str]]:
+    """Build (event type, data) pairs of a multi-tool answer streamed as growing snapshots."""
+    tools = [
+        {"id": "rs_1", "type": "reasoning", "status": "completed", "summary": []},
+        {"id": "fs_1", "type": "file_search_call", "queries": ["revenue 2024"], "status": "in_progress"},
+        {"id": "ws_1", "type": "web_search_call", "queries": ["industry revenue 2024"], "status": "in_progress"},
+        {"id": "ld_1", "type": "list_documents_call", "queries": ["annual report"], "status": "in_progress"},
+    ]
+
+    def snapshot(status: str, text: str | None = None) -> str:
+        output = [dict(tool) for tool in tools]
+        if text is not None:
+            citations = len(text) // 400
+            annotations = [
+                {"type": "file_citation", "file_id": f"file_{i}", "index": i, "filename": f"report{i}.pdf"}
+                if i % 2 == 0
+                else {
+                    "type": "url_citation",
+                    "url": f"https://example.com/{i}",
+                    "title": f"Source {i}",
+                    "start_index": 0,
+                    "end_index": 10,
+                }
+                for i in range(citations)
+            ]
+            output.append(
+                {
+                    "id": "msg_1",
+                    "type": "message",
+                    "role": "assistant",
+                    "status": "completed" if status == "completed" else "in_progress",
+                    "content": [{"type": "output_text", "text": text, "annotations": annotations}],
+                }
+            )
+        return json.dumps(
+            {
+                "id": "resp_bench",
+                "object": "response",
+                "created_at": 1700000000.0,
+                "model": "qwen-max-latest",
+                "parallel_tool_calls": False,
+                "tool_choice": "auto",
+                "tools": [],
+                "status": status,
+                "output": output,
+            }
+        )
+
+    events = [("response.created", snapshot("in_progress"))]
+    tools[0]["summary"] = [{"type": "summary_text", "text": "Look up revenue in the annual reports and the news."}]
+    events.append(("response.reasoning_summary_text.done", snapshot("in_progress")))
+    for tool, event_type in zip(tools[1:], ("file_search_call", "web_search_call", "list_documents_call"), strict=True):
+        for status in ("searching", "completed"):
+            tool["status"] = status
+            events.append((f"response.{event_type}.{status}", snapshot("in_progress")))
+
+    answer = (WORDS * (answer_chars // len(WORDS) + 1))[:answer_chars]
+    for end in range(chars_per_event, answer_chars + chars_per_event, chars_per_event):
+        events.append(("response.output_text.delta", snapshot("in_progress", answer[:end])))
+    events.append(("response.completed", snapshot("completed", answer)))
+    return events
+
+
+def run(mode: str, events: list[tuple[str, str]]) -> float:
+    accumulator = ResponseDeltaAccumulator() if mode == "delta" else None
+    started = time.perf_counter()
+    for event_type, data in events:
+        payload = json.loads(data)
+        if accumulator is not None:
+            accumulator.apply(event_type, payload)
+        else:
+            build_snapshot(event_type, payload, mode)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", type=Path, help="Recorded stream (.jsonl or raw SSE) instead of a synthesized one")
+    parser.add_argument("--answer-chars", type=int, default=8000, help="Length of the synthesized answer")
+    parser.add_argument("--chars-per-event", type=int, default=24, help="Answer growth per synthesized event")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mode (best is reported)")
+    args = parser.parse_args()
+
+    if args.input:
+        events = [(event.event, event.data) for event in Recording.load(args.input).events]
+    else:
+        events = synthesize_stream(args.answer_chars, args.chars_per_event)
+    events = [(event_type, data) for event_type, data in events if data.startswith("{")]
+    size = sum(len(data) for _, data in events) / 1_000_000
+    print(f"stream: {len(events)} snapshots, {size:.1f} MB of JSON")
+
+    baseline = None
+    for mode in (*VALIDATION_MODES, "delta"):
+        best = min(run(mode, events) for _ in range(args.repeat))
+        baseline = baseline or best
+        print(
+            f"{mode:>6}: {best * 1000:8.1f} ms  {best / len(events) * 1e6:8.1f} us/event  "
+            f"{baseline / best:5.2f}x vs all"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import argparse
-import asyncio
 import json
 import os
 from typing import Any
@@ -11,6 +10,7 @@ from forge_cli.sdk import (
     async_join_files_to_vectorstore,
     async_query_vectorstore,
     async_upload_file,
+    run_with_client,
 )
 
 # Default IDs
@@ -270,4 +270,4 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     # Run the flow
-    asyncio.run(run_full_flow(args.file, args.query, args.vec_id, args.file_id))
+    run_with_client(run_full_flow(args.file, args.query, args.vec_id, args.file_id))
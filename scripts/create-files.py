@@ -10,7 +10,6 @@ Server Configuration:
 """
 
 import argparse
-import asyncio
 import json
 import os
 from pathlib import Path
@@ -21,8 +20,10 @@ from forge_cli.sdk import (
     async_delete_file,
     async_fetch_file,
     async_upload_file,
+    async_upload_many,
     async_wait_for_task_completion,
     print_file_results,
+    run_with_client,
 )
 
 
@@ -56,6 +57,19 @@ def main():
         help="Create a Document object and dump to <doc-id>.json in current directory",
     )
 
+    # Bulk upload command
+    upload_many_parser = subparsers.add_parser("upload-many", help="Upload many files in parallel")
+    upload_many_parser.add_argument("files", nargs="+", help="Files (or directories, searched recursively) to upload")
+    upload_many_parser.add_argument(
+        "--purpose", default="general", choices=["general", "qa"], help="Purpose of the file upload (default: general)"
+    )
+    upload_many_parser.add_argument("-c", "--concurrency", type=int, default=8, help="Parallel uploads (default: 8)")
+    upload_many_parser.add_argument(
+        "--manifest",
+        default="upload-manifest.jsonl",
+        help="JSONL manifest used to resume interrupted runs (default: upload-manifest.jsonl)",
+    )
+
     # Delete file command
     delete_parser = subparsers.add_parser("delete", help="Delete a file")
     delete_parser.add_argument("-i", "--id", required=True, dest="file_id", help="ID of the file to delete")
@@ -79,11 +93,13 @@ def main():
 
     # Execute the appropriate command
     if args.command == "upload" and args.file:
-        asyncio.run(upload_file_async(args.file, args.purpose, args.custom_id, args.skip_exists, args.dump))
+        run_with_client(upload_file_async(args.file, args.purpose, args.custom_id, args.skip_exists, args.dump))
+    elif args.command == "upload-many":
+        run_with_client(upload_many_async(args.files, args.purpose, args.concurrency, args.manifest))
     elif args.command == "delete" and args.file_id:
-        asyncio.run(delete_file_async(args.file_id))
+        run_with_client(delete_file_async(args.file_id))
     elif args.command == "fetch" and args.file_id:
-        asyncio.run(fetch_file_async(args.file_id, args.dump))
+        run_with_client(fetch_file_async(args.file_id, args.dump))
     else:
         # If no command or required args are provided, show help
         parser.print_help()
@@ -149,6 +165,47 @@ async def upload_file_async(
         print(f"Error during file upload: {e}")
 
 
+async def upload_many_async(
+    inputs: list[str],
+    purpose: str = "general",
+    concurrency: int = 8,
+    manifest: str = "upload-manifest.jsonl",
+):
+    """
+    Upload many files in parallel, resuming from the manifest of a previous run.
+
+    Args:
+        inputs: Files or directories (searched recursively) to upload
+        purpose: Purpose of the file upload
+        concurrency: Number of parallel uploads
+        manifest: JSONL manifest path
+    """
+    paths = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            paths.extend(sorted(p for p in path.rglob("*") if p.is_file()))
+        elif path.exists():
+            paths.append(path)
+        else:
+            print(f"Warning: '{item}' does not exist, skipping.")
+
+    print(f"Uploading {len(paths)} file(s) with concurrency {concurrency} (manifest: {manifest})")
+    finished = 0
+
+    def report(entry):
+        nonlocal finished
+        finished += 1
+        outcome = f"{entry.file_id} (task: {entry.task_id})" if entry.status == "uploaded" else f"FAILED: {entry.error}"
+        print(f"[{finished}] {entry.path} -> {outcome}")
+
+    results = await async_upload_many(
+        paths, concurrency=concurrency, purpose=purpose, manifest_path=manifest, on_result=report
+    )
+    failed = sum(1 for entry in results if entry.status == "failed")
+    print(f"Done: {len(results) - failed} uploaded, {failed} failed")
+
+
 async def fetch_file_async(file_id: str, dump: bool = False):
     """
     Fetch a file's details and optionally dump to JSON.
@@ -23,7 +23,6 @@ Example usage:
 """
 
 import argparse
-import asyncio
 import os
 from typing import Any
 
@@ -32,6 +31,7 @@ from forge_cli.sdk import (
     async_create_vectorstore,
     async_get_vectorstore,
     async_join_files_to_vectorstore,
+    run_with_client,
 )
 
 
@@ -237,7 +237,7 @@ if __name__ == "__main__":
 
     # Execute the appropriate command
     if args.command == "create":
-        asyncio.run(
+        run_with_client(
             create_vector_store_async(
                 name=args.name,
                 description=args.description,
@@ -246,9 +246,9 @@ if __name__ == "__main__":
             )
         )
     elif args.command == "add-files" and args.vector_store_id and args.file_ids:
-        asyncio.run(add_files_to_vectorstore_async(vector_store_id=args.vector_store_id, file_ids=args.file_ids))
+        run_with_client(add_files_to_vectorstore_async(vector_store_id=args.vector_store_id, file_ids=args.file_ids))
     elif args.command == "get" and args.vector_store_id:
-        asyncio.run(get_vectorstore_async(vector_store_id=args.vector_store_id))
+        run_with_client(get_vectorstore_async(vector_store_id=args.vector_store_id))
     else:
         # If no command or required args are provided, show help
         parser.print_help()
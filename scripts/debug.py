@@ -22,7 +22,6 @@ Tool Choice Examples:
 """
 
 import argparse
-import asyncio
 import json
 
 from loguru import logger
@@ -33,7 +32,10 @@ from forge_cli.sdk import (
     create_file_search_tool,
     create_typed_request,
     create_web_search_tool,
+    run_with_client,
 )
+from forge_cli.response._types import Response
+from forge_cli.sdk.sse import SSEParser, aiter_sse_events
 
 # Default IDs for testing
 DEFAULT_VECTOR_STORE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
@@ -97,6 +99,32 @@ async def handle_typed_stream(request):
     logger.info(f"✅ Typed Stream Completed - Total events: {event_count}")
 
 
+async def replay_recorded_stream(path: str, chunk_size: int = 64 * 1024):
+    """Replay a recorded SSE stream (e.g. saved with curl -N) through the SDK's SSE parser."""
+    print_section_header(f"REPLAY {path}")
+
+    async def read_chunks():
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    parser = SSEParser()
+    event_count = 0
+    async for event in aiter_sse_events(read_chunks(), parser):
+        event_count += 1
+        response_snapshot = None
+        if event.data.startswith("{"):
+            try:
+                response_snapshot = Response(**json.loads(event.data))
+            except Exception as e:
+                logger.warning(f"Could not parse snapshot of {event.event}: {e}")
+
+        logger.bind(index=event_count, event=event.event, event_id=event.id).info("📡 Stream Event")
+        log_event_data(event.event, response_snapshot, event_count)
+
+    logger.info(f"✅ Replay Completed - Total events: {event_count}, last event id: {parser.last_event_id or '-'}")
+
+
 def log_event_data(event_type: str, response_snapshot, event_number: int):
     """Log event data in a structured and readable way."""
     if not response_snapshot:
@@ -393,6 +421,11 @@ async def main():
         type=str,
         help="Custom query to send with the request",
     )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        help="Replay a recorded SSE stream file instead of sending a request",
+    )
     parser.add_argument(
         "--vector-store-id",
         default=DEFAULT_VECTOR_STORE_ID,
@@ -432,6 +465,10 @@ async def main():
 
     args = parser.parse_args()
 
+    if args.replay:
+        await replay_recorded_stream(args.replay)
+        return
+
     # Parse tool_choice argument
     tool_choice = None
     if args.tool_choice:
@@ -520,4 +557,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_client(main())
@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 import argparse
-import asyncio
 import os
 
 # Import SDK functions
-from forge_cli.sdk import async_delete_file, async_upload_file
+from forge_cli.sdk import async_delete_file, async_upload_file, run_with_client
 
 
 async def upload_file(file_path):
@@ -81,4 +80,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_client(main())
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import argparse
-import asyncio
 import json
 from typing import Any
 
@@ -12,7 +11,7 @@ from rich.table import Table
 from rich.text import Text
 
 # Import SDK functions
-from forge_cli.sdk import async_query_vectorstore
+from forge_cli.sdk import async_query_vectorstore, run_with_client
 
 # Initialize Rich console
 console = Console()
@@ -151,4 +150,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_client(main())
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 """Command completion for chat interface using prompt_toolkit."""
 
+import asyncio
+import contextlib
 from collections.abc import Iterator
 from typing import Any
 
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
+COMPLETION_FILES_PER_COLLECTION = 200  # Files listed per collection for @-completion
+
 
 class CommandCompleter(Completer):
     """Auto-completion for chat commands and file references.
@@ -37,6 +41,7 @@ class CommandCompleter(Completer):
         self._file_cache = None  # Cache for available files
         self._cache_time = 0  # Timestamp of last cache update
         self._cache_expiry_seconds = 300  # 5 minutes
+        self._fetch_timeout_seconds = 3.0  # Longest a completion may wait for the server
 
         # Build list of all command names with leading slash
         self.all_commands: list[str] = []
@@ -183,121 +188,57 @@ class CommandCompleter(Completer):
         files.extend(uploaded_docs)
 
         # Get files from vector stores
+        complete = True
         vector_store_ids = self.conversation.get_current_vector_store_ids()
         if vector_store_ids:
-            # Try to get files from each vector store
-            for vs_id in vector_store_ids:
-                vs_files = self._get_vector_store_files_sync(vs_id)
-                files.extend(vs_files)
-
-        # Cache the result with timestamp
-        self._file_cache = files
-        self._cache_time = current_time
+            vs_files, complete = self._get_vector_store_files_sync(vector_store_ids)
+            files.extend(vs_files)
+
+        # Cache the result with timestamp; a listing cut short is retried on the next completion
+        if complete:
+            self._file_cache = files
+            self._cache_time = current_time
         return files
 
     def refresh_file_cache(self):
         """Refresh the file cache. Call this when files might have changed."""
         self._file_cache = None
 
-    def _get_vector_store_files_sync(self, vector_store_id: str) -> list[dict[str, str]]:
-        """Get files from a vector store synchronously.
+    def _get_vector_store_files_sync(self, vector_store_ids: list[str]) -> tuple[list[dict[str, str]], bool]:
+        """Get files from vector stores synchronously.
+
+        Runs the listings on the SDK's background loop (forge_cli.sdk.sync), so
+        completion shares its pooled connections instead of opening new sockets. All
+        collections are listed at once and at most _fetch_timeout_seconds is spent
+        in total, since this blocks the prompt.
 
         Args:
-            vector_store_id: The vector store ID to query
+            vector_store_ids: The vector store IDs to query
 
         Returns:
-            List of file info dictionaries
+            File info dictionaries received in time, and whether every listing finished
         """
         try:
-            import requests
-            from ..config import get_base_url
-
-            # Use synchronous requests to avoid async issues
-            base_url = get_base_url()
-            
-            # First try list_documents endpoint if available
-            list_url = f"{base_url}/v1/vector_stores/{vector_store_id}/files"
-            
-            try:
-                # Try to get file list directly
-                list_response = requests.get(list_url, timeout=3.0)
-                
-                if list_response.status_code == 200:
-                    list_data = list_response.json()
-                    files = []
-                    
-                    # Handle different response formats
-                    if "data" in list_data:
-                        file_items = list_data["data"]
-                    elif "files" in list_data:
-                        file_items = list_data["files"]
-                    else:
-                        file_items = []
-                    
-                    for item in file_items:
-                        file_id = item.get("id") or item.get("file_id")
-                        filename = item.get("filename") or item.get("name") or f"file_{file_id[:8]}.txt"
-                        
-                        if file_id:
-                            files.append({"id": file_id, "filename": filename})
-                    
-                    if files:  # If we got files from list endpoint, return them
-                        return files
-            except:
-                pass  # Fall back to search endpoint
-            
-            # Fall back to search endpoint
-            search_url = f"{base_url}/v1/vector_stores/{vector_store_id}/search"
-            
-            # Prepare the search payload
-            payload = {
-                "query": "document content text information file",  # Broad query
-                "top_k": 50,  # Get up to 50 documents for completion
-            }
-
-            # Make synchronous request
-            response = requests.post(search_url, json=payload, timeout=5.0)
-            
-            if response.status_code != 200:
-                return []
-
-            # Extract data from raw response
-            response_data = response.json()
-            documents = response_data.get("data", [])
-
-            files = []
-            seen_file_ids = set()
-
-            for item in documents:
-                # Get file_id and filename from the raw response
-                file_id = item.get("file_id")
-                filename = item.get("filename")
-                
-                # Try to extract filename from content if not provided
-                if not filename and item.get("content"):
-                    # Look for filename in content metadata
-                    content_lines = item["content"].split("\n")
-                    for line in content_lines[:5]:  # Check first 5 lines
-                        if "filename:" in line.lower() or "file:" in line.lower():
-                            filename = line.split(":", 1)[-1].strip()
-                            break
-                
-                # Default filename if still not found
-                if not filename:
-                    filename = f"document_{file_id[:8]}.txt" if file_id else "unknown.txt"
-
-                if file_id and file_id not in seen_file_ids:
-                    seen_file_ids.add(file_id)
-                    files.append({"id": file_id, "filename": filename})
-
-            return files
+            from forge_cli.sdk import sync
 
+            # The listings give up after _fetch_timeout_seconds; the margin only covers a stuck loop
+            return sync.run(self._list_vector_store_files(vector_store_ids), timeout=self._fetch_timeout_seconds + 1)
         except Exception:
-            # If anything fails, return empty list
-            return []
+            return [], False
+
+    async def _list_vector_store_files(self, vector_store_ids: list[str]) -> tuple[list[dict[str, str]], bool]:
+        """List the first files of several vector stores concurrently, within the fetch timeout."""
+        found: dict[str, list[dict[str, str]]] = {vs_id: [] for vs_id in vector_store_ids}
+        tasks = [asyncio.create_task(self._collect_vector_store_files(vs_id, found[vs_id])) for vs_id in found]
+        done, pending = await asyncio.wait(tasks, timeout=self._fetch_timeout_seconds)
+        for task in pending:
+            task.cancel()
+        # Files that arrived before a timeout are still offered, just not cached
+        complete = not pending and all(task.exception() is None for task in done)
+        return [file for files in found.values() for file in files], complete
 
     async def _get_vector_store_files_async(self, vector_store_id: str) -> list[dict[str, str]]:
-        """Get files from a vector store asynchronously.
+        """Get the first files of a vector store asynchronously.
 
         Args:
             vector_store_id: The vector store ID to query
@@ -305,39 +246,22 @@ class CommandCompleter(Completer):
         Returns:
             List of file info dictionaries
         """
+        files: list[dict[str, str]] = []
         try:
-            # Make raw HTTP request to avoid Pydantic validation issues
-            from forge_cli.config import BASE_URL
-            from forge_cli.sdk.http_client import async_make_request
-
-            url = f"{BASE_URL}/v1/vector_stores/{vector_store_id}/search"
-            payload = {
-                "query": "document content text information",  # Broad query
-                "top_k": 50,  # Get up to 50 documents for completion
-            }
-
-            status_code, response_data = await async_make_request("POST", url, json=payload)
-
-            if status_code != 200 or not response_data:
-                return []
-
-            # Extract data from raw response
-            documents = response_data.get("data", [])
-
-            files = []
-            seen_file_ids = set()
-
-            for item in documents:
-                # Get file_id and filename from the raw response
-                file_id = item.get("file_id")
-                filename = item.get("filename", f"{file_id}.txt" if file_id else "unknown.txt")
-
-                if file_id and file_id not in seen_file_ids:
-                    seen_file_ids.add(file_id)
-                    files.append({"id": file_id, "filename": filename})
-
-            return files
-
+            await self._collect_vector_store_files(vector_store_id, files)
         except Exception:
             # Silent fail for completion
-            return []
+            pass
+        return files
+
+    @staticmethod
+    async def _collect_vector_store_files(vector_store_id: str, files: list[dict[str, str]]) -> None:
+        """Append up to COMPLETION_FILES_PER_COLLECTION files of a vector store to files as they arrive."""
+        from forge_cli.sdk.vectorstore import aiter_vectorstore_files
+
+        listing = aiter_vectorstore_files(vector_store_id, page_size=COMPLETION_FILES_PER_COLLECTION)
+        async with contextlib.aclosing(listing):
+            async for file in listing:
+                files.append({"id": file.id, "filename": file.filename or f"{file.id}.txt"})
+                if len(files) >= COMPLETION_FILES_PER_COLLECTION:
+                    break
@@ -16,7 +16,7 @@ from .files import (
     UnuseCollectionCommand,
     UploadCommand,
 )
-from .info import InspectCommand
+from .info import InspectCommand, StatsCommand
 from .session import ClearCommand, ExitCommand, HelpCommand, NewCommand
 from .tool import ToggleToolCommand
 
@@ -40,6 +40,7 @@ __all__ = [
     "VectorStoreCommand",
     # Information commands
     "InspectCommand",
+    "StatsCommand",
     # Tool commands
     "ToggleToolCommand",
     # File commands
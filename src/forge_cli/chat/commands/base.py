@@ -95,7 +95,7 @@ class CommandRegistry:
             UploadCommand,
             UseCollectionCommand,
         )
-        from .info import InspectCommand
+        from .info import InspectCommand, StatsCommand
         from .session import ClearCommand, ExitCommand, HelpCommand, NewCommand
         from .tool import ToggleToolCommand
 
@@ -111,6 +111,7 @@ class CommandRegistry:
             ToolsCommand(),
             NewCommand(),
             InspectCommand(),
+            StatsCommand(),
             VectorStoreCommand(),
             UploadCommand(),
             NewDocumentCommand(),
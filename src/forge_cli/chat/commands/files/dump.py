@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..base import ChatCommand
@@ -11,12 +12,108 @@ if TYPE_CHECKING:
 
 
 class DumpCommand(ChatCommand):
-    """Dump document content."""
-    
+    """Dump document JSON response to file.
+
+    The document is streamed: segments are spilled to a temporary file while
+    downloading and copied into the output one at a time, so even very large
+    documents are dumped in constant memory.
+
+    Usage:
+    - /dump <doc-id> - Save JSON to file named <doc-id>.json
+    - /dump <doc-id> <filename> - Save JSON to custom filename
+    """
+
     name = "dump"
-    description = "Dump document content"
+    description = "Dump document JSON response to file"
     aliases = ["export"]
 
     async def execute(self, args: str, controller: ChatController) -> bool:
-        controller.display.show_status("🚧 Document operations need to be extracted from original files.py")
+        """Execute the dump command.
+
+        Args:
+            args: Command arguments containing document ID and optional filename
+            controller: The ChatController instance
+
+        Returns:
+            True to continue the chat session
+        """
+        if not args.strip():
+            controller.display.show_error("Please provide a document ID: /dump <document-id> [filename]")
+            controller.display.show_status_rich("Example: /dump doc_abc123")
+            controller.display.show_status_rich("Example: /dump doc_abc123 my_document.json")
+            return True
+
+        arg_parts = args.strip().split()
+        document_id = arg_parts[0]
+
+        # Determine output filename
+        if len(arg_parts) > 1:
+            filename = arg_parts[1]
+            if not filename.endswith(".json"):
+                filename += ".json"
+        else:
+            filename = f"{document_id}.json"
+
+        controller.display.show_status_rich(f"📥 Dumping document {document_id} to {filename}")
+
+        try:
+            from forge_cli.sdk.document_stream import async_stream_document_content
+
+            document = await async_stream_document_content(document_id)
+            if document is None:
+                controller.display.show_error(f"❌ Document not found: {document_id}")
+                controller.display.show_status_rich("💡 Make sure the document ID is correct and exists")
+                return True
+
+            with document:
+                # Create output directory if it doesn't exist
+                output_path = Path(filename)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # Write JSON to file with pretty formatting
+                with open(output_path, "w", encoding="utf-8") as f:
+                    document.write_json(f, indent=2)
+
+                size_str = self._format_file_size(output_path.stat().st_size)
+                controller.display.show_status_rich(f"✅ Successfully saved to: {output_path.absolute()}")
+                controller.display.show_status_rich(f"📊 File size: {size_str}")
+                controller.display.show_status_rich("")
+
+                # Show summary of what was saved
+                header = document.header_data
+                controller.display.show_status_rich("📋 Content Summary:")
+                controller.display.show_status_rich(f"  • Document ID: {header.get('id', 'N/A')}")
+                controller.display.show_status_rich(f"  • Title: {header.get('title', 'N/A')}")
+                controller.display.show_status_rich(f"  • MIME Type: {header.get('mime_type', 'N/A')}")
+
+                content = header.get("content")
+                if isinstance(content, dict):
+                    controller.display.show_status_rich(f"  • Segments: {document.segment_count}")
+                    if isinstance(content.get("keywords"), list):
+                        controller.display.show_status_rich(f"  • Keywords: {len(content['keywords'])}")
+                    if "page_count" in content:
+                        controller.display.show_status_rich(f"  • Pages: {content['page_count']}")
+
+        except Exception as e:
+            controller.display.show_error(f"❌ Failed to dump document: {str(e)}")
+            controller.display.show_status_rich("💡 Check the document ID, file permissions, and server connectivity")
+
         return True
+
+    def _format_file_size(self, bytes_size: int) -> str:
+        """Format file size in human-readable format.
+
+        Args:
+            bytes_size: Size in bytes
+
+        Returns:
+            Formatted size string
+        """
+        if bytes_size < 1024:
+            return f"{bytes_size} bytes"
+        elif bytes_size < 1024 * 1024:
+            return f"{bytes_size / 1024:.1f} KB"
+        elif bytes_size < 1024 * 1024 * 1024:
+            return f"{bytes_size / (1024 * 1024):.1f} MB"
+        else:
+            return f"{bytes_size / (1024 * 1024 * 1024):.1f} GB"
@@ -68,19 +68,11 @@ class ListDocsCommand(ChatCommand):
     async def _get_vector_store_docs_simple(self, vector_store_id: str) -> list[dict]:
         """Get document list from vector store."""
         try:
-            from forge_cli.sdk.vectorstore import async_query_vectorstore
-            
-            result = await async_query_vectorstore(
-                vector_store_id=vector_store_id,
-                query="document",
-                top_k=100
-            )
-            
-            if result and hasattr(result, "results"):
-                return result.results
-            elif isinstance(result, dict) and "results" in result:
-                return result["results"]
-            else:
-                return []
-        except:
-            return []
\ No newline at end of file
+            from forge_cli.sdk.vectorstore import aiter_vectorstore_files
+
+            return [
+                file.model_dump(mode="json", exclude_none=True)
+                async for file in aiter_vectorstore_files(vector_store_id)
+            ]
+        except Exception:
+            return []
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
+from ....common import jsoncodec
 from ..base import ChatCommand
 from ..utils import has_json_flag, parse_flag_parameters
 
@@ -63,7 +63,7 @@ class ShowCollectionCommand(ChatCommand):
 
             if not collection:
                 if json_output:
-                    print(json.dumps({"error": f"Collection not found: {collection_id}"}, indent=2))
+                    print(jsoncodec.dumps({"error": f"Collection not found: {collection_id}"}, indent=2))
                 else:
                     controller.display.show_error(f"❌ Collection not found: {collection_id}")
                 return True
@@ -86,7 +86,7 @@ class ShowCollectionCommand(ChatCommand):
                     if hasattr(collection, "file_counts"):
                         collection_data["file_counts"] = self._serialize_file_counts(collection.file_counts)
                 
-                print(json.dumps(collection_data, indent=2, ensure_ascii=False))
+                print(jsoncodec.dumps(collection_data, indent=2))
             else:
                 # Display formatted collection information
                 self._display_collection_info(collection, controller)
@@ -94,7 +94,7 @@ class ShowCollectionCommand(ChatCommand):
         except Exception as e:
             error_msg = f"Error fetching collection: {str(e)}"
             if json_output:
-                print(json.dumps({"error": error_msg}, indent=2))
+                print(jsoncodec.dumps({"error": error_msg}, indent=2))
             else:
                 controller.display.show_error(f"❌ {error_msg}")
 
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
+from ....common import jsoncodec
 from ..base import ChatCommand
 from ..utils import has_json_flag, parse_flag_parameters
 
@@ -46,7 +46,7 @@ class ShowCollectionsCommand(ChatCommand):
 
         if not collection_ids:
             if json_output:
-                print(json.dumps({"collections": [], "message": "No collections configured"}, indent=2))
+                print(jsoncodec.dumps({"collections": [], "message": "No collections configured"}, indent=2))
             else:
                 controller.display.show_status("No collections configured.")
             return True
@@ -78,10 +78,10 @@ class ShowCollectionsCommand(ChatCommand):
                     controller.display.show_status(f"  {collection_id} - (inaccessible)")
 
         if json_output:
-            print(json.dumps({
+            print(jsoncodec.dumps({
                 "collections": collections_data,
                 "total": len(collections_data)
-            }, indent=2, ensure_ascii=False))
+            }, indent=2))
 
         return True
 
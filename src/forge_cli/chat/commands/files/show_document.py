@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from typing import TYPE_CHECKING
 
+from ....common import jsoncodec
 from ..base import ChatCommand
 from ..utils import has_json_flag, parse_flag_parameters
 
@@ -57,44 +58,33 @@ class ShowDocumentCommand(ChatCommand):
             controller.display.show_status_rich(f"🔍 Fetching document: {document_id}")
 
         try:
-            # Import SDK functions
-            from forge_cli.sdk.config import BASE_URL
-            from forge_cli.sdk.http_client import async_make_request
+            # Stream the body so large documents never materialize their segments
+            from forge_cli.sdk.document_stream import async_stream_document_content
 
-            # Make API call
-            url = f"{BASE_URL}/v1/files/{document_id}/content"
-            status_code, response_data = await async_make_request("GET", url)
+            document = await async_stream_document_content(document_id)
 
-            if status_code == 200 and isinstance(response_data, dict):
+            if document is None:
                 if json_output:
-                    # Output as JSON
-                    print(json.dumps(response_data, indent=2, ensure_ascii=False))
-                else:
-                    # Format and display the document information
-                    self._display_document_info(response_data, controller)
-                    controller.display.show_status_rich("✅ Document information displayed successfully")
-
-            elif status_code == 404:
-                if json_output:
-                    print(json.dumps({"error": f"Document not found: {document_id}"}, indent=2))
+                    print(jsoncodec.dumps({"error": f"Document not found: {document_id}"}, indent=2))
                 else:
                     controller.display.show_error(f"❌ Document not found: {document_id}")
                     controller.display.show_status_rich("💡 Make sure the document ID is correct and exists")
-            else:
-                error_msg = f"API returned status {status_code}"
+                return True
+
+            with document:
                 if json_output:
-                    print(json.dumps({"error": error_msg, "details": response_data}, indent=2))
+                    # Output as JSON
+                    document.write_json(sys.stdout)
+                    print()
                 else:
-                    controller.display.show_error(f"❌ {error_msg}")
-                    if isinstance(response_data, dict):
-                        json_str = json.dumps(response_data, indent=2, ensure_ascii=False)
-                        controller.display.show_status_rich("Error response:")
-                        controller.display.show_status_rich(json_str)
+                    # Format and display the document information
+                    self._display_document_info(document.header_data, controller, document.segment_count)
+                    controller.display.show_status_rich("✅ Document information displayed successfully")
 
         except Exception as e:
             error_msg = f"Failed to fetch document: {str(e)}"
             if json_output:
-                print(json.dumps({"error": error_msg}, indent=2))
+                print(jsoncodec.dumps({"error": error_msg}, indent=2))
             else:
                 controller.display.show_error(f"❌ {error_msg}")
                 controller.display.show_status_rich("💡 Check the document ID and server connectivity")
@@ -128,12 +118,13 @@ class ShowDocumentCommand(ChatCommand):
             json_output = False
             return document_id, json_output
 
-    def _display_document_info(self, doc_data: dict, controller: ChatController) -> None:
+    def _display_document_info(self, doc_data: dict, controller: ChatController, segment_count: int = 0) -> None:
         """Display formatted document information.
 
         Args:
-            doc_data: Document data from API
+            doc_data: Document data from API (without segments)
             controller: Chat controller for display
+            segment_count: Number of segments in the document
         """
         controller.display.show_status_rich("📄 Document Information:")
         controller.display.show_status_rich("=" * 60)
@@ -152,6 +143,12 @@ class ShowDocumentCommand(ChatCommand):
         if "created_at" in doc_data:
             controller.display.show_status_rich(f"Created: {doc_data['created_at']}")
         
+        content = doc_data.get("content")
+        if isinstance(content, dict):
+            if content.get("page_count"):
+                controller.display.show_status_rich(f"Pages: {content['page_count']}")
+            controller.display.show_status_rich(f"Segments: {segment_count}")
+
         if "metadata" in doc_data and doc_data["metadata"]:
             controller.display.show_status_rich("\nMetadata:")
             for key, value in doc_data["metadata"].items():
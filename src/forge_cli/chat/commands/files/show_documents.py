@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
+from ....common import jsoncodec
 from ..base import ChatCommand
 from ..utils import has_json_flag, parse_flag_parameters
 
@@ -64,7 +64,7 @@ class ShowDocumentsCommand(ChatCommand):
                     "count": len(vs_docs)
                 }
 
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            print(jsoncodec.dumps(result, indent=2))
         else:
             # Show conversation documents
             if conversation_docs:
@@ -113,38 +113,22 @@ class ShowDocumentsCommand(ChatCommand):
         return False
 
     async def _get_vector_store_documents(self, vector_store_id: str, controller: ChatController) -> list[dict]:
-        """Get documents from a vector store using a broad query.
+        """Get all documents of a vector store from its paginated file listing.
 
         Args:
-            vector_store_id: The vector store ID to query
+            vector_store_id: The vector store ID to list
             controller: The ChatController instance
 
         Returns:
             List of document dictionaries from the vector store
         """
         try:
-            # Use direct HTTP request to avoid Pydantic parsing issues
-            from forge_cli.sdk.config import BASE_URL
-            from forge_cli.sdk.http_client import async_make_request
-            
-            url = f"{BASE_URL}/v1/vector_stores/{vector_store_id}/search"
-            payload = {
-                "query": "document content text information",
-                "top_k": 50
-            }
-            
-            status_code, response_data = await async_make_request("POST", url, json_payload=payload)
-            
-            if status_code == 200 and isinstance(response_data, dict):
-                # Handle the actual response structure
-                if "results" in response_data:
-                    return response_data["results"]
-                elif "data" in response_data:
-                    return response_data["data"]
-                else:
-                    return []
-            else:
-                return []
+            from forge_cli.sdk.vectorstore import aiter_vectorstore_files
+
+            return [
+                file.model_dump(mode="json", exclude_none=True)
+                async for file in aiter_vectorstore_files(vector_store_id)
+            ]
 
         except Exception as e:
             # Log error but don't fail the command
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
+from ....common import jsoncodec
 from ..base import ChatCommand
 from ..utils import has_json_flag, parse_flag_parameters
 
@@ -80,7 +80,7 @@ class ShowPagesCommand(ChatCommand):
             if status_code == 200 and isinstance(response_data, dict):
                 if json_output:
                     # Output as JSON
-                    print(json.dumps(response_data, indent=2, ensure_ascii=False))
+                    print(jsoncodec.dumps(response_data, indent=2))
                 else:
                     # Format and display the pages
                     self._display_pages(response_data, controller)
@@ -88,20 +88,20 @@ class ShowPagesCommand(ChatCommand):
 
             elif status_code == 404:
                 if json_output:
-                    print(json.dumps({"error": f"Document not found: {doc_id}"}, indent=2))
+                    print(jsoncodec.dumps({"error": f"Document not found: {doc_id}"}, indent=2))
                 else:
                     controller.display.show_error(f"❌ Document not found: {doc_id}")
             else:
                 error_msg = f"API returned status {status_code}"
                 if json_output:
-                    print(json.dumps({"error": error_msg, "details": response_data}, indent=2))
+                    print(jsoncodec.dumps({"error": error_msg, "details": response_data}, indent=2))
                 else:
                     controller.display.show_error(f"❌ {error_msg}")
 
         except Exception as e:
             error_msg = f"Failed to fetch pages: {str(e)}"
             if json_output:
-                print(json.dumps({"error": error_msg}, indent=2))
+                print(jsoncodec.dumps({"error": error_msg}, indent=2))
             else:
                 controller.display.show_error(f"❌ {error_msg}")
 
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import re
 from typing import TYPE_CHECKING
 
+from ....common import jsoncodec
 from ..base import ChatCommand
 
 if TYPE_CHECKING:
@@ -13,7 +13,10 @@ if TYPE_CHECKING:
 
 
 class TopKQueryCommand(ChatCommand):
-    """Query a vector store collection with top-k results.
+    """Query vector store collections with top-k results.
+
+    Without --collection, all active collections are searched and their results
+    merged into one top-k list. --collection accepts a comma-separated list of IDs.
 
     Usage:
         /topk <query-text>                                              (simple format)
@@ -22,6 +25,7 @@ class TopKQueryCommand(ChatCommand):
     Examples:
         /topk machine learning techniques
         /topk --collection=my_collection --query="neural networks" --top-k=10
+        /topk --collection=vs_a,vs_b --query="neural networks"
         /topk --query="python functions" --json
     """
 
@@ -67,7 +71,11 @@ class TopKQueryCommand(ChatCommand):
 
             # Show query info (unless JSON output is requested)
             if not json_output:
-                print(f"🔍 Querying collection: {collection_id}")
+                collection_ids = collection_id.split(",")
+                if len(collection_ids) > 1:
+                    print(f"🔍 Querying {len(collection_ids)} collections: {', '.join(collection_ids)}")
+                else:
+                    print(f"🔍 Querying collection: {collection_id}")
                 print(f"📝 Query: {query}")
                 print(f"🔢 Top-K: {top_k}")
                 print()
@@ -101,7 +109,8 @@ class TopKQueryCommand(ChatCommand):
             controller: Chat controller to get current collection
 
         Returns:
-            Tuple of (collection_id, query, top_k, json_output)
+            Tuple of (collection_id, query, top_k, json_output); collection_id is a
+            comma-separated list when several collections are searched
 
         Raises:
             ValueError: If parsing fails
@@ -127,11 +136,9 @@ class TopKQueryCommand(ChatCommand):
                 "No current collection set\n" + "💡 Use '/use-collection <collection-id>' to set an active collection"
             )
 
-        collection_id = current_collections[0]
+        collection_id = ",".join(current_collections)
         if len(current_collections) > 1:
-            # Inform user which collection is being used
-            controller.display.show_status(f"ℹ️ Using first active collection: {collection_id}")
-            controller.display.show_status(f"   (You have {len(current_collections)} active collections)")
+            controller.display.show_status(f"ℹ️ Searching all {len(current_collections)} active collections")
 
         # Use default top_k and no JSON output for simple format
         top_k = 5
@@ -155,12 +162,10 @@ class TopKQueryCommand(ChatCommand):
             # Try to get current collection from conversation state
             current_collections = controller.conversation.get_current_vector_store_ids()
             if current_collections:
-                # Use the first collection if multiple are active
-                collection_id = current_collections[0]
+                # Search all active collections
+                collection_id = ",".join(current_collections)
                 if len(current_collections) > 1:
-                    # Inform user which collection is being used
-                    controller.display.show_status(f"ℹ️ Using first active collection: {collection_id}")
-                    controller.display.show_status(f"   (You have {len(current_collections)} active collections)")
+                    controller.display.show_status(f"ℹ️ Searching all {len(current_collections)} active collections")
             else:
                 raise ValueError(
                     "--collection parameter is required (no current collection set)\n"
@@ -231,23 +236,27 @@ class TopKQueryCommand(ChatCommand):
         """Execute the vector store query.
 
         Args:
-            collection_id: Vector store ID to query
+            collection_id: Vector store ID to query, or a comma-separated list of IDs
             query: Search query text
             top_k: Number of results to return
             json_output: Whether to output results in JSON format
             controller: Chat controller instance
         """
         try:
-            from forge_cli.sdk.vectorstore import async_query_vectorstore
+            from forge_cli.sdk.vectorstore import async_query_vectorstore, async_query_vectorstores
 
             # Execute the query
-            result = await async_query_vectorstore(
-                vector_store_id=collection_id, query=query, top_k=top_k, filters=None
-            )
+            collection_ids = [vs_id.strip() for vs_id in collection_id.split(",") if vs_id.strip()]
+            if len(collection_ids) > 1:
+                result = await async_query_vectorstores(collection_ids, query=query, top_k=top_k, filters=None)
+            else:
+                result = await async_query_vectorstore(
+                    vector_store_id=collection_id, query=query, top_k=top_k, filters=None
+                )
 
             if result is None:
                 if json_output:
-                    print(json.dumps({"error": "Query failed - no results returned"}, indent=2))
+                    print(jsoncodec.dumps({"error": "Query failed - no results returned"}, indent=2))
                 else:
                     print("❌ Query failed - no results returned")
                 return
@@ -256,7 +265,7 @@ class TopKQueryCommand(ChatCommand):
             if hasattr(result, "data") and result.data:
                 if json_output:
                     # Output the native chunk data as JSON
-                    print(json.dumps(result.model_dump(), indent=2))
+                    print(jsoncodec.dumps(result.model_dump(), indent=2))
                 else:
                     print(f"✅ Found {len(result.data)} results:")
                     print()
@@ -289,17 +298,17 @@ class TopKQueryCommand(ChatCommand):
 
             else:
                 if json_output:
-                    print(json.dumps({"message": "No results found for the query", "data": []}, indent=2))
+                    print(jsoncodec.dumps({"message": "No results found for the query", "data": []}, indent=2))
                 else:
                     print("📭 No results found for the query")
 
         except ImportError:
             if json_output:
-                print(json.dumps({"error": "Vector store SDK not available"}, indent=2))
+                print(jsoncodec.dumps({"error": "Vector store SDK not available"}, indent=2))
             else:
                 print("❌ Vector store SDK not available")
         except Exception as e:
             if json_output:
-                print(json.dumps({"error": f"Query execution failed: {e}"}, indent=2))
+                print(jsoncodec.dumps({"error": f"Query execution failed: {e}"}, indent=2))
             else:
                 print(f"❌ Query execution failed: {e}")
@@ -140,110 +140,72 @@ class UploadCommand(ChatCommand):
     async def _track_processing_progress(self, controller: ChatController, task_id: str, filename: str):
         """Track file processing progress with real-time updates.
 
+        Polling is done by the shared TaskWatcher, which backs off while the task
+        is idle and shares requests with anyone else waiting on the same task.
+
         Args:
             controller: The ChatController instance
             task_id: Task ID to track
             filename: Original filename for display
         """
         try:
-            from forge_cli.sdk import async_check_task_status
+            from forge_cli.sdk import get_task_watcher
 
             controller.display.show_status(f"🔄 Tracking progress for: {filename}")
 
-            poll_interval = 2  # Check every 2 seconds
-            max_attempts = 150  # 5 minutes max (150 * 2 seconds)
-            attempt = 0
-            consecutive_errors = 0  # Track consecutive errors
-            max_consecutive_errors = 3  # Stop after 3 consecutive errors
-
+            timeout = 300  # 5 minutes max
             last_status = None
-            last_progress = None
-
-            while attempt < max_attempts:
-                try:
-                    # Check task status
-                    task_status = await async_check_task_status(task_id)
-                    consecutive_errors = 0  # Reset error counter on success
-
-                    # Update display if status or progress changed
-                    status_changed = task_status.status != last_status
-                    progress_changed = task_status.progress != last_progress
-
-                    if status_changed or progress_changed:
-                        progress_percent = int(task_status.progress) if task_status.progress else 0
-                        status_emoji = self._get_status_emoji(task_status.status)
-
-                        controller.display.show_status(
-                            f"{status_emoji} {task_status.status.upper()}: {filename} ({progress_percent}%)"
-                        )
-
-                        # Show additional details for certain statuses
-                        if status_changed:
-                            if task_status.status == "parsing":
-                                controller.display.show_status("📖 Parsing document content...")
-                            elif task_status.status == "vectorizing":
-                                controller.display.show_status("🧮 Creating vector embeddings...")
-
-                    last_status = task_status.status
-                    last_progress = task_status.progress
-
-                    # Check if processing is complete
-                    if task_status.status in ["completed", "failed", "cancelled"]:
-                        if task_status.status == "completed":
-                            controller.display.show_status(f"✅ Processing completed: {filename}")
-                            document_id = task_id.replace("upload-", "")
-                            controller.display.show_status(f"📄 Document ID: {document_id}")
-
-                            # Save document ID to conversation state
-                            controller.conversation.add_uploaded_document(document_id=document_id, filename=filename)
-                            controller.display.show_status("💾 Document saved to conversation state")
-                        elif task_status.status == "failed":
-                            error_msg = "Unknown error"
-                            # Try multiple fields for error information
-                            if hasattr(task_status, "failure_reason") and task_status.failure_reason:
-                                error_msg = task_status.failure_reason
-                            elif hasattr(task_status, "error_message") and task_status.error_message:
-                                error_msg = task_status.error_message
-                            elif (
-                                hasattr(task_status, "data") and task_status.data and isinstance(task_status.data, dict)
-                            ):
-                                error_msg = task_status.data.get("error", error_msg)
-                            controller.display.show_error(f"❌ Processing failed: {error_msg}")
-                        else:
-                            controller.display.show_status(f"⏹️ Processing cancelled: {filename}")
-                        return  # Exit method cleanly
-
-                except ConnectionError as e:
-                    consecutive_errors += 1
-                    controller.display.show_error(f"🌐 Connection error (attempt {consecutive_errors}): {str(e)}")
-                    if consecutive_errors >= max_consecutive_errors:
-                        controller.display.show_error("❌ Too many connection errors, stopping progress tracking")
-                        return
-                except TimeoutError as e:
-                    consecutive_errors += 1
-                    controller.display.show_error(f"⏱️ Request timeout (attempt {consecutive_errors}): {str(e)}")
-                    if consecutive_errors >= max_consecutive_errors:
-                        controller.display.show_error("❌ Too many timeouts, stopping progress tracking")
-                        return
-                except Exception as e:
-                    consecutive_errors += 1
-                    controller.display.show_error(f"❓ Unexpected error (attempt {consecutive_errors}): {str(e)}")
-                    if consecutive_errors >= max_consecutive_errors:
-                        controller.display.show_error("❌ Too many errors, stopping progress tracking")
-                        return
-
-                # Wait before next check
-                try:
-                    await asyncio.sleep(poll_interval)
-                except asyncio.CancelledError:
-                    controller.display.show_status("⏹️ Progress tracking cancelled")
-                    return
-                attempt += 1
-
-            # Handle timeout
-            if attempt >= max_attempts:
+
+            def on_progress(task_status) -> None:
+                nonlocal last_status
+                progress_percent = int(task_status.progress) if task_status.progress else 0
+                status_emoji = self._get_status_emoji(task_status.status)
+
+                controller.display.show_status(
+                    f"{status_emoji} {task_status.status.upper()}: {filename} ({progress_percent}%)"
+                )
+
+                # Show additional details for certain statuses
+                if task_status.status != last_status:
+                    if task_status.status == "parsing":
+                        controller.display.show_status("📖 Parsing document content...")
+                    elif task_status.status == "vectorizing":
+                        controller.display.show_status("🧮 Creating vector embeddings...")
+                last_status = task_status.status
+
+            try:
+                task_status = await get_task_watcher().wait(task_id, on_progress=on_progress, timeout=timeout)
+            except TimeoutError:
                 controller.display.show_error("⏰ Timeout: Processing took longer than expected")
                 controller.display.show_status(f"You can check status manually with task ID: {task_id}")
+                return
+            except ConnectionError as e:
+                controller.display.show_error(f"❌ Too many connection errors, stopping progress tracking: {str(e)}")
+                return
+            except Exception as e:
+                controller.display.show_error(f"❌ Too many errors, stopping progress tracking: {str(e)}")
+                return
+
+            if task_status.status == "completed":
+                controller.display.show_status(f"✅ Processing completed: {filename}")
+                document_id = task_id.replace("upload-", "")
+                controller.display.show_status(f"📄 Document ID: {document_id}")
+
+                # Save document ID to conversation state
+                controller.conversation.add_uploaded_document(document_id=document_id, filename=filename)
+                controller.display.show_status("💾 Document saved to conversation state")
+            elif task_status.status == "failed":
+                error_msg = "Unknown error"
+                # Try multiple fields for error information
+                if hasattr(task_status, "failure_reason") and task_status.failure_reason:
+                    error_msg = task_status.failure_reason
+                elif hasattr(task_status, "error_message") and task_status.error_message:
+                    error_msg = task_status.error_message
+                elif hasattr(task_status, "data") and task_status.data and isinstance(task_status.data, dict):
+                    error_msg = task_status.data.get("error", error_msg)
+                controller.display.show_error(f"❌ Processing failed: {error_msg}")
+            else:
+                controller.display.show_status(f"⏹️ Processing cancelled: {filename}")
 
         except asyncio.CancelledError:
             controller.display.show_status("⏹️ Progress tracking cancelled")
@@ -127,3 +127,140 @@ class InspectCommand(ChatCommand):
                     vector_stores.append(f"{vec_id} - (API error)")
 
         return "\n".join([f"• {vs}" for vs in vector_stores])
+
+
+class StatsCommand(ChatCommand):
+    """Displays per-endpoint client metrics collected by the SDK.
+
+    Latency, time to first byte and time to first token percentiles tell server
+    time apart from client parsing and rendering. Streams run with --pipeline
+    also report queue depth and timings of their read, parse and render stages,
+    and dropped streams the number and latency of reconnects.
+
+    Usage:
+    - /stats - Show p50/p90/p99 per endpoint
+    - /stats reset - Clear the collected metrics
+    """
+
+    name = "stats"
+    description = "Show per-endpoint request latency and transfer metrics"
+    aliases = ["metrics"]
+
+    async def execute(self, args: str, controller: ChatController) -> bool:
+        """Executes the stats command.
+
+        Args:
+            args: "reset" to clear the metrics, otherwise ignored.
+            controller: The `ChatController` instance.
+
+        Returns:
+            True, indicating the chat session should continue.
+        """
+        from ...sdk.compression import get_compression
+        from ...sdk.limits import get_request_limiter
+        from ...sdk.metrics import get_metrics
+        from ...sdk.single_flight import get_single_flight
+
+        metrics = get_metrics()
+        if args.strip().lower() == "reset":
+            metrics.reset()
+            get_compression().stats.reset()
+            controller.display.show_status("🧹 Client metrics cleared")
+            return True
+
+        if not metrics.endpoints:
+            controller.display.show_status("📭 No requests recorded yet")
+            return True
+
+        rows = [self._row(name, stats) for name, stats in sorted(metrics.endpoints.items())]
+        headers = ["Endpoint", "Reqs", "Err", "Latency p50/p90/p99", "TTFB p50", "TTFT p50", "Sent", "Recv", "Reused"]
+
+        if hasattr(controller.display, "_renderer") and hasattr(controller.display._renderer, "_console"):
+            from rich.table import Table
+
+            table = Table(title="📈 Client Metrics", show_header=True, header_style="bold cyan")
+            for header in headers:
+                table.add_column(header, justify="left" if header == "Endpoint" else "right")
+            for row in rows:
+                table.add_row(*row)
+            controller.display._renderer._console.print(table)
+        else:
+            controller.display.show_status("📈 Client Metrics:")
+            for row in rows:
+                controller.display.show_status("  " + " | ".join(f"{h}: {v}" for h, v in zip(headers, row, strict=True)))
+
+        transfer = get_compression().stats
+        controller.display.show_status(
+            f"📦 Request bodies: {self._format_bytes(transfer.request_bytes)} → "
+            f"{self._format_bytes(transfer.request_bytes_sent)} sent, "
+            f"responses: {self._format_bytes(transfer.response_bytes_received)} received → "
+            f"{self._format_bytes(transfer.response_bytes)} decoded"
+        )
+        single_flight = get_single_flight()
+        if single_flight.shared:
+            controller.display.show_status(
+                f"🔁 Deduplicated GETs: {single_flight.shared} calls shared a request in flight "
+                f"({single_flight.calls} sent)"
+            )
+        resumes = metrics.resumes
+        if resumes.disconnects:
+            controller.display.show_status(
+                f"🔌 Stream resumes: {resumes.disconnects} disconnects, {resumes.resumed} resumed with Last-Event-ID, "
+                f"{resumes.polled} by polling, {resumes.failed} failed ({resumes.attempts} attempts); "
+                f"reconnect p50/p99 {self._format_seconds(resumes.latency.percentile(50))}"
+                f"/{self._format_seconds(resumes.latency.percentile(99))}"
+            )
+        if metrics.stages:
+            controller.display.show_status("🧵 Stream stages (wait = queued or waiting for input, busy = working):")
+            for name, stage in metrics.stages.items():
+                controller.display.show_status(
+                    f"  {name}: {stage.processed} items"
+                    + (f", {stage.conflated} conflated" if stage.conflated else "")
+                    + f", wait p50/p99 {self._format_seconds(stage.wait.percentile(50))}"
+                    + f"/{self._format_seconds(stage.wait.percentile(99))}"
+                    + f", busy p50/p99 {self._format_seconds(stage.busy.percentile(50))}"
+                    + f"/{self._format_seconds(stage.busy.percentile(99))}"
+                    + f", queue depth mean {stage.mean_depth:.1f} max {stage.max_depth}"
+                )
+
+        limits = get_request_limiter().snapshot()
+        controller.display.show_status(
+            "🚦 Limits: "
+            + ", ".join(
+                f"{name} {state['circuit']} ({state['in_flight']} in flight, {state['waiting']} waiting"
+                + (f", {state['rejected']} rejected" if state["rejected"] else "")
+                + ")"
+                for name, state in limits.items()
+            )
+        )
+        return True
+
+    def _row(self, name: str, stats) -> list[str]:
+        latency = stats.latency
+        connections = stats.new_connections + stats.reused_connections
+        reused = f"{stats.reused_connections / connections:.0%}" if connections else "-"
+        return [
+            name,
+            str(stats.requests),
+            str(stats.errors),
+            " / ".join(self._format_seconds(latency.percentile(p)) for p in (50, 90, 99)),
+            self._format_seconds(stats.first_byte.percentile(50)) if stats.first_byte.count else "-",
+            self._format_seconds(stats.first_token.percentile(50)) if stats.first_token.count else "-",
+            self._format_bytes(stats.bytes_sent),
+            self._format_bytes(stats.bytes_received),
+            reused,
+        ]
+
+    @staticmethod
+    def _format_seconds(seconds: float) -> str:
+        if seconds < 0.01:
+            return f"{seconds * 1000:.2f}ms"  # stream stage timings are often well under a millisecond
+        return f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.2f}s"
+
+    @staticmethod
+    def _format_bytes(size: int) -> str:
+        if size < 1024:
+            return f"{size}B"
+        if size < 1024 * 1024:
+            return f"{size / 1024:.1f}KB"
+        return f"{size / (1024 * 1024):.1f}MB"
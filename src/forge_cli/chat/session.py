@@ -6,8 +6,9 @@ from typing import TYPE_CHECKING
 
 from forge_cli.chat.controller import ChatController
 from forge_cli.config import AppConfig
-from forge_cli.sdk import astream_typed_response
+from forge_cli.sdk import ForgeClient, aiter_response_events, astream_typed_response, set_default_client
 from forge_cli.stream.handler_typed import TypedStreamHandler
+from forge_cli.stream.pipeline import StreamPipeline
 
 if TYPE_CHECKING:
     from forge_cli.display.v3.base import Display
@@ -26,6 +27,9 @@ class ChatSessionManager:
         self.config = config
         self.display = display
         self.controller = ChatController(config, display)
+        # One pooled HTTP client for the whole session; commands that call the SDK
+        # without an explicit client pick it up as the process-wide default.
+        self.client = ForgeClient()
 
     async def start_session(
         self, initial_question: str | None = None, resume_conversation_id: str | None = None
@@ -36,6 +40,15 @@ class ChatSessionManager:
             initial_question: Optional initial question to process
             resume_conversation_id: Optional conversation ID to resume
         """
+        set_default_client(self.client)
+        try:
+            await self._run_session(initial_question, resume_conversation_id)
+        finally:
+            await self.client.close()
+            set_default_client(None)
+
+    async def _run_session(self, initial_question: str | None, resume_conversation_id: str | None) -> None:
+        """Run the chat loop until the user exits."""
         # Resume existing conversation if requested
         if resume_conversation_id:
             from forge_cli.models.conversation import ConversationState
@@ -102,12 +115,18 @@ class ChatSessionManager:
             self.controller.conversation.turn_count -= 1
             return
 
-        # Create typed handler and stream - use conversation state as authoritative source
-        handler = TypedStreamHandler(self.display, debug=self.controller.conversation.debug)
-
-        # Stream the response
-        event_stream = astream_typed_response(request, debug=self.controller.conversation.debug)
-        response = await handler.handle_stream(event_stream)
+        debug = self.controller.conversation.debug
+        if self.config.stream_pipeline:
+            # Read, parse and render on separate stages (see forge_cli.stream.pipeline)
+            pipeline = StreamPipeline(self.display, debug=debug, throttle_ms=self.config.throttle_ms)
+            response = await pipeline.run(aiter_response_events(request, debug=debug, client=self.client))
+        else:
+            # Create typed handler and stream - use conversation state as authoritative source
+            handler = TypedStreamHandler(self.display, debug=debug, throttle_ms=self.config.throttle_ms)
+
+            # Stream the response
+            event_stream = astream_typed_response(request, debug=debug, client=self.client, delta=True, conflate=True)
+            response = await handler.handle_stream(event_stream)
 
         # Update conversation state from response (includes adding assistant message)
         if response:
@@ -97,7 +97,7 @@ class CLIParser:
         parser.add_argument(
             "--render",
             type=str,
-            choices=["json", "rich", "plaintext"],
+            choices=["json", "ndjson", "rich", "plaintext"],
             default="rich",
             help="Output rendering format",
         )
@@ -111,7 +111,17 @@ class CLIParser:
             "--throttle",
             type=int,
             default=0,
-            help="Throttle output (milliseconds between tokens)",
+            help="Minimum milliseconds between display refreshes (0 renders every event)",
+        )
+        parser.add_argument(
+            "--pipeline",
+            action="store_true",
+            help="Read, parse and render response streams on separate threads (see /stats for per-stage timings)",
+        )
+        parser.add_argument(
+            "--scrollback",
+            action="store_true",
+            help="Print finished output to scrollback and keep only the in-progress tail live",
         )
 
         # Server argument
@@ -120,6 +130,44 @@ class CLIParser:
             default=os.environ.get("KNOWLEDGE_FORGE_URL", "http://localhost:9999"),
             help="Server URL",
         )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Do not use cached collection and document data (~/.forge-cli/cache)",
+        )
+        parser.add_argument(
+            "--stats-file",
+            metavar="PATH",
+            help="Write per-endpoint request metrics (latency percentiles, bytes, reuse) as JSON at exit",
+        )
+        parser.add_argument(
+            "--rate-limit",
+            action="append",
+            metavar="CLASS=RATE[/CONCURRENCY]",
+            help=(
+                "Limit requests per second and in flight for an endpoint class "
+                "(uploads, searches, responses, polls, default), e.g. uploads=2/4; repeatable "
+                "(default: unlimited)"
+            ),
+        )
+        parser.add_argument(
+            "--breaker-threshold",
+            type=int,
+            metavar="N",
+            help="Fail fast after N consecutive server errors on an endpoint class (default: 5, 0 disables)",
+        )
+        parser.add_argument(
+            "--breaker-reset",
+            type=float,
+            metavar="SECONDS",
+            help="Seconds to fail fast before probing a failing endpoint class again (default: 30)",
+        )
+        parser.add_argument(
+            "--compress-threshold",
+            type=int,
+            metavar="BYTES",
+            help="Gzip request bodies of at least this many bytes (default: 16384, 0 disables)",
+        )
 
         # Resume conversation argument
         parser.add_argument(
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+"""
+JSON encoding and decoding for the SDK, persistence and renderers.
+
+Every SSE event, cached body and saved conversation goes through this module, so the
+JSON library behind it decides much of the client's parse cost. The fastest installed
+backend is used:
+
+- ``orjson`` (``pip install orjson``)
+- ``msgspec`` (``pip install msgspec``)
+- the standard library ``json`` otherwise
+
+FORGE_JSON_BACKEND=orjson|msgspec|json overrides the choice, and set_backend()
+switches it at runtime (benchmarks, tests).
+
+All backends produce the same JSON text up to float formatting and whitespace:
+
+- Output is UTF-8; non-ASCII characters are not escaped.
+- Compact output has no spaces after separators; ``indent`` pretty-prints.
+- loads() accepts str or bytes and raises json.JSONDecodeError on malformed input.
+- A ``default`` hook sees the same values it would see with the standard library:
+  datetimes, dates, times and dataclasses go to it rather than being encoded
+  natively. msgspec cannot pass them through, so with a hook it encodes with the
+  standard library. UUIDs are still encoded natively, as str() would.
+
+dumpb() returns bytes for sinks that take them (binary files, request bodies, the
+HTTP cache), skipping the str round trip the accelerated backends would otherwise
+need. Values an accelerated backend cannot encode (integers beyond 64 bits,
+indents orjson does not support) are encoded with the standard library instead.
+"""
+
+import json
+import os
+from collections.abc import Callable
+from typing import IO, Any
+
+JSONDecodeError = json.JSONDecodeError
+
+# Backends in order of preference
+BACKENDS = ("orjson", "msgspec", "json")
+
+Default = Callable[[Any], Any] | None
+
+
+class _StdlibBackend:
+    name = "json"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: int | None, sort_keys: bool, default: Default) -> str:
+        separators = (",", ":") if indent is None else (",", ": ")
+        return json.dumps(
+            obj, indent=indent, sort_keys=sort_keys, default=default, ensure_ascii=False, separators=separators
+        )
+
+    def dumpb(self, obj: Any, indent: int | None, sort_keys: bool, default: Default) -> bytes:
+        return self.dumps(obj, indent, sort_keys, default).encode()
+
+
+class _OrjsonBackend:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._loads = orjson.loads
+        self._options = orjson.OPT_NON_STR_KEYS
+        self._fallback = _StdlibBackend()
+
+    def loads(self, data: str | bytes) -> Any:
+        return self._loads(data)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+
+    def dumps(self, obj: Any, indent: int | None, sort_keys: bool, default: Default) -> str:
+        return self.dumpb(obj, indent, sort_keys, default).decode()
+
+    def dumpb(self, obj: Any, indent: int | None, sort_keys: bool, default: Default) -> bytes:
+        if indent not in (None, 2):
+            return self._fallback.dumpb(obj, indent, sort_keys, default)
+        options = self._options
+        if indent == 2:
+            options |= self._orjson.OPT_INDENT_2
+        if sort_keys:
+            options |= self._orjson.OPT_SORT_KEYS
+        if default is not None:
+            # Hand these to default, as the standard library does, instead of encoding them natively
+            options |= self._orjson.OPT_PASSTHROUGH_DATETIME | self._orjson.OPT_PASSTHROUGH_DATACLASS
+        try:
+            return self._orjson.dumps(obj, default=default, option=options)
+        except TypeError:
+            # Out-of-range integers and the like; the fallback raises if the value is truly not JSON
+            return self._fallback.dumpb(obj, indent, sort_keys, default)
+
+
+class _MsgspecBackend:
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self._decode = msgspec.json.decode
+        self._fallback = _StdlibBackend()
+
+    def loads(self, data: str | bytes) -> Any:
+        try:
+            return self._decode(data)
+        except self._msgspec.DecodeError as e:
+            text = data if isinstance(data, str) else bytes(data).decode("utf-8", "replace")
+            raise JSONDecodeError(str(e), text, 0) from None
+
+    def dumps(self, obj: Any, indent: int | None, sort_keys: bool, default: Default) -> str:
+        return self.dumpb(obj, indent, sort_keys, default).decode()
+
+    def dumpb(self, obj: Any, indent: int | None, sort_keys: bool, default: Default) -> bytes:
+        if default is not None:
+            # msgspec encodes datetimes and dataclasses itself and cannot pass them to the hook
+            return self._fallback.dumpb(obj, indent, sort_keys, default)
+        try:
+            encoded = self._msgspec.json.encode(obj, order="sorted" if sort_keys else None)
+        except (TypeError, OverflowError, self._msgspec.EncodeError):
+            return self._fallback.dumpb(obj, indent, sort_keys, default)
+        return encoded if indent is None else self._msgspec.json.format(encoded, indent=indent)
+
+
+_FACTORIES: dict[str, Callable[[], Any]] = {
+    "orjson": _OrjsonBackend,
+    "msgspec": _MsgspecBackend,
+    "json": _StdlibBackend,
+}
+
+_backend: Any = None
+
+
+def available_backends() -> list[str]:
+    """Names of the backends that can be used in this environment, fastest first."""
+    names = []
+    for name in BACKENDS:
+        try:
+            _FACTORIES[name]()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend() -> str:
+    """Name of the backend in use, choosing one on first use."""
+    return _get().name
+
+
+def set_backend(name: str | None) -> None:
+    """Use the named backend (None resets to FORGE_JSON_BACKEND or the fastest installed).
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the backend's library is not installed
+    """
+    global _backend
+    if name is None:
+        _backend = None
+        return
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend '{name}'. Must be one of: {', '.join(BACKENDS)}")
+    _backend = _FACTORIES[name]()
+
+
+def _get() -> Any:
+    global _backend
+    if _backend is None:
+        preferred = os.environ.get("FORGE_JSON_BACKEND")
+        names = [preferred] if preferred in _FACTORIES else []
+        for name in [*names, *BACKENDS]:
+            try:
+                _backend = _FACTORIES[name]()
+                break
+            except ImportError:
+                continue
+    return _backend
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Decode a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return _get().loads(data)
+
+
+def load(fp: IO[str] | IO[bytes]) -> Any:
+    """Decode the JSON document in a text or binary file."""
+    return loads(fp.read())
+
+
+def dumps(obj: Any, *, indent: int | None = None, sort_keys: bool = False, default: Default = None) -> str:
+    """Encode obj as a JSON string.
+
+    Args:
+        obj: Value to encode
+        indent: Pretty-print with this indent; None is compact
+        sort_keys: Sort object keys
+        default: Called with values that cannot be encoded and returns an encodable one
+    """
+    return _get().dumps(obj, indent, sort_keys, default)
+
+
+def dumpb(obj: Any, *, indent: int | None = None, sort_keys: bool = False, default: Default = None) -> bytes:
+    """Encode obj as UTF-8 JSON bytes (see dumps)."""
+    return _get().dumpb(obj, indent, sort_keys, default)
+
+
+def dump(
+    obj: Any,
+    fp: IO[str] | IO[bytes],
+    *,
+    indent: int | None = None,
+    sort_keys: bool = False,
+    default: Default = None,
+) -> None:
+    """Encode obj into a file, as bytes if it was opened in binary mode."""
+    if "b" in getattr(fp, "mode", "") or not hasattr(fp, "encoding"):
+        fp.write(dumpb(obj, indent=indent, sort_keys=sort_keys, default=default))
+    else:
+        fp.write(dumps(obj, indent=indent, sort_keys=sort_keys, default=default))
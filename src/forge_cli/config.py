@@ -41,12 +41,21 @@ class AppConfig(BaseModel):
     server_url: str = Field(
         default_factory=lambda: os.environ.get("KNOWLEDGE_FORGE_URL", "http://localhost:9999"), alias="server"
     )
+    no_cache: bool = False  # Bypass the on-disk HTTP cache of read-mostly endpoints
+    stats_file: str | None = None  # Write per-endpoint client metrics as JSON here at exit
+    compress_threshold: int = Field(default=16 * 1024, ge=0)  # Gzip request bodies from this size (0 disables)
+    # Client-side limits per endpoint class ("uploads", "searches", ...): "RATE[/CONCURRENCY]"
+    request_limits: dict[str, str] = Field(default_factory=dict, alias="rate_limit")
+    breaker_threshold: int = Field(default=5, ge=0)  # Consecutive failures that open a circuit (0 disables)
+    breaker_reset: float = Field(default=30.0, gt=0)  # Seconds an open circuit fails fast before probing
 
     # Display settings
     debug: bool = False
     render_format: str = Field(default="rich", alias="render")
     quiet: bool = False
     throttle_ms: int = Field(default=0, ge=0, alias="throttle")
+    stream_pipeline: bool = Field(default=False, alias="pipeline")  # Read, parse and render streams on separate threads
+    scrollback: bool = False  # Commit finished output to scrollback instead of one live region
 
     # Chat mode
     chat_mode: bool = Field(default=False, alias="chat")
@@ -76,6 +85,26 @@ class AppConfig(BaseModel):
                 raise ValueError(f"Invalid vector store ID: {vec_id}")
         return v
 
+    @field_validator("request_limits", mode="before")
+    @classmethod
+    def validate_request_limits(cls, v: dict[str, str] | list[str]) -> dict[str, str]:
+        """Accept CLASS=RATE[/CONCURRENCY] strings and check classes and limits."""
+        from forge_cli.sdk.limits import ENDPOINT_CLASSES, LimitSettings
+
+        if isinstance(v, list):
+            pairs = []
+            for item in v:
+                name, sep, spec = item.partition("=")
+                if not sep:
+                    raise ValueError(f"Invalid rate limit '{item}', expected CLASS=RATE[/CONCURRENCY]")
+                pairs.append((name.strip(), spec.strip()))
+            v = dict(pairs)
+        for name, spec in v.items():
+            if name not in ENDPOINT_CLASSES:
+                raise ValueError(f"Unknown endpoint class '{name}'. Must be one of: {', '.join(ENDPOINT_CLASSES)}")
+            LimitSettings.parse(spec)
+        return v
+
     @field_validator("server_url")
     @classmethod
     def validate_server_url(cls, v: str) -> str:
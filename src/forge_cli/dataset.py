@@ -3,11 +3,12 @@ from __future__ import annotations
 
 """Common utilities and data structures for Knowledge Forge commands."""
 
-import json
 import os
 
 from pydantic import BaseModel, Field
 
+from .common import jsoncodec
+
 
 class FileEntry(BaseModel):
     """Represents a file entry in the test dataset."""
@@ -41,8 +42,8 @@ class Dataset(BaseModel):
         if not os.path.exists(json_path):
             raise FileNotFoundError(f"Test dataset file not found: {json_path}")
 
-        with open(json_path) as f:
-            data = json.load(f)
+        with open(json_path, "rb") as f:
+            data = jsoncodec.load(f)
 
         # Use Pydantic's validation to parse the data
         return cls.model_validate(data)
@@ -61,8 +62,8 @@ class Dataset(BaseModel):
         Args:
             json_path: Path where the JSON file should be saved.
         """
-        with open(json_path, "w") as f:
-            json.dump(self.model_dump(), f, indent=4)
+        with open(json_path, "wb") as f:
+            jsoncodec.dump(self.model_dump(), f, indent=4)
 
     def get_file_by_id(self, file_id: str) -> FileEntry | None:
         """Get a file entry by its ID.
@@ -46,6 +46,12 @@ class DisplayFactory:
             )
             renderer = JsonRenderer(config=json_config)
 
+        elif config.render_format == "ndjson":
+            # Line-delimited JSON deltas for pipes, no Rich
+            from forge_cli.display.v3.renderers.ndjson import NdjsonDisplayConfig, NdjsonRenderer
+
+            renderer = NdjsonRenderer(config=NdjsonDisplayConfig(include_usage=not config.quiet))
+
         elif config.render_format == "plaintext":
             # Plain text output
             from forge_cli.display.v3.renderers.plaintext import PlaintextDisplayConfig, PlaintextRenderer
@@ -55,6 +61,7 @@ class DisplayFactory:
                 show_citations=True,
                 show_usage=not config.quiet,
                 show_metadata=config.debug,
+                scrollback=config.scrollback,
             )
             renderer = PlaintextRenderer(config=plain_config)
 
@@ -68,6 +75,7 @@ class DisplayFactory:
                 show_tool_details=True,
                 show_usage=not config.quiet,
                 show_metadata=config.debug,
+                scrollback=config.scrollback,
             )
             renderer = RichRenderer(config=display_config, in_chat_mode=in_chat_mode)
 
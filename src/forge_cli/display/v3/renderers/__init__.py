@@ -1,6 +1,7 @@
 """V3 Display renderers - pure output formatting implementations."""
 
 from .json import JsonDisplayConfig, JsonRenderer
+from .ndjson import NdjsonDisplayConfig, NdjsonRenderer
 from .plaintext import PlaintextDisplayConfig, PlaintextRenderer
 from .rich import RichDisplayConfig, RichRenderer
 
@@ -9,6 +10,8 @@ __all__ = [
     "RichDisplayConfig",
     "JsonRenderer",
     "JsonDisplayConfig",
+    "NdjsonRenderer",
+    "NdjsonDisplayConfig",
     "PlaintextRenderer",
     "PlaintextDisplayConfig",
 ]
@@ -0,0 +1,57 @@
+"""Cheap version fingerprints of output items, shared by the v3 renderers.
+
+A fingerprint changes whenever the part of an item a renderer shows changes, so
+renderers can skip items that did not change between two response snapshots
+without comparing them in full.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def content_fingerprint(content: Any) -> tuple:
+    """Cheap version fingerprint for a message content part."""
+    if content.type == "output_text":
+        return (content.type, len(content.text), len(content.annotations or []))
+    return (content.type, len(getattr(content, "refusal", "") or ""))
+
+
+def reasoning_fingerprint(item: Any) -> tuple:
+    """Cheap version fingerprint for a reasoning item."""
+    return (item.status, len(item.summary), sum(len(summary.text) for summary in item.summary))
+
+
+def tool_fingerprint(item: Any) -> tuple:
+    """Cheap version fingerprint for a tool call item.
+
+    Scalars and short strings are compared by value and long strings by length, which
+    covers status transitions and streamed arguments/code. Nested models and small
+    lists/dicts (queries, results, annotations) are fingerprinted element by element,
+    so an entry that changes in place is noticed; large containers fall back to their
+    length and last element.
+    """
+    return _signature(item)
+
+
+# Containers with at most this many entries are fingerprinted entry by entry
+SMALL_CONTAINER_SIZE = 32
+SHORT_STRING_LENGTH = 64
+
+
+def _signature(value: Any) -> Any:
+    if value is None or isinstance(value, bool | int | float):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= SHORT_STRING_LENGTH else len(value)
+    if isinstance(value, BaseModel):
+        return tuple((name, _signature(field)) for name, field in value)
+    if isinstance(value, dict):
+        if len(value) <= SMALL_CONTAINER_SIZE:
+            return tuple((key, _signature(entry)) for key, entry in value.items())
+        return (len(value),)
+    if isinstance(value, list | tuple):
+        if len(value) <= SMALL_CONTAINER_SIZE:
+            return tuple(_signature(entry) for entry in value)
+        return (len(value), _signature(value[-1]))
+    return type(value).__name__
@@ -1,6 +1,5 @@
 """JSON renderer for the v3 display system."""
 
-import json
 import sys
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, TextIO
@@ -12,6 +11,7 @@ from rich.panel import Panel
 from rich.syntax import Syntax
 
 from ..base import BaseRenderer
+from ....common import jsoncodec
 from ....common.logger import logger
 from ....display.citation_styling import long2circled
 from ....response._types import Response
@@ -116,11 +116,9 @@ class JsonRenderer(BaseRenderer):
 
             # Serialize to JSON
             if self._config.pretty_print:
-                json_output = json.dumps(
-                    json_data, indent=self._config.indent, ensure_ascii=False, default=self._json_serializer
-                )
+                json_output = jsoncodec.dumps(json_data, indent=self._config.indent, default=self._json_serializer)
             else:
-                json_output = json.dumps(json_data, ensure_ascii=False, default=self._json_serializer)
+                json_output = jsoncodec.dumps(json_data, default=self._json_serializer)
 
             # Store current JSON for live updates
             self._current_json = json_output
@@ -155,7 +153,7 @@ class JsonRenderer(BaseRenderer):
                 "message": str(e),
                 "response_id": response.id if hasattr(response, "id") else None,
             }
-            error_output = json.dumps(error_json, indent=self._config.indent)
+            error_output = jsoncodec.dumps(error_json, indent=self._config.indent)
 
             # Create Rich syntax highlighting for error
             error_syntax = Syntax(error_output, "json", theme="github-dark", line_numbers=False)
@@ -186,7 +184,7 @@ class JsonRenderer(BaseRenderer):
                         "finalized_at": self._get_current_timestamp(),
                     }
                 }
-                metadata_json = json.dumps(
+                metadata_json = jsoncodec.dumps(
                     final_metadata, indent=self._config.indent if self._config.pretty_print else None
                 )
 
@@ -484,7 +482,7 @@ class JsonRenderer(BaseRenderer):
         error_data = {"type": "error", "message": error, "timestamp": self._get_current_timestamp()}
 
         try:
-            json_output = json.dumps(error_data, indent=self._config.indent if self._config.pretty_print else None)
+            json_output = jsoncodec.dumps(error_data, indent=self._config.indent if self._config.pretty_print else None)
             self._output_stream.write(json_output)
             self._output_stream.write("\n")
             self._output_stream.flush()
@@ -507,7 +505,9 @@ class JsonRenderer(BaseRenderer):
             welcome_data["enabled_tools"] = config.enabled_tools
 
         try:
-            json_output = json.dumps(welcome_data, indent=self._config.indent if self._config.pretty_print else None)
+            json_output = jsoncodec.dumps(
+                welcome_data, indent=self._config.indent if self._config.pretty_print else None
+            )
             self._output_stream.write(json_output)
             self._output_stream.write("\n")
             self._output_stream.flush()
@@ -519,7 +519,9 @@ class JsonRenderer(BaseRenderer):
         request_data = {"type": "request_info", "timestamp": self._get_current_timestamp(), **info}
 
         try:
-            json_output = json.dumps(request_data, indent=self._config.indent if self._config.pretty_print else None)
+            json_output = jsoncodec.dumps(
+                request_data, indent=self._config.indent if self._config.pretty_print else None
+            )
             self._output_stream.write(json_output)
             self._output_stream.write("\n")
             self._output_stream.flush()
@@ -531,7 +533,9 @@ class JsonRenderer(BaseRenderer):
         status_data = {"type": "status", "message": message, "timestamp": self._get_current_timestamp()}
 
         try:
-            json_output = json.dumps(status_data, indent=self._config.indent if self._config.pretty_print else None)
+            json_output = jsoncodec.dumps(
+                status_data, indent=self._config.indent if self._config.pretty_print else None
+            )
             self._output_stream.write(json_output)
             self._output_stream.write("\n")
             self._output_stream.flush()
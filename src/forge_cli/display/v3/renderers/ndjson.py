@@ -0,0 +1,361 @@
+"""NDJSON delta renderer for the v3 display system.
+
+Writes one compact JSON object per line for every snapshot, containing only what
+changed since the previous snapshot, and a full record once the response is done.
+Nothing goes through Rich, so the output can be piped into jq or any line-oriented
+consumer and keeps up with the stream.
+
+Record types:
+
+- ``response.created``: first snapshot of a response (id, model, status)
+- ``output_item.added`` / ``output_item.updated``: a new or restructured output item, in full
+- ``output_item.removed``: output items from ``output_index`` on were dropped
+- ``content_part.added``: a new content part of a message
+- ``output_text.delta``: text appended to a message content part
+- ``output_text.annotation.added``: a new annotation on a message content part
+- ``reasoning_summary_text.delta`` / ``reasoning_summary.added``: reasoning summary growth
+- ``response.status`` / ``response.usage``: top-level status or usage changed
+- ``response.final``: the complete response, emitted once when it finishes
+"""
+
+import sys
+from typing import TYPE_CHECKING, Any, TextIO
+
+from pydantic import BaseModel, Field
+
+from ....common import jsoncodec
+from ....common.logger import logger
+from ....response._types import Response
+from ..base import BaseRenderer
+from .fingerprints import tool_fingerprint
+
+if TYPE_CHECKING:
+    from ....config import AppConfig
+
+# Response statuses after which the final record is written
+FINAL_STATUSES = frozenset({"completed", "failed", "incomplete", "cancelled"})
+
+
+class NdjsonDisplayConfig(BaseModel):
+    """Configuration for NDJSON renderer output options."""
+
+    include_usage: bool = Field(True, description="Whether to emit usage records")
+    include_final: bool = Field(True, description="Whether to emit the full response once it is done")
+    output_file: str | None = Field(None, description="File path to write NDJSON output (None for stdout)")
+    append_mode: bool = Field(False, description="Whether to append to output file or overwrite")
+    flush_every_event: bool = Field(True, description="Whether to flush the stream after every snapshot")
+
+
+class _ItemState:
+    """What has already been emitted for one output item."""
+
+    __slots__ = ("id", "type", "texts", "annotation_counts", "summaries", "fingerprint")
+
+    def __init__(self, item: Any):
+        self.id = getattr(item, "id", None)
+        self.type = item.type
+        self.texts: list[str | None] = []
+        self.annotation_counts: list[int] = []
+        self.summaries: list[str] = []
+        self.fingerprint: tuple = ()
+        self.capture(item)
+
+    def capture(self, item: Any) -> None:
+        """Record the item as fully emitted."""
+        if self.type == "message":
+            self.texts = [getattr(part, "text", None) for part in item.content]
+            self.annotation_counts = [len(getattr(part, "annotations", None) or []) for part in item.content]
+            self.fingerprint = (item.status,)
+        elif self.type == "reasoning":
+            self.summaries = [summary.text for summary in item.summary]
+            self.fingerprint = (item.status,)
+        else:
+            self.fingerprint = tool_fingerprint(item)
+
+
+class NdjsonRenderer(BaseRenderer):
+    """NDJSON delta renderer for v3 display system.
+
+    Each render_response() call is diffed against the previous snapshot with cheap
+    per-item bookkeeping (text lengths, annotation counts, tool fingerprints), so the
+    work and the bytes written per event are proportional to the change, not to the
+    size of the response.
+    """
+
+    def __init__(self, config: NdjsonDisplayConfig | None = None, output_stream: TextIO | None = None):
+        """Initialize NDJSON renderer.
+
+        Args:
+            config: Output configuration
+            output_stream: Output stream (defaults to stdout)
+        """
+        super().__init__()
+        self._config = config or NdjsonDisplayConfig()
+        self._output_stream = output_stream or sys.stdout
+        self._file_handle: TextIO | None = None
+
+        # Diff state of the response being streamed
+        self._response_id: str | None = None
+        self._items: list[_ItemState] = []
+        self._status: str | None = None
+        self._usage: dict | None = None
+        self._last_response: Response | None = None
+        self._final_written = False
+        self._record_count = 0
+
+        # Open output file if specified
+        if self._config.output_file:
+            try:
+                mode = "a" if self._config.append_mode else "w"
+                self._file_handle = open(self._config.output_file, mode, encoding="utf-8")
+                self._output_stream = self._file_handle
+            except Exception as e:
+                logger.error(f"Failed to open NDJSON output file, writing to stdout: {e}")
+
+    def render_response(self, response: Response) -> None:
+        """Write the changes since the previous snapshot as NDJSON records."""
+        self._ensure_not_finalized()
+
+        if response.id != self._response_id:
+            self._start_response(response)
+        else:
+            self._diff_top_level(response)
+        self._diff_output(response.output)
+        self._last_response = response
+
+        if response.status in FINAL_STATUSES:
+            self._write_final()
+        if self._config.flush_every_event:
+            self._output_stream.flush()
+
+    def finalize(self) -> None:
+        """Write the final record if the stream ended without one and release the output."""
+        try:
+            self._write_final()
+            self._output_stream.flush()
+            if self._file_handle:
+                self._file_handle.close()
+                self._file_handle = None
+        except Exception as e:
+            logger.error(f"Error during NDJSON renderer finalization: {e}")
+        finally:
+            super().finalize()
+
+    @property
+    def record_count(self) -> int:
+        """Number of records written so far."""
+        return self._record_count
+
+    # ------------------------------------------------------------------
+    # Diffing
+    # ------------------------------------------------------------------
+
+    def _start_response(self, response: Response) -> None:
+        self._response_id = response.id
+        self._items = []
+        self._status = response.status
+        self._usage = None
+        self._final_written = False
+        self._write(
+            {"type": "response.created", "response_id": response.id, "model": response.model, "status": response.status}
+        )
+        self._diff_usage(response)
+
+    def _diff_top_level(self, response: Response) -> None:
+        if response.status != self._status:
+            self._status = response.status
+            self._write({"type": "response.status", "status": response.status})
+        self._diff_usage(response)
+
+    def _diff_usage(self, response: Response) -> None:
+        if not self._config.include_usage or response.usage is None:
+            return
+        usage = response.usage.model_dump(mode="json", exclude_none=True)
+        if usage != self._usage:
+            self._usage = usage
+            self._write({"type": "response.usage", "usage": usage})
+
+    def _diff_output(self, output: list[Any]) -> None:
+        for index, item in enumerate(output):
+            if index >= len(self._items):
+                self._items.append(_ItemState(item))
+                self._write({"type": "output_item.added", "output_index": index, "item": _dump(item)})
+                continue
+
+            state = self._items[index]
+            if (
+                state.id != getattr(item, "id", None)
+                or state.type != item.type
+                or not self._diff_item(index, state, item)
+            ):
+                self._items[index] = _ItemState(item)
+                self._write({"type": "output_item.updated", "output_index": index, "item": _dump(item)})
+
+        if len(output) < len(self._items):
+            del self._items[len(output) :]
+            self._write({"type": "output_item.removed", "output_index": len(output)})
+
+    def _diff_item(self, index: int, state: _ItemState, item: Any) -> bool:
+        """Write delta records for one item.
+
+        Returns:
+            False if the item cannot be expressed as a delta and must be written in full.
+        """
+        if state.type == "message":
+            return self._diff_message(index, state, item)
+        if state.type == "reasoning":
+            return self._diff_reasoning(index, state, item)
+
+        fingerprint = tool_fingerprint(item)
+        # Tool calls are small; any change is written as the full item
+        return fingerprint == state.fingerprint
+
+    def _diff_message(self, index: int, state: _ItemState, item: Any) -> bool:
+        if len(item.content) < len(state.texts):
+            return False
+
+        records = []
+        for part_index, part in enumerate(item.content):
+            if part_index >= len(state.texts):
+                records.append(
+                    {
+                        "type": "content_part.added",
+                        "output_index": index,
+                        "content_index": part_index,
+                        "part": _dump(part),
+                    }
+                )
+                continue
+
+            previous = state.texts[part_index]
+            text = getattr(part, "text", None)
+            if text != previous:
+                if previous is None or text is None or not text.startswith(previous):
+                    return False
+                records.append(
+                    {
+                        "type": "output_text.delta",
+                        "output_index": index,
+                        "content_index": part_index,
+                        "delta": text[len(previous) :],
+                    }
+                )
+
+            annotations = getattr(part, "annotations", None) or []
+            known = state.annotation_counts[part_index]
+            if len(annotations) < known:
+                return False
+            for annotation_index in range(known, len(annotations)):
+                records.append(
+                    {
+                        "type": "output_text.annotation.added",
+                        "output_index": index,
+                        "content_index": part_index,
+                        "annotation_index": annotation_index,
+                        "annotation": _dump(annotations[annotation_index]),
+                    }
+                )
+
+        if item.status != state.fingerprint[0]:
+            records.append({"type": "output_item.status", "output_index": index, "status": item.status})
+
+        for record in records:
+            self._write(record)
+        state.capture(item)
+        return True
+
+    def _diff_reasoning(self, index: int, state: _ItemState, item: Any) -> bool:
+        if len(item.summary) < len(state.summaries):
+            return False
+
+        records = []
+        for summary_index, summary in enumerate(item.summary):
+            if summary_index >= len(state.summaries):
+                records.append(
+                    {
+                        "type": "reasoning_summary.added",
+                        "output_index": index,
+                        "summary_index": summary_index,
+                        "text": summary.text,
+                    }
+                )
+                continue
+
+            previous = state.summaries[summary_index]
+            if summary.text != previous:
+                if not summary.text.startswith(previous):
+                    return False
+                records.append(
+                    {
+                        "type": "reasoning_summary_text.delta",
+                        "output_index": index,
+                        "summary_index": summary_index,
+                        "delta": summary.text[len(previous) :],
+                    }
+                )
+
+        if item.status != state.fingerprint[0]:
+            records.append({"type": "output_item.status", "output_index": index, "status": item.status})
+
+        for record in records:
+            self._write(record)
+        state.capture(item)
+        return True
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def _write_final(self) -> None:
+        if not self._config.include_final or self._final_written or self._last_response is None:
+            return
+        self._final_written = True
+        self._write({"type": "response.final", "response": _dump(self._last_response)})
+
+    def _write(self, record: dict[str, Any]) -> None:
+        self._output_stream.write(jsoncodec.dumps(record, default=str))
+        self._output_stream.write("\n")
+        self._record_count += 1
+
+    # Additional methods for compatibility with Display interface
+    def render_error(self, error: str) -> None:
+        """Render error message as an NDJSON record."""
+        try:
+            self._write({"type": "error", "message": error})
+            self._output_stream.flush()
+        except Exception as e:
+            logger.error(f"Failed to render error as NDJSON: {e}")
+
+    def render_welcome(self, config: "AppConfig") -> None:
+        """Render welcome information as an NDJSON record."""
+        welcome_data = {"type": "welcome", "model": getattr(config, "model", None)}
+        if getattr(config, "enabled_tools", None):
+            welcome_data["enabled_tools"] = config.enabled_tools
+        try:
+            self._write(welcome_data)
+            self._output_stream.flush()
+        except Exception as e:
+            logger.error(f"Failed to render welcome as NDJSON: {e}")
+
+    def render_request_info(self, info: dict) -> None:
+        """Render request information as an NDJSON record."""
+        try:
+            self._write({"type": "request_info", **info})
+            self._output_stream.flush()
+        except Exception as e:
+            logger.error(f"Failed to render request info as NDJSON: {e}")
+
+    def render_status(self, message: str) -> None:
+        """Render status message as an NDJSON record."""
+        try:
+            self._write({"type": "status", "message": message})
+            self._output_stream.flush()
+        except Exception as e:
+            logger.error(f"Failed to render status as NDJSON: {e}")
+
+
+def _dump(model: Any) -> Any:
+    """Serialize a pydantic model (or plain value) for a record."""
+    if hasattr(model, "model_dump"):
+        return model.model_dump(mode="json", exclude_none=True)
+    return model
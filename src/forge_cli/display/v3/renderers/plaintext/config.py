@@ -17,6 +17,9 @@ class PlaintextDisplayConfig(BaseModel):
     indent_size: int = Field(2, description="Number of spaces for indentation")
     separator_char: str = Field("─", description="Character for separators")
     separator_length: int = Field(60, description="Length of separator lines")
+    scrollback: bool = Field(
+        False, description="Print finished output to scrollback and keep only the in-progress tail live"
+    )
 
     @field_validator("refresh_rate")
     @classmethod
@@ -22,6 +22,8 @@ from forge_cli.response.type_guards import (
 )
 
 from ...base import BaseRenderer
+from ..rich.streaming_markdown import StreamingMarkdown
+from ..scrollback import ScrollbackCommitter, ScrollbackSegment, is_item_finished
 from .....common.logger import logger
 from .config import PlaintextDisplayConfig
 from .styles import PlaintextStyles
@@ -86,6 +88,11 @@ class PlaintextRenderer(BaseRenderer):
         self._start_time = time.time()
         self._render_count = 0
 
+        # Scrollback mode: finished output already printed above the live region, and
+        # incremental markdown state per message part
+        self._committer = ScrollbackCommitter(self._console)
+        self._markdown_streams: dict[tuple[str, int], StreamingMarkdown] = {}
+
     def render_response(self, response: Response) -> None:
         """Render a complete response snapshot using modular components.
 
@@ -99,7 +106,10 @@ class PlaintextRenderer(BaseRenderer):
             self._start_live_display()
 
         # Create content using modular renderers and Group
-        content = self._create_response_group_modular(response)
+        if self._config.scrollback:
+            content = self._create_scrollback_group(response)
+        else:
+            content = self._create_response_group_modular(response)
 
         # Save current content for potential final print
         self._current_content = content
@@ -146,18 +156,40 @@ class PlaintextRenderer(BaseRenderer):
 
     def _create_response_group_modular(self, response: Response) -> Group:
         """Create Rich Group from complete response snapshot using modular renderers."""
-        renderables = []
+        renderables = [r for segment in self._build_segments(response) for r in segment.renderables]
+        return Group(*renderables)
+
+    def _create_scrollback_group(self, response: Response) -> Group:
+        """Print newly finished output to scrollback and return the live tail."""
+        return Group(*self._committer.commit(self._build_segments(response)))
+
+    def _build_segments(self, response: Response) -> list[ScrollbackSegment]:
+        """Build the ordered renderables of a snapshot together with their finished state."""
+        if response.id != self._last_response_id:
+            self._markdown_streams.clear()
+            self._committer.reset()
+
+        segments = []
+        last_index = len(response.output) - 1
 
         # Process output items in their original order to preserve event sequence
-        for item in response.output:
+        for index, item in enumerate(response.output):
+            item_key = getattr(item, "id", None) or f"output-{index}"
+            finished = is_item_finished(item, index == last_index)
+            renderables = []
+
             if is_message_item(item):
                 # Use message content renderer for each content item
-                for content in item.content:
+                for part_index, content in enumerate(item.content):
+                    if self._config.scrollback and content.type == "output_text":
+                        segments.extend(self._message_segments((item_key, part_index), content.text, finished))
+                        continue
                     message_renderable = PlaintextMessageContentRenderer.from_content(
                         content, self._styles
                     )
                     if message_renderable:
-                        renderables.append(message_renderable)
+                        segments.append(ScrollbackSegment((item_key, part_index), [message_renderable], finished))
+                continue
 
             elif is_reasoning_item(item) and self._config.show_reasoning:
                 # Use reasoning renderer for single item
@@ -178,26 +210,42 @@ class PlaintextRenderer(BaseRenderer):
                     if tool_renderable:
                         renderables.append(tool_renderable)
 
+            segments.append(ScrollbackSegment(item_key, renderables, finished))
+
+        # Citations and usage keep changing until the response ends, so they always stay live
+        tail = []
+
         # Add citations section using citations renderer
         citations_renderable = PlaintextCitationsRenderer.from_response(
             response, self._styles, self._config
         ).render()
         if citations_renderable:
-            renderables.append(citations_renderable)
+            tail.append(citations_renderable)
 
         # Add usage statistics using usage renderer
         usage_renderable = PlaintextUsageRenderer.from_response(
             response, self._render_count, self._styles, self._config
         ).render()
         if usage_renderable:
-            renderables.append(usage_renderable)
-
-        new_renderables = []
-        for renderable in renderables:
-            new_renderables.append(renderable)
-            # new_renderables.append(Text("\n"))
-        # Return Group containing all renderables
-        return Group(*new_renderables)
+            tail.append(usage_renderable)
+
+        segments.append(ScrollbackSegment("__footer__", tail, False))
+        return segments
+
+    def _message_segments(self, key: tuple[str, int], text: str, finished: bool) -> list[ScrollbackSegment]:
+        """Split streaming message text into one finished segment per frozen markdown block plus its open tail.
+
+        Only blocks StreamingMarkdown has frozen are final; all other blocks stay in the tail.
+        """
+        stream = self._markdown_streams.get(key)
+        if stream is None:
+            stream = self._markdown_streams[key] = StreamingMarkdown()
+
+        parts = stream.update(text).renderables
+        frozen = stream.frozen_part_count
+        segments = [ScrollbackSegment((*key, i), [part], True) for i, part in enumerate(parts[:frozen])]
+        segments.append(ScrollbackSegment((*key, "tail"), list(parts[frozen:]), finished))
+        return segments
 
     def _get_tool_renderer(self, tool_item: Any):
         """Get the appropriate specialized renderer for a tool item.
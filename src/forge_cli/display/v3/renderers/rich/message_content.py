@@ -1,28 +1,35 @@
 """Message content renderer for Rich display system."""
 
+from rich.console import Group
 from rich.markdown import Markdown
 from forge_cli.display.citation_styling import long2circled
 from ..rendable import Rendable
+from .streaming_markdown import StreamingMarkdown
 
 
 class MessageContentRenderer(Rendable):
     """Renderer for message content (text/refusal) with proper formatting."""
     
-    def __init__(self, content):
+    def __init__(self, content, markdown_stream: StreamingMarkdown | None = None):
         """Initialize the message content renderer.
         
         Args:
             content: The message content to render
+            markdown_stream: Optional StreamingMarkdown kept across snapshots of the same
+                content part, so only its open trailing blocks are re-parsed
         """
         self.content = content
+        self.markdown_stream = markdown_stream
     
-    def render(self) -> Markdown | None:
+    def render(self) -> Markdown | Group | None:
         """Render message content as Markdown object.
         
         Returns:
             Markdown object with formatted content or None if no content
         """
-        if self.content.type == "output_text":
+        if self.content.type == "output_text" and self.markdown_stream is not None:
+            return self.markdown_stream.update(self.content.text)
+        elif self.content.type == "output_text":
             # Convert long-style citation markers to circled digits
             converted_text = long2circled(self.content.text)
             return Markdown(converted_text)
@@ -33,13 +40,14 @@ class MessageContentRenderer(Rendable):
 
 
 # Legacy function for backward compatibility
-def render_message_content(content) -> Markdown | None:
+def render_message_content(content, markdown_stream: StreamingMarkdown | None = None) -> Markdown | Group | None:
     """Legacy function wrapper for backward compatibility.
     
     Args:
         content: The message content to render
+        markdown_stream: Optional StreamingMarkdown for incremental rendering
         
     Returns:
         Markdown object with formatted content or None if no content
     """
-    return MessageContentRenderer(content).render() 
\ No newline at end of file
+    return MessageContentRenderer(content, markdown_stream).render() 
\ No newline at end of file
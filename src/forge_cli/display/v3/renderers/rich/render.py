@@ -8,6 +8,7 @@ from rich.console import Console, Group
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.rule import Rule
 from rich.text import Text
 
 from forge_cli.response._types.response import Response
@@ -28,6 +29,8 @@ from forge_cli.style.markdowns import convert_to_blockquote
 from ...base import BaseRenderer
 from ...style import ICONS, STATUS_ICONS, pack_queries, sliding_display
 from ...builder import TextBuilder
+from ..fingerprints import content_fingerprint, reasoning_fingerprint, tool_fingerprint
+from ..scrollback import ScrollbackCommitter, ScrollbackSegment, is_item_finished
 
 # Import from our new modular structure
 from .tools import (
@@ -41,6 +44,7 @@ from .tools import (
 )
 from .reason import render_reasoning_item
 from .message_content import render_message_content
+from .streaming_markdown import StreamingMarkdown
 from .citations import render_citations
 from .usage import UsageRenderer
 from .welcome import render_welcome
@@ -48,6 +52,18 @@ from .welcome import render_welcome
 if TYPE_CHECKING:
     from ....config import AppConfig
 
+TOOL_CALL_TYPES = frozenset(
+    {
+        "file_search_call",
+        "web_search_call",
+        "list_documents_call",
+        "file_reader_call",
+        "page_reader_call",
+        "code_interpreter_call",
+        "function_call",
+    }
+)
+
 
 class RichDisplayConfig(BaseModel):
     """Configuration for Rich renderer display options."""
@@ -62,6 +78,9 @@ class RichDisplayConfig(BaseModel):
     show_tool_annotations: bool = Field(True, description="Whether to show tool search results/annotations")
     max_annotations_per_tool: int = Field(5, description="Maximum number of annotations to show per tool")
     show_annotation_snippets: bool = Field(False, description="Whether to show snippets in annotations")
+    scrollback: bool = Field(
+        False, description="Print finished output to scrollback and keep only the in-progress tail live"
+    )
 
     @field_validator("refresh_rate")
     @classmethod
@@ -123,6 +142,15 @@ class RichRenderer(BaseRenderer):
         self._start_time = time.time()
         self._render_count = 0
 
+        # Per-item render cache: (item id, part index) -> (fingerprint, renderables)
+        self._render_cache: dict[tuple[str, int], tuple[tuple, list]] = {}
+        self._render_cache_hits = 0
+        self._render_cache_misses = 0
+        # Incremental markdown state per message part, same keys as the render cache
+        self._markdown_streams: dict[tuple[str, int], StreamingMarkdown] = {}
+        # Finished output already printed above the live region (scrollback mode)
+        self._committer = ScrollbackCommitter(self._console)
+
     def render_response(self, response: Response) -> None:
         """Render a complete response snapshot.
 
@@ -136,7 +164,10 @@ class RichRenderer(BaseRenderer):
             self._start_live_display()
 
         # Create rich content from response
-        content = self._create_response_content(response)
+        if self._config.scrollback:
+            content = self._create_scrollback_content(response)
+        else:
+            content = self._create_response_content(response)
 
         # Save current content for potential final print
         self._current_content = content
@@ -160,6 +191,9 @@ class RichRenderer(BaseRenderer):
             self._live = None
             self._live_started = False
 
+        self._render_cache.clear()
+        self._markdown_streams.clear()
+
         # Call parent finalize
         super().finalize()
 
@@ -178,59 +212,13 @@ class RichRenderer(BaseRenderer):
             self._live_started = True
 
     def _create_response_content(self, response: Response):
-        """Create rich content from complete response snapshot using Group."""
-        renderables = []
+        """Create rich content from complete response snapshot using Group.
 
-        # Iterate through output items maintaining order
-        for item in response.output:
-            if is_message_item(item):
-                for content in item.content:
-                    rendered_content = render_message_content(content)
-                    if rendered_content:
-                        renderables.append(rendered_content)
-            elif item.type in [
-                "file_search_call",
-                "web_search_call", 
-                "list_documents_call",
-                "file_reader_call",
-                "page_reader_call",
-                "code_interpreter_call",
-                "function_call",
-            ]:
-                # Use fully self-contained tool renderers!
-                tool_renderer = self._get_tool_renderer(item)
-                if tool_renderer:
-                    # Get complete tool content from single render() method
-                    tool_content = tool_renderer.render()
-                    if tool_content:
-                        if isinstance(tool_content, list):
-                            # If it's a list, add each item as a separate renderable
-                            for item_content in tool_content:
-                                if item_content:  # Skip empty items
-                                    if isinstance(item_content, str):
-                                        renderables.append(Text(item_content))
-                                    else:
-                                        renderables.append(item_content)
-                        else:
-                            # Single item
-                            if isinstance(tool_content, str):
-                                renderables.append(Text(tool_content))
-                            else:
-                                renderables.append(tool_content)
-            elif is_reasoning_item(item):
-                rendered_reasoning = render_reasoning_item(item)
-                if rendered_reasoning:
-                    renderables.append(rendered_reasoning)
-
-        # References section - using type-based API
-        citations = self._extract_all_citations(response)
-        if citations:
-            citations_content = render_citations(citations)
-            if citations_content:
-                if isinstance(citations_content, str):
-                    renderables.append(Text(citations_content))
-                else:
-                    renderables.append(citations_content)
+        Renderables are cached per output item (and per message part) together with a
+        cheap version fingerprint, so only items that changed since the previous
+        snapshot - normally just the one that is streaming - are rebuilt.
+        """
+        renderables = [r for segment in self._build_segments(response) for r in segment.renderables]
 
         # Create Group to combine all renderables
         if renderables:
@@ -238,23 +226,145 @@ class RichRenderer(BaseRenderer):
         else:
             group_content = Text("-")
 
-        # Create the title format with usage information using specialized renderer
-        panel_title = ""
-        if response.usage:
-            usage_renderer = UsageRenderer.from_usage_object(response.usage)
-            panel_title = usage_renderer.render()
-
         # Determine panel style based on response status
         border_style, title_style = self._get_panel_style(response)
 
         return Panel(
             group_content,
-            title=panel_title,
+            title=self._usage_title(response),
             border_style=border_style,
             title_align="left",
             padding=(1, 2),
         )
 
+    def _create_scrollback_content(self, response: Response):
+        """Print newly finished output to scrollback and return the live tail.
+
+        Scrollback is append-only, so there is no surrounding panel in this mode; the
+        usage line is drawn as a rule under the tail instead.
+        """
+        tail = self._committer.commit(self._build_segments(response))
+
+        usage_title = self._usage_title(response)
+        if usage_title:
+            border_style, _ = self._get_panel_style(response)
+            tail.append(Rule(usage_title, align="left", style=border_style))
+        return Group(*tail)
+
+    def _build_segments(self, response: Response) -> list[ScrollbackSegment]:
+        """Build the ordered, cached renderables of a snapshot with their finished state."""
+        if response.id != self._last_response_id:
+            self._render_cache.clear()
+            self._markdown_streams.clear()
+            self._committer.reset()
+
+        segments = []
+        last_index = len(response.output) - 1
+
+        # Iterate through output items maintaining order
+        for index, item in enumerate(response.output):
+            item_key = getattr(item, "id", None) or f"output-{index}"
+            finished = is_item_finished(item, index == last_index)
+            if is_message_item(item):
+                for part_index, content in enumerate(item.content):
+                    key = (item_key, part_index)
+                    renderables = self._get_cached_renderables(
+                        key,
+                        content_fingerprint(content),
+                        lambda content=content, key=key: [
+                            render_message_content(content, self._get_markdown_stream(key))
+                        ],
+                    )
+                    segments.extend(self._message_segments(key, renderables, finished))
+            elif item.type in TOOL_CALL_TYPES:
+                renderables = self._get_cached_renderables(
+                    (item_key, 0),
+                    tool_fingerprint(item),
+                    lambda item=item: self._render_tool_item(item),
+                )
+                segments.append(ScrollbackSegment((item_key, 0), renderables, finished))
+            elif is_reasoning_item(item):
+                renderables = self._get_cached_renderables(
+                    (item_key, 0),
+                    reasoning_fingerprint(item),
+                    lambda item=item: [render_reasoning_item(item)],
+                )
+                segments.append(ScrollbackSegment((item_key, 0), renderables, finished))
+
+        # References section - using type-based API; it keeps growing until the response ends
+        citations = self._extract_all_citations(response)
+        if citations:
+            renderables = self._get_cached_renderables(
+                ("__citations__", 0),
+                (len(citations),),
+                lambda: [render_citations(citations)],
+            )
+            segments.append(ScrollbackSegment(("__citations__", 0), renderables, False))
+
+        return segments
+
+    def _message_segments(self, key: tuple[str, int], renderables: list, finished: bool) -> list[ScrollbackSegment]:
+        """Split a message part into one finished segment per frozen markdown block plus its open tail.
+
+        Only blocks StreamingMarkdown has frozen are final; all other blocks stay in the tail.
+        """
+        stream = self._markdown_streams.get(key)
+        if not self._config.scrollback or stream is None or len(renderables) != 1:
+            return [ScrollbackSegment(key, renderables, finished)]
+        if not isinstance(renderables[0], Group):
+            return [ScrollbackSegment(key, renderables, finished)]
+
+        parts = renderables[0].renderables
+        frozen = stream.frozen_part_count
+        segments = [ScrollbackSegment((*key, i), [part], True) for i, part in enumerate(parts[:frozen])]
+        segments.append(ScrollbackSegment((*key, "tail"), list(parts[frozen:]), finished))
+        return segments
+
+    def _usage_title(self, response: Response) -> str:
+        """Format the usage line shown as panel title (or rule in scrollback mode)."""
+        if not response.usage:
+            return ""
+        return UsageRenderer.from_usage_object(response.usage).render()
+
+    def _get_cached_renderables(self, key: tuple[str, int], fingerprint: tuple, build) -> list:
+        """Return cached renderables for key, rebuilding them only if the fingerprint changed."""
+        cached = self._render_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            self._render_cache_hits += 1
+            return cached[1]
+
+        self._render_cache_misses += 1
+        renderables = [Text(r) if isinstance(r, str) else r for r in build() if r]
+        self._render_cache[key] = (fingerprint, renderables)
+        return renderables
+
+    def _get_markdown_stream(self, key: tuple[str, int]) -> StreamingMarkdown:
+        """Return the StreamingMarkdown that tracks one message content part."""
+        stream = self._markdown_streams.get(key)
+        if stream is None:
+            stream = self._markdown_streams[key] = StreamingMarkdown()
+        return stream
+
+    def _render_tool_item(self, item: Any) -> list:
+        """Render a tool call item with its self-contained tool renderer."""
+        tool_renderer = self._get_tool_renderer(item)
+        if not tool_renderer:
+            return []
+        # Get complete tool content from single render() method
+        tool_content = tool_renderer.render()
+        if isinstance(tool_content, list):
+            return tool_content
+        return [tool_content]
+
+    @property
+    def render_cache_stats(self) -> dict[str, int]:
+        """Render cache hit/miss counters (per output item, accumulated over the renderer's life)."""
+        return {
+            "hits": self._render_cache_hits,
+            "misses": self._render_cache_misses,
+            "entries": len(self._render_cache),
+        }
+
     def _get_tool_renderer(self, tool_item: Any):
         """Get the appropriate specialized renderer for a tool item."""
         tool_type = tool_item.type
@@ -0,0 +1,199 @@
+"""Streaming Markdown renderer that freezes completed top-level blocks."""
+
+import re
+from collections.abc import Callable
+
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+from rich.console import Console, ConsoleOptions, Group, RenderResult
+from rich.markdown import Markdown
+from rich.segment import Segment
+
+from forge_cli.display.citation_styling import long2circled
+
+# Tokens rich.markdown.Markdown consumes as inline text/styles; every other closing or
+# self-closing token is an element that updates Rich's new_line flag.
+INLINE_TOKEN_TYPES = frozenset({"text", "hardbreak", "softbreak", "link_open", "link_close", "html_inline"})
+INLINE_STYLE_TAGS = frozenset(Markdown.inlines)
+
+# Tokens after which Rich does not insert a blank line
+NO_NEW_LINE_TOKENS = frozenset({"hr"})
+
+# Bracketed text not followed by an inline link target: a reference that a "[label]: url"
+# line further down may define (or, while that line is still streaming, define differently)
+REFERENCE = re.compile(r"\[[^\]]*\](?!\()")
+CODE_SPAN = re.compile(r"`+[^`]*`+")
+
+
+class _BlankLine:
+    """The bare newline Rich's Markdown emits between top-level elements."""
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        yield Segment.line()
+
+
+class _Block:
+    """A top-level Markdown block, its renderable and how Rich spaces it."""
+
+    __slots__ = ("renderable", "leading_blank", "new_line")
+
+    def __init__(self, renderable: Markdown, tokens: list[Token]):
+        self.renderable = renderable
+        # Whether rendering the block on its own already decides the blank line before
+        # it: Rich sets new_line whenever a nested element closes, so containers and
+        # some empty elements carry their own leading spacing.
+        self.leading_blank = _has_inner_element_close(tokens)
+        self.new_line = tokens[0].type not in NO_NEW_LINE_TOKENS
+
+
+def _flatten(tokens: list[Token]):
+    """Flatten tokens the same way rich.markdown.Markdown does."""
+    for token in tokens:
+        if token.children and not (token.type == "fence" or token.tag == "img"):
+            yield from _flatten(token.children)
+        else:
+            yield token
+
+
+def _may_reference_later(tokens: list[Token]) -> bool:
+    """Whether the block may use a reference whose definition can still appear or change."""
+    return any(token.type == "inline" and REFERENCE.search(CODE_SPAN.sub("", token.content)) for token in tokens)
+
+
+def _has_inner_element_close(tokens: list[Token]) -> bool:
+    """Whether a nested element closes before the block's own (last) token."""
+    for token in _flatten(tokens[:-1]):
+        if token.nesting == 1 or token.type in INLINE_TOKEN_TYPES:
+            continue
+        if token.tag in INLINE_STYLE_TAGS and token.type not in ("fence", "code_block"):
+            continue
+        return True
+    return False
+
+
+class StreamingMarkdown:
+    """Incrementally render a growing Markdown document.
+
+    The text is split into top-level blocks (paragraphs, headings, lists, fences,
+    tables, quotes). A block is final, and its Markdown built once and reused, only
+    when no text appended later can change how it renders:
+
+    - it is followed by a block that is itself complete, so the last two blocks stay
+      open: the last block may still turn out to continue the one before it (the next
+      item of a list, making a tight list loose)
+    - it has no literal bracketed text, which a reference definition further down the
+      document would turn into a link; such a block keeps every block after it open
+
+    Reference definitions in frozen text are kept and prepended to the text of every
+    block rendered later. Each update only re-parses the open blocks, and the
+    citation conversion runs only on text that has not been frozen yet.
+
+    Once the stream completes, the stacked output is identical to rendering
+    Markdown(convert(text)) in one shot.
+    """
+
+    def __init__(self, convert: Callable[[str], str] | None = long2circled):
+        """
+        Args:
+            convert: Text transform applied before rendering (citation markers by default)
+        """
+        self._convert = convert or (lambda text: text)
+        # Same parser configuration rich.markdown.Markdown uses
+        self._parser = MarkdownIt().enable("strikethrough").enable("table")
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all frozen blocks."""
+        self._frozen_source = ""
+        self._definitions = ""  # reference definition lines of the frozen source
+        self._blocks: list[_Block] = []
+        self._tail_source: str | None = None
+        self._tail_block: _Block | None = None
+        self._frozen_part_count = 0
+
+    @property
+    def frozen_blocks(self) -> list[Markdown]:
+        """Renderables of all closed blocks, in document order."""
+        return [block.renderable for block in self._blocks]
+
+    @property
+    def frozen_length(self) -> int:
+        """Number of source characters covered by frozen blocks."""
+        return len(self._frozen_source)
+
+    @property
+    def frozen_part_count(self) -> int:
+        """Number of leading renderables in the last composed Group that belong to frozen blocks."""
+        return self._frozen_part_count
+
+    def update(self, text: str) -> Group:
+        """Render the current text, reusing every block closed in earlier updates."""
+        if not text.startswith(self._frozen_source):
+            # Text was rewritten rather than appended; start over.
+            self.reset()
+
+        open_text = text[len(self._frozen_source) :]
+        blocks = self._top_level_blocks(open_text)
+
+        final = 0
+        while final < len(blocks) - 2 and not _may_reference_later(blocks[final][0]):
+            final += 1
+        if final:
+            lines = open_text.split("\n")
+            covered = 0
+            for tokens, start, end in blocks[:final]:
+                self._add_definitions(lines[covered:start])
+                source = "\n".join(lines[start:end])
+                self._blocks.append(_Block(Markdown(self._convert(self._definitions + source)), tokens))
+                covered = end
+            tail_start = blocks[final][1]
+            self._add_definitions(lines[covered:tail_start])
+            frozen_chars = sum(len(line) + 1 for line in lines[:tail_start])
+            self._frozen_source += open_text[:frozen_chars]
+            open_text = open_text[frozen_chars:]
+            blocks = blocks[final:]
+
+        if open_text != self._tail_source:
+            self._tail_source = open_text
+            self._tail_block = None
+            if blocks and open_text.strip():
+                # Spacing before the open blocks is decided by the first of them
+                self._tail_block = _Block(Markdown(self._convert(self._definitions + open_text)), blocks[0][0])
+
+        return self._compose()
+
+    def _add_definitions(self, lines: list[str]) -> None:
+        """Keep the reference definitions among lines that lie between top-level blocks."""
+        definitions = "\n".join(line for line in lines if line.strip())
+        if definitions:
+            self._definitions += definitions + "\n\n"
+
+    def _compose(self) -> Group:
+        """Stack frozen blocks and the open tail the way Rich spaces top-level elements."""
+        renderables = []
+        previous: _Block | None = None
+        for block in self._blocks:
+            previous = self._append_block(renderables, previous, block)
+        # The spacing before the tail depends on the tail, so it is not part of the frozen prefix
+        self._frozen_part_count = len(renderables)
+        if self._tail_block is not None:
+            self._append_block(renderables, previous, self._tail_block)
+        return Group(*renderables)
+
+    @staticmethod
+    def _append_block(renderables: list, previous: _Block | None, block: _Block) -> _Block:
+        """Append block, preceded by the blank line Rich would put between it and previous."""
+        if previous is not None and previous.new_line and not block.leading_blank:
+            renderables.append(_BlankLine())
+        renderables.append(block.renderable)
+        return block
+
+    def _top_level_blocks(self, text: str) -> list[tuple[list[Token], int, int]]:
+        """Return (tokens, start line, end line) for each top-level block in text."""
+        blocks = []
+        for token in self._parser.parse(text):
+            if token.level == 0 and token.nesting in (0, 1) and token.map:
+                blocks.append(([token], token.map[0], token.map[1]))
+            elif blocks:
+                blocks[-1][0].append(token)
+        return blocks
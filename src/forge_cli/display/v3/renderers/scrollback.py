@@ -0,0 +1,84 @@
+"""Scrollback committing for live renderers.
+
+A transient Live region repaints everything it holds on every refresh. Once an answer
+is taller than the terminal that means repainting (and re-sending over SSH) the whole
+answer per frame. In scrollback mode the renderers print every finished piece of the
+response above the Live region exactly once and keep only the in-progress tail live,
+so a frame never costs more than the tail.
+"""
+
+from collections.abc import Hashable, Iterable
+from typing import Any, NamedTuple
+
+from rich.console import Console, Group
+
+# Item statuses after which an output item no longer changes
+TERMINAL_STATUSES = frozenset({"completed", "incomplete", "failed"})
+
+
+class ScrollbackSegment(NamedTuple):
+    """An ordered slice of a response snapshot.
+
+    A segment is finished only once nothing streamed later can change how it renders.
+    For message text that means a block StreamingMarkdown has frozen; a block that is
+    merely not the last one may still be continued or have its references defined.
+    """
+
+    key: Hashable
+    renderables: list
+    finished: bool
+
+
+def is_item_finished(item: Any, is_last: bool) -> bool:
+    """Whether an output item is done changing.
+
+    Tool calls may run in parallel, so they are finished only once their status is
+    terminal. Messages and reasoning stream one at a time and are also finished as
+    soon as a later output item exists.
+    """
+    if getattr(item, "status", None) in TERMINAL_STATUSES:
+        return True
+    return item.type in ("message", "reasoning") and not is_last
+
+
+class ScrollbackCommitter:
+    """Print the finished prefix of a response once and hand back the live tail.
+
+    Scrollback is append-only, so only the leading run of finished segments can be
+    committed; everything from the first unfinished segment on stays live. Committed
+    segments are remembered by key and skipped on later snapshots.
+    """
+
+    def __init__(self, console: Console):
+        """
+        Args:
+            console: Console the Live region runs on; prints land above the Live region
+        """
+        self._console = console
+        self._committed: set[Hashable] = set()
+
+    def reset(self) -> None:
+        """Forget committed segments (a new response started)."""
+        self._committed.clear()
+
+    @property
+    def committed_count(self) -> int:
+        """Number of segments printed to scrollback so far."""
+        return len(self._committed)
+
+    def commit(self, segments: Iterable[ScrollbackSegment]) -> list:
+        """Print newly finished leading segments and return the renderables still live."""
+        printable: list = []
+        tail: list = []
+        open_seen = False
+        for segment in segments:
+            open_seen = open_seen or not segment.finished
+            if open_seen:
+                tail.extend(segment.renderables)
+            elif segment.key not in self._committed:
+                self._committed.add(segment.key)
+                printable.extend(segment.renderables)
+
+        if printable:
+            self._console.print(Group(*printable))
+        return tail
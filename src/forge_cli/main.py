@@ -3,6 +3,7 @@ from __future__ import annotations
 """Main entry point - refactored for better organization and type safety."""
 
 import asyncio
+import atexit
 import os
 import sys
 
@@ -11,6 +12,10 @@ from forge_cli.cli.parser import CLIParser
 from forge_cli.config import AppConfig
 from forge_cli.dataset import Dataset
 from forge_cli.display.factory import DisplayFactory
+from forge_cli.sdk.compression import get_compression
+from forge_cli.sdk.http_cache import get_http_cache
+from forge_cli.sdk.limits import LimitSettings, RequestLimiter, set_request_limiter
+from forge_cli.sdk.metrics import get_metrics
 
 
 def create_config_from_args(args) -> AppConfig:
@@ -40,7 +45,7 @@ def create_config_from_args(args) -> AppConfig:
     # Update environment if server specified
     if config.server_url != os.environ.get("KNOWLEDGE_FORGE_URL"):
         os.environ["KNOWLEDGE_FORGE_URL"] = config.server_url
-        if not config.quiet and config.render_format != "json":
+        if not config.quiet and config.render_format not in ("json", "ndjson"):
             print(f"🔗 Using server: {config.server_url}")
 
     return config
@@ -54,6 +59,26 @@ async def main():
     # Create and configure AppConfig
     config = create_config_from_args(args)
 
+    if config.no_cache:
+        get_http_cache().enabled = False
+
+    compression = get_compression()
+    compression.threshold = config.compress_threshold
+    compression.enabled = config.compress_threshold > 0
+
+    set_request_limiter(
+        RequestLimiter(
+            {name: LimitSettings.parse(spec) for name, spec in config.request_limits.items()},
+            failure_threshold=config.breaker_threshold,
+            reset_timeout=config.breaker_reset,
+        )
+    )
+
+    if config.stats_file:
+        # atexit also covers sys.exit() and Ctrl+C
+        stats_file = config.stats_file
+        atexit.register(lambda: get_metrics().dump(stats_file))
+
     # Create display
     display = DisplayFactory.create_display(config)
     # Create and start chat session
@@ -1,6 +1,5 @@
 """Conversation state management for multi-turn chat mode."""
 
-import json
 import time
 import uuid
 from pathlib import Path
@@ -8,6 +7,8 @@ from typing import TYPE_CHECKING, Any, Final, Literal, NewType, Protocol, overlo
 
 from pydantic import BaseModel, Field, field_validator
 
+from ..common import jsoncodec
+
 # Import proper types from response system
 from ..response._types.response_input_message_item import ResponseInputMessageItem
 from ..response._types.response_usage import ResponseUsage
@@ -421,8 +422,7 @@ class ConversationState(BaseModel):
         for json_file in conversations_dir.glob("*.json"):
             try:
                 # Quick load to get basic info
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
+                data = jsoncodec.loads(json_file.read_bytes())
 
                 # Extract basic info
                 conv_id = data.get("conversation_id", json_file.stem)
@@ -484,16 +484,14 @@ class ConversationState(BaseModel):
     def save(self, path: Path) -> None:
         """Save conversation to a JSON file using Pydantic serialization."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            # Use Pydantic's model_dump for automatic serialization
-            data = self.model_dump(mode="json")
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Use Pydantic's model_dump for automatic serialization
+        data = self.model_dump(mode="json")
+        path.write_bytes(jsoncodec.dumpb(data, indent=2))
 
     @classmethod
     def load(cls, path: Path) -> "ConversationState":
         """Load conversation from a JSON file using Pydantic validation."""
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = jsoncodec.loads(path.read_bytes())
         # Use Pydantic's model_validate for automatic validation and type conversion
         return cls.model_validate(data)
 
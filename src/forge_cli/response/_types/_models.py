@@ -425,6 +425,145 @@ def construct_type(*, value: object, type_: object) -> object:
     return value
 
 
+def construct_unvalidated(*, value: object, type_: type[_T]) -> _T:
+    """Construct nested values without validation.
+
+    Unlike construct_type(), discriminated unions pick their variant by the
+    discriminator alone instead of attempting validation first. Only mappings in
+    unions without a discriminator (or with an unknown one) are handed to
+    construct_type(). The walk over each type is compiled once and cached, which
+    makes this cheaper than validating the same value. The result is only as
+    correct as the input.
+    """
+    return cast(_T, _unvalidated_builder(type_)(value))
+
+
+def _identity(value: object) -> object:
+    return value
+
+
+@lru_cache(maxsize=None)
+def _unvalidated_builder(type_: Any) -> Callable[[object], object]:
+    """Compile a function building ``type_`` from raw data, as construct_type() would without validation."""
+    original_type = type_
+    if is_type_alias_type(type_):
+        type_ = type_.__value__
+    if is_annotated_type(type_):
+        meta: tuple[Any, ...] = get_args(type_)[1:]
+        type_ = extract_type_arg(type_, 0)
+    else:
+        meta = tuple()
+
+    origin = get_origin(type_) or type_
+    args = get_args(type_)
+
+    def fallback(value: object) -> object:
+        return construct_type(value=value, type_=original_type)
+
+    if is_union(origin):
+        discriminator = _build_discriminated_union_meta(union=type_, meta_annotations=meta)
+        if discriminator:
+            key = discriminator.field_alias_from or discriminator.field_name
+            variants = {name: _unvalidated_builder(variant) for name, variant in discriminator.mapping.items()}
+
+            def build_variant(value: object) -> object:
+                if type(value) is not dict and not is_mapping(value):
+                    return value  # e.g. the string options of a tool choice
+                builder = variants.get(value.get(key))
+                return fallback(value) if builder is None else builder(value)
+
+            return build_variant
+
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            # Optional[T]: None is kept as is by every builder
+            return _unvalidated_builder(members[0])
+        if not any(is_basemodel(strip_annotated_type(member)) for member in members):
+            return _identity
+        # Only mappings can become one of the models; scalars are kept as they are
+        return lambda value: fallback(value) if type(value) is dict or is_mapping(value) else value
+
+    if origin == list:
+        inner = _unvalidated_builder(args[0]) if args else _identity
+        if inner is _identity:
+            return _identity
+        return lambda value: [inner(entry) for entry in value] if type(value) is list or is_list(value) else value
+
+    if origin == dict:
+        inner = _unvalidated_builder(args[1]) if len(args) == 2 else _identity
+        if inner is _identity:
+            return _identity
+        return lambda value: {key: inner(item) for key, item in value.items()} if is_mapping(value) else value
+
+    if not is_literal_type(type_) and inspect.isclass(origin) and issubclass(origin, BaseModel):
+        return _model_builder(cast("type[BaseModel]", type_))
+
+    if origin == float:
+        return lambda value: float(value) if type(value) is int and float(value) == value else value
+
+    if origin in (datetime, date):
+        return fallback
+
+    return _identity
+
+
+def _model_builder(model: type[BaseModel]) -> Callable[[object], object]:
+    # Fields are compiled on first use, so self-referencing models do not recurse forever
+    plan: list[tuple[str, str, str | None, Callable[[object], object] | None, FieldInfo, object]] = []
+    model_keys: set[str] = set()
+
+    def compile_plan() -> None:
+        config = get_model_config(model)
+        populate_by_name = (
+            config.allow_population_by_field_name
+            if isinstance(config, _ConfigProtocol)
+            else config.get("populate_by_name")
+        )
+        for name, field in get_model_fields(model).items():
+            key = field.alias or name
+            alternative = name if populate_by_name and key != name else None
+            if field.annotation is None:
+                raise RuntimeError(f"Unexpected field type is None for {key}")
+            builder = _unvalidated_builder(field.annotation)
+            default = field_get_default(field)
+            if field.default_factory is not None or not isinstance(default, _IMMUTABLE_DEFAULTS):
+                default = _MISSING  # built per instance
+            plan.append((name, key, alternative, None if builder is _identity else builder, field, default))
+        model_keys.update(get_model_fields(model))
+
+    def build(value: object) -> object:
+        if type(value) is not dict and not is_mapping(value):
+            return value
+        if not plan:
+            compile_plan()
+
+        fields_values: dict[str, object] = {}
+        fields_set: set[str] = set()
+        for name, key, alternative, builder, field, default in plan:
+            if alternative is not None and key not in value:
+                key = alternative
+            raw = value.get(key, _MISSING)
+            if raw is not _MISSING:
+                fields_set.add(name)
+            if raw is _MISSING or raw is None:
+                fields_values[name] = field_get_default(field) if default is _MISSING else default
+            else:
+                fields_values[name] = raw if builder is None else builder(raw)
+
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", fields_values)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        object.__setattr__(instance, "__pydantic_extra__", {k: v for k, v in value.items() if k not in model_keys})
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        return instance
+
+    return build
+
+
+_MISSING = object()
+_IMMUTABLE_DEFAULTS = (type(None), str, int, float, bool, tuple, frozenset)
+
+
 @runtime_checkable
 class CachedDiscriminatorType(Protocol):
     __discriminator__: DiscriminatorDetails
@@ -471,9 +610,14 @@ class DiscriminatorDetails:
         self.field_alias_from = discriminator_alias
 
 
+_discriminator_cache: dict[Any, DiscriminatorDetails] = {}
+
+
 def _build_discriminated_union_meta(*, union: type, meta_annotations: tuple[Any, ...]) -> DiscriminatorDetails | None:
     if isinstance(union, CachedDiscriminatorType):
         return union.__discriminator__
+    if union in _discriminator_cache:
+        return _discriminator_cache[union]
 
     discriminator_field_name: str | None = None
 
@@ -513,7 +657,11 @@ def _build_discriminated_union_meta(*, union: type, meta_annotations: tuple[Any,
         discriminator_field=discriminator_field_name,
         discriminator_alias=discriminator_alias,
     )
-    cast(CachedDiscriminatorType, union).__discriminator__ = details
+    try:
+        cast(CachedDiscriminatorType, union).__discriminator__ = details
+    except AttributeError:
+        # `X | Y` unions (types.UnionType) do not accept attributes
+        _discriminator_cache[union] = details
     return details
 
 
@@ -11,24 +11,45 @@ Recommended usage:
 - Use create_file_search_tool() and create_web_search_tool() for tools
 """
 
+from .client import (
+    ForgeClient,
+    close_default_client,
+    get_default_client,
+    run_with_client,
+    set_default_client,
+    use_client,
+)
+from .compression import HttpCompression, TransferStats, get_compression, set_compression
 from .config import BASE_URL
+from .document_stream import LazyDocument, async_stream_document_content
+from .event_queue import ConflatingEventQueue, aiter_conflated
 from .files import (
     async_check_task_status,
     async_delete_file,
     async_fetch_document_content,
     async_fetch_file,
     async_upload_file,
+    async_upload_many,
     async_wait_for_task_completion,
 )
+from .limits import CircuitOpenError, LimitSettings, RequestLimiter, get_request_limiter, set_request_limiter
+from .metrics import ClientMetrics, Histogram, ResumeStats, StageStats, get_metrics, set_metrics
 from .response import (
     async_fetch_response,  # Fetch existing responses by ID - returns typed Response
 )
+from .http_cache import HttpCache, bypass_cache, get_http_cache, set_http_cache
+from .single_flight import SingleFlight, get_single_flight, set_single_flight
+from .sse import SSEParser, ServerSentEvent, aiter_sse_events
+from .stream_resume import StreamPosition, aiter_resumed
+from .task_watcher import TaskWatcher, get_task_watcher, set_task_watcher
 from .typed_api import (
+    aiter_response_events,
     astream_typed_response,
     async_create_typed_response,
     create_file_search_tool,
     create_typed_request,
     create_web_search_tool,
+    parse_stream_event,
 )
 from .utils import (
     has_tool_calls,
@@ -36,27 +57,72 @@ from .utils import (
     print_file_results,
 )
 from .vectorstore import (
+    aiter_vectorstore_files,
     async_create_vectorstore,
     async_delete_vectorstore,
     async_get_vectorstore,
     async_get_vectorstore_summary,
     async_join_files_to_vectorstore,
     async_query_vectorstore,
+    async_query_vectorstores,
 )
 
 __all__ = [
     # Configuration
     "BASE_URL",
+    # Pooled HTTP client
+    "ForgeClient",
+    "get_default_client",
+    "set_default_client",
+    "close_default_client",
+    "use_client",
+    "run_with_client",
+    # HTTP cache of read-mostly endpoints
+    "HttpCache",
+    "get_http_cache",
+    "set_http_cache",
+    "bypass_cache",
+    # Request compression and byte counts
+    "HttpCompression",
+    "TransferStats",
+    "get_compression",
+    "set_compression",
+    # Client-side rate limits and circuit breakers
+    "RequestLimiter",
+    "LimitSettings",
+    "CircuitOpenError",
+    "get_request_limiter",
+    "set_request_limiter",
+    # Deduplication of concurrent identical GET requests
+    "SingleFlight",
+    "get_single_flight",
+    "set_single_flight",
+    # Per-endpoint client metrics
+    "ClientMetrics",
+    "Histogram",
+    "StageStats",
+    "ResumeStats",
+    "get_metrics",
+    "set_metrics",
     # File operations (all use typed returns)
     "async_upload_file",
+    "async_upload_many",
     "async_check_task_status",
     "async_wait_for_task_completion",
     "async_fetch_file",
     "async_fetch_document_content",
+    "async_stream_document_content",
+    "LazyDocument",
     "async_delete_file",
+    # Task polling
+    "TaskWatcher",
+    "get_task_watcher",
+    "set_task_watcher",
     # Vector store operations (all use typed returns)
     "async_create_vectorstore",
     "async_query_vectorstore",
+    "async_query_vectorstores",
+    "aiter_vectorstore_files",
     "async_get_vectorstore",
     "async_delete_vectorstore",
     "async_join_files_to_vectorstore",
@@ -64,9 +130,21 @@ __all__ = [
     # Response operations - TYPED API (recommended)
     "async_create_typed_response",
     "astream_typed_response",
+    "aiter_response_events",
+    "parse_stream_event",
     "create_typed_request",
     "create_file_search_tool",
     "create_web_search_tool",
+    # Server-Sent Events framing
+    "SSEParser",
+    "ServerSentEvent",
+    "aiter_sse_events",
+    # Conflation of stream events behind a slow consumer
+    "ConflatingEventQueue",
+    "aiter_conflated",
+    # Resumption of dropped response streams
+    "StreamPosition",
+    "aiter_resumed",
     # Response fetch operation
     "async_fetch_response",  # Fetch existing responses by ID
     # Utility functions
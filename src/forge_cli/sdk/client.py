@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+"""
+Pooled HTTP client shared by all SDK calls.
+
+A ForgeClient owns a single aiohttp.ClientSession backed by a keep-alive
+TCPConnector, so repeated calls (task polling, collection lookups, chat turns)
+reuse open connections instead of paying a TCP/TLS handshake and DNS lookup
+per request. SDK functions accept an explicit client and otherwise fall back
+to a process-wide default returned by get_default_client().
+"""
+
+import asyncio
+import contextlib
+import contextvars
+from collections.abc import Coroutine, Iterator
+from typing import Any
+
+import aiohttp
+from loguru import logger
+
+# Connection pool defaults
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 20
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0  # seconds an idle connection is kept open
+DEFAULT_DNS_CACHE_TTL = 300  # seconds
+
+
+class ForgeClient:
+    """Long-lived, pooled HTTP client for the Knowledge Forge API.
+
+    The underlying session is created lazily on first use and bound to the
+    running event loop. If the client is used from a different loop (e.g. a
+    script calling asyncio.run() several times) a fresh session is opened, so
+    close the client before the loop that used it finishes (see run_with_client).
+
+    Usage:
+        async with ForgeClient() as client:
+            await async_get_vectorstore(vs_id, client=client)
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache: int = DEFAULT_DNS_CACHE_TTL,
+        timeout: aiohttp.ClientTimeout | None = None,
+    ):
+        """
+        Args:
+            limit: Maximum number of simultaneous connections in the pool
+            limit_per_host: Maximum number of simultaneous connections per host
+            keepalive_timeout: Seconds an idle connection stays in the pool
+            ttl_dns_cache: Seconds resolved DNS entries are cached
+            timeout: Default timeout for requests (aiohttp defaults if None)
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout = timeout
+
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client currently has no open session."""
+        return self._session is None or self._session.closed
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+
+        if self._session is not None and not self._session.closed and self._loop is not loop:
+            # A session cannot be shared across event loops; release the stale one.
+            logger.debug("ForgeClient used from a new event loop, opening a fresh session")
+            _release_stale_session(self._session, self._loop)
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+        )
+        from .metrics import metrics_trace_config
+
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[metrics_trace_config()],
+            timeout=self.timeout or aiohttp.ClientTimeout(total=None, sock_connect=30),
+        )
+        self._loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session and release all pooled connections."""
+        session, self._session = self._session, None
+        self._loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __aenter__(self) -> ForgeClient:
+        await self.get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+def _release_stale_session(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Close a session left behind on another event loop.
+
+    A session can only be closed on its own loop. If that loop is still running the
+    close is scheduled there; otherwise its connections cannot be released any more
+    and the leak is reported instead of being hidden.
+    """
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    logger.warning(
+        "ForgeClient session was not closed before its event loop finished; "
+        "close the client (or use run_with_client) inside the loop that used it"
+    )
+
+
+_default_client: ForgeClient | None = None
+
+
+def get_default_client() -> ForgeClient:
+    """Return the process-wide default client, creating it if needed."""
+    global _default_client
+    if _default_client is None:
+        _default_client = ForgeClient()
+    return _default_client
+
+
+def set_default_client(client: ForgeClient | None) -> None:
+    """Replace the process-wide default client (None resets to a lazy default)."""
+    global _default_client
+    _default_client = client
+
+
+async def close_default_client() -> None:
+    """Close the process-wide default client if it has been opened."""
+    if _default_client is not None:
+        await _default_client.close()
+
+
+_scoped_client: contextvars.ContextVar[ForgeClient | None] = contextvars.ContextVar("forge_scoped_client", default=None)
+
+
+@contextlib.contextmanager
+def use_client(client: ForgeClient) -> Iterator[None]:
+    """Make calls without an explicit client inside the block use the given one."""
+    token = _scoped_client.set(client)
+    try:
+        yield
+    finally:
+        _scoped_client.reset(token)
+
+
+def resolve_client(client: ForgeClient | None) -> ForgeClient:
+    """Return the given client, the one set by use_client(), or the process-wide default."""
+    if client is not None:
+        return client
+    return _scoped_client.get() or get_default_client()
+
+
+def run_with_client[T](main: Coroutine[Any, Any, T]) -> T:
+    """asyncio.run() a coroutine with a pooled client that is closed before the loop ends.
+
+    SDK calls inside the coroutine that pass no explicit client use this one, so
+    scripts do not leave the lazily created default client's session open.
+    """
+
+    async def run() -> T:
+        async with ForgeClient() as client:
+            with use_client(client):
+                return await main
+
+    return asyncio.run(run())
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+"""
+Request-body compression and response decompression for SDK calls.
+
+Every chat turn POSTs the whole conversation history as JSON, which grows to
+hundreds of KB in long sessions. HttpCompression gzips JSON request bodies above
+a size threshold and keeps track, per server origin, of whether the server
+accepts them:
+
+- the first compressed request to an origin doubles as the capability probe;
+  a 415 Unsupported Media Type answer (or a response advertising an
+  ``Accept-Encoding`` without gzip, RFC 7694) marks the origin as not supporting
+  compressed bodies and the request is repeated uncompressed
+- servers that don't decode request bodies at all (FastAPI/Starlette among
+  them) fail on the gzip bytes with 400 or 422 instead, so while the origin is
+  still unprobed those answers count as a rejection too
+- only a 2xx answer to a compressed request marks the origin as supporting
+  them; other errors leave it unprobed
+- the result is cached for the life of the process
+
+Responses are requested with ``Accept-Encoding``. Server-Sent Event streams are
+read with aiohttp's automatic decompression turned off and decoded incrementally
+by StreamDecoder, so the bytes on the wire and the decoded bytes can both be
+counted. All byte counts accumulate in TransferStats.
+"""
+
+import gzip
+import zlib
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp.compression_utils import HAS_BROTLI
+from loguru import logger
+
+from ..common import jsoncodec
+from .metrics import RequestTimer
+
+DEFAULT_THRESHOLD = 16 * 1024  # JSON bodies at least this large are gzipped
+DEFAULT_LEVEL = 6
+
+# Answers to a gzipped body that mean the server could not read it, until gzip is known to work
+REJECTION_STATUSES = frozenset({400, 415, 422})
+
+# Encodings decoded by StreamDecoder; br needs the optional Brotli package
+STREAM_ACCEPT_ENCODING = "gzip, deflate"
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else STREAM_ACCEPT_ENCODING
+
+
+@dataclass
+class TransferStats:
+    """Byte counts of SDK traffic before and after compression."""
+
+    requests: int = 0
+    compressed_requests: int = 0
+    request_bytes: int = 0  # JSON bodies before compression
+    request_bytes_sent: int = 0  # JSON bodies as sent
+    responses: int = 0
+    compressed_responses: int = 0
+    response_bytes: int = 0  # bodies after decoding
+    response_bytes_received: int = 0  # bodies as received, where the wire size is known
+
+    def record_request(self, raw: int, sent: int) -> None:
+        self.requests += 1
+        self.compressed_requests += sent != raw
+        self.request_bytes += raw
+        self.request_bytes_sent += sent
+
+    def record_response(self, decoded: int, received: int | None, compressed: bool) -> None:
+        self.responses += 1
+        self.compressed_responses += compressed
+        self.response_bytes += decoded
+        # Unknown wire sizes are only possible for compressed bodies; count them as decoded
+        self.response_bytes_received += decoded if received is None else received
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes not transferred thanks to compression, in both directions."""
+        return self.request_bytes - self.request_bytes_sent + self.response_bytes - self.response_bytes_received
+
+    def as_dict(self) -> dict[str, int]:
+        return {**asdict(self), "bytes_saved": self.bytes_saved}
+
+    def reset(self) -> None:
+        for name, value in asdict(TransferStats()).items():
+            setattr(self, name, value)
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class HttpCompression:
+    """Compression policy and per-origin capability cache."""
+
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD, level: int = DEFAULT_LEVEL, enabled: bool = True):
+        """
+        Args:
+            threshold: Smallest JSON body (in bytes) that is gzipped
+            level: gzip compression level (1 fastest - 9 smallest)
+            enabled: Whether request bodies are compressed at all
+        """
+        self.threshold = threshold
+        self.level = level
+        self.enabled = enabled
+        self.stats = TransferStats()
+        self._accepts_gzip: dict[str, bool] = {}
+
+    def accepts_gzip(self, url: str) -> bool | None:
+        """Whether the server of url accepts gzipped bodies (None until probed)."""
+        return self._accepts_gzip.get(_origin(url))
+
+    def encode_json(self, url: str, payload: Any) -> tuple[bytes, dict[str, str], int]:
+        """Serialize payload and gzip it if it is large enough and the server allows it.
+
+        Returns:
+            The body, the headers to send with it and the uncompressed size
+        """
+        raw = jsoncodec.dumpb(payload)
+        headers = {"Content-Type": "application/json"}
+        if self.enabled and len(raw) >= self.threshold and self.accepts_gzip(url) is not False:
+            headers["Content-Encoding"] = "gzip"
+            return gzip.compress(raw, compresslevel=self.level, mtime=0), headers, len(raw)
+        return raw, headers, len(raw)
+
+    def learn(self, url: str, response: aiohttp.ClientResponse, sent_gzip: bool) -> bool:
+        """Update the capability cache from a response.
+
+        Returns:
+            True if a gzipped request was rejected and must be sent again uncompressed
+        """
+        origin = _origin(url)
+        advertised = response.headers.get("Accept-Encoding")
+        if advertised is not None and "gzip" not in advertised.lower():
+            rejected = sent_gzip and response.status in REJECTION_STATUSES
+            self._mark(origin, False)
+            return rejected
+        if not sent_gzip:
+            return False
+        # Once gzip is known to work, a 400 or 422 is about the payload itself
+        if response.status == 415 or (response.status in REJECTION_STATUSES and self._accepts_gzip.get(origin) is None):
+            self._mark(origin, False)
+            return True
+        if 200 <= response.status < 300:
+            self._mark(origin, True)
+        return False
+
+    def _mark(self, origin: str, supported: bool) -> None:
+        if self._accepts_gzip.get(origin) != supported:
+            logger.debug(f"{origin} {'accepts' if supported else 'does not accept'} gzipped request bodies")
+        self._accepts_gzip[origin] = supported
+
+
+_default_compression: HttpCompression | None = None
+
+
+def get_compression() -> HttpCompression:
+    """Return the process-wide compression policy, creating it if needed."""
+    global _default_compression
+    if _default_compression is None:
+        _default_compression = HttpCompression()
+    return _default_compression
+
+
+def set_compression(compression: HttpCompression | None) -> None:
+    """Replace the process-wide compression policy (None resets to a lazy default)."""
+    global _default_compression
+    _default_compression = compression
+
+
+async def open_request(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    json_payload: Any = None,
+    data: Any = None,
+    headers: Mapping[str, str] | None = None,
+    stream: bool = False,
+    timer: RequestTimer | None = None,
+    **kwargs: Any,
+) -> aiohttp.ClientResponse:
+    """Send a request, compressing a JSON payload according to the process-wide policy.
+
+    Use the returned response as an async context manager to release it. With
+    stream=True the body is left encoded for StreamDecoder (see aiter_decoded).
+    A timer, if given, is filled in by the metrics trace config and counts resends.
+    """
+    compression = get_compression()
+    headers = dict(headers or {})
+    if timer is not None:
+        kwargs["trace_request_ctx"] = timer
+    if stream:
+        headers.setdefault("Accept-Encoding", STREAM_ACCEPT_ENCODING)
+        kwargs["auto_decompress"] = False
+    else:
+        headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+
+    if json_payload is None:
+        response = await session.request(method, url, data=data, headers=headers, **kwargs)
+        compression.learn(url, response, sent_gzip=False)
+        return response
+
+    while True:
+        body, body_headers, raw_size = compression.encode_json(url, json_payload)
+        sent_gzip = "Content-Encoding" in body_headers
+        response = await session.request(method, url, data=body, headers={**headers, **body_headers}, **kwargs)
+        compression.stats.record_request(raw_size, len(body))
+        # learn() marks the origin on rejection, so the retry goes out uncompressed
+        if not compression.learn(url, response, sent_gzip):
+            return response
+        response.release()
+        if timer is not None:
+            timer.retries += 1
+        logger.info(f"{_origin(url)} rejected a gzipped request body, resending uncompressed")
+
+
+def record_response(response: aiohttp.ClientResponse, decoded: int) -> None:
+    """Count a response body that aiohttp decoded (decoded is its size after decoding)."""
+    encoding = response.headers.get("Content-Encoding", "identity").strip().lower()
+    compressed = encoding != "identity"
+    received = response.content_length if compressed else decoded
+    get_compression().stats.record_response(decoded, received, compressed)
+
+
+class StreamDecoder:
+    """Incremental decoder of a gzip or deflate encoded body."""
+
+    def __init__(self, encoding: str | None):
+        encoding = (encoding or "identity").strip().lower()
+        if encoding not in ("gzip", "deflate", "identity"):
+            raise ValueError(f"Unsupported Content-Encoding for streaming: {encoding}")
+        self.encoding = encoding
+        self.received = 0
+        self.decoded = 0
+        # For deflate the wrapping (zlib or raw) is only known from the first two bytes
+        self._decoder = zlib.decompressobj(16 + zlib.MAX_WBITS) if encoding == "gzip" else None
+        self._pending = b""
+
+    @property
+    def compressed(self) -> bool:
+        return self.encoding != "identity"
+
+    def feed(self, chunk: bytes) -> bytes:
+        self.received += len(chunk)
+        if self.encoding == "deflate" and self._decoder is None:
+            chunk = self._pending + chunk
+            if len(chunk) < 2:
+                self._pending = chunk
+                return b""
+            self._pending = b""
+            # RFC 9110 deflate is zlib-wrapped, but some servers send raw deflate
+            zlib_wrapped = chunk[0] & 0x0F == 8 and (chunk[0] << 8 | chunk[1]) % 31 == 0
+            self._decoder = zlib.decompressobj(zlib.MAX_WBITS if zlib_wrapped else -zlib.MAX_WBITS)
+        data = self._decoder.decompress(chunk) if self._decoder is not None else chunk
+        self.decoded += len(data)
+        return data
+
+    def flush(self) -> bytes:
+        if self._decoder is not None:
+            data = self._decoder.flush()
+        else:
+            data, self._pending = self._pending, b""
+        self.decoded += len(data)
+        return data
+
+
+async def aiter_decoded(response: aiohttp.ClientResponse, timer: RequestTimer | None = None) -> AsyncIterator[bytes]:
+    """Yield the decoded body of a response opened with open_request(stream=True), chunk by chunk."""
+    decoder = StreamDecoder(response.headers.get("Content-Encoding"))
+    try:
+        async for chunk in response.content.iter_any():
+            data = decoder.feed(chunk)
+            if data:
+                yield data
+        tail = decoder.flush()
+        if tail:
+            yield tail
+    finally:
+        get_compression().stats.record_response(decoder.decoded, decoder.received, decoder.compressed)
+        if timer is not None:
+            timer.bytes_received += decoder.received
+
+
+async def read_text(response: aiohttp.ClientResponse) -> str:
+    """Body of a response opened with open_request(stream=True) as text, e.g. an error message."""
+    return b"".join([chunk async for chunk in aiter_decoded(response)]).decode("utf-8", errors="replace")
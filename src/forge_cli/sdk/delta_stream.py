@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+"""
+Delta-based reconstruction of streamed Response objects.
+
+The server streams a complete Response snapshot with every event (ADR-004). Running
+Response(**data) on each of them re-validates the whole answer per token, so the total
+validation work grows quadratically with answer length.
+
+ResponseDeltaAccumulator keeps one mutable in-progress Response instead. Only
+response.created and response.completed are fully validated; every other event is
+applied as a delta:
+
+- Snapshot payloads are diffed against the previously applied payload, item by item.
+  Unchanged items are skipped, text growth is assigned in place, new annotations are
+  validated individually and appended, and only genuinely new or restructured items
+  go through pydantic.
+- OpenAI-style delta payloads (output_text.delta, output_item.added,
+  output_text.annotation.added, tool call status events, ...) are applied directly.
+
+Consumers still receive an up-to-date, API-compatible Response on every event; it is
+usually the same instance mutated in place, so keep a copy if you need history.
+"""
+
+from typing import Any
+
+from loguru import logger
+from pydantic import TypeAdapter
+
+from forge_cli.response._types import Response
+from forge_cli.response._types.annotations import Annotation
+from forge_cli.response._types.response_output_item import ResponseOutputItem
+from forge_cli.response._types.response_output_message import Content
+from forge_cli.response._types.response_reasoning_item import Summary
+from forge_cli.response._types.response_usage import ResponseUsage
+
+# Events whose payload is always fully validated
+FULL_VALIDATION_EVENT_TYPES = frozenset({"response.created", "response.completed"})
+
+# Tool call phases that map directly onto an output item's status field
+TOOL_STATUS_PHASES = frozenset({"in_progress", "searching", "interpreting", "completed", "incomplete", "failed"})
+
+_output_item_adapter: TypeAdapter = TypeAdapter(ResponseOutputItem)
+_content_adapter: TypeAdapter = TypeAdapter(Content)
+_annotation_adapter: TypeAdapter = TypeAdapter(Annotation)
+
+
+class ResponseDeltaAccumulator:
+    """Rebuild a streamed Response incrementally, validating only what changed."""
+
+    def __init__(self) -> None:
+        self.response: Response | None = None
+        # Last applied raw payload per output item (None = unknown, forces a re-validate)
+        self._raw_output: list[dict | None] = []
+        # Last applied raw top-level fields (everything except "output")
+        self._raw_top: dict[str, Any] = {}
+
+    def apply(self, event_type: str, data: dict[str, Any]) -> Response | None:
+        """Apply one stream event and return the current Response snapshot.
+
+        Args:
+            event_type: SSE event type (e.g. "response.output_text.delta")
+            data: Decoded JSON payload of the event
+
+        Returns:
+            The in-progress Response, or None if the event could not be applied
+            (e.g. a delta arriving before any snapshot).
+        """
+        if event_type in FULL_VALIDATION_EVENT_TYPES or self.response is None:
+            payload = data.get("response") if isinstance(data.get("response"), dict) else data
+            if not _is_snapshot(payload):
+                return self.response
+            self._reset(payload)
+            return self.response
+
+        if _is_snapshot(data):
+            self._merge_snapshot(data)
+        elif isinstance(data.get("response"), dict) and _is_snapshot(data["response"]):
+            self._merge_snapshot(data["response"])
+        else:
+            self._apply_delta_event(event_type, data)
+        return self.response
+
+    # ------------------------------------------------------------------
+    # Full snapshots
+    # ------------------------------------------------------------------
+
+    def _reset(self, payload: dict[str, Any]) -> None:
+        """Fully validate a snapshot and make it the new baseline."""
+        self.response = Response.model_validate(payload)
+        self._raw_output = list(payload.get("output") or [])
+        self._raw_top = {k: v for k, v in payload.items() if k != "output"}
+
+    def _merge_snapshot(self, payload: dict[str, Any]) -> None:
+        """Apply a full snapshot as a diff against the previously applied one."""
+        response = self.response
+        assert response is not None
+
+        top = {k: v for k, v in payload.items() if k != "output"}
+        if top != self._raw_top:
+            self._merge_top_level(top)
+
+        raw_items = payload.get("output") or []
+        output = response.output
+        for index, raw in enumerate(raw_items):
+            if index >= len(output):
+                output.append(_output_item_adapter.validate_python(raw))
+                self._raw_output.append(raw)
+                continue
+
+            previous = self._raw_output[index]
+            if raw == previous:
+                continue
+            if previous is None or not self._patch_item(index, previous, raw):
+                output[index] = _output_item_adapter.validate_python(raw)
+            self._raw_output[index] = raw
+
+        if len(raw_items) < len(output):
+            del output[len(raw_items) :]
+            del self._raw_output[len(raw_items) :]
+
+    def _merge_top_level(self, top: dict[str, Any]) -> None:
+        """Apply changed top-level fields, validating only what needs it."""
+        response = self.response
+        assert response is not None
+
+        changed = {k for k in top.keys() | self._raw_top.keys() if top.get(k) != self._raw_top.get(k)}
+        cheap = changed & {"status", "usage"}
+        if changed - cheap:
+            # Uncommon field changed; validate the envelope without the (large) output list.
+            envelope = Response.model_validate({**top, "output": []})
+            envelope.output = response.output
+            self.response = envelope
+        else:
+            if "status" in cheap:
+                response.status = top.get("status")
+            if "usage" in cheap:
+                usage = top.get("usage")
+                response.usage = ResponseUsage.model_validate(usage) if usage is not None else None
+        self._raw_top = top
+
+    def _patch_item(self, index: int, previous: dict[str, Any], raw: dict[str, Any]) -> bool:
+        """Patch an existing output item in place.
+
+        Returns:
+            False if the item changed shape and must be re-validated instead.
+        """
+        item = self.response.output[index]
+        if raw.get("type") != previous.get("type") or raw.get("id") != previous.get("id"):
+            return False
+
+        if raw.get("type") == "message":
+            if not self._patch_message(item, previous, raw):
+                return False
+        elif raw.get("type") == "reasoning":
+            if not self._patch_reasoning(item, previous, raw):
+                return False
+        else:
+            # Tool calls are small; a per-item re-validate is cheap and always correct.
+            return False
+
+        if raw.get("status") != previous.get("status"):
+            item.status = raw.get("status")
+        return True
+
+    def _patch_message(self, item: Any, previous: dict[str, Any], raw: dict[str, Any]) -> bool:
+        old_parts = previous.get("content") or []
+        new_parts = raw.get("content") or []
+        if len(new_parts) < len(old_parts):
+            return False
+
+        for index, part_raw in enumerate(new_parts):
+            if index >= len(old_parts):
+                item.content.append(_content_adapter.validate_python(part_raw))
+                continue
+
+            old_raw = old_parts[index]
+            if part_raw == old_raw:
+                continue
+            if part_raw.get("type") != old_raw.get("type"):
+                return False
+
+            part = item.content[index]
+            if part_raw.get("type") == "output_text":
+                if part_raw.get("text") != old_raw.get("text"):
+                    part.text = part_raw.get("text", "")
+                old_annotations = old_raw.get("annotations") or []
+                new_annotations = part_raw.get("annotations") or []
+                if new_annotations != old_annotations:
+                    if new_annotations[: len(old_annotations)] == old_annotations:
+                        part.annotations.extend(
+                            _annotation_adapter.validate_python(a) for a in new_annotations[len(old_annotations) :]
+                        )
+                    else:
+                        part.annotations = [_annotation_adapter.validate_python(a) for a in new_annotations]
+            else:
+                item.content[index] = _content_adapter.validate_python(part_raw)
+        return True
+
+    def _patch_reasoning(self, item: Any, previous: dict[str, Any], raw: dict[str, Any]) -> bool:
+        old_summary = previous.get("summary") or []
+        new_summary = raw.get("summary") or []
+        if len(new_summary) < len(old_summary):
+            return False
+
+        for index, summary_raw in enumerate(new_summary):
+            if index >= len(old_summary):
+                item.summary.append(Summary.model_validate(summary_raw))
+            elif summary_raw != old_summary[index]:
+                item.summary[index].text = summary_raw.get("text", "")
+        return True
+
+    # ------------------------------------------------------------------
+    # OpenAI-style delta events
+    # ------------------------------------------------------------------
+
+    def _apply_delta_event(self, event_type: str, data: dict[str, Any]) -> None:
+        """Apply an event that carries only a delta rather than a full snapshot."""
+        output = self.response.output
+        output_index = data.get("output_index")
+
+        try:
+            if event_type in ("response.output_item.added", "response.output_item.done") and "item" in data:
+                item = _output_item_adapter.validate_python(data["item"])
+                if output_index is None or output_index >= len(output):
+                    output.append(item)
+                    self._raw_output.append(None)
+                else:
+                    output[output_index] = item
+                    self._raw_output[output_index] = None
+                return
+
+            if output_index is None or output_index >= len(output):
+                return
+            item = output[output_index]
+            self._raw_output[output_index] = None
+
+            if event_type == "response.output_text.delta":
+                item.content[data["content_index"]].text += data["delta"]
+            elif event_type == "response.reasoning_summary_text.delta":
+                summary_index = data.get("summary_index", 0)
+                while len(item.summary) <= summary_index:
+                    item.summary.append(Summary(text="", type="summary_text"))
+                item.summary[summary_index].text += data["delta"]
+            elif event_type == "response.content_part.added" and "part" in data:
+                part = _content_adapter.validate_python(data["part"])
+                content_index = data.get("content_index", len(item.content))
+                if content_index >= len(item.content):
+                    item.content.append(part)
+                else:
+                    item.content[content_index] = part
+            elif event_type == "response.output_text.annotation.added" and "annotation" in data:
+                part = item.content[data["content_index"]]
+                part.annotations.append(_annotation_adapter.validate_python(data["annotation"]))
+            else:
+                phase = event_type.rsplit(".", 1)[-1]
+                if event_type.endswith(f"_call.{phase}") and phase in TOOL_STATUS_PHASES:
+                    item.status = phase
+        except (IndexError, KeyError, AttributeError, TypeError) as e:
+            logger.debug(f"Could not apply delta event {event_type}: {e}")
+
+
+def _is_snapshot(data: Any) -> bool:
+    """Check whether a payload looks like a full Response snapshot."""
+    return isinstance(data, dict) and data.get("object") == "response" and "output" in data
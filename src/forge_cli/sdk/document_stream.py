@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+"""
+Streaming parser for large /v1/files/{id}/content payloads.
+
+async_fetch_document_content() decodes the whole body and validates every segment,
+which for a 1,000-page document holds the raw JSON, the decoded dicts and the
+DocumentSegment models in memory at once. async_stream_document_content() instead
+splits the body while it downloads:
+
+- the elements of ``content.segments`` are copied, still as raw JSON, to a temporary
+  spill file with an (offset, length) index
+- everything else (title, abstract, page count, keywords, ...) becomes the header
+
+The returned LazyDocument exposes the header as a DocumentResponse with an empty
+segment list, and decodes segments one at a time from the spill file on demand.
+Memory stays bounded by the header and the largest single segment.
+"""
+
+import functools
+import re
+import tempfile
+from collections.abc import Iterator
+from typing import IO, Any
+
+from loguru import logger
+
+from ..common import jsoncodec
+from .client import ForgeClient, resolve_client
+from .config import BASE_URL
+from .file_types import DocumentResponse, DocumentSegment
+from .limits import get_request_limiter
+from .metrics import get_metrics
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+# Structural characters; string contents are skipped with find() or _STRING_REST
+_TOKEN = re.compile(rb'["{}\[\],:]')
+# Rest of a JSON string up to and including its closing quote, skipping escapes
+_STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_BACKSLASH = 0x5C
+_SEGMENTS_SENTINEL = "\x00forge-segments\x00"
+
+
+class _Frame:
+    __slots__ = ("is_object", "key", "expect_key")
+
+    def __init__(self, is_object: bool, key: bytes | None):
+        self.is_object = is_object
+        self.key = key
+        self.expect_key = is_object
+
+
+class DocumentSplitter:
+    """Incremental JSON splitter separating ``content.segments`` from the rest of a document.
+
+    feed() takes raw body chunks split anywhere (including inside strings and escape
+    sequences). Each complete segment element is passed, as raw JSON bytes, to
+    ``on_segment``; all other bytes accumulate in ``header`` with the segments
+    array left empty, so ``json.loads(header)`` is the document without segments.
+    """
+
+    def __init__(self, on_segment):
+        self.header = bytearray()
+        self._on_segment = on_segment
+        self._stack: list[_Frame] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._key = bytearray()
+        self._last_key: bytes | None = None
+        self._segments_frame: _Frame | None = None
+        self._segment: bytearray | None = None
+        self._segment_depth = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the body."""
+        stack = self._stack
+        size = len(chunk)
+        pos = 0
+        mark = 0  # start of the bytes not yet routed to header or segment
+
+        while pos < size:
+            if self._in_string:
+                end = self._string_end(chunk, pos)
+                if self._string_is_key:
+                    self._key += chunk[pos : size if end == -1 else end]
+                if end == -1:
+                    break
+                self._in_string = False
+                if self._string_is_key:
+                    self._last_key = bytes(self._key)
+                pos = end + 1
+                continue
+
+            match = _TOKEN.search(chunk, pos)
+            if match is None:
+                break
+            index = match.start()
+            char = chunk[index]
+            frame = stack[-1] if stack else None
+
+            if char == 0x22:  # "
+                self._string_is_key = frame is not None and frame.expect_key
+                if self._string_is_key:
+                    self._key.clear()
+                self._in_string = True
+                self._escape = False
+            elif char in b"{[":
+                key = self._last_key if frame is not None and frame.is_object else None
+                if frame is not None and frame is self._segments_frame and self._segment is None:
+                    self._route(chunk, mark, index)
+                    mark = index
+                    self._segment = bytearray()
+                    self._segment_depth = len(stack)
+                new_frame = _Frame(char == 0x7B, key)
+                stack.append(new_frame)
+                if (
+                    char == 0x5B
+                    and key == b"segments"
+                    and len(stack) == 3
+                    and stack[0].is_object
+                    and stack[1].key == b"content"
+                ):
+                    self._route(chunk, mark, index + 1)
+                    mark = index + 1
+                    self._segments_frame = new_frame
+            elif char in b"}]":
+                closed = stack.pop()
+                if closed is self._segments_frame:
+                    self._route(chunk, mark, index)
+                    mark = index
+                    self._segments_frame = None
+                elif self._segment is not None and len(stack) == self._segment_depth:
+                    self._segment += chunk[mark : index + 1]
+                    mark = index + 1
+                    self._on_segment(bytes(self._segment))
+                    self._segment = None
+            elif char == 0x3A:  # :
+                if frame is not None:
+                    frame.expect_key = False
+            elif frame is not None and frame.is_object:  # ,
+                frame.expect_key = True
+            pos = index + 1
+
+        self._route(chunk, mark, size)
+
+    def _route(self, chunk: bytes, start: int, end: int) -> None:
+        if start >= end:
+            return
+        if self._segment is not None:
+            self._segment += chunk[start:end]
+        elif self._segments_frame is None:
+            self.header += chunk[start:end]
+        # else: separators between segments, dropped
+
+    def _string_end(self, chunk: bytes, pos: int) -> int:
+        """Index of the closing quote of the current string in chunk, or -1."""
+        start = pos
+        if self._escape:
+            self._escape = False
+            start += 1
+        quote = chunk.find(b'"', start)
+        if quote != -1 and (quote == start or chunk[quote - 1] != _BACKSLASH):
+            return quote
+        # Escaped quotes ahead (or no quote at all): let the regex skip the escapes
+        match = _STRING_REST.match(chunk, start) if quote != -1 else None
+        if match is not None:
+            return match.end() - 1
+        self._escape = _trailing_backslashes(chunk, start, len(chunk)) % 2 == 1
+        return -1
+
+
+def _trailing_backslashes(chunk: bytes, start: int, end: int) -> int:
+    count = 0
+    while end - count - 1 >= start and chunk[end - count - 1] == _BACKSLASH:
+        count += 1
+    return count
+
+
+class LazyDocument:
+    """A document whose segments live in a spill file until they are asked for.
+
+    Use as a context manager (or call close()) to delete the spill file.
+    """
+
+    def __init__(self, header_data: dict[str, Any], spill: IO[bytes], index: list[tuple[int, int]]):
+        self.header_data = header_data
+        self._spill = spill
+        self._index = index
+
+    @functools.cached_property
+    def header(self) -> DocumentResponse:
+        """The header validated as a DocumentResponse (segments empty).
+
+        Validated on first access, so views that only read header_data keep working
+        for documents the model does not accept (e.g. missing timestamps).
+        """
+        return DocumentResponse.model_validate(self.header_data)
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segments in the document."""
+        return len(self._index)
+
+    def raw_segment(self, position: int) -> bytes:
+        """Raw JSON bytes of one segment."""
+        offset, length = self._index[position]
+        self._spill.seek(offset)
+        return self._spill.read(length)
+
+    def segment(self, position: int) -> DocumentSegment:
+        """Decode one segment by its position in the segment list."""
+        return DocumentSegment.model_validate_json(self.raw_segment(position))
+
+    def iter_segments(self) -> Iterator[DocumentSegment]:
+        """Yield the segments in order, decoding one at a time."""
+        for position in range(len(self._index)):
+            yield self.segment(position)
+
+    def write_json(self, out: IO[str], indent: int | None = 2) -> None:
+        """Write the complete document as JSON, streaming the segments from the spill file."""
+        data = dict(self.header_data)
+        content = data.get("content")
+        if not isinstance(content, dict) or not self._index:
+            jsoncodec.dump(data, out, indent=indent)
+            return
+
+        data["content"] = {**content, "segments": [_SEGMENTS_SENTINEL]}
+        text = jsoncodec.dumps(data, indent=indent)
+        marker = jsoncodec.dumps(_SEGMENTS_SENTINEL)
+        before, after = text.split(marker, 1)
+        pad = before[len(before.rstrip(" ")) :] if indent is not None else ""
+        out.write(before.rstrip(" "))
+        for position in range(len(self._index)):
+            if position:
+                out.write("," + ("\n" if indent is not None else ""))
+            segment = jsoncodec.dumps(jsoncodec.loads(self.raw_segment(position)), indent=indent)
+            out.write(pad + segment.replace("\n", "\n" + pad))
+        out.write(after)
+
+    def close(self) -> None:
+        """Delete the spill file."""
+        self._spill.close()
+
+    def __enter__(self) -> LazyDocument:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+async def async_stream_document_content(
+    document_id: str,
+    client: ForgeClient | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    spill_dir: str | None = None,
+) -> LazyDocument | None:
+    """
+    Asynchronously fetch document content without materializing its segments.
+
+    Args:
+        document_id: The ID of the document to fetch
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
+        chunk_size: Bytes read from the socket at a time
+        spill_dir: Directory for the temporary segment file (system default if None)
+
+    Returns:
+        LazyDocument (close it when done) or None if the document was not found
+
+    Raises:
+        Exception: For non-2xx responses other than 404 and for malformed bodies
+    """
+    url = f"{BASE_URL}/v1/files/{document_id}/content"
+    spill = tempfile.TemporaryFile(prefix="forge-segments-", dir=spill_dir)
+    index: list[tuple[int, int]] = []
+
+    def on_segment(raw: bytes) -> None:
+        index.append((spill.tell(), len(raw)))
+        spill.write(raw)
+
+    splitter = DocumentSplitter(on_segment)
+    try:
+        session = await resolve_client(client).get_session()
+        with get_metrics().measure("GET", url) as timer:
+            async with get_request_limiter().slot("GET", url) as outcome:
+                async with session.get(url, trace_request_ctx=timer) as response:
+                    outcome.status = response.status
+                    if response.status == 404:
+                        logger.warning(f"Resource not found (404) for GET {url}.")
+                        spill.close()
+                        return None
+                    if response.status != 200:
+                        error_text = await response.text()
+                        raise Exception(f"API request failed with status {response.status}: {error_text}")
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        timer.bytes_received += len(chunk)
+                        splitter.feed(chunk)
+
+        header_data = jsoncodec.loads(splitter.header)
+        if not isinstance(header_data, dict):
+            raise ValueError("document content is not a JSON object")
+        return LazyDocument(header_data, spill, index)
+    except BaseException:
+        spill.close()
+        raise
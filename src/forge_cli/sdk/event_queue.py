@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+"""
+Conflating event queue between the SSE reader and the stream consumer.
+
+Without it the consumer pulls events straight off the socket: while a slow terminal
+renders one snapshot, nothing reads the connection, and TCP backpressure slows the
+server-side stream down. aiter_conflated() instead drains the socket in a reader task
+into a bounded ConflatingEventQueue:
+
+- Progress events (``*.delta`` and ``response.in_progress``) of event types known to
+  carry full response snapshots (ADR-004) supersede each other: a new one replaces
+  one still waiting at the tail of the queue, so the consumer always gets the newest
+  state instead of working through a backlog.
+- A progress payload byte-identical to the previous one is dropped before it is
+  parsed.
+- Every other event (``response.created``, tool call transitions, completion,
+  ``done``, ``error``) is delivered, in order.
+
+Event types are only conflated once the consumer has reported (snapshot_types) that
+they carry snapshots, so OpenAI-style delta streams, whose deltas must all be
+applied, pass through untouched.
+"""
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
+
+from loguru import logger
+
+from .sse import ServerSentEvent
+
+DEFAULT_MAXSIZE = 256
+
+# Event types whose snapshot only reports progress and is superseded by the next one
+PROGRESS_EVENT_TYPES = frozenset({"response.in_progress"})
+
+
+def is_progress_event(event_type: str) -> bool:
+    return event_type.endswith(".delta") or event_type in PROGRESS_EVENT_TYPES
+
+
+class ConflatingEventQueue:
+    """Bounded FIFO of SSE events that collapses consecutive snapshot progress events."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        # Event types the consumer has seen carrying a full response snapshot
+        self.snapshot_types: set[str] = set()
+
+        self._items: deque[tuple[ServerSentEvent, bool]] = deque()
+        self._last_progress_data: str | None = None
+        self._closed = False
+        self._error: BaseException | None = None
+        self._changed = asyncio.Condition()
+
+        self.received = 0
+        self.conflated = 0
+        self.duplicates = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def conflatable(self, event: ServerSentEvent) -> bool:
+        return event.event in self.snapshot_types and is_progress_event(event.event)
+
+    async def put(self, event: ServerSentEvent) -> None:
+        """Add an event, waiting while the queue is full of events that cannot be conflated."""
+        async with self._changed:
+            self.received += 1
+            conflatable = self.conflatable(event)
+            if conflatable:
+                if event.data == self._last_progress_data:
+                    self.duplicates += 1
+                    return
+                self._last_progress_data = event.data
+                if self._items and self._items[-1][1]:
+                    self._items[-1] = (event, True)
+                    self.conflated += 1
+                    return
+
+            while len(self._items) >= self.maxsize:
+                await self._changed.wait()
+            self._items.append((event, conflatable))
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._changed.notify_all()
+
+    async def get(self) -> ServerSentEvent | None:
+        """Next event, or None once the queue is closed and drained.
+
+        Raises:
+            Exception: The error the queue was closed with, after the events before it
+        """
+        async with self._changed:
+            while not self._items and not self._closed:
+                await self._changed.wait()
+            if self._items:
+                event, _ = self._items.popleft()
+                self._changed.notify_all()
+                return event
+            if self._error is not None:
+                raise self._error
+            return None
+
+    async def close(self, error: BaseException | None = None) -> None:
+        """Mark the end of the stream; get() raises error once the remaining events are consumed."""
+        async with self._changed:
+            self._closed = True
+            self._error = error
+            self._changed.notify_all()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "received": self.received,
+            "conflated": self.conflated,
+            "duplicates": self.duplicates,
+            "max_depth": self.max_depth,
+        }
+
+
+async def aiter_conflated(
+    events: AsyncIterable[ServerSentEvent],
+    queue: ConflatingEventQueue | None = None,
+) -> AsyncIterator[ServerSentEvent]:
+    """Read events in a background task and yield them through a ConflatingEventQueue.
+
+    Args:
+        events: SSE events as read from the connection
+        queue: Queue to use, e.g. to report snapshot_types while consuming (default: a new one)
+    """
+    queue = queue if queue is not None else ConflatingEventQueue()
+
+    async def read() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.close(e)
+        else:
+            await queue.close()
+
+    reader = asyncio.create_task(read())
+    try:
+        while (event := await queue.get()) is not None:
+            yield event
+    finally:
+        reader.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reader
+        if queue.conflated or queue.duplicates:
+            logger.debug(
+                f"Stream queue: {queue.received} events received, {queue.conflated} conflated, "
+                f"{queue.duplicates} duplicates dropped, max depth {queue.max_depth}"
+            )
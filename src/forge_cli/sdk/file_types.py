@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -113,3 +114,24 @@ class DocumentResponse(BaseModel):
             except ValueError:
                 return v
         return v
+
+
+class UploadManifestEntry(BaseModel):
+    """One line of a bulk upload manifest: a local path and what the server made of it."""
+
+    path: str
+    size: int
+    mtime: float
+    md5: str | None = None
+    file_id: str | None = None
+    task_id: str | None = None
+    status: Literal["uploaded", "failed"]
+    error: str | None = None
+
+    def matches(self, path: Path) -> bool:
+        """Whether this entry still describes the file on disk."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import mimetypes
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import aiohttp  # Keep for FormData
 from loguru import logger
 
+from ..common import jsoncodec
+from .client import ForgeClient, get_default_client, resolve_client
 from .config import BASE_URL
+from .http_cache import bypass_cache, model_validate
 from .http_client import async_make_request
 
 # Import new types
-from .types import DeleteResponse, File, TaskStatus  # Updated imports
+from .types import DeleteResponse, File, TaskStatus, UploadManifestEntry  # Updated imports
 
 
 async def async_upload_file(
@@ -26,6 +32,7 @@ async def async_upload_file(
     request_id: str = None,
     skip_exists: bool = False,
     parse_options: dict[str, str] = None,
+    client: ForgeClient | None = None,
 ) -> File:  # Changed return type
     """
     Asynchronously upload a file to the Knowledge Forge API and return the file details.
@@ -44,6 +51,7 @@ async def async_upload_file(
         parse_options: Optional dict of parsing options. Keys: "abstract", "summary",
                       "outline", "keywords", "contexts", "graph", "vectorize",
                       "outline_json_style", "fast_mode". Values: "enable" or "disable".
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
 
     Returns:
         File object containing file details including id and task_id
@@ -67,6 +75,7 @@ async def async_upload_file(
 
     api_url = f"{BASE_URL}/v1/files"
     form_data = aiohttp.FormData()
+    file_handle = None
 
     if path:
         # File upload
@@ -78,9 +87,11 @@ async def async_upload_file(
         if content_type is None:
             content_type = "application/octet-stream"
 
+        # aiohttp streams the open file in chunks instead of reading it into memory
+        file_handle = open(file_path, "rb")
         form_data.add_field(
             "file",
-            open(file_path, "rb"),
+            file_handle,
             filename=file_path.name,
             content_type=content_type,
         )
@@ -106,10 +117,13 @@ async def async_upload_file(
         form_data.add_field("skip_exists", "true")
 
     if parse_options:
-        import json
-        form_data.add_field("parse_options", json.dumps(parse_options))
+        form_data.add_field("parse_options", jsoncodec.dumps(parse_options))
 
-    status_code, response_data = await async_make_request("POST", api_url, data=form_data)
+    try:
+        status_code, response_data = await async_make_request("POST", api_url, data=form_data, client=client)
+    finally:
+        if file_handle is not None:
+            file_handle.close()
 
     if status_code == 200 and isinstance(response_data, dict):
         try:
@@ -128,19 +142,160 @@ async def async_upload_file(
         raise Exception(f"Upload failed with status {status_code}. Response: {response_data}")
 
 
-async def async_check_task_status(task_id: str) -> TaskStatus:  # Changed return type
+def _file_md5(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """MD5 hex digest of a file, read in chunks."""
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_upload_manifest(manifest: Path) -> dict[str, UploadManifestEntry]:
+    """Load the latest successful manifest entry per path, ignoring unreadable lines."""
+    entries: dict[str, UploadManifestEntry] = {}
+    if not manifest.exists():
+        return entries
+    with open(manifest, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = UploadManifestEntry.model_validate_json(line)
+            except Exception:
+                continue  # Truncated last line of an interrupted run
+            if entry.status == "uploaded":
+                entries[entry.path] = entry
+    return entries
+
+
+async def async_upload_many(
+    paths: Iterable[str | Path],
+    concurrency: int = 4,
+    purpose: str = "general",
+    skip_exists: bool = True,
+    parse_options: dict[str, str] = None,
+    manifest_path: str | Path | None = None,
+    on_result: Callable[[UploadManifestEntry], None] | None = None,
+    client: ForgeClient | None = None,
+) -> list[UploadManifestEntry]:
+    """
+    Upload many local files with bounded concurrency.
+
+    Each file is streamed from disk. Its MD5 is computed in a worker thread and sent
+    along with skip_exists, so the server can short-circuit files it already has.
+    Every finished upload is appended to a JSONL manifest (path -> file id -> task id);
+    running again with the same manifest skips paths that were already uploaded and
+    have not changed on disk since.
+
+    Args:
+        paths: Local file paths to upload
+        concurrency: Maximum number of uploads (and MD5 computations) in flight; an
+            uploads limit configured on the request limiter still applies on top
+        purpose: The intended purpose of the files (e.g., "qa", "general")
+        skip_exists: Whether the server should skip files whose MD5 already exists
+        parse_options: Optional parsing options passed to every upload
+        manifest_path: Optional JSONL manifest to resume from and append to
+        on_result: Optional callback invoked with each entry as soon as it finishes
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
+
+    Returns:
+        One UploadManifestEntry per input path, in input order. Failed uploads are
+        reported with status "failed" rather than raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    file_paths = [Path(path).resolve() for path in paths]
+    manifest = Path(manifest_path).expanduser() if manifest_path else None
+    done = _read_upload_manifest(manifest) if manifest else {}
+
+    results: list[UploadManifestEntry | None] = [None] * len(file_paths)
+    pending: asyncio.Queue[tuple[int, Path]] = asyncio.Queue()
+    for index, file_path in enumerate(file_paths):
+        previous = done.get(str(file_path))
+        if previous is not None and previous.matches(file_path):
+            results[index] = previous
+        else:
+            pending.put_nowait((index, file_path))
+
+    skipped = len(file_paths) - pending.qsize()
+    if skipped:
+        logger.info(f"Skipping {skipped} file(s) already uploaded according to {manifest}")
+
+    manifest_file = open(manifest, "a", encoding="utf-8") if manifest else None
+    loop = asyncio.get_running_loop()
+    hash_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="forge-md5")
+
+    async def upload_one(file_path: Path) -> UploadManifestEntry:
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            return UploadManifestEntry(path=str(file_path), size=0, mtime=0.0, status="failed", error=str(e))
+
+        md5 = None
+        try:
+            md5 = await loop.run_in_executor(hash_pool, _file_md5, file_path)
+            uploaded = await async_upload_file(
+                path=str(file_path),
+                purpose=purpose,
+                md5=md5,
+                skip_exists=skip_exists,
+                parse_options=parse_options,
+                client=client,
+            )
+        except Exception as e:
+            logger.error(f"Upload of {file_path} failed: {e}")
+            return UploadManifestEntry(
+                path=str(file_path), size=stat.st_size, mtime=stat.st_mtime, md5=md5, status="failed", error=str(e)
+            )
+
+        return UploadManifestEntry(
+            path=str(file_path),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            md5=md5,
+            file_id=uploaded.id,
+            task_id=uploaded.task_id,
+            status="uploaded",
+        )
+
+    async def worker() -> None:
+        while True:
+            try:
+                index, file_path = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            entry = await upload_one(file_path)
+            results[index] = entry
+            if manifest_file is not None:
+                manifest_file.write(entry.model_dump_json() + "\n")
+                manifest_file.flush()
+            if on_result is not None:
+                on_result(entry)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, pending.qsize()))))
+    finally:
+        hash_pool.shutdown(wait=False, cancel_futures=True)
+        if manifest_file is not None:
+            manifest_file.close()
+
+    return results
+
+
+async def async_check_task_status(task_id: str, client: ForgeClient | None = None) -> TaskStatus:  # Changed return type
     """
     Check the status of a task by its ID.
 
     Args:
         task_id: The ID of the task to check
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
 
     Returns:
         TaskStatus object containing task status information
     """
     url = f"{BASE_URL}/v1/tasks/{task_id}"
 
-    status_code, response_data = await async_make_request("GET", url)
+    status_code, response_data = await async_make_request("GET", url, client=client)
 
     if status_code == 200 and isinstance(response_data, dict):
         try:
@@ -159,42 +314,50 @@ async def async_check_task_status(task_id: str) -> TaskStatus:  # Changed return
 
 
 async def async_wait_for_task_completion(
-    task_id: str, poll_interval: int = 2, max_attempts: int = 60
+    task_id: str,
+    poll_interval: float = 2,
+    max_attempts: int = 60,
+    client: ForgeClient | None = None,
 ) -> TaskStatus:  # Changed return type
     """
     Wait for a task to complete by polling its status.
 
+    Polling goes through the shared TaskWatcher, so concurrent waits on the same task
+    share one request per poll and idle tasks back off from poll_interval.
+
     Args:
         task_id: The ID of the task to wait for
-        poll_interval: How often to check the task status (in seconds)
+        poll_interval: Initial and shortest delay between status checks (in seconds)
         max_attempts: Maximum number of status checks before giving up
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
 
     Returns:
         TaskStatus object containing the final task status
     """
-    attempts = 0
-
-    while attempts < max_attempts:
-        task_status_obj = await async_check_task_status(task_id)  # Already returns TaskStatus
+    from .task_watcher import TaskWatcher, get_task_watcher
 
-        # Check if task is complete based on the status field of TaskStatus model
-        if task_status_obj.status in ["completed", "failed", "cancelled"]:  # Added "cancelled"
-            return task_status_obj
-
-        await asyncio.sleep(poll_interval)
-        attempts += 1
+    watcher = get_task_watcher()
+    client = resolve_client(client)
+    if client is not (watcher.client or get_default_client()):
+        watcher = TaskWatcher(client=client)
+        try:
+            return await watcher.wait(task_id, interval=poll_interval, max_polls=max_attempts)
+        finally:
+            await watcher.close()
 
-    raise TimeoutError(
-        f"Task {task_id} did not complete within the allowed time. Last status: {task_status_obj.status if 'task_status_obj' in locals() else 'unknown'}"
-    )
+    return await watcher.wait(task_id, interval=poll_interval, max_polls=max_attempts)
 
 
-async def async_fetch_file(file_id: str) -> File | None:  # Changed return type
+async def async_fetch_file(
+    file_id: str, client: ForgeClient | None = None, no_cache: bool = False
+) -> File | None:  # Changed return type
     """
     Asynchronously fetch file information by its ID.
 
     Args:
         file_id: The ID of the file to fetch
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
+        no_cache: Bypass the HTTP cache and fetch fresh data
 
     Returns:
         File object containing file details or None if not found
@@ -202,11 +365,12 @@ async def async_fetch_file(file_id: str) -> File | None:  # Changed return type
     url = f"{BASE_URL}/v1/files/{file_id}/content"  # Assuming content endpoint returns full File object
 
     try:
-        status_code, response_data = await async_make_request("GET", url)
+        with bypass_cache(no_cache):
+            status_code, response_data = await async_make_request("GET", url, client=client)
 
         if status_code == 200 and isinstance(response_data, dict):
             try:
-                return File.model_validate(response_data)  # Parse to File model
+                return model_validate(File, response_data)  # Parse to File model
             except Exception as e:
                 logger.error(
                     f"Fetch file {file_id} succeeded but failed to parse response into File model: {e}. Response: {response_data}"
@@ -227,13 +391,15 @@ async def async_fetch_file(file_id: str) -> File | None:  # Changed return type
         return None
 
 
-async def async_fetch_document_content(document_id: str):
+async def async_fetch_document_content(document_id: str, client: ForgeClient | None = None, no_cache: bool = False):
     """
     Asynchronously fetch document content by its ID.
     This function handles the actual API response structure for document content.
 
     Args:
         document_id: The ID of the document to fetch
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
+        no_cache: Bypass the HTTP cache and fetch fresh data
 
     Returns:
         DocumentResponse object containing document details or None if not found
@@ -243,11 +409,12 @@ async def async_fetch_document_content(document_id: str):
     url = f"{BASE_URL}/v1/files/{document_id}/content"
 
     try:
-        status_code, response_data = await async_make_request("GET", url)
+        with bypass_cache(no_cache):
+            status_code, response_data = await async_make_request("GET", url, client=client)
 
         if status_code == 200 and isinstance(response_data, dict):
             try:
-                return DocumentResponse.model_validate(response_data)
+                return model_validate(DocumentResponse, response_data)
             except Exception as e:
                 logger.error(
                     f"Fetch document {document_id} succeeded but failed to parse response: {e}. Response keys: {list(response_data.keys()) if response_data else 'None'}"
@@ -268,12 +435,13 @@ async def async_fetch_document_content(document_id: str):
         return None
 
 
-async def async_delete_file(file_id: str) -> DeleteResponse | None:  # Changed return type
+async def async_delete_file(file_id: str, client: ForgeClient | None = None) -> DeleteResponse | None:  # Changed return type
     """
     Asynchronously delete a file by its ID.
 
     Args:
         file_id: The ID of the file to delete
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
 
     Returns:
         DeleteResponse object if successfully deleted, None otherwise
@@ -281,7 +449,7 @@ async def async_delete_file(file_id: str) -> DeleteResponse | None:  # Changed r
     url = f"{BASE_URL}/v1/files/{file_id}"
 
     try:
-        status_code, response_data = await async_make_request("DELETE", url)
+        status_code, response_data = await async_make_request("DELETE", url, client=client)
 
         if status_code == 200 and isinstance(response_data, dict):
             try:
@@ -332,6 +500,7 @@ async def async_update_document(
     permissions: list[str] = None,
     metadata: dict = None,
     vector_store_ids: list[str] = None,
+    client: ForgeClient | None = None,
 ) -> dict | None:
     """
     Asynchronously update a document's metadata and properties.
@@ -350,6 +519,7 @@ async def async_update_document(
         permissions: Optional list of permissions
         metadata: Optional metadata dictionary
         vector_store_ids: Optional list of vector store IDs
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
 
     Returns:
         Dictionary with update confirmation or None if update failed
@@ -388,7 +558,7 @@ async def async_update_document(
         return None
 
     try:
-        status_code, response_data = await async_make_request("POST", url, json_payload=payload)
+        status_code, response_data = await async_make_request("POST", url, json_payload=payload, client=client)
         if status_code == 200 and isinstance(response_data, dict):
             return response_data
         elif status_code == 200 and isinstance(response_data, str):
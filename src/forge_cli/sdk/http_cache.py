@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+"""
+HTTP response cache for read-mostly SDK endpoints.
+
+async_make_request consults the process-wide HttpCache for GET requests to the
+endpoints listed in DEFAULT_CACHEABLE_PATHS (vector store details and summaries,
+file/document content). A cached body is
+
+- served without a request while younger than the cache TTL
+- revalidated afterwards with If-None-Match / If-Modified-Since, so an unchanged
+  resource costs a 304 instead of the full payload
+- kept on disk under ~/.forge-cli/cache, evicted least recently used once the
+  directory grows past max_bytes, and also kept in memory for the recently used ones
+  up to max_memory_bytes; bodies larger than a quarter of that budget (e.g. the
+  content of long documents) are kept on disk only, so they are not held in memory
+  between calls
+
+Bodies held in memory are returned as the same object on every hit, which lets
+model_validate() hand back the pydantic object parsed the first time instead of
+validating the payload again. Callers must treat cached bodies and models as
+read-only.
+
+Any non-GET request invalidates the cached entries of the resource it touches
+(e.g. DELETE /v1/files/{id} drops /v1/files/{id}/content). Wrap calls in
+``with bypass_cache():`` to skip cached copies and fetch fresh data.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from loguru import logger
+from pydantic import BaseModel
+
+from ..common import jsoncodec
+
+DEFAULT_CACHE_DIR = Path.home() / ".forge-cli" / "cache"
+DEFAULT_TTL = 30.0  # seconds a cached body is served without revalidation
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # on-disk budget
+DEFAULT_MAX_MEMORY_BYTES = 16 * 1024 * 1024  # raw JSON size of the bodies held in memory
+
+DEFAULT_CACHEABLE_PATHS = (
+    r"/v1/vector_stores/[^/]+",
+    r"/v1/vector_stores/[^/]+/summary",
+    r"/v1/files/[^/]+/content",
+)
+
+# Requests touching the same /v1/<collection>/<id> share cache invalidation
+_RESOURCE_ROOT = re.compile(r"^/v1/[^/]+/[^/]+")
+
+_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar("forge_http_cache_bypass", default=False)
+
+
+@contextlib.contextmanager
+def bypass_cache(active: bool = True) -> Iterator[None]:
+    """Skip cached copies for requests made inside the block; fresh responses are still stored."""
+    token = _bypass.set(active)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def cache_bypassed() -> bool:
+    """Whether the current context asked to skip cached copies."""
+    return _bypass.get()
+
+
+@dataclass(eq=False)
+class CachedResponse:
+    """A cached 200 response body with its validators."""
+
+    url: str
+    body: Any
+    size: int
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    max_age: float | None = None
+    models: dict[type, BaseModel] = field(default_factory=dict)
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the body may be served without asking the server."""
+        ttl = self.max_age if self.max_age is not None else ttl
+        return time.time() - self.stored_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers turning the next request into a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def meta(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "stored_at": self.stored_at,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "max_age": self.max_age,
+        }
+
+
+class HttpCache:
+    """Two-level (memory, disk) cache of JSON GET responses.
+
+    Each entry is a ``<key>.body`` file with the raw response bytes and a small
+    ``<key>.meta`` JSON file with the validators, so a 304 only rewrites the meta
+    file. Body file mtimes track recency for LRU eviction.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        cacheable_paths: tuple[str, ...] = DEFAULT_CACHEABLE_PATHS,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            directory: Where entries are stored (defaults to ~/.forge-cli/cache)
+            ttl: Seconds a body is served without revalidation (0 always revalidates)
+            max_bytes: On-disk size above which least recently used entries are evicted
+            max_memory_bytes: Raw size of the recently used bodies also kept in memory;
+                a single body larger than a quarter of it is never kept in memory
+            cacheable_paths: Regular expressions of URL paths whose GET responses are cached
+            enabled: Whether the cache is consulted at all
+        """
+        self.directory = Path(directory) if directory is not None else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.enabled = enabled
+        self._cacheable = re.compile("|".join(f"(?:{pattern})" for pattern in cacheable_paths) or r"(?!)")
+
+        # The memory layer is shared with the sync facade's loop thread
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._memory_bytes = 0
+        # id(body) -> entry, to find the parsed models of a body handed out earlier
+        self._bodies: dict[int, CachedResponse] = {}
+        self._disk_bytes: int | None = None
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def is_cacheable(self, method: str, url: str) -> bool:
+        """Whether a request may be answered from the cache."""
+        return self.enabled and method.upper() == "GET" and self._cacheable.fullmatch(urlsplit(url).path) is not None
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any] | None = None) -> str:
+        """Cache key of a request: resource root digest, then full request digest."""
+        full = url
+        if params:
+            full = f"{url}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+        return f"{_resource_digest(url)}-{hashlib.sha256(full.encode()).hexdigest()[:32]}"
+
+    # ------------------------------------------------------------------
+    # Lookup and storage
+    # ------------------------------------------------------------------
+
+    async def lookup(self, key: str) -> CachedResponse | None:
+        """Return the cached entry for key from memory or disk, if any."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        try:
+            entry = await asyncio.to_thread(self._read_entry, key)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable HTTP cache entry {key}: {e}")
+            await asyncio.to_thread(self._remove_entry, key)
+            return None
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    async def store(self, key: str, url: str, raw: bytes, body: Any, headers: Mapping[str, str]) -> None:
+        """Store a fresh 200 response unless the server forbids it."""
+        directives = _cache_control(headers)
+        if "no-store" in directives:
+            return
+        entry = CachedResponse(
+            url=url,
+            body=body,
+            size=len(raw),
+            stored_at=time.time(),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            max_age=0.0 if "no-cache" in directives else _max_age(directives),
+        )
+        self._remember(key, entry)
+        try:
+            await asyncio.to_thread(self._write_entry, key, entry, raw)
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache entry for {url}: {e}")
+
+    async def refresh(self, key: str, entry: CachedResponse, headers: Mapping[str, str]) -> None:
+        """Record a 304 Not Modified: the entry is fresh again, the body is kept."""
+        entry.stored_at = time.time()
+        entry.etag = headers.get("ETag", entry.etag)
+        entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+        try:
+            await asyncio.to_thread(self._write_meta, key, entry)
+        except OSError as e:
+            logger.warning(f"Could not update HTTP cache entry for {entry.url}: {e}")
+
+    def invalidate(self, url: str) -> None:
+        """Drop every entry of the resource url belongs to (memory and disk)."""
+        prefix = f"{_resource_digest(url)}-"
+        with self._lock:
+            for key in [key for key in self._memory if key.startswith(prefix)]:
+                self._forget(key)
+        if self.directory.is_dir():
+            for path in self.directory.glob(f"{prefix}*"):
+                if path.suffix == ".body":
+                    self._remove_entry(path.stem)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._memory.clear()
+            self._bodies.clear()
+            self._memory_bytes = 0
+        if self.directory.is_dir():
+            for path in self.directory.glob("*.body"):
+                self._remove_entry(path.stem)
+        self._disk_bytes = 0
+
+    def model_validate[ModelT: BaseModel](self, model: type[ModelT], data: Any) -> ModelT:
+        """``model.model_validate(data)``, memoized when data is a cached body."""
+        entry = self._bodies.get(id(data))
+        if entry is None or entry.body is not data:
+            return model.model_validate(data)
+        parsed = entry.models.get(model)
+        if parsed is None:
+            parsed = entry.models[model] = model.model_validate(data)
+        return parsed
+
+    # ------------------------------------------------------------------
+    # Memory layer
+    # ------------------------------------------------------------------
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            if key in self._memory:
+                self._forget(key)
+            if entry.size > self.max_memory_bytes // 4:
+                return
+            self._memory[key] = entry
+            self._memory_bytes += entry.size
+            self._bodies[id(entry.body)] = entry
+            while self._memory_bytes > self.max_memory_bytes:
+                self._forget(next(iter(self._memory)))
+
+    def _forget(self, key: str) -> None:
+        """Drop key from the memory layer; callers hold the lock."""
+        entry = self._memory.pop(key, None)
+        if entry is None:
+            return
+        self._memory_bytes -= entry.size
+        if self._bodies.get(id(entry.body)) is entry:
+            del self._bodies[id(entry.body)]
+
+    # ------------------------------------------------------------------
+    # Disk layer (run in a worker thread)
+    # ------------------------------------------------------------------
+
+    def _read_entry(self, key: str) -> CachedResponse | None:
+        body_path = self.directory / f"{key}.body"
+        meta_path = self.directory / f"{key}.meta"
+        if not body_path.exists() or not meta_path.exists():
+            return None
+        meta = jsoncodec.loads(meta_path.read_bytes())
+        raw = body_path.read_bytes()
+        os.utime(body_path)  # mark as recently used
+        return CachedResponse(body=jsoncodec.loads(raw), size=len(raw), **meta)
+
+    def _write_entry(self, key: str, entry: CachedResponse, raw: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        body_path = self.directory / f"{key}.body"
+        previous = body_path.stat().st_size if body_path.exists() else 0
+        _atomic_write(body_path, raw)
+        self._write_meta(key, entry)
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(path.stat().st_size for path in self.directory.glob("*.body"))
+        else:
+            self._disk_bytes += len(raw) - previous
+        if self._disk_bytes > self.max_bytes:
+            self._evict(keep=key)
+
+    def _write_meta(self, key: str, entry: CachedResponse) -> None:
+        _atomic_write(self.directory / f"{key}.meta", jsoncodec.dumpb(entry.meta()))
+
+    def _evict(self, keep: str) -> None:
+        """Delete least recently used entries until the directory is below 80% of max_bytes."""
+        bodies = []
+        for path in self.directory.glob("*.body"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            bodies.append((stat.st_mtime, stat.st_size, path.stem))
+        bodies.sort()
+
+        total = sum(size for _, size, _ in bodies)
+        target = self.max_bytes * 0.8
+        for _, size, key in bodies:
+            if total <= target:
+                break
+            if key == keep:
+                continue
+            self._remove_entry(key)
+            total -= size
+        self._disk_bytes = total
+
+    def _remove_entry(self, key: str) -> None:
+        for suffix in (".body", ".meta"):
+            path = self.directory / f"{key}{suffix}"
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            if suffix == ".body" and self._disk_bytes is not None:
+                self._disk_bytes -= size
+
+
+def _resource_digest(url: str) -> str:
+    parts = urlsplit(url)
+    root = _RESOURCE_ROOT.match(parts.path)
+    resource = f"{parts.scheme}://{parts.netloc}{root.group(0) if root else parts.path}"
+    return hashlib.sha256(resource.encode()).hexdigest()[:16]
+
+
+def _cache_control(headers: Mapping[str, str]) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _max_age(directives: dict[str, str | None]) -> float | None:
+    value = directives.get("max-age")
+    return float(value) if value and value.isdigit() else None
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+_default_cache: HttpCache | None = None
+
+
+def get_http_cache() -> HttpCache:
+    """Return the process-wide HTTP cache, creating it if needed."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = HttpCache()
+    return _default_cache
+
+
+def set_http_cache(cache: HttpCache | None) -> None:
+    """Replace the process-wide HTTP cache (None resets to a lazy default)."""
+    global _default_cache
+    _default_cache = cache
+
+
+def model_validate[ModelT: BaseModel](model: type[ModelT], data: Any) -> ModelT:
+    """Validate data into model, reusing the parsed object for unchanged cached bodies."""
+    return get_http_cache().model_validate(model, data)
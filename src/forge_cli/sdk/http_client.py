@@ -3,6 +3,14 @@ from __future__ import annotations
 import aiohttp
 from loguru import logger
 
+from ..common import jsoncodec
+from .client import ForgeClient, resolve_client
+from .compression import open_request, record_response
+from .http_cache import CachedResponse, HttpCache, cache_bypassed, get_http_cache
+from .limits import get_request_limiter
+from .metrics import get_metrics
+from .single_flight import get_single_flight
+
 
 async def async_make_request(
     method: str,
@@ -10,6 +18,7 @@ async def async_make_request(
     json_payload: dict = None,
     data=None,  # For form-data
     params: dict = None,
+    client: ForgeClient | None = None,
 ) -> tuple[int, dict | str | None]:
     """
     Makes an asynchronous HTTP request.
@@ -20,43 +29,118 @@ async def async_make_request(
         json_payload: JSON payload for the request body.
         data: Data for form-data requests.
         params: URL query parameters.
+        client: Pooled ForgeClient to use (defaults to the process-wide client).
 
     Returns:
         A tuple containing the status code and response data (dict, str, or None).
+        GET requests to cacheable endpoints may be answered from the HTTP cache
+        (see http_cache), and concurrent identical GET requests share one request
+        and one body (see single_flight); such bodies must not be mutated.
 
     Raises:
         Exception: For API request failures with non-2xx status codes (excluding 404).
         aiohttp.ClientError: For client-side errors during the request.
     """
-    async with aiohttp.ClientSession() as session:
+    if method.upper() == "GET":
+        key = (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())), cache_bypassed())
+        return await get_single_flight().do(
+            key, lambda: _make_request(method, url, json_payload, data, params, client)
+        )
+    return await _make_request(method, url, json_payload, data, params, client)
+
+
+async def _make_request(
+    method: str,
+    url: str,
+    json_payload: dict | None,
+    data,
+    params: dict | None,
+    client: ForgeClient | None,
+) -> tuple[int, dict | str | None]:
+    cache = get_http_cache()
+    cache_key = None
+    cached = None
+    headers = None
+    if cache.is_cacheable(method, url):
+        cache_key = cache.key(url, params)
+        if not cache_bypassed():
+            cached = await cache.lookup(cache_key)
+            if cached is not None:
+                if cached.is_fresh(cache.ttl):
+                    return 200, cached.body
+                headers = cached.conditional_headers()
+    elif cache.enabled and method.upper() != "GET" and not url.endswith("/search"):
+        # Writes make cached copies of the same resource stale; searches are reads
+        cache.invalidate(url)
+
+    session = await resolve_client(client).get_session()
+    try:
+        with get_metrics().measure(method, url) as timer:
+            async with get_request_limiter().slot(method, url) as outcome:
+                async with await open_request(
+                    session,
+                    method,
+                    url,
+                    json_payload=json_payload,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    timer=timer,
+                ) as response:
+                    outcome.status = response.status
+                    body_size = len(await response.read())
+                    timer.bytes_received = response.content_length or body_size
+                    record_response(response, body_size)
+                    return await _interpret_response(method, url, response, cache, cache_key, cached)
+    except aiohttp.ClientError as e:
+        logger.error(f"aiohttp.ClientError during request to {method} {url}: {e}")
+        raise  # Re-raise the original ClientError
+    except Exception as e:
+        logger.error(f"Unexpected error during request to {method} {url}: {e}")
+        raise  # Re-raise other unexpected errors
+
+
+async def _interpret_response(
+    method: str,
+    url: str,
+    response: aiohttp.ClientResponse,
+    cache: HttpCache,
+    cache_key: str | None,
+    cached: CachedResponse | None,
+) -> tuple[int, dict | str | None]:
+    """Turn a response of async_make_request into its (status, data) result."""
+    status_code = response.status
+    if status_code == 304 and cached is not None:
+        await cache.refresh(cache_key, cached, response.headers)
+        return 200, cached.body
+    if status_code == 200 and cache_key is not None:
+        raw = await response.read()
+        try:
+            body = jsoncodec.loads(raw)
+        except ValueError:
+            text = raw.decode("utf-8", errors="replace")
+            logger.error(f"Response from {method} {url} was 200 but not valid JSON. Text: {text}")
+            return status_code, text
+        await cache.store(cache_key, url, raw, body, response.headers)
+        return status_code, body
+    if status_code == 200:
         try:
-            async with session.request(method, url, json=json_payload, data=data, params=params) as response:
-                status_code = response.status
-
-                if status_code == 200:
-                    try:
-                        json_response = await response.json()
-                        return status_code, json_response
-                    except aiohttp.ContentTypeError:  # Handles cases where response is not JSON
-                        logger.error(
-                            f"Response from {method} {url} was 200 but not valid JSON. Text: {await response.text()}"
-                        )
-                        return status_code, await response.text()
-                elif status_code == 404:
-                    logger.warning(f"Resource not found (404) for {method} {url}.")
-                    return status_code, None
-                elif status_code >= 200 and status_code < 300:  # Other 2xx statuses
-                    logger.info(
-                        f"Request to {method} {url} returned status {status_code}. Text: {await response.text()}"
-                    )
-                    return status_code, await response.text()
-                else:  # Non-2xx status codes that are not 404
-                    error_text = await response.text()
-                    logger.error(f"API request to {method} {url} failed with status {status_code}: {error_text}")
-                    raise Exception(f"API request failed with status {status_code}: {error_text}")
-        except aiohttp.ClientError as e:
-            logger.error(f"aiohttp.ClientError during request to {method} {url}: {e}")
-            raise  # Re-raise the original ClientError
-        except Exception as e:
-            logger.error(f"Unexpected error during request to {method} {url}: {e}")
-            raise  # Re-raise other unexpected errors
+            json_response = await response.json(loads=jsoncodec.loads)
+            return status_code, json_response
+        except aiohttp.ContentTypeError:  # Handles cases where response is not JSON
+            logger.error(
+                f"Response from {method} {url} was 200 but not valid JSON. Text: {await response.text()}"
+            )
+            return status_code, await response.text()
+    elif status_code == 404:
+        logger.warning(f"Resource not found (404) for {method} {url}.")
+        return status_code, None
+    elif status_code >= 200 and status_code < 300:  # Other 2xx statuses
+        logger.info(
+            f"Request to {method} {url} returned status {status_code}. Text: {await response.text()}"
+        )
+        return status_code, await response.text()
+    else:  # Non-2xx status codes that are not 404
+        error_text = await response.text()
+        logger.error(f"API request to {method} {url} failed with status {status_code}: {error_text}")
+        raise Exception(f"API request failed with status {status_code}: {error_text}")
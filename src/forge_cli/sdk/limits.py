@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+"""
+Client-side request rate limiting and circuit breaking.
+
+Bulk scripts and the chat client share one RequestLimiter per process. Requests
+are grouped into endpoint classes (uploads, searches, responses, polls, and
+default for everything else); each class has
+
+- a token bucket capping the request rate (with a burst allowance)
+- a cap on requests in flight at once
+- a circuit breaker: after ``failure_threshold`` consecutive failures (5xx
+  answers, connection errors, timeouts) the class fails fast with
+  CircuitOpenError for ``reset_timeout`` seconds, then lets a single probe
+  request through (half-open). A successful probe closes the circuit; a failed
+  one opens it again.
+
+Rates and concurrency caps are off by default (see DEFAULT_LIMITS), so callers
+that bound their own concurrency, like async_upload_many, get exactly what they
+ask for; they apply once set with ``--rate-limit CLASS=RATE[/CONCURRENCY]`` or the
+``rate_limit`` config key. The circuit breakers are on by default.
+
+Waiting for a token or a slot happens before the request is sent, so a loaded
+server sees a bounded request rate instead of every caller piling on. 4xx answers
+are the caller's problem and do not trip the breaker.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+ENDPOINT_CLASSES = ("uploads", "searches", "responses", "polls", "default")
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0  # seconds an open circuit fails fast before probing
+
+
+@dataclass(frozen=True)
+class LimitSettings:
+    """Limits of one endpoint class; None means unlimited."""
+
+    rate: float | None = None  # requests per second
+    burst: int = 1  # requests allowed back to back once the bucket is full
+    concurrency: int | None = None  # requests in flight at once
+
+    @classmethod
+    def parse(cls, spec: str) -> LimitSettings:
+        """Parse ``RATE[/CONCURRENCY]`` (e.g. ``5``, ``5/4``, ``/4``; 0 means unlimited)."""
+        rate_text, _, concurrency_text = spec.strip().partition("/")
+        try:
+            rate = float(rate_text) if rate_text.strip() else 0.0
+            concurrency = int(concurrency_text) if concurrency_text.strip() else 0
+        except ValueError:
+            raise ValueError(f"Invalid limit '{spec}', expected RATE[/CONCURRENCY]") from None
+        if rate < 0 or concurrency < 0:
+            raise ValueError(f"Invalid limit '{spec}', values must not be negative")
+        return cls(
+            rate=rate or None,
+            burst=max(1, int(rate)),
+            concurrency=concurrency or None,
+        )
+
+
+# Unlimited: a default cap would silently override the concurrency callers ask for
+DEFAULT_LIMITS: dict[str, LimitSettings] = {name: LimitSettings() for name in ENDPOINT_CLASSES}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit of its endpoint class is open."""
+
+    def __init__(self, endpoint_class: str, retry_in: float):
+        super().__init__(f"Knowledge Forge {endpoint_class} requests are failing; not sending more for {retry_in:.0f}s")
+        self.endpoint_class = endpoint_class
+        self.retry_in = retry_in
+
+
+def classify(method: str, url: str) -> str:
+    """Endpoint class of a request."""
+    path = urlsplit(url).path.rstrip("/")
+    method = method.upper()
+    if path.endswith("/search"):
+        return "searches"
+    if path.startswith("/v1/responses"):
+        return "responses"
+    if path.startswith("/v1/tasks/") and method == "GET":
+        return "polls"
+    if path == "/v1/files" and method == "POST":
+        return "uploads"
+    return "default"
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second, holding at most ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()  # waiters are served in arrival order
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        name: str = "default",
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._probing or time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def admit(self) -> bool:
+        """Admit a request.
+
+        Returns:
+            True if the request is the half-open probe
+
+        Raises:
+            CircuitOpenError: While the circuit is open or another probe is in flight
+        """
+        if self._opened_at is None:
+            return False
+        remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+        if remaining <= 0 and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        raise CircuitOpenError(self.name, max(remaining, 0.0))
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info(f"Circuit for {self.name} requests closed")
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self, probe: bool = False) -> None:
+        self.failures += 1
+        if probe or (self._opened_at is None and 0 < self.failure_threshold <= self.failures):
+            logger.warning(f"Circuit for {self.name} requests opened after {self.failures} consecutive failures")
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """Give up a probe that ended without a verdict (e.g. cancelled)."""
+        self._probing = False
+
+
+class RequestOutcome:
+    """Filled in by the caller inside RequestLimiter.slot() to report the HTTP status."""
+
+    __slots__ = ("status",)
+
+    def __init__(self):
+        self.status: int | None = None
+
+
+class _EndpointLimiter:
+    def __init__(self, settings: LimitSettings, breaker: CircuitBreaker):
+        self.settings = settings
+        self.bucket = TokenBucket(settings.rate, settings.burst) if settings.rate else None
+        self.semaphore = asyncio.Semaphore(settings.concurrency) if settings.concurrency else None
+        self.breaker = breaker
+        self.in_flight = 0
+        self.waiting = 0
+
+
+class RequestLimiter:
+    """Per-endpoint-class rate limits, concurrency caps and circuit breakers."""
+
+    def __init__(
+        self,
+        limits: Mapping[str, LimitSettings] | None = None,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            limits: Settings per endpoint class; classes not given keep DEFAULT_LIMITS
+            failure_threshold: Consecutive failures that open a circuit (0 disables breaking)
+            reset_timeout: Seconds an open circuit fails fast before a probe is let through
+            enabled: Whether requests are limited at all
+        """
+        unknown = set(limits or ()) - set(ENDPOINT_CLASSES)
+        if unknown:
+            raise ValueError(f"Unknown endpoint classes: {', '.join(sorted(unknown))}")
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.enabled = enabled
+        # asyncio primitives are bound to a loop; see _endpoints()
+        self._by_loop: dict[asyncio.AbstractEventLoop, dict[str, _EndpointLimiter]] = {}
+        self._breakers = {name: CircuitBreaker(name, failure_threshold, reset_timeout) for name in ENDPOINT_CLASSES}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, method: str, url: str) -> AsyncIterator[RequestOutcome]:
+        """Wait for capacity to send a request and report its outcome to the breaker.
+
+        Set ``outcome.status`` inside the block; a 5xx status or an exception other
+        than cancellation counts as a failure.
+
+        Raises:
+            CircuitOpenError: If the endpoint class is failing and not due for a probe
+        """
+        outcome = RequestOutcome()
+        if not self.enabled:
+            yield outcome
+            return
+
+        endpoint = self._endpoints()[classify(method, url)]
+        probe = endpoint.breaker.admit()
+
+        acquired = False
+        endpoint.waiting += 1
+        try:
+            if endpoint.semaphore is not None:
+                await endpoint.semaphore.acquire()
+                acquired = True
+            if endpoint.bucket is not None:
+                await endpoint.bucket.acquire()
+        except BaseException:
+            if acquired:
+                endpoint.semaphore.release()
+            if probe:
+                endpoint.breaker.release_probe()
+            raise
+        finally:
+            endpoint.waiting -= 1
+
+        verdict = None
+        endpoint.in_flight += 1
+        try:
+            yield outcome
+            verdict = outcome.status is None or outcome.status < 500
+        except Exception:
+            # Answers below 500 mean the server is healthy, even if the caller raised
+            verdict = outcome.status is not None and outcome.status < 500
+            raise
+        finally:
+            endpoint.in_flight -= 1
+            if endpoint.semaphore is not None:
+                endpoint.semaphore.release()
+            if verdict is True:
+                endpoint.breaker.record_success()
+            elif verdict is False:
+                endpoint.breaker.record_failure(probe)
+            elif probe:
+                endpoint.breaker.release_probe()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Current state of every endpoint class, for the stats surface."""
+        endpoints = self._by_loop.get(_running_loop(), {})
+        result = {}
+        for name in ENDPOINT_CLASSES:
+            settings = self.limits[name]
+            breaker = self._breakers[name]
+            endpoint = endpoints.get(name)
+            result[name] = {
+                "rate": settings.rate,
+                "concurrency": settings.concurrency,
+                "in_flight": endpoint.in_flight if endpoint else 0,
+                "waiting": endpoint.waiting if endpoint else 0,
+                "circuit": breaker.state,
+                "consecutive_failures": breaker.failures,
+                "rejected": breaker.rejected,
+            }
+        return result
+
+    def _endpoints(self) -> dict[str, _EndpointLimiter]:
+        loop = asyncio.get_running_loop()
+        endpoints = self._by_loop.get(loop)
+        if endpoints is None:
+            # Drop the state of loops that have finished (e.g. earlier asyncio.run() calls)
+            for stale in [stale for stale in self._by_loop if stale.is_closed()]:
+                del self._by_loop[stale]
+            endpoints = self._by_loop[loop] = {
+                name: _EndpointLimiter(self.limits[name], self._breakers[name]) for name in ENDPOINT_CLASSES
+            }
+        return endpoints
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+_default_limiter: RequestLimiter | None = None
+
+
+def get_request_limiter() -> RequestLimiter:
+    """Return the process-wide limiter, creating it if needed."""
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = RequestLimiter()
+    return _default_limiter
+
+
+def set_request_limiter(limiter: RequestLimiter | None) -> None:
+    """Replace the process-wide limiter (None resets to a lazy default)."""
+    global _default_limiter
+    _default_limiter = limiter
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+"""
+Per-endpoint client metrics.
+
+Every request made through the SDK is measured with a RequestTimer and
+aggregated by ClientMetrics under a normalized endpoint name
+(``GET /v1/vector_stores/{id}``). For each endpoint it keeps
+
+- latency, time to first byte and (for streamed responses) time to first token
+  histograms
+- bytes sent and received
+- connections opened vs reused, retries and errors
+
+Histograms use fixed-memory HDR-style buckets: values are recorded in
+microseconds into 2**SUB_BUCKET_BITS linear sub-buckets per power of two, so
+every recorded value is within about 3% of its bucket bound and memory does not
+grow with the number of samples.
+
+Time to first byte comes from aiohttp tracing (see metrics_trace_config, which
+ForgeClient installs on its session); comparing it with latency and time to
+first token separates server time from client parse and render cost.
+
+Streams run through the stream pipeline (forge_cli.stream.pipeline) also record
+one StageStats per stage ("read", "parse", "render"): the depth of the stage's
+input queue, how long items waited in it and how long the stage worked on each.
+
+Streams that lost their connection and were resumed (see stream_resume) are
+counted in ResumeStats, with the time from the disconnect to the first event
+received again.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from ..common import jsoncodec
+
+SUB_BUCKET_BITS = 5
+MAX_TRACKABLE_SECONDS = 3600.0
+PERCENTILES = (50.0, 90.0, 99.0)
+
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Path segments naming a collection; the segment after one is an identifier
+_COLLECTIONS = frozenset({"vector_stores", "files", "tasks", "responses", "documents", "chunks", "conversations"})
+
+
+class Histogram:
+    """Fixed-memory log-linear histogram of durations."""
+
+    __slots__ = ("_counts", "count", "total", "min", "max")
+
+    def __init__(self, max_seconds: float = MAX_TRACKABLE_SECONDS):
+        self._counts = [0] * (_bucket_index(int(max_seconds * 1_000_000)) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one duration; values beyond the trackable range land in the last bucket."""
+        seconds = max(seconds, 0.0)
+        index = min(_bucket_index(int(seconds * 1_000_000)), len(self._counts) - 1)
+        self._counts[index] += 1
+        self.min = seconds if self.count == 0 else min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.count += 1
+        self.total += seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Upper bound (in seconds) of the bucket holding the given percentile."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(percent / 100 * self.count))
+        seen = 0
+        for index, bucket in enumerate(self._counts):
+            seen += bucket
+            if seen >= rank:
+                if index == len(self._counts) - 1:
+                    break  # the overflow bucket has no meaningful upper bound
+                return min(_bucket_upper(index) / 1_000_000, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, float]:
+        result = {"count": self.count, "mean": self.mean, "min": self.min, "max": self.max}
+        for percent in PERCENTILES:
+            result[f"p{percent:g}"] = self.percentile(percent)
+        return result
+
+
+def _bucket_index(value: int) -> int:
+    if value < 2 * _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return shift * _SUB_BUCKETS + (value >> shift)
+
+
+def _bucket_upper(index: int) -> int:
+    if index < 2 * _SUB_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    mantissa = index - shift * _SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+class EndpointStats:
+    """Aggregated measurements of one endpoint."""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.first_byte = Histogram()
+        self.first_token = Histogram()
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "latency": self.latency.to_dict(),
+            "time_to_first_byte": self.first_byte.to_dict(),
+            "time_to_first_token": self.first_token.to_dict(),
+        }
+
+
+class StageStats:
+    """Aggregated measurements of one stream pipeline stage."""
+
+    def __init__(self):
+        self.wait = Histogram()  # time an item spent waiting before the stage took it
+        self.busy = Histogram()  # time the stage spent on an item
+        self.processed = 0
+        self.conflated = 0  # items replaced by a newer one while queued
+        self.max_depth = 0
+        self._depth_total = 0
+
+    def record(self, wait: float, busy: float, depth: int) -> None:
+        """Add one processed item; depth is the input queue length when it was taken."""
+        self.processed += 1
+        self.wait.record(wait)
+        self.busy.record(busy)
+        self._depth_total += depth
+        self.max_depth = max(self.max_depth, depth)
+
+    @property
+    def mean_depth(self) -> float:
+        return self._depth_total / self.processed if self.processed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "conflated": self.conflated,
+            "max_depth": self.max_depth,
+            "mean_depth": round(self.mean_depth, 2),
+            "wait": self.wait.to_dict(),
+            "busy": self.busy.to_dict(),
+        }
+
+
+class ResumeStats:
+    """Reconnects of streamed responses whose connection dropped."""
+
+    def __init__(self):
+        self.latency = Histogram()  # disconnect to first event received again
+        self.disconnects = 0
+        self.attempts = 0
+        self.resumed = 0  # finished by reconnecting with Last-Event-ID
+        self.polled = 0  # finished by polling the stored response
+        self.failed = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "disconnects": self.disconnects,
+            "attempts": self.attempts,
+            "resumed": self.resumed,
+            "polled": self.polled,
+            "failed": self.failed,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class RequestTimer:
+    """Measurements of one request, filled in by the call site and by aiohttp tracing."""
+
+    __slots__ = ("endpoint", "started", "ttfb", "ttft", "reused", "retries", "bytes_sent", "bytes_received", "failed")
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.started = time.perf_counter()
+        self.ttfb: float | None = None
+        self.ttft: float | None = None
+        self.reused: bool | None = None
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.failed = False
+
+    def first_byte(self) -> None:
+        """Mark the arrival of the response headers (first one wins)."""
+        if self.ttfb is None:
+            self.ttfb = time.perf_counter() - self.started
+
+    def first_token(self) -> None:
+        """Mark the first streamed token (first one wins)."""
+        if self.ttft is None:
+            self.ttft = time.perf_counter() - self.started
+
+
+class ClientMetrics:
+    """Per-endpoint measurements of SDK requests."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.started_at = time.time()
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.stages: dict[str, StageStats] = {}
+        self.resumes = ResumeStats()
+
+    @staticmethod
+    def endpoint(method: str, url: str) -> str:
+        """Normalized endpoint name: identifiers in the path are replaced by {id}."""
+        segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+        for position in range(1, len(segments)):
+            previous = segments[position - 1]
+            if previous in _COLLECTIONS and segments[position] not in _COLLECTIONS:
+                segments[position] = "{id}"
+        path = "/" + "/".join(segments)
+        return f"{method.upper()} {path}"
+
+    @contextmanager
+    def measure(self, method: str, url: str) -> Iterator[RequestTimer]:
+        """Time the block as one request to url; exceptions (not cancellation) count as errors."""
+        timer = RequestTimer(self.endpoint(method, url))
+        try:
+            yield timer
+        except Exception:
+            timer.failed = True
+            raise
+        finally:
+            self.record(timer, time.perf_counter() - timer.started)
+
+    def record(self, timer: RequestTimer, latency: float) -> None:
+        if not self.enabled:
+            return
+        stats = self.endpoints.get(timer.endpoint)
+        if stats is None:
+            stats = self.endpoints[timer.endpoint] = EndpointStats()
+        stats.requests += 1
+        stats.errors += timer.failed
+        stats.retries += timer.retries
+        stats.bytes_sent += timer.bytes_sent
+        stats.bytes_received += timer.bytes_received
+        if timer.reused is not None:
+            stats.reused_connections += timer.reused
+            stats.new_connections += not timer.reused
+        stats.latency.record(latency)
+        if timer.ttfb is not None:
+            stats.first_byte.record(timer.ttfb)
+        if timer.ttft is not None:
+            stats.first_token.record(timer.ttft)
+
+    def stage(self, name: str) -> StageStats:
+        """Stats of the named stream pipeline stage, created on first use."""
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        return stats
+
+    def reset(self) -> None:
+        self.started_at = time.time()
+        self.endpoints.clear()
+        self.stages.clear()
+        self.resumes = ResumeStats()
+
+    def to_dict(self) -> dict[str, Any]:
+        from .compression import get_compression
+        from .limits import get_request_limiter
+        from .single_flight import get_single_flight
+
+        single_flight = get_single_flight()
+        return {
+            "started_at": self.started_at,
+            "endpoints": {name: stats.to_dict() for name, stats in sorted(self.endpoints.items())},
+            "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+            "resumes": self.resumes.to_dict(),
+            "transfer": get_compression().stats.as_dict(),
+            "limits": get_request_limiter().snapshot(),
+            "single_flight": {"calls": single_flight.calls, "shared": single_flight.shared},
+        }
+
+    def dump(self, path: str | Path) -> None:
+        """Write to_dict() as JSON to path."""
+        Path(path).write_bytes(jsoncodec.dumpb(self.to_dict(), indent=2) + b"\n")
+
+
+_default_metrics: ClientMetrics | None = None
+
+
+def get_metrics() -> ClientMetrics:
+    """Return the process-wide metrics, creating them if needed."""
+    global _default_metrics
+    if _default_metrics is None:
+        _default_metrics = ClientMetrics()
+    return _default_metrics
+
+
+def set_metrics(metrics: ClientMetrics | None) -> None:
+    """Replace the process-wide metrics (None resets to a lazy default)."""
+    global _default_metrics
+    _default_metrics = metrics
+
+
+# ----------------------------------------------------------------------
+# aiohttp tracing: connection reuse, bytes sent, time to first byte
+# ----------------------------------------------------------------------
+
+
+def _timer(context: SimpleNamespace) -> RequestTimer | None:
+    timer = context.trace_request_ctx
+    return timer if isinstance(timer, RequestTimer) else None
+
+
+async def _on_connection_reused(session, context, params) -> None:
+    if (timer := _timer(context)) is not None:
+        timer.reused = True
+
+
+async def _on_connection_created(session, context, params) -> None:
+    if (timer := _timer(context)) is not None:
+        timer.reused = False
+
+
+async def _on_chunk_sent(session, context, params) -> None:
+    if (timer := _timer(context)) is not None:
+        timer.bytes_sent += len(params.chunk)
+
+
+async def _on_headers_received(session, context, params) -> None:
+    if (timer := _timer(context)) is not None:
+        timer.first_byte()
+
+
+def metrics_trace_config() -> aiohttp.TraceConfig:
+    """TraceConfig feeding the RequestTimer passed as ``trace_request_ctx``."""
+    config = aiohttp.TraceConfig()
+    config.on_connection_reuseconn.append(_on_connection_reused)
+    config.on_connection_create_end.append(_on_connection_created)
+    config.on_request_chunk_sent.append(_on_chunk_sent)
+    config.on_request_end.append(_on_headers_received)
+    return config
@@ -7,12 +7,15 @@ This module now only contains utility functions that work with typed Response ob
 All dict-based response creation functions have been removed in favor of typed_api.py.
 """
 
-import aiohttp
 from loguru import logger
 
+from forge_cli.common import jsoncodec
 from forge_cli.response._types import Response
 
+from .client import ForgeClient, resolve_client
 from .config import BASE_URL
+from .limits import get_request_limiter
+from .metrics import get_metrics
 
 # All legacy dict-based response creation functions have been removed.
 # Use typed_api.py functions instead:
@@ -21,12 +24,13 @@ from .config import BASE_URL
 # - create_typed_request() to build requests with type validation
 
 
-async def async_fetch_response(response_id: str) -> Response | None:
+async def async_fetch_response(response_id: str, client: ForgeClient | None = None) -> Response | None:
     """
     Asynchronously fetch a response by its ID.
 
     Args:
         response_id: The ID of the response to fetch
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
 
     Returns:
         Response object containing the response data or None if not found/error
@@ -34,23 +38,28 @@ async def async_fetch_response(response_id: str) -> Response | None:
     url = f"{BASE_URL}/v1/responses/{response_id}"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 404:
-                    logger.warning(f"Response with ID {response_id} not found")
-                    return None
-                elif response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Fetch response failed with status {response.status}: {error_text}")
-                    return None
-
-                result = await response.json()
-                # Convert to Response object
-                try:
-                    return Response.model_validate(result)
-                except Exception as e:
-                    logger.error(f"Failed to parse response data: {e}")
-                    return None
+        session = await resolve_client(client).get_session()
+        with get_metrics().measure("GET", url) as timer:
+            async with get_request_limiter().slot("GET", url) as outcome:
+                async with session.get(url, trace_request_ctx=timer) as response:
+                    outcome.status = response.status
+                    if response.status == 404:
+                        logger.warning(f"Response with ID {response_id} not found")
+                        return None
+                    elif response.status != 200:
+                        timer.failed = True
+                        error_text = await response.text()
+                        logger.error(f"Fetch response failed with status {response.status}: {error_text}")
+                        return None
+
+                    result = await response.json(loads=jsoncodec.loads)
+                    timer.bytes_received = response.content_length or len(await response.read())
+                    # Convert to Response object
+                    try:
+                        return Response.model_validate(result)
+                    except Exception as e:
+                        logger.error(f"Failed to parse response data: {e}")
+                        return None
     except Exception as e:
         logger.error(f"Error fetching response: {str(e)}")
         return None
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+"""
+Single-flight deduplication of concurrent identical requests.
+
+The completer prefetch, /show-documents and file-reference validation can ask
+for the same collection or document at the same moment. async_make_request runs
+GET requests through the process-wide SingleFlight: while a request for the same
+(method, URL, params) is in flight, later callers wait for it instead of sending
+their own, and all of them receive the same parsed body. Like cached bodies,
+shared bodies must be treated as read-only.
+
+The request runs in its own task. A caller that is cancelled stops waiting
+without affecting the others; the request itself is only cancelled once every
+caller has gone.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.calls = 0  # calls that started a request
+        self.shared = 0  # calls that joined a request already in flight
+        self._flights: dict[tuple[asyncio.AbstractEventLoop, Hashable], _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of call(), sharing it with concurrent callers using the same key."""
+        if not self.enabled:
+            return await call()
+
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)  # tasks cannot be awaited from another loop
+        flight = self._flights.get(flight_key)
+        if flight is None:
+            flight = _Flight(loop.create_task(call()))
+            self._flights[flight_key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(flight_key, flight))
+            self.calls += 1
+        else:
+            self.shared += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller was cancelled; later callers must not join a dying request
+                self._forget(flight_key, flight)
+                flight.task.cancel()
+
+    def _forget(self, flight_key: tuple[asyncio.AbstractEventLoop, Hashable], flight: _Flight) -> None:
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+
+
+_default_single_flight: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide single-flight group, creating it if needed."""
+    global _default_single_flight
+    if _default_single_flight is None:
+        _default_single_flight = SingleFlight()
+    return _default_single_flight
+
+
+def set_single_flight(single_flight: SingleFlight | None) -> None:
+    """Replace the process-wide single-flight group (None resets to a lazy default)."""
+    global _default_single_flight
+    _default_single_flight = single_flight
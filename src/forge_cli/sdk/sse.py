@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+"""
+Incremental Server-Sent Events parser working on raw byte chunks.
+
+Follows the event stream interpretation rules of the HTML Living Standard
+(https://html.spec.whatwg.org/multipage/server-sent-events.html):
+
+- lines end with CRLF, LF or CR, and may be split anywhere across chunks
+- consecutive ``data:`` fields are joined with "\\n"
+- ``event:``, ``id:`` and ``retry:`` fields are tracked, comments (":") ignored
+- an event is dispatched on a blank line
+
+Bytes are kept in one reusable buffer and only the data of a complete event is
+decoded, once, so a long snapshot line is never decoded or copied per read.
+
+Two deliberate leniencies for the Knowledge Forge server: an event that names a type
+but carries no data (``event: done``) is still dispatched, and flush() dispatches
+an event left pending when the connection closes without a trailing blank line.
+"""
+
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+
+DEFAULT_EVENT_TYPE = "message"
+
+
+@dataclass(slots=True)
+class ServerSentEvent:
+    """A single dispatched SSE event."""
+
+    event: str
+    data: str
+    id: str | None = None
+    retry: int | None = None
+
+
+class SSEParser:
+    """Byte-level incremental SSE framer.
+
+    Feed it chunks as they arrive from the socket; each call returns the events that
+    were completed by that chunk. The parser remembers the last event id across
+    events, as needed to resume a stream with Last-Event-ID.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._data_lines: list[bytes | bytearray] = []
+        self._event_type: bytes | bytearray = b""
+        self._has_fields = False
+        # A chunk ended in CR: a LF at the start of the next chunk belongs to it
+        self._pending_cr = False
+        self._started = False
+        self._seen_cr = False
+        self.last_event_id = ""
+        self.retry: int | None = None
+
+    def feed(self, chunk: bytes) -> list[ServerSentEvent]:
+        """Consume a chunk of bytes and return the events it completed."""
+        if not self._started and chunk:
+            self._started = True
+            if chunk.startswith(b"\xef\xbb\xbf"):
+                chunk = chunk[3:]
+        if self._pending_cr:
+            self._pending_cr = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+
+        buffer = self._buffer
+        # Bytes already in the buffer are known to contain no line terminator
+        search = len(buffer)
+        buffer += chunk
+        self._seen_cr = self._seen_cr or b"\r" in chunk
+        events: list[ServerSentEvent] = []
+
+        start = 0
+        if not self._seen_cr:
+            # Fast path: LF-only line endings
+            while (end := buffer.find(b"\n", search)) != -1:
+                self._process_line(buffer[start:end], events)
+                start = search = end + 1
+        else:
+            size = len(buffer)
+            while True:
+                lf = buffer.find(b"\n", search)
+                cr = buffer.find(b"\r", search, lf if lf != -1 else size)
+                if cr != -1:
+                    end = cr
+                    if cr + 1 == size:
+                        # Cannot tell CR from CRLF yet; consume the CR, drop a leading LF next time
+                        self._pending_cr = True
+                        next_start = size
+                    else:
+                        next_start = cr + 2 if buffer[cr + 1] == 0x0A else cr + 1
+                elif lf != -1:
+                    end = lf
+                    next_start = lf + 1
+                else:
+                    break
+                self._process_line(buffer[start:end], events)
+                start = search = next_start
+
+        if start:
+            del buffer[:start]
+        return events
+
+    def flush(self) -> list[ServerSentEvent]:
+        """Dispatch whatever is pending at end of stream."""
+        events: list[ServerSentEvent] = []
+        if self._buffer:
+            self._process_line(self._buffer, events)
+            self._buffer.clear()
+        self._dispatch(events)
+        return events
+
+    def _process_line(self, line: bytes | bytearray, events: list[ServerSentEvent]) -> None:
+        if not line:
+            self._dispatch(events)
+            return
+        if line[0] == 0x3A:  # ":" comment
+            return
+
+        colon = line.find(b":")
+        if colon == -1:
+            field, value = line, b""
+        else:
+            field = line[:colon]
+            value = line[colon + 2 :] if line[colon + 1 : colon + 2] == b" " else line[colon + 1 :]
+
+        if field == b"data":
+            self._data_lines.append(value)
+            self._has_fields = True
+        elif field == b"event":
+            self._event_type = value
+            self._has_fields = True
+        elif field == b"id":
+            if b"\0" not in value:
+                self.last_event_id = value.decode("utf-8", errors="replace")
+        elif field == b"retry":
+            if value.isdigit():
+                self.retry = int(value)
+
+    def _dispatch(self, events: list[ServerSentEvent]) -> None:
+        if not self._has_fields:
+            return
+        data = b"\n".join(self._data_lines).decode("utf-8", errors="replace")
+        event_type = self._event_type.decode("utf-8", errors="replace") if self._event_type else DEFAULT_EVENT_TYPE
+        events.append(ServerSentEvent(event_type, data, self.last_event_id or None, self.retry))
+        self._data_lines = []
+        self._event_type = b""
+        self._has_fields = False
+
+
+async def aiter_sse_events(
+    chunks: AsyncIterable[bytes],
+    parser: SSEParser | None = None,
+) -> AsyncIterator[ServerSentEvent]:
+    """Yield SSE events from an async iterable of raw byte chunks.
+
+    Args:
+        chunks: Raw body chunks, e.g. ``response.content.iter_any()`` of aiohttp
+        parser: Parser to use; pass one in to read ``last_event_id`` afterwards
+    """
+    parser = parser or SSEParser()
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
+    for event in parser.flush():
+        yield event
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+"""
+Resumption of streamed responses whose connection dropped.
+
+aiter_response_events keeps a StreamPosition while it reads: the response id from
+the first snapshot (response.created) and the id of the last SSE event. When the
+connection fails before the stream finished, aiter_resumed() continues it:
+
+- If the server numbers its events, the stored response is streamed again with
+  ``GET /v1/responses/{id}?stream=true`` and ``Last-Event-ID``, so the server sends
+  only the events after the last one received.
+- Otherwise, or if the server does not stream stored responses, the response is
+  polled with async_fetch_response until it reaches a terminal status. Changed
+  snapshots are passed on as response.in_progress events and the terminal one as
+  response.completed (.failed, .incomplete), followed by done.
+
+Either way the consumer receives events continuing the same stream, so the display
+carries on from the last state it showed and the answer is not generated again.
+Failed attempts back off exponentially; after MAX_ATTEMPTS in a row the stream ends
+with an error event, as it did before resumption existed. Disconnects, attempts,
+outcomes and reconnect latency are counted in ClientMetrics.resumes (/stats).
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator
+
+import aiohttp
+from loguru import logger
+
+from ..common import jsoncodec
+from .client import ForgeClient, resolve_client
+from .compression import aiter_decoded, open_request
+from .config import BASE_URL
+from .limits import get_request_limiter
+from .metrics import get_metrics
+from .response import async_fetch_response
+from .sse import ServerSentEvent, aiter_sse_events
+
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 0.25  # seconds before the second attempt, doubled for every further one
+BACKOFF_MAX = 4.0
+POLL_INTERVAL = 1.0  # seconds between two polls of an unfinished response
+POLL_TIMEOUT = 600.0  # give up polling a response that stays in progress this long
+
+# Errors meaning the connection went away rather than the request being refused
+DISCONNECT_ERRORS: tuple[type[BaseException], ...] = (
+    aiohttp.ClientPayloadError,
+    aiohttp.ClientConnectionError,
+    ConnectionError,
+    TimeoutError,
+)
+
+# Statuses after which a stored response no longer changes
+TERMINAL_STATUSES = frozenset({"completed", "failed", "incomplete"})
+TERMINAL_EVENT_TYPES = frozenset(f"response.{status}" for status in TERMINAL_STATUSES)
+
+# Answers telling that the server cannot stream a stored response
+_UNSUPPORTED_STATUSES = frozenset({400, 404, 405, 406, 501})
+
+
+class _ResumeError(Exception):
+    """An attempt to resume failed and may be retried."""
+
+
+class _NotStreamableError(Exception):
+    """The server does not stream stored responses; poll instead."""
+
+
+class StreamPosition:
+    """How far a response stream got: what resuming it needs to know."""
+
+    __slots__ = ("response_id", "last_event_id", "terminal", "done", "streamable")
+
+    def __init__(self):
+        self.response_id: str | None = None
+        self.last_event_id: str | None = None
+        self.terminal = False  # the final snapshot (response.completed, ...) was received
+        self.done = False
+        self.streamable = True  # reconnecting with Last-Event-ID is still worth trying
+
+    def observe(self, event: ServerSentEvent) -> None:
+        """Record an event handed to the consumer."""
+        if event.id is not None:
+            self.last_event_id = event.id
+        if event.event == "done":
+            self.done = True
+        elif event.event in TERMINAL_EVENT_TYPES:
+            self.terminal = True
+        elif self.response_id is None and not event.event.endswith(".delta") and event.data.startswith("{"):
+            self.response_id = _response_id(event.data)
+
+    @property
+    def resumable(self) -> bool:
+        return self.response_id is not None and not self.done and not self.terminal
+
+
+async def aiter_resumed(position: StreamPosition, client: ForgeClient | None = None) -> AsyncIterator[ServerSentEvent]:
+    """
+    Continue a stream whose connection dropped at position.
+
+    Args:
+        position: Position of the dropped stream; updated as events arrive
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
+
+    Yields:
+        The events after position, ending with done, or with an error event whose data
+        is the message once MAX_ATTEMPTS attempts in a row failed
+    """
+    stats = get_metrics().resumes
+    stats.disconnects += 1
+    disconnected_at = time.perf_counter()
+    failures = 0
+
+    while failures < MAX_ATTEMPTS:
+        if failures:
+            await asyncio.sleep(min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (failures - 1)))
+        stats.attempts += 1
+        streaming = position.last_event_id is not None and position.streamable
+        source = _aiter_stream(position, client) if streaming else _aiter_polled(position, client)
+        received = False
+        try:
+            async with contextlib.aclosing(source):
+                async for event in source:
+                    if not received:
+                        stats.latency.record(time.perf_counter() - disconnected_at)
+                        received = True
+                    finished = position.done or position.terminal
+                    position.observe(event)
+                    if not finished and (position.done or position.terminal):
+                        # Counted before yielding: consumers stop iterating at the final event
+                        if streaming:
+                            stats.resumed += 1
+                        else:
+                            stats.polled += 1
+                    yield event
+                    if position.done:
+                        break
+        except _NotStreamableError as e:
+            logger.info(f"Cannot resume the stream of {position.response_id} ({e}), polling it instead")
+            position.streamable = False
+            continue
+        except (*DISCONNECT_ERRORS, _ResumeError) as e:
+            logger.debug(f"Resuming {position.response_id} failed: {e!r}")
+
+        if position.done or position.terminal:
+            if not position.done:
+                yield ServerSentEvent("done", "[DONE]")
+            return
+        if received:
+            # The resumed stream dropped as well; carry on from where it got to
+            stats.disconnects += 1
+            disconnected_at = time.perf_counter()
+            failures = 0
+        failures += 1
+
+    stats.failed += 1
+    error_msg = f"Stream of {position.response_id} could not be resumed after {MAX_ATTEMPTS} attempts"
+    logger.error(error_msg)
+    yield ServerSentEvent("error", error_msg)
+
+
+async def _aiter_stream(position: StreamPosition, client: ForgeClient | None) -> AsyncIterator[ServerSentEvent]:
+    """Events of the stored response after position.last_event_id."""
+    url = f"{BASE_URL}/v1/responses/{position.response_id}"
+    session = await resolve_client(client).get_session()
+    with get_metrics().measure("GET", url) as timer:
+        async with get_request_limiter().slot("GET", url) as outcome:
+            async with await open_request(
+                session,
+                "GET",
+                url,
+                headers={"Last-Event-ID": position.last_event_id},
+                stream=True,
+                timer=timer,
+                params={"stream": "true"},
+            ) as response:
+                outcome.status = response.status
+                if response.status in _UNSUPPORTED_STATUSES:
+                    raise _NotStreamableError(f"status {response.status}")
+                if response.status != 200:
+                    timer.failed = True
+                    raise _ResumeError(f"status {response.status}")
+                if response.content_type != "text/event-stream":
+                    raise _NotStreamableError(f"content type {response.content_type}")
+                async for event in aiter_sse_events(aiter_decoded(response, timer)):
+                    yield event
+
+
+async def _aiter_polled(position: StreamPosition, client: ForgeClient | None) -> AsyncIterator[ServerSentEvent]:
+    """Snapshots of the stored response, polled until it reaches a terminal status."""
+    deadline = time.monotonic() + POLL_TIMEOUT
+    last_data = None
+    while True:
+        response = await async_fetch_response(position.response_id, client=client)
+        if response is None:
+            raise _ResumeError(f"could not fetch {position.response_id}")
+        data = jsoncodec.dumps(response.model_dump(mode="json", exclude_none=True))
+        if response.status in TERMINAL_STATUSES:
+            yield ServerSentEvent(f"response.{response.status}", data)
+            yield ServerSentEvent("done", "[DONE]")
+            return
+        if data != last_data:
+            last_data = data
+            yield ServerSentEvent("response.in_progress", data)
+        if time.monotonic() >= deadline:
+            raise _ResumeError(f"{position.response_id} still {response.status} after {POLL_TIMEOUT:.0f}s")
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+def _response_id(data: str) -> str | None:
+    """Id of the response in a snapshot payload, bare or wrapped as {"response": {...}}."""
+    try:
+        payload = jsoncodec.loads(data)
+    except ValueError:
+        return None
+    if isinstance(payload, dict) and isinstance(payload.get("response"), dict):
+        payload = payload["response"]
+    if isinstance(payload, dict) and payload.get("object") == "response" and isinstance(payload.get("id"), str):
+        return payload["id"]
+    return None
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+"""
+Blocking facade over the async SDK.
+
+Synchronous callers (the prompt_toolkit completer, scripts, tests) should not open
+their own sockets or spin up a throwaway event loop per call. SyncRunner owns one
+long-lived event loop in a daemon thread together with a pooled ForgeClient;
+run() submits a coroutine to that loop and blocks until it finishes or the
+timeout expires, in which case the coroutine is cancelled.
+
+Every call made through the facade resolves ``client=None`` to the runner's
+client, so all synchronous callers share one connection pool. The HTTP cache is
+process-wide and thread-safe, so cached collection and file data is shared with
+the async chat path as well. (aiohttp sessions are bound to their event loop, so
+the chat loop and the runner loop each keep their own connection pool.)
+
+Usage:
+    from forge_cli.sdk import sync
+
+    vector_store = sync.get_vectorstore("vs_123", timeout=5)
+    files = sync.list_vectorstore_files("vs_123")
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import threading
+from collections.abc import Coroutine
+from typing import Any
+
+from loguru import logger
+
+from .client import ForgeClient, use_client
+from .file_types import File
+from .task_types import TaskStatus
+from .vectorstore_query_types import ActualVectorStoreSearchResponse
+from .vectorstore_types import Vectorstore, VectorStoreFile, VectorStoreSummary
+
+DEFAULT_TIMEOUT = 30.0  # seconds a blocking call waits before cancelling
+
+
+class SyncRunner:
+    """Runs SDK coroutines on one background event loop thread.
+
+    The loop thread is started on first use and stopped by close(); a closed
+    runner starts a fresh thread if it is used again.
+    """
+
+    def __init__(self, client: ForgeClient | None = None, default_timeout: float | None = DEFAULT_TIMEOUT):
+        """
+        Args:
+            client: Pooled client used by calls without an explicit one (a new ForgeClient if None)
+            default_timeout: Seconds run() waits when no timeout is given (None waits forever)
+        """
+        self.client = client or ForgeClient()
+        self.default_timeout = default_timeout
+
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def run[T](self, coro: Coroutine[Any, Any, T], timeout: float | None = ...) -> T:
+        """Run a coroutine on the background loop and return its result.
+
+        Args:
+            coro: The coroutine to run
+            timeout: Seconds to wait (the runner's default_timeout if omitted, None waits forever)
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            TimeoutError: If the coroutine did not finish in time; it is cancelled
+            RuntimeError: If called from the runner's own loop thread
+        """
+        if timeout is ...:
+            timeout = self.default_timeout
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SyncRunner.run() called from its own event loop; await the coroutine instead")
+
+        future = asyncio.run_coroutine_threadsafe(self._bound(coro), self._ensure_loop())
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"SDK call did not finish within {timeout} seconds") from None
+        except BaseException:
+            # KeyboardInterrupt while blocked: do not leave the call running in the background
+            future.cancel()
+            raise
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Close the pooled client and stop the loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self.client.close(), loop).result(timeout)
+        except Exception as e:
+            logger.debug(f"Error closing the sync facade client: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    async def _bound[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        with use_client(self.client):
+            return await coro
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(target=self._serve, args=(loop, ready), name="forge-sdk-sync", daemon=True)
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+
+_default_runner: SyncRunner | None = None
+_default_runner_lock = threading.Lock()
+
+
+def get_sync_runner() -> SyncRunner:
+    """Return the process-wide runner, creating it if needed."""
+    global _default_runner
+    with _default_runner_lock:
+        if _default_runner is None:
+            _default_runner = SyncRunner()
+        return _default_runner
+
+
+def set_sync_runner(runner: SyncRunner | None) -> None:
+    """Replace the process-wide runner (None resets to a lazy default)."""
+    global _default_runner
+    with _default_runner_lock:
+        _default_runner = runner
+
+
+def close_sync_runner() -> None:
+    """Stop the process-wide runner if it has been started."""
+    if _default_runner is not None:
+        _default_runner.close()
+
+
+atexit.register(close_sync_runner)
+
+
+def run[T](coro: Coroutine[Any, Any, T], timeout: float | None = ...) -> T:
+    """Run a coroutine on the process-wide runner; see SyncRunner.run()."""
+    return get_sync_runner().run(coro, timeout)
+
+
+# ----------------------------------------------------------------------
+# Blocking counterparts of the most used SDK calls
+# ----------------------------------------------------------------------
+
+
+def get_vectorstore(vector_store_id: str, no_cache: bool = False, timeout: float | None = ...) -> Vectorstore | None:
+    """Blocking async_get_vectorstore()."""
+    from .vectorstore import async_get_vectorstore
+
+    return run(async_get_vectorstore(vector_store_id, no_cache=no_cache), timeout)
+
+
+def get_vectorstore_summary(
+    vector_store_id: str,
+    model: str = "qwen-max",
+    max_tokens: int = 1000,
+    no_cache: bool = False,
+    timeout: float | None = ...,
+) -> VectorStoreSummary | None:
+    """Blocking async_get_vectorstore_summary()."""
+    from .vectorstore import async_get_vectorstore_summary
+
+    return run(
+        async_get_vectorstore_summary(vector_store_id, model=model, max_tokens=max_tokens, no_cache=no_cache),
+        timeout,
+    )
+
+
+def query_vectorstore(
+    vector_store_id: str,
+    query: str,
+    top_k: int = 10,
+    filters: dict[str, Any] | None = None,
+    timeout: float | None = ...,
+) -> ActualVectorStoreSearchResponse | None:
+    """Blocking async_query_vectorstore()."""
+    from .vectorstore import async_query_vectorstore
+
+    return run(async_query_vectorstore(vector_store_id, query, top_k=top_k, filters=filters), timeout)
+
+
+def list_vectorstore_files(
+    vector_store_id: str,
+    page_size: int = 100,
+    limit: int | None = None,
+    timeout: float | None = ...,
+) -> list[VectorStoreFile]:
+    """Collect the files of a vector store (at most limit of them) with aiter_vectorstore_files()."""
+    from .vectorstore import aiter_vectorstore_files
+
+    async def collect() -> list[VectorStoreFile]:
+        files = []
+        listing = aiter_vectorstore_files(vector_store_id, page_size=page_size)
+        # aclosing() stops the listing's next-page prefetch once the limit is reached
+        async with contextlib.aclosing(listing):
+            async for file in listing:
+                files.append(file)
+                if limit is not None and len(files) >= limit:
+                    break
+        return files
+
+    return run(collect(), timeout)
+
+
+def fetch_file(file_id: str, no_cache: bool = False, timeout: float | None = ...) -> File | None:
+    """Blocking async_fetch_file()."""
+    from .files import async_fetch_file
+
+    return run(async_fetch_file(file_id, no_cache=no_cache), timeout)
+
+
+def check_task_status(task_id: str, timeout: float | None = ...) -> TaskStatus:
+    """Blocking async_check_task_status()."""
+    from .files import async_check_task_status
+
+    return run(async_check_task_status(task_id), timeout)
+
+
+def wait_for_task_completion(
+    task_id: str, poll_interval: float = 2, max_attempts: int = 60, timeout: float | None = None
+) -> TaskStatus:
+    """Blocking async_wait_for_task_completion(); waits without a timeout unless one is given."""
+    from .files import async_wait_for_task_completion
+
+    return run(async_wait_for_task_completion(task_id, poll_interval=poll_interval, max_attempts=max_attempts), timeout)
@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+"""
+Multiplexed poller for server-side tasks (/v1/tasks/{id}).
+
+A TaskWatcher tracks any number of task ids from a single background loop instead
+of one fixed-interval sleep loop per waiter. Each task gets its own poll interval
+that adapts to how fast it is moving:
+
+- while progress advances, the interval follows the observed progress rate, aiming
+  to poll about once per PROGRESS_STEP percent
+- while nothing changes, the interval grows geometrically up to max_interval
+- every delay is jittered so tasks started together do not poll in lockstep
+
+Several waiters on the same task id share one poller and one request per poll;
+each gets its own future, so cancelling one waiter does not affect the others.
+A task nobody waits for any more is dropped from the loop.
+"""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from .client import ForgeClient
+from .files import async_check_task_status
+from .task_types import TaskStatus
+
+TERMINAL_TASK_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Poll interval defaults (seconds)
+DEFAULT_MIN_INTERVAL = 0.5
+DEFAULT_MAX_INTERVAL = 15.0
+DEFAULT_BACKOFF = 1.5
+DEFAULT_JITTER = 0.2  # +/- fraction of the interval
+PROGRESS_STEP = 5.0  # percent of progress worth one poll
+DEFAULT_MAX_CONCURRENT_POLLS = 8
+DEFAULT_MAX_CONSECUTIVE_ERRORS = 3
+
+ProgressCallback = Callable[[TaskStatus], None]
+
+
+@dataclass(eq=False)
+class _Waiter:
+    future: asyncio.Future[TaskStatus]
+    on_progress: ProgressCallback | None = None
+    polls_left: int | None = None
+
+
+@dataclass(eq=False)
+class _WatchedTask:
+    task_id: str
+    floor: float
+    interval: float
+    next_poll_at: float = 0.0
+    waiters: list[_Waiter] = field(default_factory=list)
+    last: TaskStatus | None = None
+    last_poll_at: float | None = None
+    rate: float | None = None  # smoothed progress, percent per second
+    errors: int = 0
+
+
+class _LoopState:
+    """Tasks and poll loop of one event loop (asyncio primitives are bound to their loop)."""
+
+    __slots__ = ("tasks", "runner", "wakeup", "semaphore")
+
+    def __init__(self, max_concurrent_polls: int):
+        self.tasks: dict[str, _WatchedTask] = {}
+        self.runner: asyncio.Task | None = None
+        self.wakeup = asyncio.Event()
+        self.semaphore = asyncio.Semaphore(max_concurrent_polls)
+
+
+class TaskWatcher:
+    """Poll many tasks from one loop with per-task adaptive backoff.
+
+    Usage:
+        watcher = TaskWatcher()
+        status = await watcher.wait(task_id, on_progress=lambda s: print(s.progress))
+
+    The poll loop is started lazily on the running event loop and stops by itself
+    once no task is watched. A watcher shared between event loops (e.g. the chat loop
+    and the SyncRunner background loop) keeps separate tasks and a separate poll loop
+    per event loop; the state of closed loops is dropped.
+    """
+
+    def __init__(
+        self,
+        client: ForgeClient | None = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        jitter: float = DEFAULT_JITTER,
+        max_concurrent_polls: int = DEFAULT_MAX_CONCURRENT_POLLS,
+        max_consecutive_errors: int = DEFAULT_MAX_CONSECUTIVE_ERRORS,
+        fetch: Callable[..., Awaitable[TaskStatus]] | None = None,
+    ):
+        """
+        Args:
+            client: Pooled ForgeClient to poll with (defaults to the process-wide client)
+            min_interval: Shortest delay between two polls of a task
+            max_interval: Longest delay between two polls of a task
+            backoff: Factor the interval grows by while a task makes no progress
+            jitter: Random +/- fraction applied to every delay
+            max_concurrent_polls: Maximum number of status requests in flight
+            max_consecutive_errors: Failed polls in a row after which waiters get the error
+            fetch: Status fetcher, ``fetch(task_id, client=...)`` (defaults to async_check_task_status)
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.max_consecutive_errors = max_consecutive_errors
+        self._fetch = fetch
+        self._max_concurrent_polls = max_concurrent_polls
+
+        self._by_loop: dict[asyncio.AbstractEventLoop, _LoopState] = {}
+        self.poll_count = 0
+
+    @property
+    def watched(self) -> list[str]:
+        """Ids of the tasks currently being polled, on any event loop."""
+        return [task_id for state in self._by_loop.values() for task_id in state.tasks]
+
+    def watch(
+        self,
+        task_id: str,
+        on_progress: ProgressCallback | None = None,
+        interval: float | None = None,
+        max_polls: int | None = None,
+    ) -> asyncio.Future[TaskStatus]:
+        """Start watching a task and return a future for its final status.
+
+        Watching an id that is already watched joins the existing poller.
+
+        Args:
+            task_id: The ID of the task to watch
+            on_progress: Called with the TaskStatus whenever status or progress changes
+            interval: Initial and shortest poll interval for this task (defaults to min_interval)
+            max_polls: Polls after which the future fails with TimeoutError (None for no limit)
+
+        Returns:
+            Future resolving to the terminal TaskStatus. It fails with the last error after
+            max_consecutive_errors failed polls, or with TimeoutError after max_polls polls.
+        """
+        loop = asyncio.get_running_loop()
+        state = self._state(loop)
+        future: asyncio.Future[TaskStatus] = loop.create_future()
+        waiter = _Waiter(future, on_progress, max_polls)
+
+        floor = self.min_interval if interval is None else interval
+        task = state.tasks.get(task_id)
+        if task is None:
+            task = _WatchedTask(task_id, floor=floor, interval=floor, next_poll_at=loop.time())
+            state.tasks[task_id] = task
+        elif floor < task.floor:
+            task.floor = floor
+            task.interval = min(task.interval, floor)
+            task.next_poll_at = min(task.next_poll_at, loop.time() + floor)
+        task.waiters.append(waiter)
+
+        if task.last is not None and on_progress is not None:
+            self._notify(waiter, task.last)
+
+        if state.runner is None or state.runner.done():
+            state.runner = loop.create_task(self._run(state))
+        state.wakeup.set()
+        return future
+
+    async def wait(
+        self,
+        task_id: str,
+        on_progress: ProgressCallback | None = None,
+        timeout: float | None = None,
+        interval: float | None = None,
+        max_polls: int | None = None,
+    ) -> TaskStatus:
+        """Watch a task and wait for its terminal status.
+
+        Args:
+            task_id: The ID of the task to wait for
+            on_progress: Called with the TaskStatus whenever status or progress changes
+            timeout: Seconds to wait before raising TimeoutError (None to wait indefinitely)
+            interval: Initial and shortest poll interval for this task
+            max_polls: Polls after which TimeoutError is raised
+
+        Returns:
+            The terminal TaskStatus (completed, failed or cancelled)
+        """
+        future = self.watch(task_id, on_progress=on_progress, interval=interval, max_polls=max_polls)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            # wait_for cancels the future when timeout elapses; a max_polls TimeoutError is the future's own
+            if timeout is None or not future.cancelled():
+                raise
+            task = self._state(asyncio.get_running_loop()).tasks.get(task_id)
+            last = task.last.status if task is not None and task.last is not None else "unknown"
+            raise TimeoutError(
+                f"Task {task_id} did not complete within {timeout} seconds. Last status: {last}"
+            ) from None
+
+    async def close(self) -> None:
+        """Stop polling on the running event loop and cancel its pending waiters."""
+        state = self._by_loop.pop(asyncio.get_running_loop(), None)
+        if state is None:
+            return
+        runner, state.runner = state.runner, None
+        for task in state.tasks.values():
+            for waiter in task.waiters:
+                waiter.future.cancel()
+        state.tasks.clear()
+        if runner is not None and not runner.done():
+            runner.cancel()
+            try:
+                await runner
+            except asyncio.CancelledError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Poll loop
+    # ------------------------------------------------------------------
+
+    def _state(self, loop: asyncio.AbstractEventLoop) -> _LoopState:
+        state = self._by_loop.get(loop)
+        if state is None:
+            # Drop the state of loops that have finished (e.g. earlier asyncio.run() calls)
+            for stale in [stale for stale in self._by_loop if stale.is_closed()]:
+                del self._by_loop[stale]
+            state = self._by_loop[loop] = _LoopState(self._max_concurrent_polls)
+        return state
+
+    async def _run(self, state: _LoopState) -> None:
+        loop = asyncio.get_running_loop()
+        while state.tasks:
+            now = loop.time()
+            due = [task for task in state.tasks.values() if task.next_poll_at <= now]
+            if due:
+                await asyncio.gather(*(self._poll(state, task) for task in due))
+                continue
+
+            state.wakeup.clear()
+            delay = min(task.next_poll_at for task in state.tasks.values()) - now
+            try:
+                await asyncio.wait_for(state.wakeup.wait(), delay)
+            except TimeoutError:
+                pass
+
+    async def _poll(self, state: _LoopState, task: _WatchedTask) -> None:
+        task.waiters = [waiter for waiter in task.waiters if not waiter.future.done()]
+        if not task.waiters:
+            state.tasks.pop(task.task_id, None)
+            return
+
+        fetch = self._fetch or async_check_task_status
+        async with state.semaphore:
+            self.poll_count += 1
+            try:
+                status = await fetch(task.task_id, client=self.client)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._on_error(state, task, e)
+                return
+
+        task.errors = 0
+        now = asyncio.get_running_loop().time()
+        previous, task.last = task.last, status
+        if previous is None or status.status != previous.status or status.progress != previous.progress:
+            for waiter in task.waiters:
+                self._notify(waiter, status)
+
+        if status.status in TERMINAL_TASK_STATUSES:
+            self._finish(state, task, result=status)
+            return
+
+        self._count_poll(task)
+        if not task.waiters:
+            state.tasks.pop(task.task_id, None)
+            return
+
+        task.interval = self._next_interval(task, previous, status, now)
+        task.last_poll_at = now
+        task.next_poll_at = now + self._jittered(task.interval)
+
+    def _on_error(self, state: _LoopState, task: _WatchedTask, error: Exception) -> None:
+        task.errors += 1
+        logger.debug(f"Polling task {task.task_id} failed ({task.errors} in a row): {error}")
+        if task.errors >= self.max_consecutive_errors:
+            self._finish(state, task, error=error)
+            return
+
+        self._count_poll(task)
+        if not task.waiters:
+            state.tasks.pop(task.task_id, None)
+            return
+        task.interval = min(self.max_interval, task.interval * self.backoff)
+        task.next_poll_at = asyncio.get_running_loop().time() + self._jittered(task.interval)
+
+    def _count_poll(self, task: _WatchedTask) -> None:
+        """Charge one poll to every waiter with a poll budget and time out exhausted ones."""
+        remaining = []
+        for waiter in task.waiters:
+            if waiter.polls_left is not None:
+                waiter.polls_left -= 1
+                if waiter.polls_left <= 0:
+                    last = task.last.status if task.last is not None else "unknown"
+                    if not waiter.future.done():
+                        waiter.future.set_exception(
+                            TimeoutError(
+                                f"Task {task.task_id} did not complete within the allowed time. Last status: {last}"
+                            )
+                        )
+                    continue
+            remaining.append(waiter)
+        task.waiters = remaining
+
+    def _next_interval(self, task: _WatchedTask, previous: TaskStatus | None, status: TaskStatus, now: float) -> float:
+        """Pick the next poll interval from the observed progress rate."""
+        if previous is None:
+            return task.interval
+
+        if (
+            status.progress is not None
+            and previous.progress is not None
+            and status.progress > previous.progress
+            and task.last_poll_at is not None
+            and now > task.last_poll_at
+        ):
+            rate = (status.progress - previous.progress) / (now - task.last_poll_at)
+            task.rate = rate if task.rate is None else 0.5 * task.rate + 0.5 * rate
+            interval = PROGRESS_STEP / task.rate
+        elif status.status != previous.status or status.progress != previous.progress:
+            # Moving, but without a usable progress figure
+            interval = task.interval / self.backoff
+        else:
+            interval = task.interval * self.backoff
+
+        return max(task.floor, min(self.max_interval, interval))
+
+    def _jittered(self, interval: float) -> float:
+        if not self.jitter:
+            return interval
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _finish(
+        self,
+        state: _LoopState,
+        task: _WatchedTask,
+        result: TaskStatus | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        state.tasks.pop(task.task_id, None)
+        for waiter in task.waiters:
+            if waiter.future.done():
+                continue
+            if error is not None:
+                waiter.future.set_exception(error)
+            else:
+                waiter.future.set_result(result)
+        task.waiters = []
+
+    @staticmethod
+    def _notify(waiter: _Waiter, status: TaskStatus) -> None:
+        if waiter.on_progress is None:
+            return
+        try:
+            waiter.on_progress(status)
+        except Exception as e:
+            logger.error(f"Task progress callback failed for {status.id}: {e}")
+
+
+_default_watcher: TaskWatcher | None = None
+
+
+def get_task_watcher() -> TaskWatcher:
+    """Return the process-wide task watcher, creating it if needed."""
+    global _default_watcher
+    if _default_watcher is None:
+        _default_watcher = TaskWatcher()
+    return _default_watcher
+
+
+def set_task_watcher(watcher: TaskWatcher | None) -> None:
+    """Replace the process-wide task watcher (None resets to a lazy default)."""
+    global _default_watcher
+    _default_watcher = watcher
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from forge_cli.sdk.client import (
+    ForgeClient,
+    get_default_client,
+    resolve_client,
+    run_with_client,
+    set_default_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_across_calls():
+    client = ForgeClient()
+    try:
+        first = await client.get_session()
+        second = await client.get_session()
+        assert first is second
+        assert first.connector.limit == client.limit
+        assert first.connector.limit_per_host == client.limit_per_host
+    finally:
+        await client.close()
+    assert client.closed
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_session():
+    async with ForgeClient() as client:
+        session = await client.get_session()
+        assert not client.closed
+    assert session.closed
+    assert client.closed
+
+
+def test_new_event_loop_gets_fresh_session():
+    client = ForgeClient()
+
+    async def grab():
+        return await client.get_session()
+
+    first = asyncio.run(grab())
+    with patch("forge_cli.sdk.client.logger.warning") as warning:
+        second = asyncio.run(grab())
+    assert first is not second
+    # The first loop is gone, so its session can no longer be closed; that is reported
+    warning.assert_called_once()
+    asyncio.run(client.close())
+
+
+def test_run_with_client_closes_its_client():
+    async def grab():
+        client = resolve_client(None)
+        await client.get_session()
+        return client
+
+    set_default_client(None)
+    try:
+        client = run_with_client(grab())
+        assert client is not get_default_client()
+        assert client.closed
+    finally:
+        set_default_client(None)
+
+
+def test_session_on_a_running_loop_is_closed_there():
+    client = ForgeClient()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        first = asyncio.run_coroutine_threadsafe(client.get_session(), other_loop).result(5)
+        connector = first.connector
+
+        async def grab_and_wait():
+            second = await client.get_session()
+            for _ in range(100):
+                if first.closed:
+                    break
+                await asyncio.sleep(0.01)
+            await client.close()
+            return second
+
+        second = asyncio.run(grab_and_wait())
+        assert second is not first
+        assert first.closed
+        assert connector.closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(5)
+        other_loop.close()
+
+
+def test_resolve_client_falls_back_to_default():
+    set_default_client(None)
+    try:
+        default = get_default_client()
+        assert resolve_client(None) is default
+        explicit = ForgeClient()
+        assert resolve_client(explicit) is explicit
+
+        set_default_client(explicit)
+        assert get_default_client() is explicit
+    finally:
+        set_default_client(None)
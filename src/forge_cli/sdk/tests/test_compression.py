@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import gzip
+import json
+import zlib
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from forge_cli.common import jsoncodec
+from forge_cli.sdk.client import ForgeClient
+from forge_cli.sdk.compression import (
+    HttpCompression,
+    StreamDecoder,
+    aiter_decoded,
+    get_compression,
+    open_request,
+    set_compression,
+)
+from forge_cli.sdk.http_cache import HttpCache, set_http_cache
+from forge_cli.sdk.http_client import async_make_request
+
+LARGE_PAYLOAD = {"input": [{"role": "user", "content": "tell me more " * 200}]}
+SSE_STREAM = b"".join(f"event: delta\ndata: {json.dumps({'n': n})}\n\n".encode() for n in range(200))
+
+
+@pytest_asyncio.fixture
+async def server():
+    received = []
+
+    async def echo(request: web.Request) -> web.Response:
+        raw = await request.read()  # aiohttp decodes Content-Encoding: gzip
+        received.append((request.headers.get("Content-Encoding"), len(raw)))
+        return web.json_response({"size": len(json.loads(raw)["input"][0]["content"])})
+
+    async def strict(request: web.Request) -> web.Response:
+        received.append((request.headers.get("Content-Encoding"), request.content_length))
+        if request.headers.get("Content-Encoding"):
+            return web.Response(status=415, text="compressed bodies not supported")
+        return web.json_response({"ok": True})
+
+    async def undecoded(request: web.Request) -> web.Response:
+        # Like FastAPI, which ignores Content-Encoding and fails to parse the gzip bytes as JSON
+        received.append(request.headers.get("Content-Encoding"))
+        await request.read()
+        if request.headers.get("Content-Encoding"):
+            return web.json_response({"detail": "JSON decode error"}, status=422)
+        return web.json_response({"ok": True})
+
+    async def invalid(request: web.Request) -> web.Response:
+        received.append(request.headers.get("Content-Encoding"))
+        await request.read()
+        return web.json_response({"detail": "invalid input"}, status=422)
+
+    async def stream(request: web.Request) -> web.StreamResponse:
+        received.append(request.headers.get("Accept-Encoding"))
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Content-Encoding": "gzip"})
+        await response.prepare(request)
+        body = gzip.compress(SSE_STREAM)
+        for offset in range(0, len(body), 100):
+            await response.write(body[offset : offset + 100])
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/echo", echo)
+    app.router.add_post("/strict", strict)
+    app.router.add_post("/undecoded", undecoded)
+    app.router.add_post("/invalid", invalid)
+    app.router.add_post("/stream", stream)
+    async with TestServer(app) as test_server:
+        test_server.received = received
+        yield test_server
+
+
+@pytest_asyncio.fixture
+async def client():
+    async with ForgeClient() as forge_client:
+        yield forge_client
+
+
+@pytest.fixture(autouse=True)
+def compression(tmp_path):
+    compression = HttpCompression(threshold=1024)
+    set_compression(compression)
+    set_http_cache(HttpCache(directory=tmp_path))
+    yield compression
+    set_compression(None)
+    set_http_cache(None)
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_gzipped(server, client, compression):
+    status, body = await async_make_request("POST", str(server.make_url("/echo")), LARGE_PAYLOAD, client=client)
+
+    assert status == 200
+    assert body == {"size": len(LARGE_PAYLOAD["input"][0]["content"])}
+    assert server.received[0][0] == "gzip"
+    assert compression.accepts_gzip(str(server.make_url("/"))) is True
+    stats = compression.stats
+    assert stats.compressed_requests == 1
+    assert stats.request_bytes == len(jsoncodec.dumpb(LARGE_PAYLOAD))
+    assert stats.request_bytes_sent < stats.request_bytes / 10
+
+
+@pytest.mark.asyncio
+async def test_small_bodies_are_sent_as_is(server, client, compression):
+    await async_make_request("POST", str(server.make_url("/echo")), {"input": [{"content": "hi"}]}, client=client)
+
+    assert server.received[0][0] is None
+    assert compression.stats.compressed_requests == 0
+    assert compression.accepts_gzip(str(server.make_url("/"))) is None
+
+
+@pytest.mark.asyncio
+async def test_rejected_gzip_is_resent_and_remembered(server, client, compression):
+    url = str(server.make_url("/strict"))
+
+    assert await async_make_request("POST", url, LARGE_PAYLOAD, client=client) == (200, {"ok": True})
+    assert await async_make_request("POST", url, LARGE_PAYLOAD, client=client) == (200, {"ok": True})
+
+    # One probe, then uncompressed for the rest of the process
+    assert [encoding for encoding, _ in server.received] == ["gzip", None, None]
+    assert compression.accepts_gzip(url) is False
+
+
+@pytest.mark.asyncio
+async def test_server_that_cannot_decode_gzip_answering_422(server, client, compression):
+    url = str(server.make_url("/undecoded"))
+
+    assert await async_make_request("POST", url, LARGE_PAYLOAD, client=client) == (200, {"ok": True})
+    assert await async_make_request("POST", url, LARGE_PAYLOAD, client=client) == (200, {"ok": True})
+
+    assert server.received == ["gzip", None, None]
+    assert compression.accepts_gzip(url) is False
+
+
+@pytest.mark.asyncio
+async def test_422_after_gzip_is_known_to_work_is_not_a_rejection(server, client, compression):
+    await async_make_request("POST", str(server.make_url("/echo")), LARGE_PAYLOAD, client=client)
+    url = str(server.make_url("/invalid"))
+
+    with pytest.raises(Exception, match="status 422"):
+        await async_make_request("POST", url, LARGE_PAYLOAD, client=client)
+
+    assert server.received[1:] == ["gzip"]
+    assert compression.accepts_gzip(url) is True
+
+
+@pytest.mark.asyncio
+async def test_stream_is_decoded_incrementally(server, client, compression):
+    session = await client.get_session()
+    async with await open_request(
+        session, "POST", str(server.make_url("/stream")), json_payload={}, stream=True
+    ) as response:
+        chunks = [chunk async for chunk in aiter_decoded(response)]
+
+    assert b"".join(chunks) == SSE_STREAM
+    assert server.received == ["gzip, deflate"]
+    stats = get_compression().stats
+    assert stats.compressed_responses == 1
+    assert stats.response_bytes == len(SSE_STREAM)
+    assert stats.response_bytes_received == len(gzip.compress(SSE_STREAM))
+    assert stats.bytes_saved > 0
+
+
+@pytest.mark.parametrize("wbits", [zlib.MAX_WBITS, -zlib.MAX_WBITS])
+def test_deflate_decoder_handles_both_wrappings_split_anywhere(wbits):
+    compressor = zlib.compressobj(wbits=wbits)
+    encoded = compressor.compress(SSE_STREAM) + compressor.flush()
+    decoder = StreamDecoder("deflate")
+
+    decoded = b"".join(decoder.feed(encoded[i : i + 1]) for i in range(len(encoded))) + decoder.flush()
+
+    assert decoded == SSE_STREAM
+    assert decoder.received == len(encoded)
+    assert decoder.decoded == len(SSE_STREAM)
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        StreamDecoder("zstd")
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import copy
+
+from forge_cli.response._types import Response
+from forge_cli.sdk.delta_stream import ResponseDeltaAccumulator
+
+
+def _snapshot(
+    text: str = "",
+    annotations: list | None = None,
+    status: str = "in_progress",
+    tool_status: str = "searching",
+):
+    return {
+        "id": "resp_1",
+        "object": "response",
+        "created_at": 1700000000.0,
+        "model": "qwen-max-latest",
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+        "status": status,
+        "output": [
+            {
+                "id": "fs_1",
+                "type": "file_search_call",
+                "queries": ["revenue"],
+                "status": tool_status,
+            },
+            {
+                "id": "msg_1",
+                "type": "message",
+                "role": "assistant",
+                "status": status,
+                "content": [{"type": "output_text", "text": text, "annotations": annotations or []}],
+            },
+        ],
+    }
+
+
+def _citation(index: int) -> dict:
+    return {"type": "file_citation", "file_id": f"file_{index}", "index": index, "filename": f"doc{index}.pdf"}
+
+
+def test_snapshot_stream_matches_full_validation():
+    events = [
+        ("response.created", _snapshot()),
+        ("response.file_search_call.completed", _snapshot(tool_status="completed")),
+        ("response.output_text.delta", _snapshot("Revenue", tool_status="completed")),
+        ("response.output_text.delta", _snapshot("Revenue grew", [_citation(0)], tool_status="completed")),
+        (
+            "response.output_text.delta",
+            _snapshot("Revenue grew 12%", [_citation(0), _citation(1)], tool_status="completed"),
+        ),
+    ]
+
+    accumulator = ResponseDeltaAccumulator()
+    for event_type, data in events:
+        snapshot = accumulator.apply(event_type, copy.deepcopy(data))
+        expected = Response.model_validate(data)
+        assert snapshot.model_dump() == expected.model_dump()
+
+
+def test_in_place_updates_keep_instance():
+    accumulator = ResponseDeltaAccumulator()
+    first = accumulator.apply("response.created", _snapshot("a"))
+    second = accumulator.apply("response.output_text.delta", _snapshot("ab"))
+    assert first is second
+    assert second.output_text == "ab"
+
+
+def test_completed_event_is_fully_validated():
+    accumulator = ResponseDeltaAccumulator()
+    accumulator.apply("response.created", _snapshot("a"))
+    partial = accumulator.apply("response.output_text.delta", _snapshot("ab"))
+    final = accumulator.apply("response.completed", _snapshot("abc", status="completed", tool_status="completed"))
+    assert final is not partial
+    assert final.status == "completed"
+    assert final.output_text == "abc"
+
+
+def test_openai_style_delta_events():
+    accumulator = ResponseDeltaAccumulator()
+    accumulator.apply("response.created", _snapshot("Hello"))
+
+    accumulator.apply(
+        "response.output_text.delta",
+        {
+            "type": "response.output_text.delta",
+            "output_index": 1,
+            "content_index": 0,
+            "item_id": "msg_1",
+            "delta": " world",
+        },
+    )
+    accumulator.apply(
+        "response.output_text.annotation.added",
+        {
+            "type": "response.output_text.annotation.added",
+            "output_index": 1,
+            "content_index": 0,
+            "annotation_index": 0,
+            "item_id": "msg_1",
+            "annotation": _citation(3),
+        },
+    )
+    snapshot = accumulator.apply(
+        "response.file_search_call.completed",
+        {"type": "response.file_search_call.completed", "output_index": 0, "item_id": "fs_1"},
+    )
+
+    assert snapshot.output_text == "Hello world"
+    assert snapshot.output[1].content[0].annotations[0].file_id == "file_3"
+    assert snapshot.output[0].status == "completed"
+
+    # A later full snapshot still reconciles correctly after deltas were applied.
+    data = _snapshot("Hello world!", [_citation(3)], tool_status="completed")
+    snapshot = accumulator.apply("response.output_text.delta", data)
+    assert snapshot.model_dump() == Response.model_validate(data).model_dump()
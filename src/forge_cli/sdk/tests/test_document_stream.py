@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pydantic import ValidationError
+
+from forge_cli.sdk.document_stream import DocumentSplitter, LazyDocument, async_stream_document_content
+
+DOCUMENT = {
+    "id": "doc_1",
+    "title": 'Annual "report" {draft}',
+    "created_at": "2024-01-01T00:00:00",
+    "updated_at": "2024-01-01T00:00:00",
+    "content": {
+        "id": "doc_1",
+        "abstract": "ends with a backslash \\",
+        "page_count": 3,
+        "segments": [
+            {
+                "id": f"seg_{i}",
+                "content": 'text with ]}," and ü ' * i,
+                "index": i,
+                "metadata": {"pages": [i, {"k": "]"}]},
+            }
+            for i in range(12)
+        ],
+        "keywords": ["revenue"],
+    },
+    "metadata": {"segments": [1, 2]},
+}
+RAW = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, len(RAW)])
+def test_splitter_separates_segments_at_any_chunk_boundary(chunk_size):
+    segments = []
+    splitter = DocumentSplitter(segments.append)
+    for offset in range(0, len(RAW), chunk_size):
+        splitter.feed(RAW[offset : offset + chunk_size])
+
+    expected = json.loads(RAW)
+    expected_segments = expected["content"]["segments"]
+    expected["content"]["segments"] = []
+    assert json.loads(splitter.header) == expected
+    assert [json.loads(segment) for segment in segments] == expected_segments
+
+
+@pytest.mark.asyncio
+async def test_stream_document_content_spills_segments(tmp_path):
+    async def content(request: web.Request) -> web.Response:
+        if request.match_info["doc_id"] != "doc_1":
+            return web.Response(status=404)
+        return web.Response(body=RAW, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/v1/files/{doc_id}/content", content)
+    async with TestServer(app) as server:
+        with patch("forge_cli.sdk.document_stream.BASE_URL", str(server.make_url("")).rstrip("/")):
+            assert await async_stream_document_content("missing") is None
+            document = await async_stream_document_content("doc_1", chunk_size=16, spill_dir=str(tmp_path))
+
+    with document:
+        assert document.header.title == DOCUMENT["title"]
+        assert document.header.content.page_count == 3
+        assert document.header.content.segments == []
+        assert document.segment_count == 12
+        assert document.segment(5).index == 5
+        assert [segment.id for segment in document.iter_segments()] == [f"seg_{i}" for i in range(12)]
+
+        out = io.StringIO()
+        document.write_json(out)
+        assert out.getvalue() == json.dumps(DOCUMENT, indent=2, ensure_ascii=False)
+
+
+def test_header_is_validated_only_when_asked_for():
+    header_data = {"id": "doc_1", "title": "No timestamps", "content": {"segments": []}}
+    with LazyDocument(header_data, io.BytesIO(), []) as document:
+        assert document.header_data["title"] == "No timestamps"
+        out = io.StringIO()
+        document.write_json(out)
+        assert json.loads(out.getvalue()) == header_data
+
+        with pytest.raises(ValidationError):
+            document.header
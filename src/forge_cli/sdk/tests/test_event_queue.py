@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from forge_cli.sdk.client import ForgeClient
+from forge_cli.sdk.event_queue import ConflatingEventQueue, aiter_conflated
+from forge_cli.sdk.http_cache import HttpCache, set_http_cache
+from forge_cli.sdk.sse import ServerSentEvent
+from forge_cli.sdk.typed_api import astream_typed_response, create_typed_request
+from forge_cli.testing.mock_server import DEFAULT_ANSWER, MockForgeServer, Recording
+
+DELTA = "response.output_text.delta"
+
+
+def _queue() -> ConflatingEventQueue:
+    queue = ConflatingEventQueue()
+    queue.snapshot_types.add(DELTA)
+    return queue
+
+
+async def _drain(queue: ConflatingEventQueue) -> list[tuple[str, str]]:
+    await queue.close()
+    drained = []
+    while (event := await queue.get()) is not None:
+        drained.append((event.event, event.data))
+    return drained
+
+
+@pytest.mark.asyncio
+async def test_progress_snapshots_collapse_to_the_newest():
+    queue = _queue()
+    for event, data in [
+        ("response.created", "{0}"),
+        (DELTA, "{1}"),
+        (DELTA, "{2}"),
+        (DELTA, "{2}"),  # byte-identical
+        ("response.file_search_call.completed", "{3}"),
+        (DELTA, "{4}"),
+        (DELTA, "{5}"),
+        ("done", ""),
+    ]:
+        await queue.put(ServerSentEvent(event, data))
+
+    assert await _drain(queue) == [
+        ("response.created", "{0}"),
+        (DELTA, "{2}"),
+        ("response.file_search_call.completed", "{3}"),
+        (DELTA, "{5}"),
+        ("done", ""),
+    ]
+    assert queue.stats == {"received": 8, "conflated": 2, "duplicates": 1, "max_depth": 5}
+
+
+@pytest.mark.asyncio
+async def test_unknown_event_types_are_never_conflated():
+    queue = ConflatingEventQueue()  # e.g. OpenAI-style deltas, each carrying only new text
+    for text in ("Re", "ven", "ue"):
+        await queue.put(ServerSentEvent(DELTA, text))
+    assert [data for _, data in await _drain(queue)] == ["Re", "ven", "ue"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure():
+    queue = ConflatingEventQueue(maxsize=2)
+    for index in range(2):
+        await queue.put(ServerSentEvent("response.output_item.added", str(index)))
+
+    blocked = asyncio.create_task(queue.put(ServerSentEvent("done", "")))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    assert (await queue.get()).data == "0"
+    await asyncio.wait_for(blocked, 1)
+    assert queue.max_depth == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_sees_fresh_state_and_all_lifecycle_events():
+    async def source():
+        yield ServerSentEvent("response.created", "{created}")
+        for index in range(200):
+            yield ServerSentEvent(DELTA, f"{{{index}}}")
+            if index % 50 == 0:
+                await asyncio.sleep(0)
+        yield ServerSentEvent("response.completed", "{completed}")
+        raise ConnectionResetError("dropped")
+
+    queue = _queue()
+    seen = []
+    with pytest.raises(ConnectionResetError):
+        async for event in aiter_conflated(source(), queue):
+            seen.append(event.event)
+            await asyncio.sleep(0.005)  # an expensive render
+
+    assert seen[0] == "response.created"
+    assert seen[-1] == "response.completed"
+    assert seen.count(DELTA) < 20
+    assert queue.received == 202
+
+
+@pytest.mark.asyncio
+async def test_typed_stream_conflates_behind_a_slow_consumer(tmp_path):
+    set_http_cache(HttpCache(directory=tmp_path, enabled=False))
+    recording = Recording.synthesize(chars_per_event=2, interval=0.001)
+    try:
+        async with MockForgeServer([recording], speed=1.0) as server, ForgeClient() as client:
+            with patch("forge_cli.sdk.typed_api.BASE_URL", server.url):
+                events = []
+                stream = astream_typed_response(create_typed_request("hi"), client=client, delta=True, conflate=True)
+                async for event_type, snapshot in stream:
+                    events.append((event_type, snapshot))
+                    await asyncio.sleep(0.01)
+    finally:
+        set_http_cache(None)
+
+    types = [event_type for event_type, _ in events]
+    assert types.count(DELTA) < sum(event.event == DELTA for event in recording.events)
+    assert "response.file_search_call.completed" in types
+    assert types[-2:] == ["response.completed", "done"]
+    assert events[-2][1].output_text == DEFAULT_ANSWER
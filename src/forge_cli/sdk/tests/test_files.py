@@ -15,6 +15,7 @@ from forge_cli.sdk.files import (
     async_delete_file,
     async_fetch_file,
     async_upload_file,
+    async_upload_many,
     async_wait_for_task_completion,
 )
 from forge_cli.sdk.types import DeleteResponse, File, TaskStatus
@@ -99,7 +100,7 @@ async def test_async_check_task_status_success(mock_http_client):
     assert result.result["file_id"] == "file_123"
 
     expected_url = f"{BASE_URL}/v1/tasks/{task_id}"
-    mock_http_client.assert_called_once_with("GET", expected_url)
+    mock_http_client.assert_called_once_with("GET", expected_url, client=None)
 
 
 # --- Tests for async_delete_file ---
@@ -121,7 +122,7 @@ async def test_async_delete_file_success_200(mock_http_client):
     assert result.object_field == "file"  # Check aliased field
 
     expected_url = f"{BASE_URL}/v1/files/{file_id_to_delete}"
-    mock_http_client.assert_called_once_with("DELETE", expected_url)
+    mock_http_client.assert_called_once_with("DELETE", expected_url, client=None)
 
 
 @pytest.mark.asyncio
@@ -139,7 +140,7 @@ async def test_async_delete_file_success_204(mock_http_client):
     assert result.object_field == "file"
 
     expected_url = f"{BASE_URL}/v1/files/{file_id_to_delete}"
-    mock_http_client.assert_called_once_with("DELETE", expected_url)
+    mock_http_client.assert_called_once_with("DELETE", expected_url, client=None)
 
 
 @pytest.mark.asyncio
@@ -165,7 +166,7 @@ async def test_async_fetch_file_success(mock_http_client):
     assert result.bytes == 2048
 
     expected_url = f"{BASE_URL}/v1/files/{file_id_to_fetch}/content"
-    mock_http_client.assert_called_once_with("GET", expected_url)
+    mock_http_client.assert_called_once_with("GET", expected_url, client=None)
 
 
 @pytest.mark.asyncio
@@ -177,7 +178,7 @@ async def test_async_fetch_file_not_found(mock_http_client):
     assert result is None
 
     expected_url = f"{BASE_URL}/v1/files/{file_id_to_fetch}/content"
-    mock_http_client.assert_called_once_with("GET", expected_url)
+    mock_http_client.assert_called_once_with("GET", expected_url, client=None)
 
 
 # Test for async_wait_for_task_completion
@@ -256,6 +257,59 @@ async def test_async_wait_for_task_completion_timeout(mock_http_client):
     assert mock_http_client.call_count == 3
 
 
+
+# --- Tests for async_upload_many ---
+def _upload_response(file_id: str, md5: str) -> dict:
+    return {
+        "id": file_id,
+        "object": "file",
+        "filename": f"{file_id}.txt",
+        "bytes": 5,
+        "md5": md5,
+        "purpose": "general",
+        "created_at": datetime.utcnow().isoformat(),
+        "task_id": f"task_{file_id}",
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_upload_many_sends_md5_and_resumes(mock_http_client, tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"doc{index}.txt"
+        path.write_text(f"doc {index}")
+        paths.append(path)
+    manifest = tmp_path / "manifest.jsonl"
+
+    sent_md5s = []
+
+    async def fake_request(method, url, data=None, client=None):
+        fields = {options["name"]: value for options, _, value in data._fields}
+        sent_md5s.append(fields["md5"])
+        assert fields["skip_exists"] == "true"
+        if fields["file"].name.endswith("doc1.txt"):
+            raise Exception("boom")
+        return 200, _upload_response(f"file_{len(sent_md5s)}", fields["md5"])
+
+    mock_http_client.side_effect = fake_request
+
+    results = await async_upload_many(paths, concurrency=2, manifest_path=manifest)
+
+    assert [entry.status for entry in results] == ["uploaded", "failed", "uploaded"]
+    assert all(len(md5) == 32 for md5 in sent_md5s)
+    assert len(manifest.read_text().splitlines()) == 3
+
+    # A second run only retries the failed file
+    mock_http_client.reset_mock()
+    mock_http_client.side_effect = None
+    mock_http_client.return_value = (200, _upload_response("file_retry", "0" * 32))
+    results = await async_upload_many(paths, concurrency=2, manifest_path=manifest)
+
+    assert mock_http_client.call_count == 1
+    assert [entry.status for entry in results] == ["uploaded"] * 3
+    assert results[1].file_id == "file_retry"
+
+
 # TODO: Add tests for error cases (API returns non-200 status, Pydantic validation failures)
 # For Pydantic validation failure, you'd mock async_make_request to return (200, malformed_dict)
 # and assert that the SDK function raises an Exception or returns None as designed.
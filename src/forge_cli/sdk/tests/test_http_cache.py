@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from forge_cli.sdk.client import ForgeClient
+from forge_cli.sdk.http_cache import HttpCache, bypass_cache, set_http_cache
+from forge_cli.sdk.http_client import async_make_request
+from forge_cli.sdk.types import Vectorstore
+
+VECTORSTORE = {"id": "vs_1", "object": "vector_store", "name": "docs", "created_at": 1700000000}
+
+
+@pytest_asyncio.fixture
+async def server():
+    seen = []
+
+    async def get_vectorstore(request: web.Request) -> web.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response(VECTORSTORE, headers={"ETag": '"v1"'})
+
+    async def delete_vectorstore(request: web.Request) -> web.Response:
+        return web.json_response({"id": "vs_1", "object": "vector_store", "deleted": True})
+
+    app = web.Application()
+    app.router.add_get("/v1/vector_stores/vs_1", get_vectorstore)
+    app.router.add_delete("/v1/vector_stores/vs_1", delete_vectorstore)
+    async with TestServer(app) as test_server:
+        test_server.seen = seen
+        yield test_server
+
+
+@pytest_asyncio.fixture
+async def client():
+    async with ForgeClient() as forge_client:
+        yield forge_client
+
+
+def _use_cache(tmp_path, **kwargs) -> HttpCache:
+    cache = HttpCache(directory=tmp_path, **kwargs)
+    set_http_cache(cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    yield
+    set_http_cache(None)
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_request(server, client, tmp_path):
+    _use_cache(tmp_path, ttl=60)
+    url = str(server.make_url("/v1/vector_stores/vs_1"))
+
+    first = await async_make_request("GET", url, client=client)
+    second = await async_make_request("GET", url, client=client)
+
+    assert first == second == (200, VECTORSTORE)
+    assert server.seen == [None]
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_and_model_is_memoized(server, client, tmp_path):
+    cache = _use_cache(tmp_path, ttl=0)
+    url = str(server.make_url("/v1/vector_stores/vs_1"))
+
+    _, first = await async_make_request("GET", url, client=client)
+    _, second = await async_make_request("GET", url, client=client)
+
+    assert server.seen == [None, '"v1"']
+    assert second is first
+    assert cache.model_validate(Vectorstore, second) is cache.model_validate(Vectorstore, first)
+
+    # A new process starts with an empty memory layer and reads the body from disk
+    cold = _use_cache(tmp_path, ttl=0)
+    status, body = await async_make_request("GET", url, client=client)
+    assert (status, body) == (200, VECTORSTORE)
+    assert server.seen[-1] == '"v1"'
+    assert cold.model_validate(Vectorstore, body).id == "vs_1"
+
+
+@pytest.mark.asyncio
+async def test_bypass_and_writes_skip_cached_copies(server, client, tmp_path):
+    _use_cache(tmp_path, ttl=60)
+    url = str(server.make_url("/v1/vector_stores/vs_1"))
+
+    await async_make_request("GET", url, client=client)
+    with bypass_cache():
+        await async_make_request("GET", url, client=client)
+    assert server.seen == [None, None]
+
+    await async_make_request("DELETE", url, client=client)
+    await async_make_request("GET", url, client=client)
+    assert server.seen == [None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = HttpCache(directory=tmp_path, max_bytes=250, max_memory_bytes=0)
+    raw = b'"' + b"x" * 98 + b'"'
+    for age, name in enumerate(("a", "b", "c")):
+        key = cache.key(f"http://h/v1/files/{name}/content")
+        await cache.store(key, "u", raw, "x" * 98, {})
+        os.utime(tmp_path / f"{key}.body", (1000 + age, 1000 + age))
+
+    assert len(list(tmp_path.glob("*.body"))) == 2
+    assert await cache.lookup(cache.key("http://h/v1/files/c/content")) is not None
+    assert await cache.lookup(cache.key("http://h/v1/files/a/content")) is None
+
+
+@pytest.mark.asyncio
+async def test_memory_layer_is_capped_in_bytes(tmp_path):
+    cache = HttpCache(directory=tmp_path, max_memory_bytes=1000)
+    small = b'"' + b"x" * 198 + b'"'
+    for name in ("a", "b", "c", "d", "e"):
+        await cache.store(cache.key(f"http://h/v1/files/{name}/content"), "u", small, "x" * 198, {})
+    large_key = cache.key("http://h/v1/files/big/content")
+    await cache.store(large_key, "u", b'"' + b"x" * 298 + b'"', "x" * 298, {})
+
+    # Oldest entries leave memory once the budget is exceeded; large bodies stay on disk only
+    assert cache._memory_bytes <= 1000
+    assert cache.key("http://h/v1/files/e/content") in cache._memory
+    assert large_key not in cache._memory
+    assert (await cache.lookup(large_key)).body == "x" * 298
+    assert large_key not in cache._memory
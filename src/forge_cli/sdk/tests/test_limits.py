@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from forge_cli.sdk.client import ForgeClient
+from forge_cli.sdk.http_cache import HttpCache, set_http_cache
+from forge_cli.sdk.http_client import async_make_request
+from forge_cli.sdk.limits import (
+    DEFAULT_LIMITS,
+    CircuitBreaker,
+    CircuitOpenError,
+    LimitSettings,
+    RequestLimiter,
+    TokenBucket,
+    classify,
+    set_request_limiter,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_cache(tmp_path):
+    set_http_cache(HttpCache(directory=tmp_path, enabled=False))
+    yield
+    set_http_cache(None)
+    set_request_limiter(None)
+
+
+@pytest_asyncio.fixture
+async def server():
+    state = {"status": 500, "hits": 0}
+
+    async def search(request: web.Request) -> web.Response:
+        state["hits"] += 1
+        return web.json_response({"data": []}, status=state["status"])
+
+    async def upload(request: web.Request) -> web.Response:
+        state["in_flight"] = state.get("in_flight", 0) + 1
+        state["peak"] = max(state.get("peak", 0), state["in_flight"])
+        await asyncio.sleep(0.05)
+        state["in_flight"] -= 1
+        return web.json_response({"id": "file_1"})
+
+    app = web.Application()
+    app.router.add_post("/v1/vector_stores/{id}/search", search)
+    app.router.add_post("/v1/files", upload)
+    async with TestServer(app) as test_server:
+        test_server.state = state
+        yield test_server
+
+
+def test_parse_limit_specs():
+    assert LimitSettings.parse("5") == LimitSettings(rate=5.0, burst=5, concurrency=None)
+    assert LimitSettings.parse("0.5/4") == LimitSettings(rate=0.5, burst=1, concurrency=4)
+    assert LimitSettings.parse("/2") == LimitSettings(rate=None, burst=1, concurrency=2)
+    with pytest.raises(ValueError):
+        LimitSettings.parse("fast")
+    with pytest.raises(ValueError):
+        RequestLimiter({"bulk": LimitSettings()})
+
+
+def test_classify():
+    assert classify("POST", "http://h/v1/files") == "uploads"
+    assert classify("POST", "http://h/v1/vector_stores/vs_1/search") == "searches"
+    assert classify("POST", "http://h/v1/responses") == "responses"
+    assert classify("GET", "http://h/v1/tasks/t1") == "polls"
+    assert classify("GET", "http://h/v1/files/f1") == "default"
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_caps_the_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    assert time.monotonic() - started >= 5 / 50 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_and_cancellation():
+    limiter = RequestLimiter({"searches": LimitSettings(concurrency=2)})
+    url = "http://h/v1/vector_stores/vs_1/search"
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.slot("POST", url):
+            peak = max(peak, limiter.snapshot()["searches"]["in_flight"])
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    assert peak == 2
+
+    # Cancelled waiters give their slot back
+    blockers = [asyncio.create_task(call()) for _ in range(4)]
+    await asyncio.sleep(0)
+    for task in blockers:
+        task.cancel()
+    await asyncio.gather(*blockers, return_exceptions=True)
+    await asyncio.wait_for(asyncio.gather(*(call() for _ in range(2))), 1)
+    assert limiter.snapshot()["searches"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_default_limits_honour_caller_concurrency(server):
+    assert all(settings == LimitSettings() for settings in DEFAULT_LIMITS.values())
+    url = str(server.make_url("/v1/files"))
+
+    async with ForgeClient() as client:
+        await asyncio.gather(*(async_make_request("POST", url, {}, client=client) for _ in range(8)))
+
+    assert server.state["peak"] == 8
+
+
+def test_breaker_half_open_probe():
+    breaker = CircuitBreaker("searches", failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.admit()
+
+    time.sleep(0.06)
+    assert breaker.admit() is True  # the probe
+    with pytest.raises(CircuitOpenError):
+        breaker.admit()  # only one probe at a time
+    breaker.record_failure(probe=True)
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    assert breaker.admit() is True
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.admit() is False
+
+
+@pytest.mark.asyncio
+async def test_server_errors_open_the_circuit(server):
+    limiter = RequestLimiter(failure_threshold=3, reset_timeout=0.05)
+    set_request_limiter(limiter)
+    url = str(server.make_url("/v1/vector_stores/vs_1/search"))
+
+    async with ForgeClient() as client:
+        for _ in range(3):
+            with pytest.raises(Exception, match="status 500"):
+                await async_make_request("POST", url, {"query": "q"}, client=client)
+        with pytest.raises(CircuitOpenError):
+            await async_make_request("POST", url, {"query": "q"}, client=client)
+        assert server.state["hits"] == 3
+        assert limiter.snapshot()["searches"]["circuit"] == "open"
+        assert limiter.snapshot()["searches"]["rejected"] == 1
+
+        server.state["status"] = 200
+        await asyncio.sleep(0.06)
+        assert await async_make_request("POST", url, {"query": "q"}, client=client) == (200, {"data": []})
+        assert limiter.snapshot()["searches"]["circuit"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_trip_the_breaker(server):
+    limiter = RequestLimiter(failure_threshold=1)
+    set_request_limiter(limiter)
+    server.state["status"] = 400
+    url = str(server.make_url("/v1/vector_stores/vs_1/search"))
+
+    async with ForgeClient() as client:
+        for _ in range(3):
+            with pytest.raises(Exception, match="status 400"):
+                await async_make_request("POST", url, {"query": "q"}, client=client)
+
+    assert server.state["hits"] == 3
+    assert limiter.snapshot()["searches"]["circuit"] == "closed"
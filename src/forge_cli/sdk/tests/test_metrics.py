@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from forge_cli.common import jsoncodec
+from forge_cli.sdk.client import ForgeClient
+from forge_cli.sdk.http_cache import HttpCache, set_http_cache
+from forge_cli.sdk.http_client import async_make_request
+from forge_cli.sdk.metrics import ClientMetrics, Histogram, set_metrics
+
+
+@pytest.fixture(autouse=True)
+def metrics(tmp_path):
+    metrics = ClientMetrics()
+    set_metrics(metrics)
+    set_http_cache(HttpCache(directory=tmp_path, enabled=False))
+    yield metrics
+    set_metrics(None)
+    set_http_cache(None)
+
+
+@pytest_asyncio.fixture
+async def server():
+    async def search(request: web.Request) -> web.Response:
+        await request.read()
+        return web.json_response({"data": [{"text": "x" * 500}]})
+
+    async def broken(request: web.Request) -> web.Response:
+        return web.Response(status=500, text="boom")
+
+    app = web.Application()
+    app.router.add_post("/v1/vector_stores/{id}/search", search)
+    app.router.add_get("/v1/files/{id}", broken)
+    async with TestServer(app) as test_server:
+        yield test_server
+
+
+def test_histogram_percentiles_are_within_bucket_precision():
+    histogram = Histogram()
+    values = [random.uniform(0.001, 2.0) for _ in range(5000)]
+    for value in values:
+        histogram.record(value)
+
+    ordered = sorted(values)
+    for percent in (50, 90, 99):
+        exact = ordered[round(percent / 100 * len(ordered)) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.04)
+    assert histogram.count == 5000
+    assert histogram.max == max(values)
+
+
+def test_histogram_memory_is_fixed():
+    histogram = Histogram()
+    buckets = len(histogram._counts)
+    for value in (0.0, 1e-6, 0.5, 10_000.0):
+        histogram.record(value)
+    assert len(histogram._counts) == buckets
+    assert histogram.percentile(100) == 10_000.0  # clamped to the last bucket, reported as max
+
+
+def test_endpoint_names_hide_identifiers():
+    endpoint = ClientMetrics.endpoint
+    assert endpoint("get", "http://h/v1/vector_stores/vs_1") == "GET /v1/vector_stores/{id}"
+    assert endpoint("POST", "http://h/v1/vector_stores/vs_1/search") == "POST /v1/vector_stores/{id}/search"
+    assert endpoint("GET", "http://h/v1/files/f1/content?x=1") == "GET /v1/files/{id}/content"
+    assert endpoint("GET", "http://h/v1/vector_stores/vs_1/files") == "GET /v1/vector_stores/{id}/files"
+    assert endpoint("POST", "http://h/v1/responses") == "POST /v1/responses"
+
+
+@pytest.mark.asyncio
+async def test_requests_are_recorded_per_endpoint(server, metrics, tmp_path):
+    async with ForgeClient() as client:
+        for vs_id in ("vs_1", "vs_2", "vs_3"):
+            url = str(server.make_url(f"/v1/vector_stores/{vs_id}/search"))
+            await async_make_request("POST", url, {"query": "q"}, client=client)
+        # async_make_request signals non-2xx answers with a bare Exception
+        with pytest.raises(Exception, match="failed with status 500"):
+            await async_make_request("GET", str(server.make_url("/v1/files/f1")), client=client)
+
+    search = metrics.endpoints["POST /v1/vector_stores/{id}/search"]
+    assert search.requests == 3
+    assert search.errors == 0
+    assert search.bytes_sent == 3 * len(jsoncodec.dumpb({"query": "q"}))
+    assert search.bytes_received > 3 * 500
+    assert search.new_connections == 1
+    assert search.reused_connections == 2
+    assert search.first_byte.count == 3
+    assert search.first_byte.max <= search.latency.max
+
+    assert metrics.endpoints["GET /v1/files/{id}"].errors == 1
+
+    path = tmp_path / "stats.json"
+    metrics.dump(path)
+    dumped = json.loads(path.read_text())
+    assert dumped["endpoints"]["POST /v1/vector_stores/{id}/search"]["latency"]["count"] == 3
+    assert "p99" in dumped["endpoints"]["POST /v1/vector_stores/{id}/search"]["latency"]
+    assert "transfer" in dumped
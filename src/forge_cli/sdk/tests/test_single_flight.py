@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from forge_cli.sdk.client import ForgeClient
+from forge_cli.sdk.http_cache import HttpCache, set_http_cache
+from forge_cli.sdk.http_client import async_make_request
+from forge_cli.sdk.single_flight import SingleFlight, set_single_flight
+
+
+@pytest.fixture(autouse=True)
+def single_flight(tmp_path):
+    single_flight = SingleFlight()
+    set_single_flight(single_flight)
+    set_http_cache(HttpCache(directory=tmp_path, enabled=False))
+    yield single_flight
+    set_single_flight(None)
+    set_http_cache(None)
+
+
+@pytest_asyncio.fixture
+async def server():
+    hits = []
+
+    async def get_files(request: web.Request) -> web.Response:
+        hits.append(request.query_string)
+        await asyncio.sleep(0.05)
+        return web.json_response({"data": [{"id": "f1"}], "has_more": False})
+
+    app = web.Application()
+    app.router.add_get("/v1/vector_stores/{id}/files", get_files)
+    async with TestServer(app) as test_server:
+        test_server.hits = hits
+        yield test_server
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call(single_flight):
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    results = await asyncio.gather(*(single_flight.do("k", fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert (single_flight.calls, single_flight.shared) == (1, 4)
+
+    # Once finished, the next call starts a new request
+    assert await single_flight.do("k", fetch) == {"value": 2}
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller(single_flight):
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(single_flight.do("k", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_caller_keeps_the_request(single_flight):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(single_flight.do("k", fetch))
+    second = asyncio.create_task(single_flight.do("k", fetch))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "done"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_request_is_cancelled_when_every_caller_leaves(single_flight):
+    cancelled = asyncio.Event()
+
+    async def fetch():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    callers = [asyncio.create_task(single_flight.do("k", fetch)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert single_flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_are_sent_once(server):
+    url = str(server.make_url("/v1/vector_stores/vs_1/files"))
+    async with ForgeClient() as client:
+        results = await asyncio.gather(
+            *(async_make_request("GET", url, params={"limit": 10}, client=client) for _ in range(4)),
+            async_make_request("GET", url, params={"limit": 20}, client=client),
+        )
+
+    assert sorted(server.hits) == ["limit=10", "limit=20"]
+    assert all(result[1] is results[0][1] for result in results[:4])
+    assert results[4][1] is not results[0][1]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+from forge_cli.sdk.sse import ServerSentEvent, SSEParser, aiter_sse_events
+
+
+def _feed_all(chunks: list[bytes]) -> tuple[list[ServerSentEvent], SSEParser]:
+    parser = SSEParser()
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    events.extend(parser.flush())
+    return events, parser
+
+
+STREAM = (
+    b": keep-alive comment\n"
+    b"event: response.created\n"
+    b'data: {"id": "resp_1"}\n'
+    b"\n"
+    b"event: response.output_text.delta\n"
+    b"id: 7\n"
+    b"retry: 3000\n"
+    b'data: {"text":\n'
+    b'data: "h\xc3\xa9llo"}\n'
+    b"\n"
+    b"event: done\n"
+    b"\n"
+)
+
+
+def test_parses_events_fields_and_multiline_data():
+    events, parser = _feed_all([STREAM])
+
+    assert [event.event for event in events] == ["response.created", "response.output_text.delta", "done"]
+    assert events[0].data == '{"id": "resp_1"}'
+    assert events[0].id is None
+    assert events[1].data == '{"text":\n"héllo"}'
+    assert events[1].id == "7"
+    assert events[1].retry == 3000
+    assert events[2].data == ""
+    assert parser.last_event_id == "7"
+
+
+def test_chunk_boundaries_do_not_matter():
+    expected, _ = _feed_all([STREAM])
+    # One byte at a time also splits the multi-byte UTF-8 character
+    events, _ = _feed_all([STREAM[i : i + 1] for i in range(len(STREAM))])
+    assert events == expected
+
+
+@pytest.mark.parametrize("newline", [b"\r\n", b"\r"])
+def test_crlf_and_cr_line_endings(newline):
+    stream = STREAM.replace(b"\n", newline)
+    expected, _ = _feed_all([STREAM])
+    assert _feed_all([stream])[0] == expected
+    assert _feed_all([stream[i : i + 1] for i in range(len(stream))])[0] == expected
+
+
+def test_default_event_type_and_field_without_colon():
+    events, _ = _feed_all([b"data\n\ndata:x\n\n"])
+    assert [(event.event, event.data) for event in events] == [("message", ""), ("message", "x")]
+
+
+def test_id_with_null_is_ignored_and_id_persists():
+    events, _ = _feed_all([b"id: 1\ndata: a\n\nid: x\x00y\ndata: b\n\n"])
+    assert [event.id for event in events] == ["1", "1"]
+
+
+def test_pending_event_is_flushed_at_end_of_stream():
+    parser = SSEParser()
+    assert parser.feed(b"event: done") == []
+    assert [event.event for event in parser.flush()] == ["done"]
+
+
+@pytest.mark.asyncio
+async def test_aiter_sse_events():
+    async def chunks():
+        yield STREAM[:10]
+        yield STREAM[10:]
+
+    events = [event async for event in aiter_sse_events(chunks())]
+    assert [event.event for event in events] == ["response.created", "response.output_text.delta", "done"]
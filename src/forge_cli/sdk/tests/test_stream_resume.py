@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import contextlib
+import json
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from forge_cli.sdk import stream_resume
+from forge_cli.sdk.client import ForgeClient
+from forge_cli.sdk.http_cache import HttpCache, set_http_cache
+from forge_cli.sdk.metrics import ClientMetrics, set_metrics
+from forge_cli.sdk.sse import ServerSentEvent
+from forge_cli.sdk.stream_resume import StreamPosition
+from forge_cli.sdk.typed_api import astream_typed_response, create_typed_request
+from forge_cli.testing.mock_server import DEFAULT_ANSWER, MockForgeServer, Recording
+
+
+@pytest.fixture(autouse=True)
+def metrics(tmp_path):
+    set_http_cache(HttpCache(directory=tmp_path, enabled=False))
+    metrics = ClientMetrics()
+    set_metrics(metrics)
+    with patch.object(stream_resume, "BACKOFF_BASE", 0.01), patch.object(stream_resume, "POLL_INTERVAL", 0.01):
+        yield metrics
+    set_metrics(None)
+    set_http_cache(None)
+
+
+@contextlib.contextmanager
+def pointed_at(url: str):
+    with (
+        patch("forge_cli.sdk.typed_api.BASE_URL", url),
+        patch("forge_cli.sdk.stream_resume.BASE_URL", url),
+        patch("forge_cli.sdk.response.BASE_URL", url),
+    ):
+        yield
+
+
+async def collect(url: str, **kwargs) -> list[tuple[str, object]]:
+    with pointed_at(url):
+        async with ForgeClient() as client:
+            request = create_typed_request("How did revenue develop?")
+            return [item async for item in astream_typed_response(request, client=client, **kwargs)]
+
+
+def test_position_tracks_response_id_and_event_ids():
+    position = StreamPosition()
+    position.observe(ServerSentEvent("response.created", json.dumps({"response": {"id": "r1", "object": "response"}})))
+    position.observe(ServerSentEvent("response.output_text.delta", '{"delta": "x"}', id="7"))
+    assert (position.response_id, position.last_event_id, position.resumable) == ("r1", "7", True)
+
+    position.observe(ServerSentEvent("response.completed", "{}"))
+    assert position.terminal and not position.resumable
+
+
+@pytest.mark.asyncio
+async def test_dropped_stream_resumes_with_last_event_id(metrics):
+    server = MockForgeServer([Recording.synthesize()], speed=None, disconnect_rate=1.0, event_ids=True, seed=3)
+    async with server:
+        events = await collect(server.url, delta=True)
+
+    types = [event_type for event_type, _ in events]
+    assert "error" not in types
+    assert types[-2:] == ["response.completed", "done"]
+    assert events[-2][1].output_text == DEFAULT_ANSWER
+    assert server.hits["GET /v1/responses/{id}"] >= 1
+
+    resumes = metrics.resumes
+    assert resumes.resumed == 1 and resumes.failed == 0 and resumes.polled == 0
+    assert resumes.disconnects == server.hits["POST /v1/responses"] + server.hits["GET /v1/responses/{id}"] - 1
+    assert resumes.latency.count == resumes.disconnects
+
+
+@pytest.mark.asyncio
+async def test_stream_without_event_ids_is_polled(metrics):
+    server = MockForgeServer([Recording.synthesize()], speed=None, disconnect_rate=1.0, seed=3)
+    async with server:
+        events = await collect(server.url, validate="final")
+
+    assert [event_type for event_type, _ in events][-2:] == ["response.completed", "done"]
+    assert events[-2][1].output_text == DEFAULT_ANSWER
+    assert metrics.resumes.polled == 1
+    assert metrics.resumes.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_resume_can_be_disabled(metrics):
+    server = MockForgeServer([Recording.synthesize()], speed=None, disconnect_rate=1.0, event_ids=True, seed=3)
+    async with server:
+        events = await collect(server.url, resume=False)
+
+    assert events[-1] == ("error", None)
+    assert metrics.resumes.disconnects == 0
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(metrics):
+    created = {"id": "resp_gone", "object": "response", "created_at": 0, "model": "m", "output": []}
+
+    async def create(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await response.write(f"id: 1\nevent: response.created\ndata: {json.dumps(created)}\n\n".encode())
+        request.transport.close()
+        return response
+
+    async def unavailable(request: web.Request) -> web.Response:
+        return web.json_response({"error": "unavailable"}, status=503)
+
+    app = web.Application()
+    app.router.add_post("/v1/responses", create)
+    app.router.add_get("/v1/responses/{id}", unavailable)
+    with patch.object(stream_resume, "MAX_ATTEMPTS", 3):
+        async with TestServer(app) as server:
+            events = await collect(str(server.make_url("")).rstrip("/"))
+
+    assert events[-1] == ("error", None)
+    assert metrics.resumes.failed == 1
+    assert metrics.resumes.attempts == 3
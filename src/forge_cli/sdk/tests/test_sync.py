@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from forge_cli.sdk import sync
+from forge_cli.sdk.client import ForgeClient, resolve_client
+from forge_cli.sdk.sync import SyncRunner
+
+
+@pytest.fixture
+def runner():
+    runner = SyncRunner(default_timeout=5)
+    previous = sync._default_runner
+    sync.set_sync_runner(runner)
+    yield runner
+    sync.set_sync_runner(previous)
+    runner.close()
+
+
+def test_run_returns_result_from_background_thread(runner):
+    async def where():
+        await asyncio.sleep(0)
+        return threading.current_thread()
+
+    first = runner.run(where())
+    second = runner.run(where())
+
+    assert first is second  # one long-lived loop thread
+    assert first is not threading.current_thread()
+    assert runner.running
+
+
+def test_calls_share_the_runner_client(runner):
+    async def resolved():
+        return resolve_client(None)
+
+    assert runner.run(resolved()) is runner.client
+    # Outside the runner the default client is unaffected
+    assert resolve_client(None) is not runner.client
+
+
+def test_timeout_cancels_the_coroutine(runner):
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        runner.run(slow(), timeout=0.05)
+    assert cancelled.wait(1)
+
+
+def test_exceptions_propagate(runner):
+    async def boom():
+        raise ValueError("nope")
+
+    with pytest.raises(ValueError, match="nope"):
+        runner.run(boom())
+
+
+def test_run_from_loop_thread_is_rejected(runner):
+    async def nested():
+        return runner.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        runner.run(nested())
+
+
+def test_close_stops_thread_and_restarts_on_demand(runner):
+    runner.run(asyncio.sleep(0))
+    runner.close()
+    assert not runner.running
+    assert runner.client.closed
+
+    assert runner.run(asyncio.sleep(0, result="again")) == "again"
+    assert runner.running
+
+
+def test_list_vectorstore_files_collects_pages(runner):
+    pages = {
+        None: {"data": [{"id": "f1", "filename": "a.pdf"}, {"id": "f2", "filename": "b.pdf"}], "has_more": True},
+        "f2": {"data": [{"id": "f3", "filename": "c.pdf"}], "has_more": False},
+    }
+    clients = []
+
+    async def fake_request(method, url, params=None, client=None):
+        clients.append(resolve_client(client))
+        return 200, pages[params.get("after")]
+
+    with patch("forge_cli.sdk.vectorstore.async_make_request", side_effect=fake_request):
+        files = sync.list_vectorstore_files("vs_1", page_size=2)
+        limited = sync.list_vectorstore_files("vs_1", page_size=2, limit=1)
+
+    assert [file.id for file in files] == ["f1", "f2", "f3"]
+    assert [file.id for file in limited] == ["f1"]
+    assert all(client is runner.client for client in clients)
+
+
+def test_list_vectorstore_files_closes_the_listing_at_the_limit(runner):
+    closed = []
+    listings = []  # keep the generators alive so garbage collection cannot close them
+
+    async def listing(vector_store_id):
+        try:
+            for index in range(10):
+                yield SimpleNamespace(id=f"f{index}")
+        finally:
+            closed.append(vector_store_id)
+
+    def fake_listing(vector_store_id, page_size=100, client=None):
+        listings.append(listing(vector_store_id))
+        return listings[-1]
+
+    with patch("forge_cli.sdk.vectorstore.aiter_vectorstore_files", fake_listing):
+        files = sync.list_vectorstore_files("vs_1", limit=2)
+        assert closed == ["vs_1"]
+
+    assert [file.id for file in files] == ["f0", "f1"]
+
+
+def test_explicit_client_is_used(runner):
+    other = ForgeClient()
+
+    async def resolved():
+        return resolve_client(other)
+
+    assert runner.run(resolved()) is other
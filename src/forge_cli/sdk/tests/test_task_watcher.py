@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from forge_cli.sdk.task_watcher import TaskWatcher
+from forge_cli.sdk.types import TaskStatus
+
+
+def _status(task_id: str, status: str, progress: float | None = None) -> TaskStatus:
+    return TaskStatus.model_validate({"id": task_id, "status": status, "progress": progress})
+
+
+class FakeTasks:
+    """Serves a scripted sequence of statuses per task id."""
+
+    def __init__(self, scripts: dict[str, list[TaskStatus | Exception]]):
+        self.scripts = {task_id: list(script) for task_id, script in scripts.items()}
+        self.calls: list[str] = []
+
+    async def __call__(self, task_id: str, client=None) -> TaskStatus:
+        self.calls.append(task_id)
+        script = self.scripts[task_id]
+        item = script.pop(0) if len(script) > 1 else script[0]
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def _watcher(fetch: FakeTasks, **kwargs) -> TaskWatcher:
+    kwargs.setdefault("min_interval", 0.001)
+    kwargs.setdefault("max_interval", 0.01)
+    kwargs.setdefault("jitter", 0)
+    return TaskWatcher(fetch=fetch, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_watchers_share_polls():
+    fetch = FakeTasks(
+        {"t1": [_status("t1", "in_progress", 10), _status("t1", "in_progress", 60), _status("t1", "completed", 100)]}
+    )
+    watcher = _watcher(fetch)
+
+    seen_a, seen_b = [], []
+    results = await asyncio.gather(
+        watcher.wait("t1", on_progress=lambda s: seen_a.append(s.progress)),
+        watcher.wait("t1", on_progress=lambda s: seen_b.append(s.progress)),
+    )
+
+    assert [r.status for r in results] == ["completed", "completed"]
+    assert fetch.calls == ["t1", "t1", "t1"]
+    assert seen_a == seen_b == [10, 60, 100]
+    assert watcher.watched == []
+
+
+@pytest.mark.asyncio
+async def test_idle_task_backs_off_and_active_task_keeps_polling():
+    idle = [_status("idle", "pending")] * 8 + [_status("idle", "completed")]
+    busy = [_status("busy", "in_progress", p) for p in range(0, 100, 10)] + [_status("busy", "completed", 100)]
+    fetch = FakeTasks({"idle": idle, "busy": busy})
+    watcher = _watcher(fetch, min_interval=0.001, max_interval=0.05, backoff=2)
+
+    await asyncio.gather(watcher.wait("idle"), watcher.wait("busy"))
+
+    assert fetch.calls.count("idle") == 9
+    # The idle task's interval doubled after every unchanged poll, the busy one stayed at the floor
+    busy_done = len(fetch.calls) - fetch.calls[::-1].index("busy")
+    assert fetch.calls[:busy_done].count("idle") < fetch.calls.count("busy")
+
+
+@pytest.mark.asyncio
+async def test_consecutive_errors_fail_the_waiter():
+    fetch = FakeTasks({"t1": [ConnectionError("down")]})
+    watcher = _watcher(fetch, max_consecutive_errors=3)
+
+    with pytest.raises(ConnectionError):
+        await watcher.wait("t1")
+    assert len(fetch.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_stop_others():
+    fetch = FakeTasks({"t1": [_status("t1", "in_progress")] * 5 + [_status("t1", "completed")]})
+    watcher = _watcher(fetch)
+
+    first = watcher.watch("t1")
+    second = watcher.watch("t1")
+    first.cancel()
+
+    assert (await second).status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_wait_timeout_and_unwatched_task_is_dropped():
+    fetch = FakeTasks({"t1": [_status("t1", "in_progress")]})
+    watcher = _watcher(fetch, max_interval=0.001)
+
+    with pytest.raises(TimeoutError, match="t1"):
+        await watcher.wait("t1", timeout=0.05)
+
+    await asyncio.sleep(0.01)
+    assert watcher.watched == []
+    await watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_max_polls_timeout_is_not_rewritten():
+    fetch = FakeTasks({"t1": [_status("t1", "in_progress")]})
+    watcher = _watcher(fetch)
+
+    with pytest.raises(TimeoutError, match="within the allowed time"):
+        await watcher.wait("t1", max_polls=2)
+    assert len(fetch.calls) == 2
+
+
+def test_watcher_shared_between_event_loops():
+    fetch = FakeTasks({"t1": [_status("t1", "in_progress")] * 20 + [_status("t1", "completed")]})
+    watcher = _watcher(fetch)
+    loop_started = threading.Event()
+    results = []
+
+    def other_loop():
+        async def wait():
+            future = watcher.watch("t1")
+            loop_started.set()
+            results.append(await asyncio.wait_for(future, 5))
+
+        asyncio.run(wait())
+
+    thread = threading.Thread(target=other_loop)
+    thread.start()
+    assert loop_started.wait(5)
+    # Using the watcher from this loop must not orphan the waiter on the other one
+    assert asyncio.run(watcher.wait("t1", timeout=5)).status == "completed"
+    thread.join(5)
+    assert [status.status for status in results] == ["completed"]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import copy
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from forge_cli.response._types import Response
+from forge_cli.response._types._models import construct_unvalidated
+from forge_cli.sdk.client import ForgeClient
+from forge_cli.sdk.http_cache import HttpCache, set_http_cache
+from forge_cli.sdk.typed_api import astream_typed_response, build_snapshot, create_typed_request
+from forge_cli.testing.mock_server import DEFAULT_ANSWER, MockForgeServer, Recording
+
+
+def _payloads() -> list[tuple[str, dict]]:
+    return [(event.event, json.loads(event.data)) for event in Recording.synthesize().events if event.data]
+
+
+def test_unvalidated_construction_matches_validation():
+    for _, data in _payloads():
+        data["output"].append(
+            {
+                "id": "ws_1",
+                "type": "web_search_call",
+                "status": "completed",
+                "queries": ["revenue"],
+            }
+        )
+        data["tool_choice"] = {"type": "file_search"}
+        constructed = construct_unvalidated(value=copy.deepcopy(data), type_=Response)
+        assert constructed == Response(**data)
+        assert constructed.model_dump() == Response(**data).model_dump()
+
+
+def test_modes():
+    event_type, data = _payloads()[-1]
+    assert event_type == "response.completed"
+    invalid = {**data, "status": "exploded"}
+
+    with pytest.raises(ValidationError):
+        build_snapshot("response.output_text.delta", invalid, "all")
+    # Intermediate snapshots are not validated in "final" mode, nothing is in "none" mode
+    assert build_snapshot("response.output_text.delta", invalid, "final").status == "exploded"
+    assert build_snapshot("response.completed", invalid, "none").status == "exploded"
+
+    warnings = []
+    with patch("forge_cli.sdk.typed_api.logger.warning", side_effect=warnings.append):
+        assert build_snapshot("response.completed", data, "final") == Response(**data)
+        assert warnings == []
+
+        # A final snapshot that fails validation is reported and returned as built
+        assert build_snapshot("response.completed", invalid, "final").status == "exploded"
+        assert "failed validation" in warnings[0]
+
+        # Validation coerces the string temperature; the unvalidated build does not
+        coerced = {**data, "temperature": "0.5"}
+        assert build_snapshot("response.completed", coerced, "final").temperature == 0.5
+        assert "disagrees" in warnings[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("validate", ["all", "final", "none"])
+async def test_stream_modes_yield_the_same_snapshots(validate, tmp_path):
+    set_http_cache(HttpCache(directory=tmp_path, enabled=False))
+    try:
+        async with MockForgeServer(speed=None) as server, ForgeClient() as client:
+            with patch("forge_cli.sdk.typed_api.BASE_URL", server.url):
+                request = create_typed_request("How did revenue develop?")
+                events = [item async for item in astream_typed_response(request, client=client, validate=validate)]
+    finally:
+        set_http_cache(None)
+
+    assert all(snapshot is not None for event_type, snapshot in events if event_type != "done")
+    assert events[-2][1].output_text == DEFAULT_ANSWER
+
+
+@pytest.mark.asyncio
+async def test_validate_cannot_be_combined_with_delta():
+    request = create_typed_request("hi")
+    with pytest.raises(ValueError):
+        await astream_typed_response(request, delta=True, validate="final").__anext__()
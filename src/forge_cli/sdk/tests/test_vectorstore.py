@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
@@ -17,12 +18,14 @@ from forge_cli.sdk.types import (
 
 # Assuming Pydantic models and SDK functions are accessible via these imports
 from forge_cli.sdk.vectorstore import (
+    aiter_vectorstore_files,
     async_create_vectorstore,
     async_delete_vectorstore,
     async_get_vectorstore,
     async_get_vectorstore_summary,
     async_join_files_to_vectorstore,
     async_query_vectorstore,
+    async_query_vectorstores,
 )
 
 
@@ -98,7 +101,7 @@ async def test_async_get_vectorstore_success(mock_http_client):
     assert result.name == "ExistingVS"
 
     expected_url = f"{BASE_URL}/v1/vector_stores/{vs_id}"
-    mock_http_client.assert_called_once_with("GET", expected_url)
+    mock_http_client.assert_called_once_with("GET", expected_url, client=None)
 
 
 # --- Tests for async_query_vectorstore ---
@@ -153,7 +156,7 @@ async def test_async_delete_vectorstore_success_200(mock_http_client):
     assert result.object_field == "vector_store"
 
     expected_url = f"{BASE_URL}/v1/vector_stores/{vs_id_to_delete}"
-    mock_http_client.assert_called_once_with("DELETE", expected_url)
+    mock_http_client.assert_called_once_with("DELETE", expected_url, client=None)
 
 
 @pytest.mark.asyncio
@@ -169,7 +172,7 @@ async def test_async_delete_vectorstore_success_204(mock_http_client):
     assert result.object_field == "vector_store"
 
     expected_url = f"{BASE_URL}/v1/vector_stores/{vs_id_to_delete}"
-    mock_http_client.assert_called_once_with("DELETE", expected_url)
+    mock_http_client.assert_called_once_with("DELETE", expected_url, client=None)
 
 
 # --- Tests for async_join_files_to_vectorstore ---
@@ -221,3 +224,81 @@ async def test_async_get_vectorstore_summary_success(mock_http_client):
 
 # TODO: Add tests for error cases (API non-200, Pydantic validation failures, etc.)
 # and edge cases (e.g., empty query results).
+
+
+# --- Tests for async_query_vectorstores ---
+def _search_page(vs_id: str, hits: list[tuple[str, float, str]]) -> dict:
+    return {
+        "object": "vector_store.search_results.page",
+        "search_query": "q",
+        "data": [
+            {"file_id": file_id, "filename": f"{file_id}.pdf", "score": score, "content": [{"type": "text", "text": text}]}
+            for file_id, score, text in hits
+        ],
+        "has_more": False,
+        "request_id": f"req_{vs_id}",
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_query_vectorstores_merges_and_dedupes(mock_http_client):
+    pages = {
+        "vs_a": _search_page("vs_a", [("f1", 0.9, "alpha"), ("f2", 0.5, "beta")]),
+        "vs_b": _search_page("vs_b", [("f1", 0.9, "alpha"), ("f3", 0.8, "gamma"), ("f4", 0.1, "delta")]),
+        "vs_c": None,
+    }
+
+    async def fake_request(method, url, json_payload=None, client=None):
+        vs_id = url.split("/")[-2]
+        if pages[vs_id] is None:
+            raise Exception("boom")
+        return 200, pages[vs_id]
+
+    mock_http_client.side_effect = fake_request
+
+    result = await async_query_vectorstores(["vs_a", "vs_b", "vs_c", "vs_a"], "q", top_k=3, concurrency=2)
+
+    assert [(item.file_id, item.score) for item in result.data] == [("f1", 0.9), ("f3", 0.8), ("f2", 0.5)]
+    assert result.has_more is True
+    assert result.request_id == "req_vs_a,req_vs_b"
+    assert mock_http_client.call_count == 3
+
+
+# --- Tests for aiter_vectorstore_files ---
+@pytest.mark.asyncio
+async def test_aiter_vectorstore_files_follows_cursor(mock_http_client):
+    pages = {
+        None: {"data": [{"id": "f1", "filename": "a.pdf"}, {"id": "f2", "filename": "b.pdf"}], "has_more": True},
+        "f2": {"data": [{"file_id": "f3", "name": "c.pdf"}], "has_more": False},
+    }
+    requested = []
+
+    async def fake_request(method, url, params=None, client=None):
+        requested.append(params)
+        return 200, pages[params.get("after")]
+
+    mock_http_client.side_effect = fake_request
+
+    files = [file async for file in aiter_vectorstore_files("vs_1", page_size=2)]
+
+    assert [(file.id, file.filename) for file in files] == [("f1", "a.pdf"), ("f2", "b.pdf"), ("f3", "c.pdf")]
+    assert requested == [{"limit": 2}, {"limit": 2, "after": "f2"}]
+    assert mock_http_client.call_args.args == ("GET", f"{BASE_URL}/v1/vector_stores/vs_1/files")
+
+
+@pytest.mark.asyncio
+async def test_aiter_vectorstore_files_prefetches_and_stops_early(mock_http_client):
+    async def fake_request(method, url, params=None, client=None):
+        after = int(params.get("after", 0))
+        return 200, {"data": [{"id": str(after + 1)}], "has_more": True}
+
+    mock_http_client.side_effect = fake_request
+
+    iterator = aiter_vectorstore_files("vs_1", page_size=1)
+    first = await anext(iterator)
+    await asyncio.sleep(0)
+    # The second page was requested before the first one was consumed
+    assert first.id == "1"
+    assert mock_http_client.call_count == 2
+    await iterator.aclose()
+    assert mock_http_client.call_count == 2
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import json
+import contextlib
 from collections.abc import AsyncIterator
-from typing import Any
+from typing import Any, Literal
 
-import aiohttp
 from loguru import logger
 
 from forge_cli.response._types import (
@@ -14,14 +13,32 @@ from forge_cli.response._types import (
     Response,
     WebSearchTool,
 )
+from forge_cli.common import jsoncodec
+from forge_cli.response._types._models import construct_unvalidated
 
+from .client import ForgeClient, resolve_client
+from .compression import aiter_decoded, open_request, read_text
 from .config import BASE_URL
+from .delta_stream import ResponseDeltaAccumulator
+from .event_queue import ConflatingEventQueue, aiter_conflated
+from .limits import get_request_limiter
+from .metrics import get_metrics
+from .sse import ServerSentEvent, aiter_sse_events
+from .stream_resume import DISCONNECT_ERRORS, StreamPosition, aiter_resumed
+
+# How astream_typed_response validates snapshots: every one, only the final one, or none
+ValidationMode = Literal["all", "final", "none"]
+VALIDATION_MODES: tuple[str, ...] = ("all", "final", "none")
+
+# Events carrying the last snapshot of a response
+FINAL_EVENT_TYPES = frozenset({"response.completed", "response.failed", "response.incomplete"})
 
 
 async def async_create_typed_response(
     request: Request,
     stream: bool = False,
     debug: bool = False,
+    client: ForgeClient | None = None,
 ) -> Response:
     """
     Create a response using a typed Request object.
@@ -30,6 +47,7 @@ async def async_create_typed_response(
         request: A typed Request object with all configuration
         stream: Whether to return a streaming response
         debug: Enable debug logging
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
 
     Returns:
         A typed Response object
@@ -40,54 +58,41 @@ async def async_create_typed_response(
     payload = request.as_openai_chat_request()
 
     if debug:
-        logger.debug(f"Creating typed response with payload:\n{json.dumps(payload, indent=2, ensure_ascii=False)}")
+        logger.debug(f"Creating typed response with payload:\n{jsoncodec.dumps(payload, indent=2)}")
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Response creation failed with status {response.status}: {error_text}")
-
-                if stream:
-                    # For streaming, we need to collect the final response
-                    final_data = None
-                    async for line in response.content:
-                        line = line.decode("utf-8").strip()
-                        if line.startswith("event:") and line[6:].strip() == "response.completed":
-                            # The actual data for response.completed is in the data: line
-                            continue
-                        if line.startswith("data:"):
-                            data_str = line[5:].strip()
-                            if data_str.startswith("{"):
-                                try:
-                                    data = json.loads(data_str)
-                                    # Check if this is the data for response.completed
-                                    # Based on original sdk.py, the final response is associated with "response.completed" event type
-                                    # We need to find which line.startswith("event:") was before this data
-                                    # However, the current logic assumes the last JSON object on "data:" is the one.
-                                    # A more robust stream handling might be needed if multiple JSON data objects are sent
-                                    # before the "response.completed" event line.
-                                    # For now, let's assume the last data object before "done" or the one tied to "response.completed" event is it.
-                                    # Stream processing based on event types and response snapshots
-                                    # To simplify, we will assume the *last* JSON payload received on the stream before 'done' is the full response
-                                    # if `response.completed` event was seen.
-                                    # A better approach for robust streaming is to accumulate data based on event types.
-                                    final_data = data  # Keep track of the latest data payload
-                                except json.JSONDecodeError:
-                                    pass  # Ignore malformed JSON
-                        elif line.startswith("event:") and line[6:].strip() == "done":
-                            break  # Stream finished
-
-                    if final_data:  # Check if we received any data that could be the final response
-                        return Response(**final_data)
+        session = await resolve_client(client).get_session()
+        with get_metrics().measure("POST", url) as timer:
+            async with get_request_limiter().slot("POST", url) as outcome:
+                async with await open_request(
+                    session, "POST", url, json_payload=payload, stream=stream, timer=timer
+                ) as response:
+                    outcome.status = response.status
+                    if response.status != 200:
+                        error_text = await read_text(response) if stream else await response.text()
+                        raise Exception(f"Response creation failed with status {response.status}: {error_text}")
+
+                    if stream:
+                        # For streaming, the last JSON payload (the response.completed snapshot) is the
+                        # final response; only that one needs decoding
+                        final_payload = None
+                        async for event in aiter_sse_events(aiter_decoded(response, timer)):
+                            if event.event == "done":
+                                break  # Stream finished
+                            if event.event.endswith(".delta"):
+                                timer.first_token()
+                            if event.data.startswith("{"):
+                                final_payload = event.data
+
+                        if final_payload:  # Check if we received any data that could be the final response
+                            return Response(**jsoncodec.loads(final_payload))
+                        else:
+                            raise Exception("No final response data received from stream")
                     else:
-                        raise Exception("No final response data received from stream")
-                else:
-                    # Non-streaming response
-                    result = await response.json()
-                    return Response(**result)
-
+                        # Non-streaming response
+                        result = await response.json(loads=jsoncodec.loads)
+                        timer.bytes_received = response.content_length or len(await response.read())
+                        return Response(**result)
     except Exception as e:
         logger.error(f"Error creating typed response: {str(e)}")
         raise
@@ -96,6 +101,11 @@ async def async_create_typed_response(
 async def astream_typed_response(
     request: Request,
     debug: bool = False,
+    client: ForgeClient | None = None,
+    delta: bool = False,
+    validate: ValidationMode = "all",
+    conflate: bool = False,
+    resume: bool = True,
 ) -> AsyncIterator[tuple[str, Response | None]]:
     """
     Stream a response using a typed Request object, yielding typed events with Response snapshots.
@@ -103,12 +113,179 @@ async def astream_typed_response(
     Args:
         request: A typed Request object with all configuration
         debug: Enable debug logging
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
+        delta: Rebuild snapshots incrementally with a ResponseDeltaAccumulator instead of
+            validating every event payload. Only response.created and response.completed are
+            fully validated; the yielded Response is mutated in place between events.
+        validate: How snapshots are validated when delta is not set. "all" validates every
+            snapshot; "final" builds intermediate snapshots without validation and fully
+            validates only the final one (response.completed, .failed or .incomplete), logging a
+            warning if validation disagrees with the unvalidated build; "none" validates nothing.
+        conflate: Read the connection in a background task and collapse progress snapshots the
+            consumer has not picked up yet to the newest one (see event_queue), so a slow
+            consumer neither stalls the socket nor falls behind. Lifecycle events are kept.
+        resume: If the connection drops mid-answer, reconnect with Last-Event-ID or poll the
+            stored response (see stream_resume) instead of yielding ("error", None).
 
     Yields:
         Tuples of (event_type, response_snapshot) where response_snapshot is a Response object
         representing the complete state at that point in the stream (snapshot-based design per ADR-004).
         For events that don't contain full response data, response_snapshot will be None.
     """
+    if validate not in VALIDATION_MODES:
+        raise ValueError(f"validate must be one of {', '.join(VALIDATION_MODES)}, got {validate!r}")
+    if delta and validate != "all":
+        raise ValueError("validate applies to full snapshots and cannot be combined with delta")
+
+    accumulator = ResponseDeltaAccumulator() if delta else None
+    queue = ConflatingEventQueue() if conflate else None
+    events = aiter_response_events(request, debug=debug, client=client, queue=queue, resume=resume)
+    async with contextlib.aclosing(events):
+        async for event in events:
+            if event.event in ("done", "error"):
+                yield event.event, None
+                break
+            yield parse_stream_event(
+                event.event,
+                event.data,
+                validate=validate,
+                accumulator=accumulator,
+                snapshot_types=queue.snapshot_types if queue is not None else None,
+                debug=debug,
+            )
+
+
+async def aiter_response_events(
+    request: Request,
+    debug: bool = False,
+    client: ForgeClient | None = None,
+    queue: ConflatingEventQueue | None = None,
+    resume: bool = True,
+) -> AsyncIterator[ServerSentEvent]:
+    """
+    Create a streamed response and yield its raw SSE events, undecoded.
+
+    This is the network half of astream_typed_response; parse_stream_event is the other half.
+    The stream ends after a "done" event. If the connection drops before that, the stream is
+    resumed (see stream_resume) and its remaining events follow as if nothing happened.
+    Failures to create, read or resume the stream are logged and reported as a final
+    "error" event whose data is the error message.
+
+    Args:
+        request: A typed Request object with all configuration
+        debug: Enable debug logging
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
+        queue: Read the connection in a background task through this ConflatingEventQueue
+        resume: Resume a dropped stream instead of ending it with an error
+    """
+    payload = _stream_payload(request)
+    url = f"{BASE_URL}/v1/responses"
+    position = StreamPosition()
+
+    if debug:
+        logger.debug(f"Streaming typed response with payload:\n{jsoncodec.dumps(payload, indent=2)}")
+
+    try:
+        session = await resolve_client(client).get_session()
+        with get_metrics().measure("POST", url) as timer:
+            async with get_request_limiter().slot("POST", url) as outcome:
+                async with await open_request(
+                    session, "POST", url, json_payload=payload, stream=True, timer=timer
+                ) as response:
+                    outcome.status = response.status
+                    if response.status != 200:
+                        timer.failed = True
+                        error_text = await read_text(response)
+                        error_msg = f"Response creation failed with status {response.status}: {error_text}"
+                        logger.error(error_msg)
+                        yield ServerSentEvent("error", error_msg)
+                        return
+
+                    # Process the SSE stream
+                    events = aiter_sse_events(aiter_decoded(response, timer))
+                    if queue is not None:
+                        events = aiter_conflated(events, queue)
+                    try:
+                        async with contextlib.aclosing(events):
+                            async for event in events:
+                                if event.event.endswith(".delta"):
+                                    timer.first_token()
+                                position.observe(event)
+                                yield event
+                                if event.event == "done":
+                                    return
+                    except DISCONNECT_ERRORS as e:
+                        if not (resume and position.resumable):
+                            raise
+                        timer.failed = True
+                        logger.warning(f"Stream of {position.response_id} dropped ({e!r}), resuming")
+    except Exception as e:
+        error_msg = f"Error creating typed response stream: {str(e)}"
+        logger.error(error_msg)
+        yield ServerSentEvent("error", error_msg)
+        return
+
+    # The connection closed before "done"
+    if not resume:
+        return
+    if position.resumable:
+        async for event in aiter_resumed(position, client):
+            yield event
+    elif position.terminal:
+        yield ServerSentEvent("done", "[DONE]")
+
+
+def parse_stream_event(
+    event_type: str,
+    data_str: str,
+    *,
+    validate: ValidationMode = "all",
+    accumulator: ResponseDeltaAccumulator | None = None,
+    snapshot_types: set[str] | None = None,
+    debug: bool = False,
+) -> tuple[str, Response | None]:
+    """
+    Decode one SSE event into the (event_type, snapshot) pair astream_typed_response yields.
+
+    Args:
+        event_type: SSE event type
+        data_str: Raw event data
+        validate: "all", "final" or "none" (see astream_typed_response)
+        accumulator: Apply the payload to this delta accumulator instead of building a snapshot
+        snapshot_types: Event types seen carrying a full response snapshot are added here
+        debug: Log payloads that cannot be converted to a Response
+
+    Returns:
+        ("error", None) for malformed JSON, (event_type, None) for events without a snapshot
+    """
+    if not data_str.startswith(("{", "[")):
+        # Empty or non-JSON data: the event type without a snapshot
+        return event_type, None
+
+    try:
+        data = jsoncodec.loads(data_str)
+    except jsoncodec.JSONDecodeError:
+        logger.error(f"Failed to parse JSON data: {data_str}")
+        return "error", None
+
+    if not isinstance(data, dict):
+        return event_type, None
+    if snapshot_types is not None and data.get("object") == "response":
+        snapshot_types.add(event_type)
+
+    # Events carry full response snapshots according to ADR-004
+    try:
+        if accumulator is not None:
+            return event_type, accumulator.apply(event_type, data)
+        return event_type, build_snapshot(event_type, data, validate)
+    except Exception as e:
+        if debug:
+            logger.debug(f"Could not convert {event_type} data to a Response: {e}")
+        return event_type, None
+
+
+def _stream_payload(request: Request) -> dict[str, Any]:
+    """The POST /v1/responses body of a streamed request."""
     # Convert Request to API format
     request_dict = request.model_dump(exclude_none=True)
 
@@ -146,119 +323,39 @@ async def astream_typed_response(
                 # This case should ideally not happen if Request model is used correctly
                 tools.append(tool)
         payload["tools"] = tools
+    return payload
 
-    url = f"{BASE_URL}/v1/responses"
-    current_event_type = ""
 
-    if debug:
-        logger.debug(f"Streaming typed response with payload:\n{json.dumps(payload, indent=2, ensure_ascii=False)}")
+def build_snapshot(event_type: str, data: dict[str, Any], validate: ValidationMode = "all") -> Response:
+    """
+    Build the Response snapshot of one stream event.
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    error_msg = f"Response creation failed with status {response.status}: {error_text}"
-                    logger.error(error_msg)
-                    yield "error", None
-                    return
-
-                # Process the SSE stream
-                async for line in response.content:
-                    line = line.decode("utf-8").strip()
-
-                    if not line:
-                        continue
-
-                    # Process event type
-                    if line.startswith("event:"):
-                        current_event_type = line[6:].strip()
-
-                        # If this is the "done" event, we're finished
-                        if current_event_type == "done":
-                            yield "done", None
-                            break
-                        continue  # Wait for data line
-
-                    # Process data
-                    if line.startswith("data:"):
-                        data_str = line[5:].strip()
-                        if not data_str:  # Empty data line
-                            yield current_event_type, None  # Yield event type with no data
-                            continue
-
-                        # Parse JSON data
-                        if data_str.startswith("{") or data_str.startswith("["):
-                            try:
-                                data = json.loads(data_str)
-
-                                # Events that contain full response snapshots according to ADR-004
-                                # This list seems to be from the original sdk.py comments.
-                                SNAPSHOT_EVENT_TYPES = {
-                                    "response.created",
-                                    "response.in_progress",
-                                    "response.completed",
-                                    "response.output_text.delta",
-                                    "response.output_text.done",
-                                    "response.reasoning_summary_text.delta",
-                                    "response.reasoning_summary_text.done",
-                                    "response.file_search_call.completed",
-                                    "response.web_search_call.completed",
-                                    "response.function_call.completed",
-                                    "response.list_documents_call.completed",
-                                    "response.file_reader_call.completed",
-                                    "response.page_reader_call.completed",
-                                    "response.code_interpreter_call.completed",
-                                }
-
-                                response_obj = None
-                                if data and isinstance(data, dict):  # Ensure data is a dict before **data
-                                    try:
-                                        # Attempt to create a Response object from the data
-                                        # This assumes 'data' directly maps to Response fields
-                                        response_obj = Response(**data)
-                                    except Exception as e:
-                                        if debug:
-                                            logger.debug(
-                                                f"Could not convert event data to Response for event {current_event_type} with data {data_str}: {e}"
-                                            )
-                                        # If conversion fails, but it's a snapshot type, yield None for data part
-                                        if current_event_type in SNAPSHOT_EVENT_TYPES:
-                                            yield current_event_type, None
-                                        else:  # Not a snapshot type, yield event with raw data (or handle differently)
-                                            # For simplicity, we'll yield None here too if not a snapshot type and fails parsing
-                                            # Or, one could yield (current_event_type, data) if raw data is useful
-                                            yield current_event_type, None
-                                        continue  # Move to next line
-
-                                    yield current_event_type, response_obj
-
-                                    # If this is the completed event, also yield the final response object
-                                    if current_event_type == "response.completed":
-                                        # The problem description implies 'final_response' as a special event.
-                                        # ADR-004 suggests 'response.completed' carries the full final state.
-                                        # Let's ensure that the object yielded here is indeed the final complete one.
-                                        # The current logic yields (current_event_type, response_obj) for response.completed.
-                                        # No separate "final_response" event is yielded here per the loop structure.
-                                        # The original sdk.py had a specific `yield "final_response", response_obj`
-                                        # This might be redundant if ("response.completed", response_obj) is already the full final state.
-                                        # For now, adhering to the structure which yields ("response.completed", Response_object).
-                                        pass
-
-                                else:  # Data is not a dict or is None
-                                    yield current_event_type, None
-
-                            except json.JSONDecodeError:
-                                error_msg = f"Failed to parse JSON data: {data_str}"
-                                logger.error(error_msg)
-                                yield "error", None  # Yield an error event
-                        else:  # Data is not JSON
-                            yield current_event_type, None  # Yield event type with no parseable data
+    Args:
+        event_type: SSE event type
+        data: Decoded JSON payload of the event
+        validate: "all", "final" or "none" (see astream_typed_response)
+
+    Returns:
+        The snapshot; in "final" mode a final snapshot that fails validation is returned unvalidated
 
+    Raises:
+        pydantic.ValidationError: If validate is "all" and the payload is invalid
+    """
+    if validate == "all":
+        return Response(**data)
+
+    snapshot = construct_unvalidated(value=data, type_=Response)
+    if validate == "none" or event_type not in FINAL_EVENT_TYPES:
+        return snapshot
+
+    try:
+        validated = Response.model_validate(data)
     except Exception as e:
-        error_msg = f"Error creating typed response stream: {str(e)}"
-        logger.error(error_msg)
-        yield "error", None
+        logger.warning(f"Final snapshot of {data.get('id')} failed validation: {e}")
+        return snapshot
+    if validated != snapshot:
+        logger.warning(f"Final snapshot of {data.get('id')}: validation disagrees with the unvalidated build")
+    return validated
 
 
 def create_typed_request(
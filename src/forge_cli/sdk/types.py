@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from .common_types import DeleteResponse  # New import
-from .file_types import File
+from .file_types import File, UploadManifestEntry
 from .task_types import TaskStatus
 from .vectorstore_query_types import (
     ActualVectorStoreSearchResponse,
@@ -10,13 +10,15 @@ from .vectorstore_query_types import (
     VectorStoreQueryResponse,
     VectorStoreQueryResultItem,
 )
-from .vectorstore_types import Vectorstore, VectorStoreSummary
+from .vectorstore_types import Vectorstore, VectorStoreFile, VectorStoreSummary
 
 __all__ = [
     "DeleteResponse",  # Added
     "File",
     "TaskStatus",
+    "UploadManifestEntry",
     "Vectorstore",
+    "VectorStoreFile",
     "VectorStoreSummary",
     "VectorStoreQueryResponse",
     "VectorStoreQueryResultItem",
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+from collections.abc import AsyncIterator, Iterable
+
 from loguru import logger
 
+from .client import ForgeClient
 from .config import BASE_URL
+from .http_cache import bypass_cache, model_validate
 from .http_client import async_make_request
 
 # Import new types
 from .types import (
     ActualVectorStoreSearchResponse,
+    ActualVectorStoreSearchResultItem,
     DeleteResponse,
     Vectorstore,
+    VectorStoreFile,
     VectorStoreSummary,
 )  # Updated imports
 
@@ -20,6 +28,7 @@ async def async_create_vectorstore(
     file_ids: list[str] = None,
     custom_id: str = None,
     metadata: dict[str, str | int | float | bool | list | dict] = None,
+    client: ForgeClient | None = None,
 ) -> Vectorstore | None:  # Changed return type
     """
     Asynchronously create a new vector store.
@@ -39,7 +48,7 @@ async def async_create_vectorstore(
         payload["metadata"] = metadata
 
     try:
-        status_code, response_data = await async_make_request("POST", url, json_payload=payload)
+        status_code, response_data = await async_make_request("POST", url, json_payload=payload, client=client)
         if status_code == 200 and isinstance(response_data, dict):
             try:
                 return Vectorstore.model_validate(response_data)
@@ -69,6 +78,7 @@ async def async_query_vectorstore(
     query: str,
     top_k: int = 10,
     filters: dict[str, str | int | float | bool | list | dict] = None,
+    client: ForgeClient | None = None,
 ) -> ActualVectorStoreSearchResponse | None:  # Changed return type to match actual API response
     """
     Asynchronously query a vector store.
@@ -82,7 +92,7 @@ async def async_query_vectorstore(
         payload["filters"] = filters
 
     try:
-        status_code, response_data = await async_make_request("POST", url, json_payload=payload)
+        status_code, response_data = await async_make_request("POST", url, json_payload=payload, client=client)
         if status_code == 200 and isinstance(response_data, dict):
             try:
                 return ActualVectorStoreSearchResponse.model_validate(response_data)
@@ -107,20 +117,175 @@ async def async_query_vectorstore(
         return None
 
 
-async def async_get_vectorstore(vector_store_id: str) -> Vectorstore | None:  # Changed return type
+async def async_query_vectorstores(
+    vector_store_ids: Iterable[str],
+    query: str,
+    top_k: int = 10,
+    filters: dict[str, str | int | float | bool | list | dict] = None,
+    concurrency: int = 8,
+    client: ForgeClient | None = None,
+) -> ActualVectorStoreSearchResponse | None:
+    """
+    Asynchronously query several vector stores and merge their results into one global top-k.
+
+    Collections are queried concurrently, at most `concurrency` at a time, each for its
+    own top_k. Their result lists are sorted by score and merged with a k-way heap that
+    stops as soon as k unique results are collected. Results are deduplicated by file
+    and chunk, keeping the best scoring copy, since the same document is often joined
+    to more than one collection.
+
+    Args:
+        vector_store_ids: IDs of the vector stores to query (duplicates are ignored)
+        query: Search query text
+        top_k: Number of results to return in total
+        filters: Optional filters applied to every collection
+        concurrency: Maximum number of collection queries in flight
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
+
+    Returns:
+        ActualVectorStoreSearchResponse with the merged results, or None if every query failed
+    """
+    ids = list(dict.fromkeys(vector_store_ids))
+    if not ids:
+        return None
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def query_one(vector_store_id: str) -> ActualVectorStoreSearchResponse | None:
+        async with semaphore:
+            return await async_query_vectorstore(vector_store_id, query, top_k=top_k, filters=filters, client=client)
+
+    responses = await asyncio.gather(*(query_one(vector_store_id) for vector_store_id in ids))
+    succeeded = [response for response in responses if response is not None]
+    for vector_store_id, response in zip(ids, responses, strict=True):
+        if response is None:
+            logger.warning(f"Vector store query for {vector_store_id} failed, merging the remaining collections")
+    if not succeeded:
+        return None
+
+    # Servers return results best-first; sort defensively, it is a no-op in that case
+    ranked = [sorted(response.data, key=lambda item: -item.score) for response in succeeded]
+    merged: list[ActualVectorStoreSearchResultItem] = []
+    seen: set[tuple] = set()
+    has_more = any(response.has_more for response in succeeded)
+    for item in heapq.merge(*ranked, key=lambda item: -item.score):
+        key = _chunk_key(item)
+        if key in seen:
+            continue
+        if len(merged) == top_k:
+            has_more = True
+            break
+        seen.add(key)
+        merged.append(item)
+
+    return ActualVectorStoreSearchResponse(
+        object="vector_store.search_results.page",
+        search_query=query,
+        data=merged,
+        has_more=has_more,
+        next_page=None,
+        request_id=",".join(response.request_id for response in succeeded),
+    )
+
+
+def _chunk_key(item: ActualVectorStoreSearchResultItem) -> tuple:
+    """Identity of a search hit across collections: its file and chunk."""
+    attributes = item.attributes or {}
+    for name in ("chunk_id", "chunk_index", "chunk"):
+        if attributes.get(name) is not None:
+            return item.file_id, name, str(attributes[name])
+    return item.file_id, "text", tuple(content.text for content in item.content)
+
+
+async def aiter_vectorstore_files(
+    vector_store_id: str,
+    page_size: int = 100,
+    client: ForgeClient | None = None,
+) -> AsyncIterator[VectorStoreFile]:
+    """
+    Asynchronously iterate over all files of a vector store, page by page.
+
+    Follows the list cursor (``after=<last id>`` while ``has_more``, or an explicit
+    ``next_page`` token) until the listing is exhausted. While the caller consumes one
+    page, the next one is already being fetched, so a full listing costs about one
+    round trip per page plus the caller's own work. Breaking out of the loop stops
+    paging; wrap the iterator in contextlib.aclosing() to also cancel the prefetch
+    right away instead of when the generator is collected.
+
+    Args:
+        vector_store_id: ID of the vector store to list
+        page_size: Number of files requested per page
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
+
+    Yields:
+        VectorStoreFile for each file in the vector store
+
+    Raises:
+        Exception: If a page cannot be fetched or parsed
+    """
+    url = f"{BASE_URL}/v1/vector_stores/{vector_store_id}/files"
+
+    async def fetch_page(cursor: dict[str, str]) -> dict | None:
+        params = {"limit": page_size, **cursor}
+        status_code, response_data = await async_make_request("GET", url, params=params, client=client)
+        if status_code == 404:
+            return None
+        if status_code != 200 or not isinstance(response_data, dict):
+            raise Exception(f"Listing files of vector store {vector_store_id} failed: {response_data}")
+        return response_data
+
+    pending: asyncio.Task | None = asyncio.ensure_future(fetch_page({}))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            if page is None:
+                return
+
+            items = page.get("data")
+            if items is None:
+                items = page.get("files", [])
+            cursor = _next_cursor(page, items)
+            if cursor is not None:
+                # Prefetch the next page while this one is consumed
+                pending = asyncio.ensure_future(fetch_page(cursor))
+
+            for item in items:
+                yield VectorStoreFile.model_validate(item)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            if pending.done() and not pending.cancelled():
+                pending.exception()  # retrieved, so a failed prefetch is not reported as unhandled
+
+
+def _next_cursor(page: dict, items: list) -> dict[str, str] | None:
+    """Query parameters for the page after this one, or None on the last page."""
+    if page.get("next_page"):
+        return {"page": page["next_page"]}
+    if not page.get("has_more") or not items:
+        return None
+    last_id = page.get("last_id") or items[-1].get("id") or items[-1].get("file_id")
+    return {"after": last_id} if last_id else None
+
+
+async def async_get_vectorstore(
+    vector_store_id: str, client: ForgeClient | None = None, no_cache: bool = False
+) -> Vectorstore | None:  # Changed return type
     """
     Asynchronously get vector store information by its ID.
     ...
+    Set no_cache to bypass the HTTP cache and fetch fresh data.
     Returns:
         Vectorstore object containing vector store details or None if not found
     """
     url = f"{BASE_URL}/v1/vector_stores/{vector_store_id}"
 
     try:
-        status_code, response_data = await async_make_request("GET", url)
+        with bypass_cache(no_cache):
+            status_code, response_data = await async_make_request("GET", url, client=client)
         if status_code == 200 and isinstance(response_data, dict):
             try:
-                return Vectorstore.model_validate(response_data)
+                return model_validate(Vectorstore, response_data)
             except Exception as e:
                 logger.error(
                     f"Get vector store {vector_store_id} succeeded but failed to parse response: {e}. Data: {response_data}"
@@ -144,7 +309,9 @@ async def async_get_vectorstore(vector_store_id: str) -> Vectorstore | None:  #
         return None
 
 
-async def async_delete_vectorstore(vector_store_id: str) -> DeleteResponse | None:  # Changed return type
+async def async_delete_vectorstore(
+    vector_store_id: str, client: ForgeClient | None = None
+) -> DeleteResponse | None:  # Changed return type
     """
     Asynchronously delete a vector store by its ID.
     ...
@@ -154,7 +321,7 @@ async def async_delete_vectorstore(vector_store_id: str) -> DeleteResponse | Non
     url = f"{BASE_URL}/v1/vector_stores/{vector_store_id}"
 
     try:
-        status_code, response_data = await async_make_request("DELETE", url)
+        status_code, response_data = await async_make_request("DELETE", url, client=client)
         if status_code == 200 and isinstance(response_data, dict):
             try:
                 # Assuming API returns e.g. {"id": vs_id, "object": "vector_store", "deleted": True}
@@ -185,7 +352,9 @@ async def async_delete_vectorstore(vector_store_id: str) -> DeleteResponse | Non
 
 
 async def async_join_files_to_vectorstore(
-    vector_store_id: str, file_ids: list[str]
+    vector_store_id: str,
+    file_ids: list[str],
+    client: ForgeClient | None = None,
 ) -> Vectorstore | None:  # Changed return type
     """
     Asynchronously join files to an existing vector store.
@@ -197,7 +366,7 @@ async def async_join_files_to_vectorstore(
     payload = {"join_file_ids": file_ids}
 
     try:
-        status_code, response_data = await async_make_request("POST", url, json_payload=payload)
+        status_code, response_data = await async_make_request("POST", url, json_payload=payload, client=client)
         if status_code == 200 and isinstance(response_data, dict):
             try:
                 return Vectorstore.model_validate(response_data)  # API likely returns updated VS object
@@ -223,11 +392,16 @@ async def async_join_files_to_vectorstore(
 
 
 async def async_get_vectorstore_summary(
-    vector_store_id: str, model: str = "qwen-max", max_tokens: int = 1000
+    vector_store_id: str,
+    model: str = "qwen-max",
+    max_tokens: int = 1000,
+    client: ForgeClient | None = None,
+    no_cache: bool = False,
 ) -> VectorStoreSummary | None:  # Changed return type
     """
     Asynchronously get vector store summary.
     ...
+    Set no_cache to bypass the HTTP cache and fetch fresh data.
     Returns:
         VectorStoreSummary object containing summary information or None if failed
     """
@@ -235,10 +409,11 @@ async def async_get_vectorstore_summary(
     params = {"model": model, "max_tokens": max_tokens}
 
     try:
-        status_code, response_data = await async_make_request("GET", url, params=params)
+        with bypass_cache(no_cache):
+            status_code, response_data = await async_make_request("GET", url, params=params, client=client)
         if status_code == 200 and isinstance(response_data, dict):
             try:
-                return VectorStoreSummary.model_validate(response_data)
+                return model_validate(VectorStoreSummary, response_data)
             except Exception as e:
                 logger.error(
                     f"Get VS summary for {vector_store_id} succeeded but failed to parse response: {e}. Data: {response_data}"
@@ -270,6 +445,7 @@ async def async_modify_vectorstore(
     expires_after: int = None,
     join_file_ids: list[str] = None,
     left_file_ids: list[str] = None,
+    client: ForgeClient | None = None,
 ) -> Vectorstore | None:
     """
     Asynchronously modify an existing vector store.
@@ -282,6 +458,7 @@ async def async_modify_vectorstore(
         expires_after: Optional new expiration policy (seconds)
         join_file_ids: Optional list of file IDs to add to the vector store
         left_file_ids: Optional list of file IDs to remove from the vector store
+        client: Pooled ForgeClient to use (defaults to the process-wide client)
 
     Returns:
         Vectorstore object with updated information or None if modification failed
@@ -308,7 +485,7 @@ async def async_modify_vectorstore(
         return None
 
     try:
-        status_code, response_data = await async_make_request("POST", url, json_payload=payload)
+        status_code, response_data = await async_make_request("POST", url, json_payload=payload, client=client)
         if status_code == 200 and isinstance(response_data, dict):
             try:
                 return Vectorstore.model_validate(response_data)
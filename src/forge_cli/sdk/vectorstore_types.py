@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any  # Added Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class FileCounts(BaseModel):
@@ -44,6 +44,39 @@ class Vectorstore(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat() if v else None}
 
 
+class VectorStoreFile(BaseModel):
+    """
+    A file listed in a vector store (an item of GET /v1/vector_stores/{id}/files).
+    """
+
+    model_config = ConfigDict(extra="allow", populate_by_name=True)
+
+    id: str
+    filename: str | None = None
+    status: str | None = None
+    bytes: int | None = None
+    created_at: datetime | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_keys(cls, data: Any) -> Any:
+        """Accept the file_id / name spellings some servers use."""
+        if isinstance(data, dict):
+            if "id" not in data and "file_id" in data:
+                data = {**data, "id": data["file_id"]}
+            if "filename" not in data and "name" in data:
+                data = {**data, "filename": data["name"]}
+        return data
+
+    @field_validator("created_at", mode="before")
+    @classmethod
+    def parse_created_at(cls, v):
+        """Convert Unix timestamp to datetime if needed."""
+        if isinstance(v, int):
+            return datetime.fromtimestamp(v)
+        return v
+
+
 class VectorStoreSummary(BaseModel):  # Renamed from VectorStoreSummaryResponse for brevity, as it's the content itself
     """
     Represents the summary of a vector store.
@@ -1,7 +1,12 @@
 """Stream handling modules."""
 
 from .handler import TypedStreamHandler
+from .pipeline import StageQueue, StreamPipeline
+from .render_scheduler import RenderScheduler
 
 __all__ = [
     "TypedStreamHandler",
+    "RenderScheduler",
+    "StreamPipeline",
+    "StageQueue",
 ]
@@ -4,17 +4,26 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 
+from ..common import jsoncodec
 from ..display.v3.base import Display
 from ..response._types import Response
+from .render_scheduler import RenderScheduler
 
 
 class TypedStreamHandler:
     """Stream handler that works with typed Response streams only."""
 
-    def __init__(self, display: Display, debug: bool = False):
-        """Initialize with display and debug settings."""
+    def __init__(self, display: Display, debug: bool = False, throttle_ms: int = 0):
+        """Initialize with display and debug settings.
+
+        Args:
+            display: Display receiving Response snapshots
+            debug: Enable debug output
+            throttle_ms: Minimum milliseconds between renders; 0 renders every snapshot
+        """
         self.display = display
         self.debug = debug
+        self.scheduler = RenderScheduler(display, throttle_ms) if throttle_ms > 0 else None
         # Note: Registry system removed - processing now handled directly by v3 renderers
 
     async def handle_stream(
@@ -40,13 +49,11 @@ class TypedStreamHandler:
                     print(f"[DEBUG] {event_type}: Response snapshot (id: {event_data.id})")
 
                     # Show full response details in debug mode
-                    import json
-
                     try:
                         # Convert to dict and pretty print
                         response_dict = event_data.model_dump(exclude_none=True)
                         print("[DEBUG] Full Response Data:")
-                        print(json.dumps(response_dict, indent=2, ensure_ascii=False))
+                        print(jsoncodec.dumps(response_dict, indent=2))
                     except Exception as e:
                         print(f"[DEBUG] Error serializing response: {e}")
                         # Fallback to showing key fields
@@ -67,10 +74,15 @@ class TypedStreamHandler:
                 # Store the Response snapshot directly
                 final_response = event_data
                 # Render the complete Response snapshot using v3 display
-                self.display.handle_response(event_data)
+                if self.scheduler is not None:
+                    self.scheduler.submit(event_type, event_data)
+                else:
+                    self.display.handle_response(event_data)
 
             # Handle lifecycle events
             elif event_type == "done":
+                if self.scheduler is not None:
+                    self.scheduler.flush()
                 # Stream completed
                 # In chat mode, don't finalize the display as it will be reused
                 if getattr(self.display, "_mode", "default") != "chat":
@@ -78,6 +90,8 @@ class TypedStreamHandler:
                 break
 
             elif event_type == "error":
+                if self.scheduler is not None:
+                    self.scheduler.flush()
                 # Stream error
                 error_msg = "Stream error occurred"
                 if event_data:
@@ -94,6 +108,9 @@ class TypedStreamHandler:
             if self.debug and event_data is None:
                 print(f"  └─ Event {event_type} (no data)")
 
+        if self.scheduler is not None:
+            self.scheduler.close()
+
         return final_response
 
     # Note: Most processing logic has been moved to v3 renderers
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+"""
+Three-stage stream pipeline: socket reader, parser and renderer on their own threads.
+
+TypedStreamHandler consumes astream_typed_response on the event loop, so reading the
+socket, decoding JSON into Response snapshots and laying out the display take turns on
+one thread: while a frame renders, nothing reads the connection. StreamPipeline splits
+them into stages:
+
+- read: an asyncio task pulls raw SSE events off the connection (aiter_response_events)
+- parse: a worker thread runs json.loads and builds the snapshots (parse_stream_event)
+- render: a thread that owns the display, and with it the Console, for the whole stream
+
+Bounded StageQueues connect the stages. A full queue blocks the stage feeding it, except
+for progress events of a type known to carry full snapshots (ADR-004): those supersede
+one still waiting at the tail, so a slow stage gets the newest state instead of a
+backlog. Every other event is delivered in order. Because each snapshot is handed to
+another thread, snapshots are built independently per event (validate="final" by
+default) rather than with the in-place delta accumulator.
+
+Parsing and rendering are mostly Python and hold the GIL, so the stages overlap only
+where one waits on I/O; the point is that neither stops the socket from being read.
+Each stage records a StageStats in the process-wide ClientMetrics (/stats): depth of
+its input queue, how long items waited in it and how long the stage spent on each.
+For the read stage, "wait" is time spent waiting for the server and "busy" is time
+blocked on a full parse queue.
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any
+
+from loguru import logger
+
+from ..display.v3.base import Display
+from ..response._types import Response
+from ..sdk.event_queue import is_progress_event
+from ..sdk.metrics import ClientMetrics, StageStats, get_metrics
+from ..sdk.sse import ServerSentEvent
+from ..sdk.typed_api import VALIDATION_MODES, ValidationMode, parse_stream_event
+
+DEFAULT_QUEUE_SIZE = 64
+
+# Stage names as recorded in ClientMetrics.stages
+STAGES = ("read", "parse", "render")
+
+# Events ending a stream
+_END_EVENT_TYPES = frozenset({"done", "error"})
+
+
+class StageQueue:
+    """Bounded thread-safe FIFO between two stages that conflates superseded progress items."""
+
+    def __init__(self, maxsize: int, stats: StageStats):
+        """
+        Args:
+            maxsize: Items the queue holds before put() blocks
+            stats: Stats of the consuming stage; conflated items are counted here
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.stats = stats
+
+        self._items: deque[tuple[float, Any, bool]] = deque()
+        self._closed = False
+        self._changed = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, item: Any, conflatable: bool = False, block: bool = True) -> bool:
+        """Add an item, replacing a conflatable one at the tail if item is conflatable.
+
+        Returns:
+            True once added; False if the queue is closed, or full and block is false
+        """
+        with self._changed:
+            if conflatable and self._items and self._items[-1][2] and not self._closed:
+                # Keep the original enqueue time: the wait measures how stale the slot is
+                self._items[-1] = (self._items[-1][0], item, True)
+                self.stats.conflated += 1
+                return True
+            while len(self._items) >= self.maxsize and not self._closed:
+                if not block:
+                    return False
+                self._changed.wait()
+            if self._closed:
+                return False
+            self._items.append((time.perf_counter(), item, conflatable))
+            self._changed.notify_all()
+            return True
+
+    async def aput(self, item: Any, conflatable: bool = False) -> bool:
+        """put() from the event loop: waits for room on a worker thread instead of blocking the loop."""
+        if self.put(item, conflatable, block=False):
+            return True
+        if self._closed:
+            return False
+        return await asyncio.get_running_loop().run_in_executor(None, self.put, item, conflatable)
+
+    def get(self) -> tuple[Any, float, int] | None:
+        """Next item with the time it waited and the queue depth it was taken at.
+
+        Blocks until an item arrives; returns None once the queue is closed and drained.
+        """
+        with self._changed:
+            while not self._items and not self._closed:
+                self._changed.wait()
+            if not self._items:
+                return None
+            depth = len(self._items)
+            enqueued_at, item, _ = self._items.popleft()
+            self._changed.notify_all()
+        return item, time.perf_counter() - enqueued_at, depth
+
+    def close(self) -> None:
+        """Mark the end of input; get() returns None once the remaining items are consumed."""
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    def abort(self) -> None:
+        """Close the queue and drop the items still waiting, releasing blocked producers."""
+        with self._changed:
+            self._items.clear()
+            self._closed = True
+            self._changed.notify_all()
+
+
+class StreamPipeline:
+    """Read, parse and render one response stream on separate stages."""
+
+    def __init__(
+        self,
+        display: Display,
+        debug: bool = False,
+        throttle_ms: int = 0,
+        validate: ValidationMode = "final",
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        metrics: ClientMetrics | None = None,
+    ):
+        """
+        Args:
+            display: Display receiving Response snapshots; only the render thread touches it
+                until run() returns
+            debug: Log every event handled by the render stage
+            throttle_ms: Minimum milliseconds between renders of progress snapshots; snapshots
+                arriving meanwhile are conflated in the render queue
+            validate: Snapshot validation mode (see astream_typed_response)
+            queue_size: Capacity of each queue between two stages
+            metrics: Metrics receiving the stage stats (default: the process-wide metrics)
+        """
+        if validate not in VALIDATION_MODES:
+            raise ValueError(f"validate must be one of {', '.join(VALIDATION_MODES)}, got {validate!r}")
+        self.display = display
+        self.debug = debug
+        self.window = throttle_ms / 1000.0
+        self.validate = validate
+        self.queue_size = queue_size
+        self.metrics = metrics
+
+        # Event types the parser has seen carrying a full response snapshot
+        self.snapshot_types: set[str] = set()
+        self.final_response: Response | None = None
+
+        self._parse_queue: StageQueue | None = None
+        self._render_queue: StageQueue | None = None
+        self._error: BaseException | None = None
+
+    async def run(self, events: AsyncIterator[ServerSentEvent]) -> Response | None:
+        """
+        Drive a stream of raw SSE events (see aiter_response_events) through the stages.
+
+        Args:
+            events: SSE events as read from the connection; closed when the stream ends
+
+        Returns:
+            The last Response snapshot, or None if the stream carried none
+
+        Raises:
+            Exception: An error raised by the display
+        """
+        metrics = self.metrics or get_metrics()
+        self._parse_queue = StageQueue(self.queue_size, metrics.stage("parse"))
+        self._render_queue = StageQueue(self.queue_size, metrics.stage("render"))
+
+        loop = asyncio.get_running_loop()
+        finished = asyncio.Event()
+        workers = [
+            threading.Thread(target=self._parse, name="forge-stream-parse", daemon=True),
+            threading.Thread(target=self._render, args=(loop, finished), name="forge-stream-render", daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+        reader = asyncio.create_task(self._read(events, metrics.stage("read")))
+
+        try:
+            await finished.wait()
+        finally:
+            reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reader
+            self._parse_queue.abort()
+            self._render_queue.abort()
+            # Hand the display back only once the render thread is done with it
+            await asyncio.to_thread(_join, workers)
+
+        if self._error is not None:
+            raise self._error
+        return self.final_response
+
+    async def _read(self, events: AsyncIterator[ServerSentEvent], stats: StageStats) -> None:
+        queue = self._parse_queue
+        closing = contextlib.aclosing(events) if hasattr(events, "aclose") else contextlib.nullcontext()
+        try:
+            async with closing:
+                waiting_since = time.perf_counter()
+                async for event in events:
+                    received = time.perf_counter()
+                    conflatable = event.event in self.snapshot_types and is_progress_event(event.event)
+                    if not await queue.aput(event, conflatable):
+                        break
+                    handed_over = time.perf_counter()
+                    stats.record(received - waiting_since, handed_over - received, 0)
+                    waiting_since = handed_over
+                    if event.event in _END_EVENT_TYPES:
+                        break
+        except Exception as e:
+            logger.error(f"Error reading response stream: {e}")
+            await queue.aput(ServerSentEvent("error", str(e)))
+        finally:
+            queue.close()
+
+    def _parse(self) -> None:
+        source, sink = self._parse_queue, self._render_queue
+        try:
+            while (entry := source.get()) is not None:
+                event, wait, depth = entry
+                started = time.perf_counter()
+                if event.event in _END_EVENT_TYPES:
+                    event_type, payload = event.event, event.data or None
+                else:
+                    event_type, payload = parse_stream_event(
+                        event.event,
+                        event.data,
+                        validate=self.validate,
+                        snapshot_types=self.snapshot_types,
+                        debug=self.debug,
+                    )
+                source.stats.record(wait, time.perf_counter() - started, depth)
+
+                conflatable = isinstance(payload, Response) and is_progress_event(event_type)
+                if not sink.put((event_type, payload), conflatable) or event_type in _END_EVENT_TYPES:
+                    break
+        except Exception as e:
+            logger.error(f"Error parsing response stream: {e}")
+            sink.put(("error", f"Failed to parse response stream: {e}"))
+        finally:
+            sink.close()
+
+    def _render(self, loop: asyncio.AbstractEventLoop, finished: asyncio.Event) -> None:
+        queue = self._render_queue
+        try:
+            while (entry := queue.get()) is not None:
+                (event_type, payload), wait, depth = entry
+                started = time.perf_counter()
+                if self.debug:
+                    logger.debug(f"Render {event_type}" + (f" ({payload.id})" if isinstance(payload, Response) else ""))
+
+                if isinstance(payload, Response):
+                    self.final_response = payload
+                    self.display.handle_response(payload)
+                elif event_type == "done":
+                    # In chat mode, don't finalize the display as it will be reused
+                    if getattr(self.display, "_mode", "default") != "chat":
+                        self.display.complete()
+                elif event_type == "error":
+                    self.display.show_error(payload if isinstance(payload, str) else "Stream error occurred")
+                queue.stats.record(wait, time.perf_counter() - started, depth)
+
+                if event_type in _END_EVENT_TYPES:
+                    break
+                if self.window and is_progress_event(event_type):
+                    # Let snapshots arriving meanwhile conflate in the queue
+                    time.sleep(max(0.0, started + self.window - time.perf_counter()))
+        except Exception as e:
+            self._error = e
+        finally:
+            loop.call_soon_threadsafe(finished.set)
+
+
+def _join(threads: list[threading.Thread]) -> None:
+    for thread in threads:
+        thread.join()
+
+
+__all__ = [
+    "StageQueue",
+    "StreamPipeline",
+    "DEFAULT_QUEUE_SIZE",
+    "STAGES",
+]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+"""Frame-rate-limited render scheduler between the stream handler and the display."""
+
+import asyncio
+import time
+
+from ..display.v3.base import Display
+from ..response._types import Response
+
+# Upper bound for the adaptive frame window (seconds)
+MAX_FRAME_WINDOW = 1.0
+# Window is kept at least this multiple of the smoothed frame cost
+FRAME_COST_FACTOR = 2.0
+# Smoothing factor for the frame cost moving average
+FRAME_COST_ALPHA = 0.3
+
+# Events that always render immediately with the latest state
+FLUSH_EVENT_TYPES = frozenset({"response.completed", "response.failed", "response.incomplete", "error", "done"})
+
+
+class RenderScheduler:
+    """Coalesce Response snapshots and render at most once per throttle window.
+
+    Snapshots submitted inside a window replace each other, so the display always
+    receives the newest state. A trailing timer renders the pending snapshot when the
+    window closes, so the screen never lags behind a stalled stream. Completion,
+    error and tool-status transitions bypass the window.
+
+    When a single frame takes longer than the budget (slow terminals, SSH), the
+    window widens to a multiple of the measured frame cost and shrinks back once
+    frames are cheap again.
+    """
+
+    def __init__(self, display: Display, throttle_ms: int):
+        """
+        Args:
+            display: Display receiving the coalesced snapshots
+            throttle_ms: Minimum milliseconds between two renders
+        """
+        self.display = display
+        self.base_window = throttle_ms / 1000.0
+        self.window = self.base_window
+
+        self._pending: Response | None = None
+        self._last_render_at = 0.0
+        self._last_tool_states: tuple = ()
+        self._frame_cost = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+
+        self.rendered = 0
+        self.coalesced = 0
+
+    def submit(self, event_type: str, response: Response) -> None:
+        """Queue a snapshot, rendering it now if the window allows or the event demands it."""
+        if self._pending is not None:
+            self.coalesced += 1
+        self._pending = response
+
+        tool_states = _tool_states(response)
+        if tool_states != self._last_tool_states or event_type in FLUSH_EVENT_TYPES:
+            self.flush()
+            return
+
+        delay = self._last_render_at + self.window - time.perf_counter()
+        if delay <= 0:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(delay, self.flush)
+
+    def flush(self) -> None:
+        """Render the pending snapshot, if any, immediately."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        response, self._pending = self._pending, None
+        if response is None or self.display.is_finalized:
+            return
+
+        started = time.perf_counter()
+        self.display.handle_response(response)
+        finished = time.perf_counter()
+
+        self._last_render_at = finished
+        self._last_tool_states = _tool_states(response)
+        self.rendered += 1
+        self._adapt(finished - started)
+
+    def close(self) -> None:
+        """Flush remaining state and cancel the trailing timer."""
+        self.flush()
+
+    def _adapt(self, frame_cost: float) -> None:
+        """Widen or relax the frame window based on the smoothed render cost."""
+        if self._frame_cost == 0.0:
+            self._frame_cost = frame_cost
+        else:
+            self._frame_cost += FRAME_COST_ALPHA * (frame_cost - self._frame_cost)
+        self.window = min(MAX_FRAME_WINDOW, max(self.base_window, self._frame_cost * FRAME_COST_FACTOR))
+
+    @property
+    def stats(self) -> dict[str, float | int]:
+        """Render/coalesce counters and the current adaptive window."""
+        return {
+            "rendered": self.rendered,
+            "coalesced": self.coalesced,
+            "window_ms": round(self.window * 1000, 1),
+            "frame_cost_ms": round(self._frame_cost * 1000, 2),
+        }
+
+
+def _tool_states(response: Response) -> tuple:
+    """Statuses of all tool call items, used to detect tool-status transitions."""
+    return tuple(
+        (getattr(item, "id", None), item.status)
+        for item in response.output
+        if item.type not in ("message", "reasoning") and hasattr(item, "status")
+    )
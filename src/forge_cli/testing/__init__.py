@@ -0,0 +1,9 @@
+"""Offline testing and benchmarking helpers."""
+
+from .mock_server import MockForgeServer, RecordedEvent, Recording
+
+__all__ = [
+    "MockForgeServer",
+    "RecordedEvent",
+    "Recording",
+]
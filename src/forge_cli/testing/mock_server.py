@@ -0,0 +1,731 @@
+from __future__ import annotations
+
+"""
+Local mock Knowledge Forge server for offline benchmarking and tests.
+
+An aiohttp application implementing the endpoints the SDK uses:
+
+- ``POST /v1/responses`` replays recorded SSE streams; ``GET /v1/responses/{id}``
+  returns the final snapshot of a replayed response, or with ``?stream=true``
+  replays its stream again
+- ``POST /v1/files`` (multipart), ``GET /v1/files/{id}/content``,
+  ``POST /v1/files/{id}/content``, ``DELETE /v1/files/{id}`` and
+  ``GET /v1/files/{id}/pages``
+- ``GET /v1/tasks/{id}``: upload processing tasks complete after ``task_duration``
+- ``/v1/vector_stores`` create, get, modify, delete, ``/summary``, paginated
+  ``/files`` and ``/search`` (term-overlap scoring over document segments)
+
+Recordings are either timed JSONL files, one ``{"t", "event", "data", "id"}``
+object per event (``t`` is seconds since the stream started; see ``record`` below),
+or raw SSE streams as saved with ``curl -N``, whose events are spaced
+``interval`` apart. They are replayed at recorded pace (``speed=1``), at Nx speed
+(``speed=N``) or as fast as possible (``speed=None``). Without recordings a
+synthesized file-search answer is streamed.
+
+Faults are injected per request: a fixed ``latency`` plus random ``jitter`` before
+the handler runs, ``error_rate`` answers with ``error_status``, and
+``disconnect_rate`` streams cut off after a random number of events. A stream
+requested with ``Last-Event-ID`` (from either endpoint) resumes after that event
+when the server sends event ids (``event_ids=True`` numbers events of recordings
+that have none).
+
+Usage::
+
+    python -m forge_cli.testing.mock_server serve --port 9999 --recording stream.jsonl --speed 4
+    KNOWLEDGE_FORGE_URL=http://127.0.0.1:9999 forge-cli ...
+
+    # Record a stream from a real server, with its timing
+    python -m forge_cli.testing.mock_server record --request request.json --output stream.jsonl
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from loguru import logger
+
+from forge_cli.sdk.sse import SSEParser
+
+DEFAULT_ANSWER = (
+    "Knowledge Forge streams complete response snapshots, so every event carries the whole answer so far. "
+    "Revenue grew 12% year over year, driven by subscriptions [1], while costs stayed flat [2]. "
+)
+
+
+@dataclass(slots=True)
+class RecordedEvent:
+    """One SSE event of a recording."""
+
+    offset: float  # seconds since the stream started
+    event: str
+    data: str
+    id: str | None = None
+
+    def encode(self, event_id: str | None = None) -> bytes:
+        lines = []
+        if event_id is not None:
+            lines.append(f"id: {event_id}")
+        lines.append(f"event: {self.event}")
+        lines.extend(f"data: {line}" for line in self.data.split("\n"))
+        return ("\n".join(lines) + "\n\n").encode()
+
+
+class Recording:
+    """A recorded SSE stream of one response."""
+
+    def __init__(self, events: Sequence[RecordedEvent]):
+        self.events = list(events)
+
+    @property
+    def duration(self) -> float:
+        return self.events[-1].offset - self.events[0].offset if self.events else 0.0
+
+    @property
+    def final_snapshot(self) -> dict[str, Any] | None:
+        """The last response snapshot of the stream."""
+        for event in reversed(self.events):
+            if event.data.startswith("{"):
+                snapshot = json.loads(event.data)
+                if isinstance(snapshot, dict) and snapshot.get("object") == "response":
+                    return snapshot
+        return None
+
+    @classmethod
+    def load(cls, path: str | Path, interval: float = 0.02) -> Recording:
+        """Load a timed ``.jsonl`` recording, or a raw SSE stream with events ``interval`` seconds apart."""
+        path = Path(path)
+        if path.suffix == ".jsonl":
+            events = []
+            with path.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        item = json.loads(line)
+                        events.append(RecordedEvent(item["t"], item["event"], item.get("data", ""), item.get("id")))
+            return cls(events)
+        return cls.from_sse(path.read_bytes(), interval)
+
+    @classmethod
+    def from_sse(cls, payload: bytes, interval: float = 0.02) -> Recording:
+        parser = SSEParser()
+        sse_events = parser.feed(payload) + parser.flush()
+        return cls(
+            [
+                RecordedEvent(index * interval, event.event, event.data, event.id or None)
+                for index, event in enumerate(sse_events)
+            ]
+        )
+
+    @classmethod
+    def synthesize(
+        cls,
+        answer: str = DEFAULT_ANSWER,
+        chars_per_event: int = 24,
+        interval: float = 0.02,
+        response_id: str = "resp_mock",
+    ) -> Recording:
+        """A file-search answer streamed as growing snapshots, one event every ``interval`` seconds."""
+
+        def snapshot(status: str, tool_status: str | None = None, text: str | None = None) -> str:
+            output: list[dict[str, Any]] = []
+            if tool_status is not None:
+                output.append(
+                    {"id": "fs_1", "type": "file_search_call", "queries": ["revenue growth"], "status": tool_status}
+                )
+            if text is not None:
+                annotations = [
+                    {"type": "file_citation", "file_id": f"file_{index}", "index": index, "filename": f"doc{index}.pdf"}
+                    for index in (1, 2)
+                    if f"[{index}]" in text
+                ]
+                output.append(
+                    {
+                        "id": "msg_1",
+                        "type": "message",
+                        "role": "assistant",
+                        "status": "completed" if status == "completed" else "in_progress",
+                        "content": [{"type": "output_text", "text": text, "annotations": annotations}],
+                    }
+                )
+            return json.dumps(
+                {
+                    "id": response_id,
+                    "object": "response",
+                    "created_at": 1700000000.0,
+                    "model": "qwen-max-latest",
+                    "parallel_tool_calls": False,
+                    "tool_choice": "auto",
+                    "tools": [],
+                    "status": status,
+                    "output": output,
+                },
+                ensure_ascii=False,
+            )
+
+        steps = [
+            ("response.created", snapshot("in_progress")),
+            ("response.file_search_call.in_progress", snapshot("in_progress", "in_progress")),
+            ("response.file_search_call.searching", snapshot("in_progress", "searching")),
+            ("response.file_search_call.completed", snapshot("in_progress", "completed")),
+        ]
+        for end in range(chars_per_event, len(answer) + chars_per_event, chars_per_event):
+            steps.append(("response.output_text.delta", snapshot("in_progress", "completed", answer[:end])))
+        steps.append(("response.output_text.done", snapshot("in_progress", "completed", answer)))
+        steps.append(("response.completed", snapshot("completed", "completed", answer)))
+        steps.append(("done", ""))
+        return cls([RecordedEvent(index * interval, event, data) for index, (event, data) in enumerate(steps)])
+
+    def dump(self, path: str | Path) -> None:
+        """Write the recording as timed JSONL."""
+        with Path(path).open("w", encoding="utf-8") as f:
+            for event in self.events:
+                item = {"t": round(event.offset, 6), "event": event.event, "data": event.data}
+                if event.id is not None:
+                    item["id"] = event.id
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+class MockForgeServer:
+    """In-memory Knowledge Forge server replaying recorded streams, with fault injection."""
+
+    def __init__(
+        self,
+        recordings: Sequence[Recording] | None = None,
+        documents: Iterable[dict[str, Any]] = (),
+        speed: float | None = 1.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        disconnect_rate: float = 0.0,
+        event_ids: bool = False,
+        task_duration: float = 0.5,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            recordings: Streams replayed round-robin by POST /v1/responses (default: a synthesized one)
+            documents: Documents (as returned by /v1/files/{id}/content) the server starts with
+            speed: Replay speed relative to the recording; None replays as fast as possible
+            latency: Seconds added before every request is handled
+            jitter: Up to this many random seconds added on top of latency
+            error_rate: Fraction of requests answered with error_status instead
+            error_status: HTTP status of injected errors
+            disconnect_rate: Fraction of streams whose connection is dropped mid-stream
+            event_ids: Number the events of recordings without SSE ids, enabling Last-Event-ID resume
+            task_duration: Seconds until an upload processing task completes
+            seed: Seed of the fault injection random generator
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive, or None for as fast as possible")
+        self.recordings = list(recordings or [Recording.synthesize()])
+        self.speed = speed
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.disconnect_rate = disconnect_rate
+        self.event_ids = event_ids
+        self.task_duration = task_duration
+        self.hits: Counter[str] = Counter()  # requests per route, e.g. "POST /v1/responses"
+
+        self._random = random.Random(seed)
+        self._next_recording = itertools.cycle(self.recordings)
+        self._responses: dict[str, dict[str, Any]] = {}
+        self._recordings_by_response: dict[str, Recording] = {}
+        self._documents: dict[str, dict[str, Any]] = {}
+        self._files: dict[str, dict[str, Any]] = {}
+        self._tasks: dict[str, dict[str, Any]] = {}
+        self._vector_stores: dict[str, dict[str, Any]] = {}
+        for document in documents:
+            self.add_document(document)
+
+        self.app = self._create_app()
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    def add_document(self, document: dict[str, Any], filename: str | None = None, size: int = 0) -> dict[str, Any]:
+        """Register a processed document and its file record."""
+        document = {"created_at": _now(), "updated_at": _now(), "vector_store_ids": [], **document}
+        document_id = document["id"]
+        self._documents[document_id] = document
+        self._files[document_id] = {
+            "id": document_id,
+            "object": "file",
+            "filename": filename or document.get("title") or document_id,
+            "bytes": size,
+            "purpose": "general",
+            "status": "completed",
+            "created_at": document["created_at"],
+            "md5": document.get("md5sum"),
+        }
+        for vector_store_id in document["vector_store_ids"]:
+            store = self._vector_stores.get(vector_store_id)
+            if store is not None and document_id not in store["file_ids"]:
+                store["file_ids"].append(document_id)
+        return document
+
+    # Serving
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve on host:port (0 picks a free port) and return the base URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        logger.info(f"Mock Knowledge Forge server listening on {self.url}")
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> MockForgeServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def _create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._inject_faults], client_max_size=1024**3)
+        app.router.add_post("/v1/responses", self._create_response)
+        app.router.add_get("/v1/responses/{id}", self._get_response)
+        app.router.add_post("/v1/files", self._upload_file)
+        app.router.add_delete("/v1/files/{id}", self._delete_file)
+        app.router.add_get("/v1/files/{id}/content", self._get_content)
+        app.router.add_post("/v1/files/{id}/content", self._update_content)
+        app.router.add_get("/v1/files/{id}/pages", self._get_pages)
+        app.router.add_get("/v1/tasks/{id}", self._get_task)
+        app.router.add_post("/v1/vector_stores", self._create_vector_store)
+        app.router.add_get("/v1/vector_stores/{id}", self._get_vector_store)
+        app.router.add_post("/v1/vector_stores/{id}", self._modify_vector_store)
+        app.router.add_delete("/v1/vector_stores/{id}", self._delete_vector_store)
+        app.router.add_get("/v1/vector_stores/{id}/summary", self._get_summary)
+        app.router.add_get("/v1/vector_stores/{id}/files", self._list_vector_store_files)
+        app.router.add_post("/v1/vector_stores/{id}/search", self._search)
+        return app
+
+    @web.middleware
+    async def _inject_faults(self, request: web.Request, handler) -> web.StreamResponse:
+        resource = request.match_info.route.resource
+        self.hits[f"{request.method} {resource.canonical if resource else request.path}"] += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return _error(self.error_status, "Injected error")
+        return await handler(request)
+
+    # Responses
+
+    async def _create_response(self, request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        recording = next(self._next_recording)
+        final = recording.final_snapshot
+        if final is not None:
+            # The response counts as generated in full once its stream starts
+            self._responses[final["id"]] = final
+            self._recordings_by_response[final["id"]] = recording
+        if payload.get("stream") is False:
+            if final is None:
+                return _error(500, "Recording has no response snapshot")
+            return web.json_response(final)
+
+        return await self._stream(request, recording)
+
+    async def _stream(self, request: web.Request, recording: Recording) -> web.StreamResponse:
+        """Replay a recording as SSE, resuming after Last-Event-ID if the request has one."""
+        events = list(enumerate(recording.events, 1))
+        last_event_id = request.headers.get("Last-Event-ID")
+        if last_event_id is not None:
+            for position, (number, event) in enumerate(events):
+                if self._event_id(event, number) == last_event_id:
+                    events = events[position + 1 :]
+                    break
+
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+        await response.prepare(request)
+
+        cut_after = None
+        if self.disconnect_rate and len(events) > 1 and self._random.random() < self.disconnect_rate:
+            cut_after = self._random.randrange(1, len(events))
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        base = events[0][1].offset if events else 0.0
+        for sent, (number, event) in enumerate(events):
+            if self.speed is not None:
+                delay = started + (event.offset - base) / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await response.write(event.encode(self._event_id(event, number)))
+            if cut_after is not None and sent + 1 >= cut_after:
+                logger.debug(f"Mock server dropping stream after {sent + 1} events")
+                request.transport.close()
+                return response
+        await response.write_eof()
+        return response
+
+    def _event_id(self, event: RecordedEvent, number: int) -> str | None:
+        if event.id is not None:
+            return event.id
+        return str(number) if self.event_ids else None
+
+    async def _get_response(self, request: web.Request) -> web.StreamResponse:
+        snapshot = self._responses.get(request.match_info["id"])
+        if snapshot is None:
+            return _error(404, "Response not found")
+        if request.query.get("stream") == "true":
+            return await self._stream(request, self._recordings_by_response[request.match_info["id"]])
+        return web.json_response(snapshot)
+
+    # Files and tasks
+
+    async def _upload_file(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        upload = form.get("file")
+        file_id = form.get("id") or _new_id()
+        if form.get("skip_exists") == "true" and file_id in self._files:
+            return web.json_response(self._files[file_id])
+
+        if upload is not None:
+            content = upload.file.read()
+            filename = upload.filename
+        else:
+            content = b""
+            filename = form.get("name") or form.get("url") or file_id
+        text = content.decode("utf-8", errors="replace")
+        self.add_document(
+            {
+                "id": file_id,
+                "md5sum": form.get("md5") or "",
+                "mime_type": getattr(upload, "content_type", None) or "application/octet-stream",
+                "title": filename,
+                "content": {"id": file_id, "page_count": 1, "segments": [_segment(file_id, 0, text)]},
+            },
+            filename=filename,
+            size=len(content),
+        )
+
+        task_id = _new_id()
+        self._tasks[task_id] = {"id": task_id, "resource_id": file_id, "started": time.monotonic()}
+        record = self._files[file_id]
+        record.update(status="processing", purpose=form.get("purpose") or "general", task_id=task_id)
+        return web.json_response(record)
+
+    async def _get_task(self, request: web.Request) -> web.Response:
+        task = self._tasks.get(request.match_info["id"])
+        if task is None:
+            return _error(404, "Task not found")
+        progress = min(1.0, (time.monotonic() - task["started"]) / self.task_duration) if self.task_duration else 1.0
+        status = "completed" if progress >= 1.0 else "in_progress"
+        if status == "completed" and task["resource_id"] in self._files:
+            self._files[task["resource_id"]]["status"] = "completed"
+        return web.json_response(
+            {
+                "id": task["id"],
+                "object": "task",
+                "type": "file_processing",
+                "status": status,
+                "progress": round(progress * 100, 1),
+                "resource_id": task["resource_id"],
+                "result": {"file_id": task["resource_id"]} if status == "completed" else None,
+            }
+        )
+
+    async def _get_content(self, request: web.Request) -> web.Response:
+        file_id = request.match_info["id"]
+        document = self._documents.get(file_id)
+        if document is None:
+            return _error(404, "File not found")
+        # The content endpoint serves both File and DocumentResponse readers
+        return web.json_response({**self._files[file_id], **document})
+
+    async def _update_content(self, request: web.Request) -> web.Response:
+        file_id = request.match_info["id"]
+        document = self._documents.get(file_id)
+        if document is None:
+            return _error(404, "File not found")
+        document.update(await request.json(), updated_at=_now())
+        return web.json_response({"id": file_id, "updated": True})
+
+    async def _delete_file(self, request: web.Request) -> web.Response:
+        file_id = request.match_info["id"]
+        if self._files.pop(file_id, None) is None:
+            return _error(404, "File not found")
+        self._documents.pop(file_id, None)
+        for store in self._vector_stores.values():
+            if file_id in store["file_ids"]:
+                store["file_ids"].remove(file_id)
+        return web.json_response({"id": file_id, "object": "file", "deleted": True})
+
+    async def _get_pages(self, request: web.Request) -> web.Response:
+        document = self._documents.get(request.match_info["id"])
+        if document is None:
+            return _error(404, "File not found")
+        segments = (document.get("content") or {}).get("segments") or []
+        start = int(request.query.get("start_page", 1))
+        end = int(request.query.get("end_page", len(segments)))
+        pages = [
+            {"page_number": number, "content": segment.get("content", "")}
+            for number, segment in enumerate(segments, 1)
+            if start <= number <= end
+        ]
+        return web.json_response(
+            {"object": "list", "document_id": document["id"], "total_pages": len(segments), "pages": pages}
+        )
+
+    # Vector stores
+
+    async def _create_vector_store(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        store = {
+            "id": payload.get("id") or _new_id(),
+            "object": "vector_store",
+            "name": payload["name"],
+            "description": payload.get("description"),
+            "metadata": payload.get("metadata"),
+            "file_ids": [],
+            "created_at": _now(),
+        }
+        self._vector_stores[store["id"]] = store
+        self._join(store, payload.get("file_ids") or [])
+        return web.json_response(self._vector_store_view(store))
+
+    async def _get_vector_store(self, request: web.Request) -> web.Response:
+        store = self._vector_stores.get(request.match_info["id"])
+        if store is None:
+            return _error(404, "Vector store not found")
+        return web.json_response(self._vector_store_view(store))
+
+    async def _modify_vector_store(self, request: web.Request) -> web.Response:
+        store = self._vector_stores.get(request.match_info["id"])
+        if store is None:
+            return _error(404, "Vector store not found")
+        payload = await request.json()
+        for field in ("name", "description", "metadata"):
+            if field in payload:
+                store[field] = payload[field]
+        self._join(store, payload.get("join_file_ids") or [])
+        for file_id in payload.get("left_file_ids") or []:
+            if file_id in store["file_ids"]:
+                store["file_ids"].remove(file_id)
+        return web.json_response(self._vector_store_view(store))
+
+    async def _delete_vector_store(self, request: web.Request) -> web.Response:
+        vector_store_id = request.match_info["id"]
+        if self._vector_stores.pop(vector_store_id, None) is None:
+            return _error(404, "Vector store not found")
+        return web.json_response({"id": vector_store_id, "object": "vector_store.deleted", "deleted": True})
+
+    async def _get_summary(self, request: web.Request) -> web.Response:
+        store = self._vector_stores.get(request.match_info["id"])
+        if store is None:
+            return _error(404, "Vector store not found")
+        abstracts = [
+            (self._documents[file_id].get("content") or {}).get("abstract") or self._files[file_id]["filename"]
+            for file_id in store["file_ids"]
+        ]
+        return web.json_response(
+            {
+                "vector_store_id": store["id"],
+                "summary_text": "\n".join(abstracts) or "Empty collection.",
+                "model_used": "mock",
+                "created_at": _now(),
+            }
+        )
+
+    async def _list_vector_store_files(self, request: web.Request) -> web.Response:
+        store = self._vector_stores.get(request.match_info["id"])
+        if store is None:
+            return _error(404, "Vector store not found")
+        file_ids = store["file_ids"]
+        limit = int(request.query.get("limit", 20))
+        start = file_ids.index(request.query["after"]) + 1 if request.query.get("after") in file_ids else 0
+        page = file_ids[start : start + limit]
+        return web.json_response(
+            {
+                "object": "list",
+                "data": [{**self._files[file_id], "vector_store_id": store["id"]} for file_id in page],
+                "has_more": start + limit < len(file_ids),
+                "last_id": page[-1] if page else None,
+            }
+        )
+
+    async def _search(self, request: web.Request) -> web.Response:
+        store = self._vector_stores.get(request.match_info["id"])
+        if store is None:
+            return _error(404, "Vector store not found")
+        payload = await request.json()
+        query = payload.get("query", "")
+        terms = query.lower().split()
+        results = []
+        for file_id in store["file_ids"]:
+            segments = (self._documents[file_id].get("content") or {}).get("segments") or []
+            for segment in segments:
+                text = segment.get("content", "")
+                lowered = text.lower()
+                score = sum(term in lowered for term in terms) / len(terms) if terms else 0.0
+                if score > 0:
+                    results.append(
+                        {
+                            "file_id": file_id,
+                            "filename": self._files[file_id]["filename"],
+                            "score": score,
+                            "attributes": {"segment_id": segment.get("id"), "index": segment.get("index")},
+                            "content": [{"type": "text", "text": text}],
+                        }
+                    )
+        results.sort(key=lambda result: result["score"], reverse=True)
+        return web.json_response(
+            {
+                "object": "vector_store.search_results.page",
+                "search_query": query,
+                "data": results[: int(payload.get("top_k", 10))],
+                "has_more": False,
+                "next_page": None,
+                "request_id": _new_id(),
+            }
+        )
+
+    def _join(self, store: dict[str, Any], file_ids: Iterable[str]) -> None:
+        for file_id in file_ids:
+            if file_id in self._files and file_id not in store["file_ids"]:
+                store["file_ids"].append(file_id)
+
+    def _vector_store_view(self, store: dict[str, Any]) -> dict[str, Any]:
+        file_ids = store["file_ids"]
+        completed = sum(self._files[file_id]["status"] == "completed" for file_id in file_ids)
+        return {
+            **store,
+            "bytes": sum(self._files[file_id]["bytes"] for file_id in file_ids),
+            "file_counts": {
+                "in_progress": len(file_ids) - completed,
+                "completed": completed,
+                "failed": 0,
+                "cancelled": 0,
+                "total": len(file_ids),
+            },
+        }
+
+
+def _segment(document_id: str, index: int, text: str) -> dict[str, Any]:
+    return {"id": f"{document_id}-P{index:04d}", "content": text, "index": index, "metadata": {}, "url": ""}
+
+
+def _error(status: int, message: str) -> web.Response:
+    return web.json_response({"error": {"message": message, "type": "mock_error"}}, status=status)
+
+
+async def record(request_payload: dict[str, Any], output: str | Path, url: str | None = None) -> Recording:
+    """Send a request to a real server and save its SSE stream, with timing, as a JSONL recording."""
+    from forge_cli.sdk.client import ForgeClient
+    from forge_cli.sdk.compression import aiter_decoded, open_request, read_text
+    from forge_cli.sdk.config import BASE_URL
+    from forge_cli.sdk.sse import aiter_sse_events
+
+    url = url or f"{BASE_URL}/v1/responses"
+    events = []
+    async with ForgeClient() as client:
+        session = await client.get_session()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async with await open_request(session, "POST", url, json_payload=request_payload, stream=True) as response:
+            if response.status != 200:
+                raise Exception(f"Recording failed with status {response.status}: {await read_text(response)}")
+            async for event in aiter_sse_events(aiter_decoded(response)):
+                events.append(RecordedEvent(loop.time() - started, event.event, event.data, event.id or None))
+                if event.event == "done":
+                    break
+
+    recording = Recording(events)
+    recording.dump(output)
+    logger.info(f"Recorded {len(events)} events over {recording.duration:.2f}s to {output}")
+    return recording
+
+
+def _load_documents(paths: Iterable[str]) -> list[dict[str, Any]]:
+    return [json.loads(Path(path).read_text(encoding="utf-8")) for path in paths]
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = MockForgeServer(
+        recordings=[Recording.load(path, args.interval) for path in args.recording] or None,
+        documents=_load_documents(args.documents),
+        speed=None if args.speed == "max" else float(args.speed),
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        disconnect_rate=args.disconnect_rate,
+        event_ids=args.event_ids,
+        task_duration=args.task_duration,
+        seed=args.seed,
+    )
+    await server.start(args.host, args.port)
+    print(f"Mock Knowledge Forge server on {server.url} (KNOWLEDGE_FORGE_URL={server.url})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Local mock Knowledge Forge server")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Serve recorded streams and in-memory files and vector stores")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=9999)
+    serve.add_argument("--recording", action="append", default=[], help="Recording to replay (.jsonl or raw SSE)")
+    serve.add_argument("--interval", type=float, default=0.02, help="Seconds between events of raw SSE recordings")
+    serve.add_argument("--documents", nargs="*", default=[], help="Document JSON files to serve")
+    serve.add_argument("--speed", default="1", help="Replay speed multiplier, or 'max' for as fast as possible")
+    serve.add_argument("--latency", type=float, default=0.0, help="Seconds added before every request")
+    serve.add_argument("--jitter", type=float, default=0.0, help="Random extra latency, up to this many seconds")
+    serve.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failed on purpose")
+    serve.add_argument("--error-status", type=int, default=503, help="HTTP status of injected errors")
+    serve.add_argument("--disconnect-rate", type=float, default=0.0, help="Fraction of streams dropped mid-way")
+    serve.add_argument("--event-ids", action="store_true", help="Number SSE events to allow Last-Event-ID resume")
+    serve.add_argument("--task-duration", type=float, default=0.5, help="Seconds until upload tasks complete")
+    serve.add_argument("--seed", type=int, help="Seed for latency, error and disconnect injection")
+
+    rec = commands.add_parser("record", help="Record a stream from a real server")
+    rec.add_argument("--request", required=True, type=Path, help="JSON request payload for POST /v1/responses")
+    rec.add_argument("--output", required=True, type=Path, help="JSONL recording to write")
+    rec.add_argument("--url", help="Responses endpoint (default: $KNOWLEDGE_FORGE_URL/v1/responses)")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "serve":
+            asyncio.run(_serve(args))
+        else:
+            asyncio.run(record(json.loads(args.request.read_text(encoding="utf-8")), args.output, args.url))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Tests for the /stats command."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from forge_cli.chat.commands.info import StatsCommand
+from forge_cli.sdk.metrics import ClientMetrics, set_metrics
+
+
+@pytest.fixture
+def metrics():
+    metrics = ClientMetrics()
+    set_metrics(metrics)
+    yield metrics
+    set_metrics(None)
+
+
+@pytest.fixture
+def controller():
+    controller = MagicMock(spec=["display"])
+    controller.display = MagicMock(spec=["show_status", "show_error"])
+    return controller
+
+
+def _shown(controller) -> str:
+    return "\n".join(call.args[0] for call in controller.display.show_status.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_no_requests(metrics, controller):
+    assert await StatsCommand().execute("", controller) is True
+    assert "No requests recorded" in _shown(controller)
+
+
+@pytest.mark.asyncio
+async def test_shows_percentiles_per_endpoint(metrics, controller):
+    for _ in range(3):
+        with metrics.measure("GET", "http://h/v1/vector_stores/vs_1") as timer:
+            timer.reused = True
+
+    await StatsCommand().execute("", controller)
+
+    shown = _shown(controller)
+    assert "GET /v1/vector_stores/{id}" in shown
+    assert "Reqs: 3" in shown
+    assert "Reused: 100%" in shown
+
+
+@pytest.mark.asyncio
+async def test_reset(metrics, controller):
+    with metrics.measure("GET", "http://h/v1/files/f1"):
+        pass
+
+    await StatsCommand().execute("reset", controller)
+
+    assert metrics.endpoints == {}
+
+
+@pytest.mark.asyncio
+async def test_shows_stream_stages(metrics, controller):
+    with metrics.measure("POST", "http://h/v1/responses"):
+        pass
+    metrics.stage("parse").record(0.001, 0.0002, 3)
+    metrics.stage("render").record(0.004, 0.015, 1)
+    metrics.stage("render").conflated = 7
+
+    await StatsCommand().execute("", controller)
+
+    shown = _shown(controller)
+    assert "parse: 1 items, wait p50/p99 1.00ms" in shown
+    assert "render: 1 items, 7 conflated" in shown
+    assert "queue depth mean 3.0 max 3" in shown
+
+
+@pytest.mark.asyncio
+async def test_shows_stream_resumes(metrics, controller):
+    with metrics.measure("POST", "http://h/v1/responses"):
+        pass
+    await StatsCommand().execute("", controller)
+    assert "Stream resumes" not in _shown(controller)
+
+    resumes = metrics.resumes
+    resumes.disconnects, resumes.attempts, resumes.resumed, resumes.polled = 3, 4, 2, 1
+    resumes.latency.record(0.05)
+    controller.display.show_status.reset_mock()
+    await StatsCommand().execute("", controller)
+
+    shown = _shown(controller)
+    assert "3 disconnects, 2 resumed with Last-Event-ID, 1 by polling, 0 failed (4 attempts)" in shown
+    assert "reconnect p50/p99 50ms" in shown
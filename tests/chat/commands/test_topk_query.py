@@ -199,13 +199,26 @@ class TestTopKQueryCommand:
 
         collection_id, query, top_k, json_output = command._parse_args("test query", mock_controller)
 
-        assert collection_id == "vs_1"  # Uses first collection
+        assert collection_id == "vs_1,vs_2,vs_3"  # Searches all active collections
         assert query == "test query"
         assert top_k == 5
         assert json_output is False
 
         # Check that informative message was displayed
-        mock_controller.display.show_status.assert_any_call("ℹ️ Using first active collection: vs_1")
+        mock_controller.display.show_status.assert_any_call("ℹ️ Searching all 3 active collections")
+
+    async def test_execute_multiple_collections(self, command, mock_controller):
+        """Test execute merges results across all active collections."""
+        mock_controller.conversation.get_current_vector_store_ids.return_value = ["vs_1", "vs_2"]
+        with patch("forge_cli.sdk.vectorstore.async_query_vectorstores") as mock_query:
+            mock_result = MagicMock()
+            mock_result.data = []
+            mock_query.return_value = mock_result
+
+            result = await command.execute("machine learning", mock_controller)
+
+            assert result is True
+            mock_query.assert_called_once_with(["vs_1", "vs_2"], query="machine learning", top_k=5, filters=None)
 
     async def test_execute_simple_format(self, command, mock_controller):
         """Test execute with simple format."""
@@ -0,0 +1,91 @@
+"""Tests for @-file completion listings in CommandCompleter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from forge_cli.chat import command_completer
+from forge_cli.chat.command_completer import CommandCompleter
+from forge_cli.sdk import sync, vectorstore
+
+
+@pytest.fixture(autouse=True)
+def runner():
+    runner = sync.SyncRunner()
+    sync.set_sync_runner(runner)
+    yield runner
+    runner.close()
+    sync.set_sync_runner(None)
+
+
+@pytest.fixture
+def listings(monkeypatch):
+    """Fake collections: vs_big has 1000 files, vs_slow stalls after its first files."""
+    requested = []
+
+    async def fake_listing(vector_store_id, page_size=100, client=None):
+        requested.append((vector_store_id, page_size))
+        count = 1000 if vector_store_id == "vs_big" else 3
+        for index in range(count):
+            if vector_store_id == "vs_slow" and index == 2:
+                await asyncio.sleep(60)
+            await asyncio.sleep(0.01 if vector_store_id.startswith("vs_small") else 0)
+            yield SimpleNamespace(id=f"{vector_store_id}_file_{index}", filename=f"doc{index}.pdf")
+
+    monkeypatch.setattr(vectorstore, "aiter_vectorstore_files", fake_listing)
+    return requested
+
+
+def _completer(*vector_store_ids: str) -> CommandCompleter:
+    conversation = MagicMock()
+    conversation.get_uploaded_documents.return_value = []
+    conversation.get_current_vector_store_ids.return_value = list(vector_store_ids)
+    completer = CommandCompleter({}, {}, conversation)
+    completer._fetch_timeout_seconds = 0.2
+    return completer
+
+
+def test_listing_is_capped_and_cached(listings):
+    completer = _completer("vs_big", "vs_small")
+
+    files = completer._get_available_files()
+
+    ids = [file["id"] for file in files]
+    assert len(ids) == command_completer.COMPLETION_FILES_PER_COLLECTION + 3
+    assert "vs_small_file_2" in ids
+    assert ("vs_big", command_completer.COMPLETION_FILES_PER_COLLECTION) in listings
+    assert completer._file_cache is files
+
+
+def test_collections_are_listed_concurrently(listings, runner):
+    completer = _completer("vs_small_a", "vs_small_b", "vs_small_c", "vs_small_d")
+    runner.run(asyncio.sleep(0))  # start the loop thread outside the measurement
+
+    started = time.monotonic()
+    files = completer._get_available_files()
+
+    assert len(files) == 12
+    # Four sequential listings of 3 x 10 ms would take at least 120 ms
+    assert time.monotonic() - started < 0.1
+
+
+def test_timed_out_listing_keeps_first_files_and_is_not_cached(listings):
+    completer = _completer("vs_slow", "vs_small")
+
+    started = time.monotonic()
+    files = completer._get_available_files()
+
+    assert time.monotonic() - started < 1
+    assert [file["id"] for file in files] == [
+        "vs_slow_file_0",
+        "vs_slow_file_1",
+        "vs_small_file_0",
+        "vs_small_file_1",
+        "vs_small_file_2",
+    ]
+    assert completer._file_cache is None
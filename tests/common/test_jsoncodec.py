@@ -0,0 +1,111 @@
+"""Tests for the JSON codec used by the SDK, persistence and renderers."""
+
+import io
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from uuid import UUID
+
+import pytest
+
+from forge_cli.common import jsoncodec
+from forge_cli.models.conversation import ConversationState
+
+DOCUMENT = {"id": "resp_1", "text": "Umsatz wuchs um 12 % – laut Bericht", "items": [1, 2.5, None, True], "nested": {}}
+
+
+@pytest.fixture(params=jsoncodec.available_backends())
+def backend(request):
+    jsoncodec.set_backend(request.param)
+    yield request.param
+    jsoncodec.set_backend(None)
+
+
+def test_round_trip(backend):
+    encoded = jsoncodec.dumps(DOCUMENT)
+    assert jsoncodec.get_backend() == backend
+    assert json.loads(encoded) == DOCUMENT
+    assert jsoncodec.loads(encoded) == DOCUMENT
+    assert jsoncodec.loads(encoded.encode()) == DOCUMENT
+    assert jsoncodec.loads(memoryview(encoded.encode())) == DOCUMENT
+    assert jsoncodec.dumpb(DOCUMENT) == encoded.encode()
+
+
+def test_output_format_is_the_same_for_every_backend(backend):
+    value = {"a": [1, "é"], "b": {}}
+    assert jsoncodec.dumps(value) == '{"a":[1,"é"],"b":{}}'
+    assert jsoncodec.dumps(value, indent=2) == json.dumps(value, indent=2, ensure_ascii=False)
+    assert jsoncodec.dumps({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
+
+
+def test_malformed_input_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        jsoncodec.loads('{"id": ')
+    with pytest.raises(ValueError):
+        jsoncodec.loads(b"")
+
+
+def test_default_hook_and_fallback(backend):
+    when = datetime(2024, 5, 1, 12, 0)
+    assert jsoncodec.loads(jsoncodec.dumps({"at": when}, default=str))["at"].startswith("2024-05-01")
+    assert jsoncodec.loads(jsoncodec.dumps({"n": 2**70})) == {"n": 2**70}
+    assert jsoncodec.dumps([1], indent=4) == "[\n    1\n]"
+    with pytest.raises(TypeError):
+        jsoncodec.dumps({"value": object()})
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+def test_default_hook_sees_the_same_values_on_every_backend(backend):
+    value = {
+        "at": datetime(2024, 1, 1, 1, 2, 3),
+        "day": date(2024, 1, 1),
+        "id": UUID(int=1),
+        "point": _Point(1),
+        "items": [time(1, 2)],
+    }
+    expected = json.dumps(value, default=str, ensure_ascii=False, separators=(",", ":"))
+
+    assert jsoncodec.dumps(value, default=str) == expected
+    assert '"at":"2024-01-01 01:02:03"' in expected
+    assert jsoncodec.dumps(value, indent=2, default=str) == json.dumps(value, indent=2, default=str)
+
+
+def test_dump_writes_bytes_to_binary_files(backend):
+    binary, text = io.BytesIO(), io.StringIO()
+    jsoncodec.dump(DOCUMENT, binary, indent=2)
+    jsoncodec.dump(DOCUMENT, text, indent=2)
+    assert binary.getvalue().decode() == text.getvalue()
+    assert jsoncodec.load(io.BytesIO(binary.getvalue())) == DOCUMENT
+
+
+def test_conversation_round_trip(backend, tmp_path):
+    conversation = ConversationState(model="qwen-max-latest")
+    for turn in range(20):
+        conversation.add_user_message(f"Frage {turn}: Wie hoch war der Umsatz?")
+        conversation.add_assistant_message(f"Antwort {turn}: 12 % mehr als im Vorjahr.")
+
+    path = tmp_path / "conversation.json"
+    conversation.save(path)
+    loaded = ConversationState.load(path)
+
+    assert loaded.get_message_count() == 40
+    assert loaded.model_dump(mode="json") == conversation.model_dump(mode="json")
+    assert "Vorjahr" in path.read_text(encoding="utf-8")
+
+
+def test_backend_selection(monkeypatch):
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        jsoncodec.set_backend("simdjson")
+
+    monkeypatch.setenv("FORGE_JSON_BACKEND", "json")
+    jsoncodec.set_backend(None)
+    try:
+        assert jsoncodec.get_backend() == "json"
+    finally:
+        monkeypatch.delenv("FORGE_JSON_BACKEND")
+        jsoncodec.set_backend(None)
+    assert jsoncodec.get_backend() == jsoncodec.available_backends()[0]
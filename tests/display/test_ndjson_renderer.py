@@ -0,0 +1,110 @@
+"""Tests for the NDJSON delta renderer."""
+
+import io
+import json
+
+from forge_cli.display.v3.renderers.ndjson import NdjsonRenderer
+from forge_cli.response._types import Response
+
+
+def make_response(
+    text: str,
+    annotations: int = 0,
+    tool_status: str = "searching",
+    status: str = "in_progress",
+) -> Response:
+    return Response.model_validate(
+        {
+            "id": "resp_1",
+            "object": "response",
+            "created_at": 1700000000.0,
+            "model": "qwen-max-latest",
+            "parallel_tool_calls": False,
+            "tool_choice": "auto",
+            "tools": [],
+            "status": status,
+            "output": [
+                {"id": "fs_1", "type": "file_search_call", "queries": ["revenue"], "status": tool_status},
+                {
+                    "id": "msg_1",
+                    "type": "message",
+                    "role": "assistant",
+                    "status": status,
+                    "content": [
+                        {
+                            "type": "output_text",
+                            "text": text,
+                            "annotations": [
+                                {"type": "file_citation", "file_id": f"file_{i}", "index": i, "filename": "a.pdf"}
+                                for i in range(annotations)
+                            ],
+                        }
+                    ],
+                },
+            ],
+        }
+    )
+
+
+def render(snapshots: list[Response]) -> list[dict]:
+    stream = io.StringIO()
+    renderer = NdjsonRenderer(output_stream=stream)
+    for snapshot in snapshots:
+        renderer.render_response(snapshot)
+    renderer.finalize()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestNdjsonRenderer:
+    def test_text_growth_is_written_as_deltas(self):
+        records = render([make_response("Rev"), make_response("Revenue"), make_response("Revenue grew")])
+
+        assert [r["type"] for r in records] == [
+            "response.created",
+            "output_item.added",
+            "output_item.added",
+            "output_text.delta",
+            "output_text.delta",
+            "response.final",
+        ]
+        assert [r["delta"] for r in records if r["type"] == "output_text.delta"] == ["enue", " grew"]
+
+    def test_unchanged_snapshot_writes_nothing(self):
+        stream = io.StringIO()
+        renderer = NdjsonRenderer(output_stream=stream)
+        renderer.render_response(make_response("Hi"))
+        written = stream.getvalue()
+        renderer.render_response(make_response("Hi"))
+        assert stream.getvalue() == written
+
+    def test_tool_status_and_annotations(self):
+        records = render(
+            [
+                make_response("Hi"),
+                make_response("Hi", tool_status="completed"),
+                make_response("Hi", annotations=1, tool_status="completed"),
+            ]
+        )
+        updated = [r for r in records if r["type"] == "output_item.updated"]
+        assert len(updated) == 1
+        assert updated[0]["item"]["status"] == "completed"
+
+        added = [r for r in records if r["type"] == "output_text.annotation.added"]
+        assert len(added) == 1
+        assert added[0]["annotation"]["file_id"] == "file_0"
+
+    def test_final_record_written_once_on_completion(self):
+        final = make_response("Done.", tool_status="completed", status="completed")
+        records = render([make_response("Do"), final])
+
+        finals = [r for r in records if r["type"] == "response.final"]
+        assert len(finals) == 1
+        assert finals[0]["response"] == final.model_dump(mode="json", exclude_none=True)
+        assert {"type": "response.status", "status": "completed"} in records
+
+    def test_each_line_is_compact_json(self):
+        stream = io.StringIO()
+        renderer = NdjsonRenderer(output_stream=stream)
+        renderer.render_response(make_response("Hello"))
+        for line in stream.getvalue().splitlines():
+            assert ": " not in line and ", " not in line
@@ -0,0 +1,100 @@
+"""Tests for the per-item render cache in RichRenderer."""
+
+import io
+
+from rich.console import Console
+
+from forge_cli.display.v3.renderers.fingerprints import tool_fingerprint
+from forge_cli.display.v3.renderers.rich.render import RichRenderer
+from forge_cli.response._types import Response, ResponseFileSearchToolCall
+
+
+def make_response(text: str, tool_status: str = "completed", response_id: str = "resp_1") -> Response:
+    return Response.model_validate(
+        {
+            "id": response_id,
+            "object": "response",
+            "created_at": 1700000000.0,
+            "model": "qwen-max-latest",
+            "parallel_tool_calls": False,
+            "tool_choice": "auto",
+            "tools": [],
+            "status": "in_progress",
+            "output": [
+                {"id": "fs_1", "type": "file_search_call", "queries": ["revenue"], "status": tool_status},
+                {"id": "rs_1", "type": "reasoning", "summary": [{"type": "summary_text", "text": "Thinking"}]},
+                {
+                    "id": "msg_1",
+                    "type": "message",
+                    "role": "assistant",
+                    "status": "in_progress",
+                    "content": [{"type": "output_text", "text": text, "annotations": []}],
+                },
+            ],
+        }
+    )
+
+
+class TestRichRenderCache:
+    """Only items whose fingerprint changed should be rebuilt."""
+
+    def setup_method(self):
+        self.renderer = RichRenderer(console=Console(file=io.StringIO()))
+
+    def test_first_render_misses_every_item(self):
+        self.renderer._create_response_content(make_response("Hello"))
+        assert self.renderer.render_cache_stats["misses"] == 3
+        assert self.renderer.render_cache_stats["hits"] == 0
+
+    def test_streaming_text_only_rebuilds_message(self):
+        renderer = self.renderer
+        renderer._create_response_content(make_response("Hello"))
+        renderer._last_response_id = "resp_1"
+
+        for text in ("Hello w", "Hello wo", "Hello world"):
+            renderer._create_response_content(make_response(text))
+
+        stats = renderer.render_cache_stats
+        # Tool call and reasoning are reused on every later snapshot; the message is rebuilt.
+        assert stats["hits"] == 6
+        assert stats["misses"] == 3 + 3
+
+    def test_tool_status_transition_invalidates_tool(self):
+        renderer = self.renderer
+        renderer._create_response_content(make_response("Hi", tool_status="searching"))
+        renderer._last_response_id = "resp_1"
+        renderer._create_response_content(make_response("Hi", tool_status="completed"))
+
+        stats = renderer.render_cache_stats
+        assert stats["misses"] == 4
+        assert stats["hits"] == 2
+
+    def test_new_response_clears_cache(self):
+        renderer = self.renderer
+        renderer._create_response_content(make_response("Hi"))
+        renderer._last_response_id = "resp_1"
+        renderer._create_response_content(make_response("Hi", response_id="resp_2"))
+
+        assert renderer.render_cache_stats["hits"] == 0
+        assert renderer.render_cache_stats["misses"] == 6
+
+
+class TestToolFingerprint:
+    """Tool items changed in place must not be served from the cache."""
+
+    def make_tool(self, **fields) -> ResponseFileSearchToolCall:
+        return ResponseFileSearchToolCall.model_validate(
+            {"id": "fs_1", "type": "file_search_call", "queries": ["revenue"], "status": "searching", **fields}
+        )
+
+    def test_query_growing_in_place_changes_fingerprint(self):
+        assert tool_fingerprint(self.make_tool()) != tool_fingerprint(self.make_tool(queries=["revenue 2023"]))
+
+    def test_same_length_annotations_update_changes_fingerprint(self):
+        citation = {"type": "file_citation", "file_id": "file_1", "index": 0}
+        first = self.make_tool(annotations=[citation])
+        second = self.make_tool(annotations=[{**citation, "filename": "report.pdf"}])
+        assert tool_fingerprint(first) != tool_fingerprint(second)
+
+    def test_unchanged_item_keeps_fingerprint(self):
+        assert tool_fingerprint(self.make_tool()) == tool_fingerprint(self.make_tool())
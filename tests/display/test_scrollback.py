@@ -0,0 +1,140 @@
+"""Tests for scrollback mode in the live renderers."""
+
+import io
+
+from rich.console import Console
+
+from forge_cli.display.v3.renderers.plaintext import PlaintextDisplayConfig, PlaintextRenderer
+from forge_cli.display.v3.renderers.rich.render import RichRenderer
+from forge_cli.display.v3.renderers.scrollback import ScrollbackCommitter, ScrollbackSegment
+from forge_cli.response._types import Response
+
+
+def make_response(text: str, tool_status: str = "completed", message_status: str = "in_progress") -> Response:
+    return Response.model_validate(
+        {
+            "id": "resp_1",
+            "object": "response",
+            "created_at": 1700000000.0,
+            "model": "qwen-max-latest",
+            "parallel_tool_calls": False,
+            "tool_choice": "auto",
+            "tools": [],
+            "status": "in_progress",
+            "output": [
+                {"id": "fs_1", "type": "file_search_call", "queries": ["revenue"], "status": tool_status},
+                {
+                    "id": "msg_1",
+                    "type": "message",
+                    "role": "assistant",
+                    "status": message_status,
+                    "content": [{"type": "output_text", "text": text, "annotations": []}],
+                },
+            ],
+        }
+    )
+
+
+def make_console() -> Console:
+    return Console(file=io.StringIO(), width=80, force_terminal=False)
+
+
+class TestScrollbackCommitter:
+    def test_commits_only_finished_prefix_once(self):
+        console = make_console()
+        committer = ScrollbackCommitter(console)
+        segments = [
+            ScrollbackSegment("a", ["first"], True),
+            ScrollbackSegment("b", ["second"], False),
+            ScrollbackSegment("c", ["third"], True),
+        ]
+
+        tail = committer.commit(segments)
+        assert tail == ["second", "third"]
+        assert committer.committed_count == 1
+
+        # Committing again does not reprint "a"
+        committer.commit(segments)
+        assert console.file.getvalue() == "first\n"
+
+
+class TestRichScrollback:
+    def setup_method(self):
+        self.console = make_console()
+        self.renderer = RichRenderer(console=self.console, scrollback=True)
+
+    def render(self, response: Response):
+        content = self.renderer._create_scrollback_content(response)
+        self.renderer._last_response_id = response.id
+        return content
+
+    def test_finished_blocks_leave_the_live_region(self):
+        self.render(make_response("First paragraph.", tool_status="searching"))
+        assert self.console.file.getvalue() == ""
+
+        tail = self.render(make_response("First paragraph.\n\nSecond paragraph.\n\nThird"))
+        printed = self.console.file.getvalue()
+        assert "revenue" in printed
+        assert "First paragraph." in printed
+
+        live = _render_text(tail)
+        assert "Third" in live
+        assert "First paragraph." not in live
+
+    def test_completed_message_is_printed_once(self):
+        self.render(make_response("One.\n\nTwo"))
+        self.render(make_response("One.\n\nTwo.", message_status="completed"))
+        self.render(make_response("One.\n\nTwo.", message_status="completed"))
+
+        printed = self.console.file.getvalue()
+        assert printed.count("One.") == 1
+        assert printed.count("Two.") == 1
+
+    def test_block_that_is_not_last_stays_live_until_final(self):
+        # The first item is not the last block, but the next item makes the list loose
+        tail = self.render(make_response("1. first item\n\n2"))
+        assert "first item" not in self.console.file.getvalue()
+        assert "first item" in _render_text(tail)
+
+        tail = self.render(make_response("1. first item\n\n2. second item\n\nAfter.\n\nMore"))
+        printed = self.console.file.getvalue()
+        assert "first item" in printed
+        assert "second item" in printed
+        assert "More" in _render_text(tail)
+
+    def test_paragraph_with_reference_is_committed_resolved(self):
+        text = "Read [the docs][1].\n\nOne.\n\nTwo.\n\n[1]: https://example.com/docs\n"
+        for end in range(1, len(text)):
+            self.render(make_response(text[:end]))
+        assert "[the docs]" not in self.console.file.getvalue()
+
+        self.render(make_response(text, message_status="completed"))
+        printed = self.console.file.getvalue()
+        assert "[the docs]" not in printed
+        assert printed.count("the docs") == 1
+
+
+class TestPlaintextScrollback:
+    def test_finished_items_leave_the_live_region(self):
+        console = make_console()
+        renderer = PlaintextRenderer(console=console, config=PlaintextDisplayConfig(scrollback=True))
+
+        tail = renderer._create_scrollback_group(make_response("Intro.\n\nMore.\n\n- item"))
+        printed = console.file.getvalue()
+        assert "Intro." in printed
+        assert "item" not in printed
+        assert "item" in _render_text(tail)
+
+    def test_block_that_is_not_last_stays_live_until_final(self):
+        console = make_console()
+        renderer = PlaintextRenderer(console=console, config=PlaintextDisplayConfig(scrollback=True))
+
+        tail = renderer._create_scrollback_group(make_response("1. first item\n\n2"))
+        assert "first item" not in console.file.getvalue()
+        assert "first item" in _render_text(tail)
+
+
+def _render_text(renderable) -> str:
+    console = make_console()
+    console.print(renderable)
+    return console.file.getvalue()
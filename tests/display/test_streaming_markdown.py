@@ -0,0 +1,97 @@
+"""Tests for StreamingMarkdown incremental rendering."""
+
+import io
+import re
+
+import pytest
+from rich.console import Console, Group
+from rich.markdown import Markdown
+
+from forge_cli.display.citation_styling import long2circled
+from forge_cli.display.v3.renderers.rich.streaming_markdown import StreamingMarkdown
+
+DOCUMENTS = [
+    "# Title\n\nSome paragraph with **bold** text\nspanning two lines.\n\n"
+    "- item one\n- item two\n\n  continued item two\n\n1. first\n2. second\n\n"
+    "```python\ndef f():\n\n    return 1\n```\n\n| a | b |\n|---|---|\n| 1 | 2 |\n\n"
+    "> quote here\n> more\n\nFinal para",
+    "Revenue grew ⟦⟦1⟧⟧ last year.\n\n## Details\nMargins improved ⟦⟦2⟧⟧.\n\n---\n\n- a\n- b",
+    "Para\n\n##\nText after an empty heading\n\n> \n\nend",
+    # Later text changes how earlier blocks render
+    "1. first item\n\n2. second item\n\n3. third\n",
+    "Read [the docs][1] first.\n\nThen the rest.\n\nAnd more.\n\n[1]: https://example.com/docs\n",
+    "1. Install it:\n   ```bash\n   pip install forge-cli\n   ```\n2. Run it\n\nAfter the list\n",
+    # Definitions in frozen text still resolve later references
+    "[1]: https://example.com\n\nIntro.\n\nSee [this][1].\n\nMore.\n\nEnd [again][1].",
+]
+
+
+def render(renderable) -> str:
+    console = Console(file=io.StringIO(), width=60, force_terminal=True, color_system="truecolor")
+    console.print(renderable)
+    # Hyperlink ids are random per render
+    return re.sub(r"id=\d+;", "", console.file.getvalue())
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("step", [1, 7])
+def test_streamed_output_matches_one_shot_render(document, step):
+    stream = StreamingMarkdown()
+    for end in range(1, len(document) + 1, step):
+        stream.update(document[:end])
+
+    final = stream.update(document)
+    assert render(final) == render(Markdown(long2circled(document)))
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_frozen_blocks_are_final(document):
+    """Blocks frozen at any point render as they do in the finished document."""
+    stream = StreamingMarkdown()
+    frozen_prefixes = []
+    for end in range(1, len(document) + 1):
+        parts = stream.update(document[:end]).renderables
+        frozen_prefixes.append(render(Group(*parts[: stream.frozen_part_count])))
+
+    final = render(Markdown(long2circled(document)))
+    for prefix in frozen_prefixes:
+        assert final.startswith(prefix.rstrip("\n"))
+
+
+def test_closed_blocks_are_frozen_and_reused():
+    stream = StreamingMarkdown()
+    stream.update("First paragraph.\n\nSecond paragraph.\n\nThird")
+    frozen = stream.frozen_blocks
+    assert len(frozen) == 1
+
+    stream.update("First paragraph.\n\nSecond paragraph.\n\nThird paragraph.\n\nFourth")
+    assert len(stream.frozen_blocks) == 2
+    assert stream.frozen_blocks[0] is frozen[0]
+    assert stream.frozen_length == len("First paragraph.\n\nSecond paragraph.\n\n")
+
+
+def test_last_two_blocks_stay_open():
+    stream = StreamingMarkdown()
+    stream.update("1. first item\n\n2")
+    assert stream.frozen_blocks == []
+
+
+def test_open_fence_is_not_frozen():
+    stream = StreamingMarkdown()
+    stream.update("Intro\n\nMore\n\n```\ncode\n\n\nmore code")
+    assert len(stream.frozen_blocks) == 1
+
+
+def test_possible_reference_keeps_later_blocks_open():
+    stream = StreamingMarkdown()
+    stream.update("Intro.\n\nRead [the docs][1].\n\nOne.\n\nTwo.\n\nThree")
+    assert len(stream.frozen_blocks) == 1
+
+
+def test_rewritten_text_resets_state():
+    stream = StreamingMarkdown()
+    stream.update("One.\n\nTwo.\n\nThree.\n\nFour")
+    stream.update("Different.\n\nText.\n\nHere")
+    assert len(stream.frozen_blocks) == 1
+    document = "Different.\n\nText.\n\nHere"
+    assert render(stream.update(document)) == render(Markdown(document))
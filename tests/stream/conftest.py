@@ -0,0 +1,32 @@
+"""Shared helpers for the stream tests."""
+
+import threading
+import time
+
+from forge_cli.response._types import Response
+
+
+class RecordingDisplay:
+    """Display stand-in recording what was rendered and on which thread."""
+
+    def __init__(self, frame_cost: float = 0.0, fail: bool = False):
+        self.rendered: list[str] = []
+        self.threads: set[str] = set()
+        self.errors: list[str] = []
+        self.completed = False
+        self.is_finalized = False
+        self.frame_cost = frame_cost
+        self.fail = fail
+
+    def handle_response(self, response: Response) -> None:
+        if self.fail:
+            raise RuntimeError("terminal went away")
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.frame_cost)
+        self.rendered.append(response.output_text)
+
+    def complete(self) -> None:
+        self.completed = True
+
+    def show_error(self, message: str) -> None:
+        self.errors.append(message)
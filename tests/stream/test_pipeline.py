@@ -0,0 +1,120 @@
+"""Tests for the three-stage StreamPipeline."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from forge_cli.sdk.metrics import ClientMetrics, StageStats
+from forge_cli.sdk.sse import ServerSentEvent
+from forge_cli.stream.pipeline import StageQueue, StreamPipeline
+from forge_cli.testing.mock_server import DEFAULT_ANSWER, Recording
+
+from .conftest import RecordingDisplay
+
+
+async def replay(events: list[ServerSentEvent], interval: float = 0.0):
+    for event in events:
+        if interval:
+            await asyncio.sleep(interval)
+        yield event
+
+
+def recorded_events() -> list[ServerSentEvent]:
+    recording = Recording.synthesize(chars_per_event=4)
+    return [ServerSentEvent(event.event, event.data) for event in recording.events]
+
+
+def test_stage_queue_conflates_tail_and_blocks_when_full():
+    stats = StageStats()
+    queue = StageQueue(2, stats)
+
+    assert queue.put("a", conflatable=True)
+    assert queue.put("b", conflatable=True)  # replaces "a"
+    assert queue.put("c")
+    assert queue.put("d", conflatable=True, block=False) is False  # full, "c" cannot be conflated
+    assert stats.conflated == 1
+
+    assert queue.get()[0] == "b"
+    assert queue.get()[0] == "c"
+
+    queue.put("e")
+    queue.close()
+    assert queue.put("f") is False
+    assert queue.get()[0] == "e"
+    assert queue.get() is None
+
+
+def test_stage_queue_abort_releases_blocked_producer():
+    queue = StageQueue(1, StageStats())
+    queue.put("a")
+    results = []
+    producer = threading.Thread(target=lambda: results.append(queue.put("b")))
+    producer.start()
+    time.sleep(0.02)
+    queue.abort()
+    producer.join(1)
+    assert results == [False]
+    assert queue.get() is None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_renders_on_its_own_thread():
+    display = RecordingDisplay()
+    metrics = ClientMetrics()
+    events = recorded_events()
+
+    response = await StreamPipeline(display, metrics=metrics).run(replay(events))
+
+    assert response is not None and response.status == "completed"
+    assert response.output_text == DEFAULT_ANSWER
+    assert display.rendered[-1] == DEFAULT_ANSWER
+    assert display.threads == {"forge-stream-render"}
+    assert display.completed
+
+    stages = metrics.to_dict()["stages"]
+    assert set(stages) == {"read", "parse", "render"}
+    assert stages["read"]["processed"] == len(events)
+    assert stages["render"]["processed"] + stages["render"]["conflated"] == len(events)
+
+
+@pytest.mark.asyncio
+async def test_slow_render_conflates_without_stalling_the_reader():
+    display = RecordingDisplay(frame_cost=0.02)
+    metrics = ClientMetrics()
+    events = recorded_events()
+
+    started = time.perf_counter()
+    response = await StreamPipeline(display, queue_size=4, metrics=metrics).run(replay(events, interval=0.001))
+    elapsed = time.perf_counter() - started
+
+    assert response.output_text == DEFAULT_ANSWER
+    assert display.rendered[-1] == DEFAULT_ANSWER
+    render = metrics.stage("render")
+    assert render.conflated > 0
+    assert render.processed < len(events) / 2
+    assert elapsed < len(events) * display.frame_cost
+
+
+@pytest.mark.asyncio
+async def test_stream_errors_reach_the_display():
+    display = RecordingDisplay()
+    events = [
+        *recorded_events()[:3],
+        ServerSentEvent("error", "Error creating typed response stream: connection reset"),
+    ]
+
+    response = await StreamPipeline(display, metrics=ClientMetrics()).run(replay(events))
+
+    assert response is not None
+    assert display.errors == ["Error creating typed response stream: connection reset"]
+    assert not display.completed
+
+
+@pytest.mark.asyncio
+async def test_display_failure_is_raised():
+    display = RecordingDisplay(fail=True)
+
+    with pytest.raises(RuntimeError, match="terminal went away"):
+        await asyncio.wait_for(StreamPipeline(display, metrics=ClientMetrics()).run(replay(recorded_events())), 5)
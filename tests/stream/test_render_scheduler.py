@@ -0,0 +1,73 @@
+"""Tests for the throttled RenderScheduler."""
+
+import asyncio
+
+import pytest
+
+from forge_cli.response._types import Response
+from forge_cli.stream.render_scheduler import RenderScheduler
+
+from .conftest import RecordingDisplay
+
+
+def make_response(text: str, tool_status: str = "completed") -> Response:
+    return Response.model_validate(
+        {
+            "id": "resp_1",
+            "object": "response",
+            "created_at": 1700000000.0,
+            "model": "qwen-max-latest",
+            "parallel_tool_calls": False,
+            "tool_choice": "auto",
+            "tools": [],
+            "output": [
+                {"id": "fs_1", "type": "file_search_call", "queries": ["q"], "status": tool_status},
+                {
+                    "id": "msg_1",
+                    "type": "message",
+                    "role": "assistant",
+                    "status": "in_progress",
+                    "content": [{"type": "output_text", "text": text, "annotations": []}],
+                },
+            ],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_burst_is_coalesced_to_latest():
+    display = RecordingDisplay()
+    scheduler = RenderScheduler(display, throttle_ms=50)
+
+    for i in range(20):
+        scheduler.submit("response.output_text.delta", make_response("x" * i))
+
+    # First snapshot renders immediately (new tool state), the rest are coalesced.
+    assert display.rendered == [""]
+    await asyncio.sleep(0.1)
+    assert display.rendered == ["", "x" * 19]
+    assert scheduler.coalesced == 18
+
+
+@pytest.mark.asyncio
+async def test_completion_and_tool_transitions_flush():
+    display = RecordingDisplay()
+    scheduler = RenderScheduler(display, throttle_ms=1000)
+
+    scheduler.submit("response.output_text.delta", make_response("a", tool_status="searching"))
+    scheduler.submit("response.output_text.delta", make_response("ab", tool_status="searching"))
+    scheduler.submit("response.file_search_call.completed", make_response("ab", tool_status="completed"))
+    scheduler.submit("response.completed", make_response("abc"))
+
+    assert display.rendered == ["a", "ab", "abc"]
+    scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_frames_widen_window():
+    display = RecordingDisplay(frame_cost=0.03)
+    scheduler = RenderScheduler(display, throttle_ms=10)
+
+    scheduler.submit("response.output_text.delta", make_response("a"))
+    assert scheduler.window >= 0.05
+    scheduler.close()
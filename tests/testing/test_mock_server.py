@@ -0,0 +1,141 @@
+"""Tests for the mock Knowledge Forge server."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+from forge_cli.sdk import files, vectorstore
+from forge_cli.sdk.client import ForgeClient
+from forge_cli.sdk.http_cache import HttpCache, set_http_cache
+from forge_cli.sdk.sse import SSEParser
+from forge_cli.sdk.typed_api import astream_typed_response, create_typed_request
+from forge_cli.testing.mock_server import DEFAULT_ANSWER, MockForgeServer, RecordedEvent, Recording
+
+
+@pytest.fixture(autouse=True)
+def _no_cache(tmp_path):
+    set_http_cache(HttpCache(directory=tmp_path, enabled=False))
+    yield
+    set_http_cache(None)
+
+
+def test_recording_round_trip(tmp_path):
+    recording = Recording.synthesize(interval=0.01)
+    assert recording.events[-1].event == "done"
+    assert recording.final_snapshot["status"] == "completed"
+
+    path = tmp_path / "stream.jsonl"
+    recording.dump(path)
+    loaded = Recording.load(path)
+    assert [(e.offset, e.event, e.data) for e in loaded.events] == [
+        (e.offset, e.event, e.data) for e in recording.events
+    ]
+
+    raw = b"".join(event.encode() for event in recording.events)
+    (tmp_path / "stream.sse").write_bytes(raw)
+    from_sse = Recording.load(tmp_path / "stream.sse", interval=0.5)
+    assert [e.data for e in from_sse.events] == [e.data for e in recording.events]
+    assert from_sse.duration == pytest.approx(0.5 * (len(recording.events) - 1))
+
+
+@pytest.mark.asyncio
+async def test_replays_stream_through_the_sdk():
+    async with MockForgeServer(speed=None) as server, ForgeClient() as client:
+        with patch("forge_cli.sdk.typed_api.BASE_URL", server.url):
+            request = create_typed_request("How did revenue develop?")
+            events = [item async for item in astream_typed_response(request, client=client)]
+
+        assert events[0][0] == "response.created"
+        assert events[-1] == ("done", None)
+        final = events[-2][1]
+        assert final.status == "completed"
+        assert final.output_text == DEFAULT_ANSWER
+
+        async with (await client.get_session()).get(f"{server.url}/v1/responses/resp_mock") as response:
+            assert (await response.json())["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_replay_pace_follows_speed():
+    recording = Recording([RecordedEvent(offset * 0.1, "tick", "{}") for offset in range(4)])
+
+    async def replay(speed: float | None) -> float:
+        async with MockForgeServer([recording], speed=speed) as server, aiohttp.ClientSession() as session:
+            started = time.monotonic()
+            async with session.post(f"{server.url}/v1/responses", json={}) as response:
+                await response.read()
+            return time.monotonic() - started
+
+    assert await replay(1.0) >= 0.3
+    assert await replay(4.0) < 0.2
+    assert await replay(None) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_files_tasks_and_vector_stores(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("Quarterly revenue grew by twelve percent.")
+
+    async with MockForgeServer(task_duration=0.05) as server, ForgeClient() as client:
+        with (
+            patch("forge_cli.sdk.files.BASE_URL", server.url),
+            patch("forge_cli.sdk.vectorstore.BASE_URL", server.url),
+        ):
+            uploaded = await files.async_upload_file(str(path), client=client)
+            task = await files.async_wait_for_task_completion(uploaded.task_id, poll_interval=0.02, client=client)
+            assert task.status == "completed"
+
+            store = await vectorstore.async_create_vectorstore("notes", file_ids=[uploaded.id], client=client)
+            assert store.file_counts.completed == 1
+
+            results = await vectorstore.async_query_vectorstore(store.id, "revenue growth", client=client)
+            assert results.data[0].file_id == uploaded.id
+            assert results.data[0].score == 0.5
+
+            listed = [item.id async for item in vectorstore.aiter_vectorstore_files(store.id, client=client)]
+            assert listed == [uploaded.id]
+
+            document = await files.async_fetch_document_content(uploaded.id, client=client)
+            assert document.title == "notes.txt"
+
+        async with (await client.get_session()).get(f"{server.url}/v1/files/{uploaded.id}/pages") as response:
+            pages = (await response.json())["pages"]
+        assert pages == [{"page_number": 1, "content": "Quarterly revenue grew by twelve percent."}]
+
+
+@pytest.mark.asyncio
+async def test_error_injection_and_latency():
+    async with MockForgeServer(error_rate=1.0, latency=0.05) as server, aiohttp.ClientSession() as session:
+        started = time.monotonic()
+        async with session.get(f"{server.url}/v1/vector_stores/vs_1") as response:
+            assert response.status == 503
+        assert time.monotonic() - started >= 0.05
+        assert server.hits["GET /v1/vector_stores/{id}"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dropped_stream_resumes_with_last_event_id():
+    async with (
+        MockForgeServer(speed=None, disconnect_rate=1.0, event_ids=True, seed=1) as server,
+        aiohttp.ClientSession() as session,
+    ):
+        parser = SSEParser()
+        received = []
+        with pytest.raises(aiohttp.ClientPayloadError):
+            async with session.post(f"{server.url}/v1/responses", json={}) as response:
+                async for chunk in response.content.iter_any():
+                    received.extend(parser.feed(chunk))
+        assert received and received[-1].event != "done"
+
+        server.disconnect_rate = 0.0
+        headers = {"Last-Event-ID": parser.last_event_id}
+        async with session.post(f"{server.url}/v1/responses", json={}, headers=headers) as response:
+            rest = SSEParser().feed(await response.read())
+
+        events = received + rest
+        assert [event.id for event in events] == [str(number) for number in range(1, len(events) + 1)]
+        assert events[-1].event == "done"